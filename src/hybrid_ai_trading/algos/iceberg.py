@@ -104,3 +104,17 @@ class IcebergExecutor:
                 }
 
         return {"status": "filled", "algo": "Iceberg", "details": results}
+
+    def schedule(
+        self, scheduler: Any, symbol: str, side: str, size: int, price: float
+    ) -> str:
+        """Non-blocking variant: queue on an ExecutionScheduler, return parent id."""
+        return scheduler.submit(
+            symbol,
+            side,
+            size,
+            price,
+            algo="ICEBERG",
+            display_size=self.display_size,
+            interval=self.delay,
+        )
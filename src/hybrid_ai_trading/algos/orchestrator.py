@@ -8,7 +8,7 @@ Responsibilities
 ---------------
 - Maintain a registry of supported execution algos
 - Provide discovery via `get_algo_executor`
-- Expose unified imports for VWAP, TWAP, and Iceberg executors
+- Expose unified imports for VWAP, VWAP curve, TWAP, and Iceberg executors
 - Wrap signals (VWAPSignal) for strategy-level integration
 """
 
@@ -32,6 +32,12 @@ def _load_vwap_executor() -> Any:
     return VWAPExecutor
 
 
+def _load_vwap_curve_executor() -> Any:
+    from hybrid_ai_trading.algos.vwap_curve import VWAPCurveExecutor
+
+    return VWAPCurveExecutor
+
+
 def _load_twap_executor() -> Any:
     from hybrid_ai_trading.algos.twap import TWAPExecutor
 
@@ -49,6 +55,7 @@ def _load_iceberg_executor() -> Any:
 # ----------------------------------------------------------------------
 ALGO_REGISTRY: Dict[str, Any] = {
     "VWAP": _load_vwap_executor,
+    "VWAP_CURVE": _load_vwap_curve_executor,
     "TWAP": _load_twap_executor,
     "ICEBERG": _load_iceberg_executor,
 }
@@ -61,7 +68,7 @@ def get_algo_executor(name: str) -> Type:
     Parameters
     ----------
     name : str
-        Name of the execution algo ("VWAP", "TWAP", "ICEBERG")
+        Name of the execution algo ("VWAP", "VWAP_CURVE", "TWAP", "ICEBERG")
 
     Returns
     -------
@@ -0,0 +1,476 @@
+"""
+Execution Scheduler (Hybrid AI Quant Pro v1.0 - Non-Blocking Parent Orders)
+---------------------------------------------------------------------------
+- Works many parent orders at once, interleaving their child slices instead
+  of sleeping between slices (TWAPExecutor / IcebergExecutor block their
+  thread for the whole life of one parent)
+- One heap of (due time, seq, parent id): each tick pops every due parent,
+  sends one child for it and reschedules it
+- Slice policies: TWAPPolicy (equal slices at a fixed interval), IcebergPolicy
+  (display-size slices), VWAP (algos.vwap_curve volume curves); anything
+  with first_due/child_qty/next_due plugs in via POLICIES
+- cancel(pid) / amend(pid, size=..., price=...) on working parents
+- Per-symbol caps over a rolling cap_window_s, across all parents in that
+  symbol; the rest is deferred:
+    * caps[symbol]: absolute quantity per window
+    * participation[symbol]: fraction of the market volume reported via
+      on_volume() in the same window (a 0.1 cap sends at most 10% of what
+      printed); parents deferred by it wake when new volume arrives
+- Drivers: step() / run_until_idle() inline (with a VirtualClock a whole
+  session's schedule runs instantly), or `await run()` on asyncio with child
+  orders placed on a thread pool (workers<=1 places inline)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from hybrid_ai_trading.utils.clock import Clock, WallClock
+
+logger = logging.getLogger("hybrid_ai_trading.algos.scheduler")
+
+_REJECTED = {"rejected", "blocked", "error", "cancelled", "canceled"}
+
+
+@dataclass
+class ParentOrder:
+    pid: str
+    symbol: str
+    side: str
+    size: float
+    price: float
+    algo: str
+    policy: Any
+    start: float
+    due: float = 0.0
+    sent: float = 0.0
+    filled: float = 0.0
+    n_children: int = 0
+    rejects: int = 0
+    status: str = "working"  # working / done / cancelled / error
+    reason: Optional[str] = None
+    inflight: bool = False
+    children: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.size - self.sent)
+
+    @property
+    def integral(self) -> bool:
+        return float(self.size).is_integer()
+
+    def result(self) -> Dict[str, Any]:
+        """Executor-style summary: status, algo, details (+ fill progress)."""
+        status = {"done": "filled", "working": "working"}.get(self.status, self.status)
+        out = {
+            "status": status,
+            "algo": self.algo,
+            "details": list(self.children),
+            "filled": self.filled,
+            "remaining": self.remaining,
+        }
+        if self.reason:
+            out["reason"] = self.reason
+        return out
+
+
+def _split(parent: ParentOrder, slices_left: int) -> float:
+    qty = parent.remaining / max(1, slices_left)
+    if parent.integral:
+        qty = min(parent.remaining, max(1.0, math.floor(qty)))
+    return qty
+
+
+class TWAPPolicy:
+    """Equal slices every `interval` seconds from the parent's start."""
+
+    def __init__(self, slices: int = 10, interval: float = 60.0) -> None:
+        self.slices = max(1, int(slices))
+        self.interval = max(0.0, float(interval))
+
+    def first_due(self, parent: ParentOrder, now: float) -> float:
+        return now
+
+    def child_qty(self, parent: ParentOrder, now: float) -> float:
+        return _split(parent, self.slices - parent.n_children)
+
+    def next_due(self, parent: ParentOrder, now: float) -> float:
+        return parent.start + parent.n_children * self.interval
+
+
+class IcebergPolicy:
+    """Display-size slices, the next one `interval` seconds after each child."""
+
+    def __init__(self, display_size: float = 10, interval: float = 0.0) -> None:
+        self.display_size = max(1.0, float(display_size))
+        self.interval = max(0.0, float(interval))
+
+    def first_due(self, parent: ParentOrder, now: float) -> float:
+        return now
+
+    def child_qty(self, parent: ParentOrder, now: float) -> float:
+        return min(self.display_size, parent.remaining)
+
+    def next_due(self, parent: ParentOrder, now: float) -> float:
+        return now + self.interval
+
+
+def _vwap_policy(**params: Any) -> Any:
+    from hybrid_ai_trading.algos.vwap_curve import VWAPCurvePolicy
+
+    return VWAPCurvePolicy(**params)
+
+
+POLICIES: Dict[str, Any] = {
+    "TWAP": TWAPPolicy,
+    "ICEBERG": IcebergPolicy,
+    "VWAP": _vwap_policy,
+}
+
+
+class ExecutionScheduler:
+    def __init__(
+        self,
+        order_manager: Any,
+        clock: Optional[Clock] = None,
+        caps: Optional[Dict[str, float]] = None,
+        cap_window_s: float = 60.0,
+        workers: int = 8,
+        max_child_rejects: int = 3,
+        participation: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.order_manager = order_manager
+        self.clock = clock or WallClock()
+        self.caps = dict(caps or {})
+        self.participation = dict(participation or {})
+        self.cap_window_s = float(cap_window_s)
+        self.workers = int(workers)
+        self.max_child_rejects = int(max_child_rejects)
+        self.parents: Dict[str, ParentOrder] = {}
+        self.deferred = 0
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._window: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._volume: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._parked: Dict[str, Set[str]] = {}  # waiting on market volume
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # parent lifecycle
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        price: float,
+        algo: str = "TWAP",
+        policy: Any = None,
+        **params: Any,
+    ) -> str:
+        """Queue a parent order; returns its id. params build the algo policy."""
+        if size <= 0 or price <= 0:
+            raise ValueError(f"invalid parent order: size={size} price={price}")
+        algo = algo.upper()
+        if policy is None:
+            if algo not in POLICIES:
+                raise KeyError(f"no slice policy for algo '{algo}'")
+            policy = POLICIES[algo](**params)
+        now = self.clock.now()
+        with self._lock:
+            pid = f"P{next(self._ids)}"
+            p = ParentOrder(pid, symbol, side, size, price, algo, policy, start=now)
+            p.due = policy.first_due(p, now)
+            self.parents[pid] = p
+            self._push(p)
+        self._notify()
+        return pid
+
+    def cancel(self, pid: str) -> bool:
+        with self._lock:
+            p = self.parents.get(pid)
+            if p is None or p.status != "working":
+                return False
+            p.status = "cancelled"
+        self._notify()
+        return True
+
+    def amend(
+        self, pid: str, size: Optional[float] = None, price: Optional[float] = None
+    ) -> bool:
+        """Change total size (not below what was already sent) and/or price."""
+        with self._lock:
+            p = self.parents.get(pid)
+            if p is None or p.status != "working":
+                return False
+            if price is not None:
+                p.price = float(price)
+            if size is not None:
+                p.size = max(float(size), p.sent)
+                if p.remaining <= 0 and not p.inflight:
+                    p.status = "done"
+        self._notify()
+        return True
+
+    def on_volume(self, symbol: str, qty: float, ts: Optional[float] = None) -> None:
+        """Market volume printed in `symbol` (feeds participation caps)."""
+        now = self.clock.now() if ts is None else float(ts)
+        with self._lock:
+            if symbol not in self.participation:
+                return
+            self._volume.setdefault(symbol, deque()).append((now, float(qty)))
+            for pid in self._parked.pop(symbol, ()):
+                p = self.parents.get(pid)
+                if p is not None and p.status == "working" and p.due > now:
+                    p.due = now
+                    self._push(p)
+        self._notify()
+
+    def result(self, pid: str) -> Dict[str, Any]:
+        with self._lock:
+            return self.parents[pid].result()
+
+    def working(self) -> int:
+        with self._lock:
+            return sum(p.status == "working" for p in self.parents.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            by: Dict[str, int] = {}
+            for p in self.parents.values():
+                by[p.status] = by.get(p.status, 0) + 1
+            return {
+                "parents": by,
+                "children": sum(p.n_children for p in self.parents.values()),
+                "deferred_by_caps": self.deferred,
+                "queued": len(self._heap),
+            }
+
+    # ------------------------------------------------------------------
+    # scheduling core
+    # ------------------------------------------------------------------
+    def _push(self, p: ParentOrder) -> None:
+        heapq.heappush(self._heap, (p.due, next(self._seq), p.pid))
+
+    def _allowance(self, symbol: str, now: float) -> Tuple[Optional[float], float]:
+        """(quantity still allowed in the cap window or None, when it frees up)."""
+        cap, pct = self.caps.get(symbol), self.participation.get(symbol)
+        if cap is None and pct is None:
+            return None, now
+        cutoff = now - self.cap_window_s
+        win = self._window.setdefault(symbol, deque())
+        while win and win[0][0] <= cutoff:
+            win.popleft()
+        used = sum(q for _, q in win)
+        allowed = math.inf if cap is None else cap - used
+        if pct is not None:
+            vol = self._volume.setdefault(symbol, deque())
+            while vol and vol[0][0] <= cutoff:
+                vol.popleft()
+            allowed = min(allowed, pct * sum(q for _, q in vol) - used)
+        free_at = win[0][0] + self.cap_window_s if win else now + self.cap_window_s
+        return max(0.0, allowed), free_at
+
+    def _take_due(self, now: float) -> List[Tuple[ParentOrder, float]]:
+        """Pop every due parent and reserve its next child quantity."""
+        out: List[Tuple[ParentOrder, float]] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, pid = heapq.heappop(self._heap)
+                p = self.parents.get(pid)
+                if p is None or p.status != "working" or p.inflight or due != p.due:
+                    continue  # finished, busy, or a stale heap entry
+                qty = p.policy.child_qty(p, now)
+                if qty <= 0:  # nothing due yet (e.g. VWAP ahead of its curve)
+                    nxt = p.policy.next_due(p, now)
+                    if nxt <= now:
+                        p.status, p.reason = "error", "slice policy stalled"
+                    else:
+                        p.due = nxt
+                        self._push(p)
+                    continue
+                allowed, free_at = self._allowance(p.symbol, now)
+                if allowed is not None and qty > allowed:
+                    qty = math.floor(allowed) if p.integral else allowed
+                    if qty <= 0:
+                        self.deferred += 1
+                        p.due = max(free_at, now)
+                        self._push(p)
+                        if p.symbol in self.participation:
+                            self._parked.setdefault(p.symbol, set()).add(p.pid)
+                        continue
+                if allowed is not None:
+                    self._window[p.symbol].append((now, qty))
+                p.inflight = True
+                p.sent += qty
+                p.n_children += 1
+                out.append((p, qty))
+        return out
+
+    def _place(self, p: ParentOrder, qty: float) -> Tuple[Any, Optional[str]]:
+        try:
+            return self.order_manager.place_order(p.symbol, p.side, qty, p.price), None
+        except Exception as e:
+            logger.error("[Scheduler] %s child %d failed: %s", p.pid, p.n_children, e)
+            return None, str(e)
+
+    def _complete(
+        self, p: ParentOrder, qty: float, raw: Any, err: Optional[str]
+    ) -> None:
+        now = self.clock.now()
+        with self._lock:
+            p.inflight = False
+            raw = raw if isinstance(raw, dict) else {}
+            status = "error" if err else raw.get("status", "unknown")
+            if status == "ok":
+                status = "filled"
+            p.children.append(
+                {
+                    "slice": p.n_children,
+                    "size": qty,
+                    "status": status,
+                    "price": raw.get("fill_price", p.price),
+                    "broker": raw.get("broker", "simulator"),
+                    "ts": now,
+                    "details": raw,
+                }
+            )
+            if err:
+                p.status, p.reason = "error", f"{p.algo} child {p.n_children}: {err}"
+            elif status in _REJECTED:
+                p.sent -= qty  # quantity goes back to the parent
+                p.rejects += 1
+                if p.rejects >= self.max_child_rejects:
+                    p.status, p.reason = "error", "too many rejected children"
+            elif status == "filled":
+                p.filled += qty
+            if p.status == "working":
+                if p.remaining <= 0:
+                    p.status = "done"
+                else:
+                    p.due = max(now, p.policy.next_due(p, now))
+                    self._push(p)
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            while self._heap:
+                due, _, pid = self._heap[0]
+                p = self.parents.get(pid)
+                if p is not None and p.status == "working" and due == p.due:
+                    return due
+                heapq.heappop(self._heap)
+            return None
+
+    # ------------------------------------------------------------------
+    # drivers
+    # ------------------------------------------------------------------
+    def step(self, now: Optional[float] = None) -> Optional[float]:
+        """Send every due child inline; returns the next due time (or None)."""
+        for p, qty in self._take_due(self.clock.now() if now is None else now):
+            raw, err = self._place(p, qty)
+            self._complete(p, qty, raw, err)
+        return self.next_due()
+
+    def run_until_idle(self, max_steps: Optional[int] = None) -> int:
+        """Drive step() until no parent is working; sleeps via the clock."""
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            nxt = self.step()
+            steps += 1
+            if nxt is None:
+                break
+            if getattr(self.clock, "virtual", False):
+                self.clock.advance_to(nxt)
+            else:
+                self.clock.sleep(nxt - self.clock.now())
+        return steps
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="algo")
+        return self._pool
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass
+
+    async def _place_async(self, p: ParentOrder, qty: float) -> None:
+        if self.workers <= 1:
+            raw, err = self._place(p, qty)
+        else:
+            loop = asyncio.get_running_loop()
+            raw, err = await loop.run_in_executor(self._executor(), self._place, p, qty)
+        self._complete(p, qty, raw, err)
+
+    async def run(self, stop_when_idle: bool = True) -> None:
+        """Asyncio driver; children of different parents run concurrently."""
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopped = False
+        tasks: Set[asyncio.Task] = set()
+        wake = self._wake
+
+        def _done(t: asyncio.Task) -> None:
+            tasks.discard(t)
+            wake.set()  # a finished child reschedules its parent
+
+        virtual = getattr(self.clock, "virtual", False)
+        try:
+            while not self._stopped:
+                for p, qty in self._take_due(self.clock.now()):
+                    t = asyncio.ensure_future(self._place_async(p, qty))
+                    tasks.add(t)
+                    t.add_done_callback(_done)
+                if virtual and tasks:
+                    # event time only moves once every child of this tick is back
+                    await asyncio.gather(*list(tasks))
+                    continue
+                nxt = self.next_due()
+                if nxt is None and not tasks and stop_when_idle:
+                    break
+                if virtual and nxt is not None:
+                    self.clock.advance_to(nxt)
+                    await asyncio.sleep(0)
+                    continue
+                delay = None if nxt is None else max(0.0, nxt - self.clock.now())
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            if tasks:
+                await asyncio.gather(*list(tasks))
+        finally:
+            self._loop = self._wake = None
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._notify()
+
+
+__all__ = [
+    "ExecutionScheduler",
+    "IcebergPolicy",
+    "POLICIES",
+    "ParentOrder",
+    "TWAPPolicy",
+]
@@ -99,3 +99,17 @@ class TWAPExecutor:
                 }
 
         return {"status": "filled", "algo": "TWAP", "details": results}
+
+    def schedule(
+        self, scheduler: Any, symbol: str, side: str, size: int, price: float
+    ) -> str:
+        """Non-blocking variant: queue on an ExecutionScheduler, return parent id."""
+        return scheduler.submit(
+            symbol,
+            side,
+            size,
+            price,
+            algo="TWAP",
+            slices=self.slices,
+            interval=self.delay,
+        )
@@ -0,0 +1,387 @@
+"""
+VWAP Curve Executor (Hybrid AI Quant Pro v1.0 - Historical Volume Profiles)
+---------------------------------------------------------------------------
+- build_profiles(): per-weekday intraday volume curves from stored minute
+  bars (each session normalised to 1, then averaged so every day weighs the
+  same) plus the average session volume (adv)
+- VolumeProfileStore: profiles precomputed per (symbol, weekday) and kept in
+  a dict, so the runtime lookup is O(1); weekdays with fewer than min_days
+  sessions fall back to the symbol's pooled curve, unknown symbols to a flat
+  curve. Bars come from the shared BarCache (HAT_BAR_CACHE) or add_bars()
+- VWAPCurvePolicy: ExecutionScheduler slice policy; the parent's target
+  progress follows the expected volume curve over its window, and when
+  realized volume is fed via on_bar() it becomes
+      done / (done + adv * expected share still to come)
+  so a busy session pulls child orders forward and a quiet one holds back
+- VWAPCurveExecutor: execute() runs one parent to completion (like the
+  TWAP/Iceberg executors); schedule() queues it on a shared scheduler
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from hybrid_ai_trading.algos.scheduler import ExecutionScheduler
+from hybrid_ai_trading.utils.clock import Clock
+
+logger = logging.getLogger("hybrid_ai_trading.algos.vwap_curve")
+
+ALL_DAYS = -1  # pooled profile key
+US_SESSION = (570, 960)  # 09:30-16:00 in minutes after midnight
+
+
+class VolumeProfile:
+    """Expected share of session volume per bucket for one symbol/weekday."""
+
+    def __init__(
+        self,
+        weights: Sequence[float],
+        bucket_min: int = 5,
+        open_min: int = US_SESSION[0],
+        adv: float = 0.0,
+        days: int = 0,
+    ) -> None:
+        w = [max(0.0, float(x)) for x in weights] or [1.0]
+        total = sum(w)
+        self.weights = [x / total for x in w] if total > 0 else [1.0 / len(w)] * len(w)
+        self.cum = [0.0]
+        for x in self.weights:
+            self.cum.append(self.cum[-1] + x)
+        self.bucket_min = int(bucket_min)
+        self.open_min = int(open_min)
+        self.close_min = self.open_min + self.bucket_min * len(self.weights)
+        self.adv = float(adv)
+        self.days = int(days)
+
+    @classmethod
+    def flat(cls, bucket_min: int = 5, session: Tuple[int, int] = US_SESSION):
+        n = max(1, (session[1] - session[0]) // bucket_min)
+        return cls([1.0] * n, bucket_min, session[0])
+
+    def bucket(self, minute: float) -> int:
+        i = int((minute - self.open_min) // self.bucket_min)
+        return min(max(i, 0), len(self.weights) - 1)
+
+    def cum_at(self, minute: float) -> float:
+        """Expected share of session volume done by `minute` (linear in bucket)."""
+        if minute <= self.open_min:
+            return 0.0
+        if minute >= self.close_min:
+            return 1.0
+        i = self.bucket(minute)
+        frac = (minute - self.open_min - i * self.bucket_min) / self.bucket_min
+        return self.cum[i] + frac * self.weights[i]
+
+    def expected(self, m0: float, m1: float) -> float:
+        """Expected traded volume between two minutes of the session."""
+        return self.adv * max(0.0, self.cum_at(m1) - self.cum_at(m0))
+
+
+def build_profiles(
+    bars: pd.DataFrame,
+    tz: str = "America/New_York",
+    bucket_min: int = 5,
+    session: Tuple[int, int] = US_SESSION,
+    lookback_days: int = 20,
+    min_days: int = 3,
+) -> Dict[int, VolumeProfile]:
+    """{weekday (0=Mon) or ALL_DAYS: VolumeProfile} from bars with ts (ms) + volume."""
+    if bars is None or bars.empty or "volume" not in bars:
+        return {}
+    local = pd.to_datetime(bars["ts"].astype("int64"), unit="ms", utc=True)
+    local = local.dt.tz_convert(tz)
+    minute = local.dt.hour * 60 + local.dt.minute
+    n = max(1, (session[1] - session[0]) // bucket_min)
+    df = pd.DataFrame(
+        {
+            "day": local.dt.date.to_numpy(),
+            "bucket": ((minute - session[0]) // bucket_min).to_numpy(),
+            "volume": pd.to_numeric(bars["volume"], errors="coerce").to_numpy(),
+        }
+    )
+    df = df[(df["bucket"] >= 0) & (df["bucket"] < n)].dropna()
+    grid = df.pivot_table(
+        index="day", columns="bucket", values="volume", aggfunc="sum", fill_value=0.0
+    ).reindex(columns=range(n), fill_value=0.0)
+    totals = grid.sum(axis=1)
+    grid, totals = grid[totals > 0], totals[totals > 0]
+    if grid.empty:
+        return {}
+    grid, totals = grid.iloc[-lookback_days:], totals.iloc[-lookback_days:]
+    shares = grid.div(totals, axis=0)
+    weekday = pd.Index([d.weekday() for d in shares.index])
+
+    def _profile(mask) -> VolumeProfile:
+        return VolumeProfile(
+            shares[mask].mean(axis=0).tolist(),
+            bucket_min,
+            session[0],
+            adv=float(totals[mask].mean()),
+            days=int(mask.sum()),
+        )
+
+    pooled = _profile(weekday >= 0)
+    out = {ALL_DAYS: pooled}
+    for wd in range(7):
+        mask = weekday == wd
+        if mask.sum() >= min_days:
+            out[wd] = _profile(mask)
+    return out
+
+
+class VolumeProfileStore:
+    def __init__(
+        self,
+        bar_cache: Any = None,
+        provider: str = "polygon",
+        timeframe: str = "1/minute",
+        tz: str = "America/New_York",
+        bucket_min: int = 5,
+        session: Tuple[int, int] = US_SESSION,
+        lookback_days: int = 20,
+        min_days: int = 3,
+    ) -> None:
+        self.bar_cache = bar_cache
+        self.provider = provider
+        self.timeframe = timeframe
+        self.tz_name = tz
+        self.tz = ZoneInfo(tz)
+        self.bucket_min = int(bucket_min)
+        self.session = session
+        self.lookback_days = int(lookback_days)
+        self.min_days = int(min_days)
+        self.flat = VolumeProfile.flat(self.bucket_min, session)
+        self._profiles: Dict[Tuple[str, int], VolumeProfile] = {}
+        self._loaded: set = set()
+        self._live: Dict[str, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # precompute
+    # ------------------------------------------------------------------
+    def add_bars(self, symbol: str, bars: pd.DataFrame) -> int:
+        """Build and cache the profiles of one symbol; returns sessions used."""
+        profiles = build_profiles(
+            bars,
+            self.tz_name,
+            self.bucket_min,
+            self.session,
+            self.lookback_days,
+            self.min_days,
+        )
+        pooled = profiles.get(ALL_DAYS)
+        with self._lock:
+            self._loaded.add(symbol)
+            if pooled is None:
+                return 0
+            for wd in (ALL_DAYS, *range(7)):
+                self._profiles[(symbol, wd)] = profiles.get(wd, pooled)
+        return pooled.days
+
+    def load(self, symbol: str) -> int:
+        """Profiles from the stored minute bars of `symbol` (0 when none)."""
+        if self.bar_cache is None:
+            with self._lock:
+                self._loaded.add(symbol)
+            return 0
+        try:
+            bars, _ = self.bar_cache.load(self.provider, symbol, self.timeframe)
+        except Exception as e:
+            logger.warning("[VWAP] no stored bars for %s: %s", symbol, e)
+            bars = None
+        return self.add_bars(symbol, bars)
+
+    def precompute(self, symbols: Iterable[str]) -> Dict[str, int]:
+        return {s: self.load(s) for s in symbols}
+
+    # ------------------------------------------------------------------
+    # runtime
+    # ------------------------------------------------------------------
+    def get(self, symbol: str, weekday: int = ALL_DAYS) -> VolumeProfile:
+        hit = self._profiles.get((symbol, weekday))
+        if hit is not None:
+            return hit
+        if symbol not in self._loaded:
+            self.load(symbol)  # once per symbol
+            return self._profiles.get((symbol, weekday), self.flat)
+        return self.flat
+
+    def local(self, ts: float) -> datetime:
+        return datetime.fromtimestamp(ts, tz=self.tz)
+
+    def profile_at(self, symbol: str, ts: float) -> Tuple[VolumeProfile, float]:
+        """(profile for the session containing ts, minute of day of ts)."""
+        t = self.local(ts)
+        prof = self.get(symbol, t.weekday())
+        return prof, t.hour * 60 + t.minute + t.second / 60.0
+
+    def on_bar(self, symbol: str, ts: float, volume: float) -> None:
+        """Feed realized market volume (bar close time ts, epoch seconds)."""
+        day = self.local(ts).date()
+        with self._lock:
+            prev = self._live.get(symbol)
+            total = prev[1] if prev is not None and prev[0] == day else 0.0
+            self._live[symbol] = (day, total + float(volume))
+
+    def realized(self, symbol: str, ts: Optional[float] = None) -> Optional[float]:
+        """Volume fed so far today (the day of `ts` if given); None if no bars."""
+        hit = self._live.get(symbol)
+        if hit is None or (ts is not None and hit[0] != self.local(ts).date()):
+            return None
+        return hit[1]
+
+
+_DEFAULT: Dict[str, VolumeProfileStore] = {}
+
+
+def default_profile_store() -> VolumeProfileStore:
+    """Shared store over the default BarCache (flat curves when caching is off)."""
+    if "default" not in _DEFAULT:
+        from hybrid_ai_trading.data.store.bar_cache import default_bar_cache
+
+        _DEFAULT["default"] = VolumeProfileStore(default_bar_cache())
+    return _DEFAULT["default"]
+
+
+class VWAPCurvePolicy:
+    """
+    Slice policy following the expected volume curve between the parent's
+    start and `end` (epoch seconds), `start + duration` or the session close.
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[VolumeProfileStore] = None,
+        end: Optional[float] = None,
+        duration: Optional[float] = None,
+        interval: float = 60.0,
+        min_slice: float = 1.0,
+    ) -> None:
+        self.profiles = profiles if profiles is not None else default_profile_store()
+        self.end = end
+        self.duration = duration
+        self.interval = max(1e-3, float(interval))
+        self.min_slice = float(min_slice)
+        self.profile: Optional[VolumeProfile] = None
+
+    def first_due(self, parent: Any, now: float) -> float:
+        self.profile, self.m0 = self.profiles.profile_at(parent.symbol, now)
+        self.t0 = now
+        if self.end is not None:
+            t_end = float(self.end)
+        elif self.duration is not None:
+            t_end = now + float(self.duration)
+        else:
+            t_end = now + (self.profile.close_min - self.m0) * 60.0
+        self.t_end = max(now, t_end)
+        self.m_end = self.m0 + (self.t_end - now) / 60.0
+        # no bars yet today (e.g. submitted before the open): baseline 0
+        self.r0 = self.profiles.realized(parent.symbol, now) or 0.0
+        return now
+
+    def progress(self, parent: Any, now: float) -> float:
+        """Share of the parent that should have been sent by `now`."""
+        if now >= self.t_end:
+            return 1.0
+        prof = self.profile
+        m = self.m0 + (now - self.t0) / 60.0
+        elapsed = prof.cum_at(m) - prof.cum_at(self.m0)
+        left = prof.cum_at(self.m_end) - prof.cum_at(m)
+        if elapsed + left <= 0:  # window outside the session: linear in time
+            return (now - self.t0) / (self.t_end - self.t0)
+        r = self.profiles.realized(parent.symbol, now)
+        if r is not None and r >= self.r0 and prof.adv > 0:
+            done = r - self.r0
+            expect = prof.adv * left
+            return done / (done + expect) if done + expect > 0 else 1.0
+        return elapsed / (elapsed + left)
+
+    def child_qty(self, parent: Any, now: float) -> float:
+        p = self.progress(parent, now)
+        if p >= 1.0:
+            return parent.remaining
+        qty = parent.size * p - parent.sent
+        if parent.integral:
+            qty = math.floor(qty)
+        if qty < self.min_slice:
+            return 0.0
+        return min(qty, parent.remaining)
+
+    def next_due(self, parent: Any, now: float) -> float:
+        return min(now + self.interval, self.t_end)
+
+
+class VWAPCurveExecutor:
+    """
+    VWAP executor slicing by historical intraday volume.
+    Same result shape as the TWAP/Iceberg executors.
+    """
+
+    def __init__(
+        self,
+        order_manager: Any,
+        profiles: Optional[VolumeProfileStore] = None,
+        interval: float = 60.0,
+        duration: Optional[float] = None,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        self.order_manager = order_manager
+        self.profiles = profiles
+        self.interval = float(interval)
+        self.duration = duration
+        self.clock = clock
+
+    def schedule(
+        self,
+        scheduler: ExecutionScheduler,
+        symbol: str,
+        side: str,
+        size: int,
+        price: float,
+        end: Optional[float] = None,
+    ) -> str:
+        return scheduler.submit(
+            symbol,
+            side,
+            size,
+            price,
+            algo="VWAP",
+            profiles=self.profiles,
+            end=end,
+            duration=self.duration,
+            interval=self.interval,
+        )
+
+    def execute(
+        self, symbol: str, side: str, size: int, price: float
+    ) -> Dict[str, Any]:
+        if size <= 0 or price <= 0:
+            logger.warning("[VWAP] Invalid parameters: size=%s price=%s", size, price)
+            return {
+                "status": "error",
+                "reason": "invalid parameters",
+                "algo": "VWAP",
+                "details": [],
+            }
+        sched = ExecutionScheduler(self.order_manager, clock=self.clock, workers=1)
+        pid = self.schedule(sched, symbol, side, size, price)
+        sched.run_until_idle()
+        return sched.result(pid)
+
+
+__all__ = [
+    "ALL_DAYS",
+    "VWAPCurveExecutor",
+    "VWAPCurvePolicy",
+    "VolumeProfile",
+    "VolumeProfileStore",
+    "build_profiles",
+    "default_profile_store",
+]
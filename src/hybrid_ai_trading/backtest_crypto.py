@@ -1,22 +1,54 @@
 from __future__ import annotations
 
 import argparse
+import math
 import os
 import statistics as stats
-from typing import Any, Dict, List, Tuple
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from hybrid_ai_trading.data.store.bar_cache import (
+    BarCache,
+    ccxt_rows_to_frame,
+    default_bar_cache,
+    frame_to_ccxt_rows,
+)
 
 try:
     import ccxt
 except Exception:
     ccxt = None
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 
 def pct(a: float, b: float) -> float:
     return 0.0 if b == 0 else 100.0 * (a - b) / b
 
 
+def _csum(vals: List[float]) -> float:
+    """
+    Neumaier-compensated float sum, left to right.
+
+    The same algorithm as builtin sum() on floats from Python 3.12, spelled
+    out so results do not depend on the interpreter version.
+    """
+    total = comp = 0.0
+    for v in vals:
+        t = total + v
+        if abs(total) >= abs(v):
+            comp += (total - t) + v
+        else:
+            comp += (v - t) + total
+        total = t
+    return total + comp if comp and math.isfinite(comp) else total
+
+
 def sma(vals: List[float], n: int) -> float:
-    return 0.0 if len(vals) < n or n <= 0 else sum(vals[-n:]) / n
+    return 0.0 if len(vals) < n or n <= 0 else _csum(vals[-n:]) / n
 
 
 def atr(ohlcv: List[List[float]], n: int = 14) -> float:
@@ -28,7 +60,7 @@ def atr(ohlcv: List[List[float]], n: int = 14) -> float:
         h, l, c = float(row[2]), float(row[3]), float(row[4])
         trs.append(max(h - l, abs(h - pc), abs(l - pc)))
         pc = c
-    return sum(trs) / n
+    return _csum(trs) / n
 
 
 def get_exchange(name: str):
@@ -52,17 +84,22 @@ def map_symbol(symbol: str, ex_name: str) -> str:
 
 
 def fetch_ohlcv_forward(
-    ex, symbol: str, tf: str, total: int
+    ex, symbol: str, tf: str, total: int, cache: Optional[BarCache] = None
 ) -> Tuple[List[List[float]], int]:
     """
     Forward pagination:
       - start since = now - total * tf_ms
       - fetch in chunks; append strictly increasing bars
+    With a BarCache (or $HAT_BAR_CACHE set) only bars missing from the cache
+    are downloaded; the last `total` bars up to now are returned.
     Returns (bars, tf_ms).
     """
     out: List[List[float]] = []
     tf_ms = int(ex.parse_timeframe(tf) * 1000)
     now_ms = ex.milliseconds()
+    cache = cache if cache is not None else default_bar_cache()
+    if cache is not None:
+        return _fetch_ohlcv_cached(ex, symbol, tf, total, tf_ms, now_ms, cache)
     since = now_ms - total * tf_ms
     last_ts = None
     remaining = total
@@ -97,42 +134,67 @@ def fetch_ohlcv_forward(
     return out, tf_ms
 
 
-def run_bt(
-    symbol: str,
+def _fetch_ohlcv_cached(
+    ex, symbol: str, tf: str, total: int, tf_ms: int, now_ms: int, cache: BarCache
+) -> Tuple[List[List[float]], int]:
+    def fetch(start: int, end: int):
+        rows: List[List[float]] = []
+        since = start
+        while since < end:
+            batch = ex.fetch_ohlcv(symbol, timeframe=tf, since=since, limit=1000)
+            batch = [r for r in batch or [] if r and since <= r[0] < end]
+            if batch:
+                rows.extend(batch)
+                since = int(batch[-1][0]) + tf_ms
+            else:  # no bars in this window; move past it
+                since += tf_ms * 1000
+        return ccxt_rows_to_frame(rows)
+
+    end = (now_ms // tf_ms + 1) * tf_ms
+    provider = f"ccxt.{getattr(ex, 'id', type(ex).__name__)}"
+    df = cache.get(provider, symbol, tf, end - total * tf_ms, end, fetch, now_ms=now_ms)
+    return frame_to_ccxt_rows(df)[-total:], tf_ms
+
+
+# ----------------------------------------------------------------------
+# Trade simulation
+#   - simulate_trades_reference: original bar-by-bar loop (O(n^2), parity oracle)
+#   - simulate_trades: precomputed NumPy indicators + first-hit exit search (O(n))
+# Both return the same list of trade dicts; summarize_trades builds the metrics.
+# ----------------------------------------------------------------------
+WARMUP_BARS = 200
+
+
+def _near_high_window(tf: str) -> int:
+    return 78 if tf == "5m" else 26 if tf == "15m" else 360
+
+
+def _trade(
+    ohl: List[List[float]], i: int, j: int, c: float, exitp: float, **extra: float
+) -> Dict[str, Any]:
+    return {
+        "entry_ts": ohl[i - 1][0],
+        "exit_ts": ohl[j][0] if j < len(ohl) else None,
+        "entry": c,
+        "exit": exitp,
+        **extra,
+    }
+
+
+def simulate_trades_reference(
+    ohl: List[List[float]],
     tf: str = "5m",
     risk_quote: float = 2.0,
     atr_k: float = 2.0,
     min_quote: float = 5.8,
     cap: float = 50.0,
-    ex_name: str = "kraken",
-    total_bars: int = 1500,
     fee_bps: float = 10.0,
-) -> Dict[str, Any]:
-    ex = get_exchange(ex_name)
-    if ex is None:
-        return {"symbol": f"{symbol} [@{ex_name}]", "msg": "no exchange"}
-    sym_m = map_symbol(symbol, ex_name)
-
-    ohl, tf_ms = fetch_ohlcv_forward(ex, sym_m, tf, total_bars)
-    if len(ohl) < 200:
-        return {
-            "symbol": f"{symbol} [{sym_m}@{ex_name}]",
-            "msg": "insufficient data",
-            "bars": len(ohl),
-        }
-
-    equity = 1.0
-    wins: List[bool] = []
-    rets: List[float] = []
-    dd = 0.0
-    peak = 1.0
+) -> List[Dict[str, Any]]:
+    """Original quadratic loop, kept as the reference for parity tests."""
+    trades: List[Dict[str, Any]] = []
     fee_rt = 2 * fee_bps / 10000.0  # round-trip
 
-    # estimate period length (days)
-    total_minutes = (len(ohl) * tf_ms) / (1000 * 60)
-    period_days = total_minutes / (60 * 24)
-
-    i = 200
+    i = WARMUP_BARS
     while i < len(ohl):
         window = ohl[:i]
         c = float(window[-1][4])
@@ -140,7 +202,7 @@ def run_bt(
         s50 = sma([x[4] for x in window], 50)
 
         # near-high lookback by tf
-        win = 78 if tf == "5m" else 26 if tf == "15m" else 360
+        win = _near_high_window(tf)
         highs_src = [x[4] for x in window[-min(len(window), win) :]]
         if not highs_src:
             i += 1
@@ -184,23 +246,164 @@ def run_bt(
 
         gross = (exitp - c) / c
         net = gross - fee_rt
-        rets.append(net)
-        wins.append(net > 0)
+        trades.append(
+            _trade(ohl, i, j, c, exitp, stop=stop, tp=tp, size_q=size_q, net=net)
+        )
+        i = j if j > i else i + 1
+    return trades
+
+
+def _rolling_sum(x: "np.ndarray", n: int) -> "np.ndarray":
+    """
+    Sum of x[k-n+1 .. k] for every k >= n-1.
+
+    Vectorized _csum() (Neumaier compensation, left to right) so windows
+    match sma()/atr() bit-for-bit.
+    """
+    m = len(x) - n + 1
+    if m <= 0:
+        return np.empty(0)
+    total = np.zeros(m)
+    comp = np.zeros(m)
+    for k in range(n):
+        v = x[k : k + m]
+        t = total + v
+        comp += np.where(np.abs(total) >= np.abs(v), (total - t) + v, (v - t) + total)
+        total = t
+    return np.where(np.isfinite(comp), total + comp, total)
+
+
+def _trailing_max(x: "np.ndarray", win: int) -> "np.ndarray":
+    """out[i] = max(x[max(0, i - win) : i]) for i >= 1 (out[0] = nan)."""
+    out = np.full(len(x), np.nan)
+    prefix = np.maximum.accumulate(x)
+    head = min(win, len(x) - 1)
+    out[1 : head + 1] = prefix[:head]
+    if len(x) > win:
+        windows = np.lib.stride_tricks.sliding_window_view(x, win)
+        out[win + 1 :] = windows[1:-1].max(axis=1)
+    return out
+
+
+def _first_hit(
+    closes: "np.ndarray", s50: "np.ndarray", start: int, stop: float, tp: float
+) -> int:
+    """First j >= start with an exit condition; len(closes) if none (galloping scan)."""
+    n = len(closes)
+    step = 64
+    while start < n:
+        end = min(n, start + step)
+        c2 = closes[start:end]
+        hit = (c2 <= stop) | (c2 <= s50[start:end]) | (c2 >= tp)
+        k = int(hit.argmax())
+        if hit[k]:
+            return start + k
+        start, step = end, step * 2
+    return n
+
+
+def simulate_trades(
+    ohl: List[List[float]],
+    tf: str = "5m",
+    risk_quote: float = 2.0,
+    atr_k: float = 2.0,
+    min_quote: float = 5.8,
+    cap: float = 50.0,
+    fee_bps: float = 10.0,
+) -> List[Dict[str, Any]]:
+    """Linear-time engine: same trades as simulate_trades_reference."""
+    if np is None:
+        return simulate_trades_reference(
+            ohl, tf, risk_quote, atr_k, min_quote, cap, fee_bps
+        )
+    n = len(ohl)
+    if n <= WARMUP_BARS:
+        return []
+
+    arr = np.asarray([row[:5] for row in ohl], dtype=float)
+    highs, lows, closes = arr[:, 2], arr[:, 3], arr[:, 4]
+    fee_rt = 2 * fee_bps / 10000.0
+
+    # Indicators aligned to "window = ohl[:i]" (last bar i-1), for i in [0, n]
+    sma20 = np.full(n + 1, 0.0)
+    sma50 = np.full(n + 1, 0.0)
+    sma20[20:] = _rolling_sum(closes, 20) / 20
+    sma50[50:] = _rolling_sum(closes, 50) / 50
+    prev_close = np.concatenate(([np.nan], closes[:-1]))
+    tr = np.maximum(
+        highs - lows,
+        np.maximum(np.abs(highs - prev_close), np.abs(lows - prev_close)),
+    )
+    atr14 = np.full(n + 1, 0.0)
+    atr14[15:] = _rolling_sum(tr[1:], 14) / 14
+    near_high = _trailing_max(closes, _near_high_window(tf))
+
+    idx = np.arange(WARMUP_BARS, n)
+    c = closes[idx - 1]
+    a = atr14[idx]
+    high = near_high[idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = np.where(high == 0, 0.0, 100.0 * (c - high) / high)
+    stop = c - atr_k * a
+    enter = (sma20[idx] > sma50[idx]) & (np.abs(dist) <= 1.0) & (a > 0.0)
+    enter &= (c - stop) > 0
+
+    # next_entry[k] = first entry index >= WARMUP_BARS + k (n if none)
+    cand = np.where(enter, idx, n)
+    next_entry = np.minimum.accumulate(cand[::-1])[::-1]
+    exit_s50 = sma50[1:]  # SMA50 over ohl[: j + 1]
+
+    trades: List[Dict[str, Any]] = []
+    i = WARMUP_BARS
+    while i < n:
+        i = int(next_entry[i - WARMUP_BARS])
+        if i >= n:
+            break
+        k = i - WARMUP_BARS
+        ci, ai, st = float(c[k]), float(a[k]), float(stop[k])
+        r = ci - st
+        size_q = max(min_quote, (risk_quote * ci) / (atr_k * ai))
+        if cap > 0:
+            size_q = min(size_q, cap)
+        tp = ci + 2 * r
+
+        j = _first_hit(closes, exit_s50, i + 1, st, tp)
+        if j < n:
+            c2 = float(closes[j])
+            exitp = st if c2 <= st else c2 if c2 <= exit_s50[j] else tp
+        else:
+            exitp = ci
+
+        net = (exitp - ci) / ci - fee_rt
+        trades.append(
+            _trade(ohl, i, j, ci, exitp, stop=st, tp=tp, size_q=size_q, net=net)
+        )
+        i = j
+    return trades
+
 
+def summarize_trades(
+    label: str, n_bars: int, tf: str, tf_ms: int, trades: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Metrics dict reported by run_bt (equity, PF, drawdown, CAGR)."""
+    equity = 1.0
+    dd = 0.0
+    peak = 1.0
+    rets = [t["net"] for t in trades]
+    wins = [x > 0 for x in rets]
+    for net in rets:
         # multiplicative equity & drawdown
         equity *= 1.0 + net
         peak = max(peak, equity)
         dd = min(dd, (equity / peak) - 1.0)
-        i = j if j > i else i + 1
+
+    # estimate period length (days)
+    total_minutes = (n_bars * tf_ms) / (1000 * 60)
+    period_days = total_minutes / (60 * 24)
 
     n = len(rets)
     if n == 0:
-        return {
-            "symbol": f"{symbol} [{sym_m}@{ex_name}]",
-            "trades": 0,
-            "msg": "no trades",
-            "bars": len(ohl),
-        }
+        return {"symbol": label, "trades": 0, "msg": "no trades", "bars": n_bars}
 
     pos_sum = sum(x for x in rets if x > 0)
     neg_sum = -sum(x for x in rets if x < 0)
@@ -210,7 +413,6 @@ def run_bt(
         else (float("inf") if neg_sum == 0 else 0.0)
     )
 
-    total_ret = equity - 1.0
     cagr = None
     try:
         years = max(1e-6, period_days / 365.25)
@@ -219,8 +421,8 @@ def run_bt(
         cagr = None
 
     return {
-        "symbol": f"{symbol} [{sym_m}@{ex_name}]",
-        "bars": len(ohl),
+        "symbol": label,
+        "bars": n_bars,
         "tf": tf,
         "trades": n,
         "win%": round(100 * sum(wins) / n, 1),
@@ -233,6 +435,72 @@ def run_bt(
     }
 
 
+def run_bt(
+    symbol: str,
+    tf: str = "5m",
+    risk_quote: float = 2.0,
+    atr_k: float = 2.0,
+    min_quote: float = 5.8,
+    cap: float = 50.0,
+    ex_name: str = "kraken",
+    total_bars: int = 1500,
+    fee_bps: float = 10.0,
+    engine: str = "fast",
+) -> Dict[str, Any]:
+    ex = get_exchange(ex_name)
+    if ex is None:
+        return {"symbol": f"{symbol} [@{ex_name}]", "msg": "no exchange"}
+    sym_m = map_symbol(symbol, ex_name)
+
+    ohl, tf_ms = fetch_ohlcv_forward(ex, sym_m, tf, total_bars)
+    if len(ohl) < 200:
+        return {
+            "symbol": f"{symbol} [{sym_m}@{ex_name}]",
+            "msg": "insufficient data",
+            "bars": len(ohl),
+        }
+
+    sim = simulate_trades_reference if engine == "reference" else simulate_trades
+    trades = sim(ohl, tf, risk_quote, atr_k, min_quote, cap, fee_bps)
+    return summarize_trades(
+        f"{symbol} [{sym_m}@{ex_name}]", len(ohl), tf, tf_ms, trades
+    )
+
+
+def synthetic_ohlcv(n: int, tf_ms: int = 60_000, seed: int = 0) -> List[List[float]]:
+    """Random-walk OHLCV rows [ts, o, h, l, c, v] for benchmarks and tests."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.exp(np.cumsum(rng.normal(0.0002, 0.004, n)))
+    opens = np.concatenate(([closes[0]], closes[:-1]))
+    wick = np.abs(rng.normal(0, 0.002, n)) * closes
+    highs = np.maximum(opens, closes) + wick
+    lows = np.minimum(opens, closes) - wick
+    vols = rng.integers(1, 1000, n).astype(float)
+    ts0 = 1_600_000_000_000
+    return [
+        [ts0 + k * tf_ms, float(o), float(h), float(lo), float(c), float(v)]
+        for k, (o, h, lo, c, v) in enumerate(zip(opens, highs, lows, closes, vols))
+    ]
+
+
+def benchmark(bars: int, tf: str = "1m", reference_bars: int = 5000) -> None:
+    """Time the fast engine on `bars` synthetic bars (reference on a prefix)."""
+    ohl = synthetic_ohlcv(bars)
+    t0 = time.perf_counter()
+    fast = simulate_trades(ohl, tf)
+    t_fast = time.perf_counter() - t0
+    print(f"fast      bars={bars:>7} trades={len(fast):>5} {t_fast:8.3f}s")
+
+    sub = ohl[: min(bars, reference_bars)]
+    t0 = time.perf_counter()
+    ref = simulate_trades_reference(sub, tf)
+    t_ref = time.perf_counter() - t0
+    same = ref == simulate_trades(sub, tf)
+    print(
+        f"reference bars={len(sub):>7} trades={len(ref):>5} {t_ref:8.3f}s parity={same}"
+    )
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--exchange", default=os.getenv("BT_EXCHANGE", "kraken"))
@@ -252,8 +520,21 @@ def main():
         "--cap", type=float, default=float(os.getenv("HG_MAX_TRADE_QUOTE", "50"))
     )
     ap.add_argument("--pairs", default=os.getenv("TC_CRYPTO", "BTC/USDC,ETH/USDC"))
+    ap.add_argument(
+        "--engine", choices=("fast", "reference"), default="fast", help="trade engine"
+    )
+    ap.add_argument(
+        "--bars",
+        type=int,
+        default=0,
+        help="benchmark: simulate N synthetic bars offline and exit",
+    )
     args = ap.parse_args()
 
+    if args.bars:
+        benchmark(args.bars, args.tf)
+        return
+
     pairs = [s.strip() for s in str(args.pairs).split(",") if s.strip()]
     for p in pairs:
         res = run_bt(
@@ -266,6 +547,7 @@ def main():
             ex_name=str(args.exchange).lower(),
             total_bars=args.limit,
             fee_bps=args.fee_bps,
+            engine=args.engine,
         )
         print(res)
 
@@ -13,7 +13,7 @@ Responsibilities:
 import logging
 import os
 
-import requests
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 logger = logging.getLogger("hybrid_ai_trading.data.clients.alpaca_client")
 
@@ -60,7 +60,9 @@ class AlpacaClient:
         """Perform HTTP request and return JSON, raising AlpacaAPIError on failure."""
         url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
         try:
-            resp = requests.request(method, url, headers=self._headers(), **kwargs)
+            resp = shared_transport().request(
+                method, url, headers=self._headers(), **kwargs
+            )
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
@@ -9,7 +9,7 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
-import requests
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 logger = logging.getLogger("hybrid_ai_trading.data.clients.alpaca_news_client")
 
@@ -44,7 +44,7 @@ class AlpacaNewsClient:
             "APCA-API-SECRET-KEY": self.secret_key,
         }
         try:
-            r = requests.get(url, params=params, headers=headers, timeout=15)
+            r = shared_transport().get(url, params=params, headers=headers, timeout=15)
             r.raise_for_status()
             data = r.json()
         except Exception as e:
@@ -7,6 +7,8 @@ from typing import Any, Dict, Iterable, List, Optional, Union
 
 import requests
 
+from hybrid_ai_trading.utils.http_transport import shared_transport
+
 
 class BenzingaAPIError(RuntimeError):
     """Unified wrapper error for Benzinga client failures."""
@@ -96,7 +98,8 @@ class BenzingaClient:
     Notes:
     - API key resolution precedence: api_key arg > BENZINGA_KEY > BENZINGA_API_KEY.
     - Keeps exact param names date_from/date_to.
-    - Uses requests.get (not a Session) so tests can monkeypatch requests.get.
+    - Uses the shared pooled transport; test doubles patch
+      shared_transport().session.
     - JSON:
         * list -> returns the list as-is
         * dict with 'data' -> returns list in 'data' (or wraps dict to [dict])
@@ -161,8 +164,10 @@ class BenzingaClient:
                 params[k] = v
 
         try:
-            # honor tests' monkeypatch of requests.get
-            resp = requests.get(self.base_url, params=params, timeout=self.timeout_sec)
+            # pooled session (tests patch shared_transport().session.get)
+            resp = shared_transport().get(
+                self.base_url, params=params, timeout=self.timeout_sec
+            )
 
             ctype = (resp.headers.get("content-type") or "").lower()
             # XML path (return list of items)
@@ -5,7 +5,7 @@ CoinAPI Client (Hybrid AI Quant Pro v1.4 ÃƒÆ’Ã‚Â¢ÃƒÂ¢Ã¢â‚¬Å
 -------------------------------------------------------------------------------
 Exports:
 - _iso, parse_symbol, coinapi_symbol
-- _get_headers(load_config/env/stub), _retry_get(requests.get w/ retry+stub)
+- _get_headers(load_config/env/stub), _retry_get(pooled GET w/ retry+stub)
 - http_get (typed exceptions)
 - get_ohlcv, get_ohlcv_latest (module-level wrapper), get_fx_rate (module), ping (module)
 - batch_prev_close (rich dict shape; supports STUB)
@@ -18,6 +18,13 @@ import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from hybrid_ai_trading.data.store.bar_cache import (
+    default_bar_cache,
+    frame_to_iso_rows,
+    iso_rows_to_frame,
+)
+from hybrid_ai_trading.utils.http_transport import shared_transport
+
 try:
     import requests  # type: ignore
     from requests import Response  # type: ignore
@@ -27,6 +34,7 @@ except Exception:  # pragma: no cover
 
 __all__ = [
     "_iso",
+    "iso_to_ms",
     "parse_symbol",
     "coinapi_symbol",
     "_get_headers",
@@ -206,7 +214,7 @@ def _retry_get(
     sleep_seconds: float = 0.01,
 ) -> Response:
     """
-    requests.get with retry on retry_status, using _get_headers().
+    GET (shared pooled transport) with retry on retry_status, using _get_headers().
     Stub path: if headers == {} and COINAPI_ALLOW_STUB!= "0" ÃƒÆ’Ã‚Â¢ÃƒÂ¢Ã¢â€šÂ¬Ã‚Â ÃƒÂ¢Ã¢â€šÂ¬Ã¢â€žÂ¢ return _StubResponse().
     """
     headers = _get_headers()
@@ -219,8 +227,12 @@ def _retry_get(
     last_exc: Optional[Exception] = None
     for attempt in range(max_retry + 1):
         try:
-            resp = requests.get(
-                url, headers=headers, params=params or {}, timeout=_DEFAULT_TIMEOUT
+            resp = shared_transport().get(
+                url,
+                headers=headers,
+                params=params or {},
+                timeout=_DEFAULT_TIMEOUT,
+                retry=False,  # this loop owns the retries
             )
         except Exception as e:
             last_exc = e
@@ -258,7 +270,7 @@ def http_get(
     if requests is None:  # pragma: no cover
         raise RuntimeError("requests not available")
     url = (base_url or BASE_URL).rstrip("/") + "/" + path.lstrip("/")
-    sess = session or requests.Session()
+    sess = session or shared_transport()
     try:
         resp = sess.get(
             url,
@@ -292,6 +304,12 @@ def _row_to_bar(row: Dict[str, Any]) -> Dict[str, float]:
     }
 
 
+def iso_to_ms(value: Union[str, datetime, int, float]) -> int:
+    """Epoch milliseconds (UTC) for anything _iso() accepts, at 1s precision."""
+    dt = datetime.strptime(_iso(value), "%Y-%m-%dT%H:%M:%SZ")
+    return int(dt.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
 def get_ohlcv(
     symbol: str,
     period_id: str = "1MIN",
@@ -304,9 +322,41 @@ def get_ohlcv(
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
     timeout: float = _DEFAULT_TIMEOUT,
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     base, quote = parse_symbol(symbol)
     sym_id = coinapi_symbol(exchange, base, quote)
+    cache = default_bar_cache() if use_cache else None
+    if cache is not None and time_start is not None and time_end is not None:
+
+        def fetch(s: int, e: int):
+            rows = get_ohlcv(
+                symbol,
+                period_id,
+                time_start=s / 1000.0,
+                time_end=e / 1000.0,
+                limit=100_000,
+                exchange=exchange,
+                session=session,
+                api_key=api_key,
+                base_url=base_url,
+                timeout=timeout,
+                use_cache=False,
+            )
+            return iso_rows_to_frame(rows)
+
+        df = cache.get(
+            "coinapi",
+            sym_id,
+            period_id,
+            iso_to_ms(time_start),
+            iso_to_ms(time_end),
+            fetch,
+            limit=100_000,
+        )
+        rows = frame_to_iso_rows(df)
+        return rows[: int(limit)] if limit is not None else rows
+
     params: Dict[str, Any] = {"period_id": period_id}
     if time_start is not None:
         params["time_start"] = _iso(time_start)
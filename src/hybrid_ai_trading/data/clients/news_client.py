@@ -18,10 +18,10 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import requests
 from sqlalchemy.exc import IntegrityError
 
 from hybrid_ai_trading.data.store.database import News, SessionLocal
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 # ---------------------------------------------------------------------
 # Logging
@@ -92,7 +92,7 @@ def fetch_polygon_news(
         params["ticker"] = ticker
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = shared_transport().get(url, params=params, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         results = data.get("results", [])
@@ -132,7 +132,7 @@ def fetch_benzinga_news(symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
     params: Dict[str, Any] = {"token": benzinga_key, "symbols": symbol, "limit": limit}
 
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = shared_transport().get(url, params=params, timeout=10)
         resp.raise_for_status()
         data = resp.json()
         if isinstance(data, dict):
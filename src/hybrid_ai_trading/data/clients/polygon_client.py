@@ -19,6 +19,8 @@ import logging
 import os
 from typing import Any, Dict, Optional
 
+from hybrid_ai_trading.utils.http_transport import shared_transport
+
 try:
     import requests  # type: ignore
 except Exception:  # pragma: no cover
@@ -133,7 +135,7 @@ class PolygonClient:
             if self.session is not None:
                 resp = self.session.get(url, params=q, timeout=self.timeout)
             else:
-                resp = requests.get(url, params=q, timeout=self.timeout)
+                resp = shared_transport().get(url, params=q, timeout=self.timeout)
 
             # may raise any Exception per tests
             resp.raise_for_status()
@@ -154,6 +156,15 @@ class PolygonClient:
         """Return previous-day aggregate for the ticker."""
         return self._request(f"v2/aggs/ticker/{symbol}/prev")
 
+    def get_daily_ohlcv(
+        self, symbol: str, start: str, end: str, limit: int = 50_000
+    ) -> Dict[str, Any]:
+        """Daily aggregates for [start, end] (YYYY-MM-DD), oldest first."""
+        return self._request(
+            f"v2/aggs/ticker/{symbol}/range/1/day/{start}/{end}",
+            params={"adjusted": "true", "sort": "asc", "limit": int(limit)},
+        )
+
     def ping(self) -> bool:
         try:
             _ = self.prev_close("AAPL")
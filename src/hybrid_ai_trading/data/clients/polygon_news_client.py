@@ -9,7 +9,7 @@ import logging
 import os
 from typing import Any, Dict, List, Optional, Union
 
-import requests
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 logger = logging.getLogger("hybrid_ai_trading.data.clients.polygon_news_client")
 
@@ -43,7 +43,7 @@ class PolygonNewsClient:
         if date_from:
             params["published_utc.gte"] = f"{date_from}T00:00:00Z"
         try:
-            resp = requests.get(url, params=params, timeout=15)
+            resp = shared_transport().get(url, params=params, timeout=15)
             resp.raise_for_status()
             data: Union[Dict[str, Any], List[Dict[str, Any]]] = resp.json()
         except Exception as e:
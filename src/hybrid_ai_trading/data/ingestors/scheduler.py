@@ -0,0 +1,514 @@
+"""
+Ingest Scheduler (Hybrid AI Quant Pro v1.0 - Multi-Symbol, Rate-Limited)
+------------------------------------------------------------------------
+- One service refreshes many (provider, symbol) jobs instead of one
+  run_polygon_ingestor loop per symbol
+- Each provider has its own TokenBucket sized to its request quota
+  (PROVIDER_LIMITS); a throttled provider never holds up the others
+- Each provider keeps a priority queue (heap) keyed by next-due time, so the
+  stalest symbol is always fetched first; never-fetched symbols start due
+- Jobs run on a ThreadPoolExecutor (workers <= 1 runs them inline); a
+  symbol is never queued while its own fetch is in flight
+- A failed fetch is retried with exponential backoff capped at its interval
+- metrics() reports lag (seconds since the last successful refresh),
+  overdue time, fetch/error/row counts and latency per symbol;
+  provider_metrics() reports queue depth, throttling and bucket tokens
+- ohlcv_job() turns a bar fetcher (polygon_bars, coinapi_bars, ccxt_bars)
+  into an incremental job: fetch from the high-water mark, store the new
+  bars with bulk_insert_prices
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger("hybrid_ai_trading.data.ingestors.scheduler")
+
+JobFn = Callable[[str], int]
+Bar = Dict[str, float]  # {"t": epoch ms, "o", "h", "l", "c", "v"}
+BarFetcher = Callable[[str, int, int], List[Bar]]
+
+# (requests per second, burst) per provider
+PROVIDER_LIMITS: Dict[str, Tuple[float, float]] = {
+    "polygon": (5 / 60, 5),  # free tier: 5 requests / minute
+    "coinapi": (100 / 86_400, 10),  # free tier: 100 requests / day
+    "kraken": (1.0, 1),  # public REST: about one call per second
+}
+DEFAULT_LIMIT: Tuple[float, float] = (1.0, 1)
+
+_DAY_MS = 86_400_000
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `burst`."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.clock = clock
+        self.tokens = self.burst
+        self._t = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._t:
+            self.tokens = min(self.burst, self.tokens + (now - self._t) * self.rate)
+            self._t = now
+
+    def try_acquire(self, n: float = 1.0, now: Optional[float] = None) -> float:
+        """Take `n` tokens and return 0.0, or return the seconds to wait."""
+        with self._lock:
+            now = self.clock() if now is None else now
+            self._refill(now)
+            if self.tokens >= n:
+                self.tokens -= n
+                return 0.0
+            return (n - self.tokens) / self.rate
+
+    def available(self, now: Optional[float] = None) -> float:
+        with self._lock:
+            self._refill(self.clock() if now is None else now)
+            return self.tokens
+
+
+@dataclass
+class SymbolState:
+    provider: str
+    symbol: str
+    fn: JobFn
+    interval_s: float
+    added: float
+    due: float
+    last_ok: Optional[float] = None
+    last_attempt: Optional[float] = None
+    fetches: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    rows: int = 0
+    last_rows: int = 0
+    last_latency_ms: float = 0.0
+    last_error: str = ""
+    in_flight: bool = False
+
+    def lag(self, now: float) -> float:
+        """Seconds since the last successful refresh (or since added)."""
+        return now - (self.last_ok if self.last_ok is not None else self.added)
+
+
+class IngestScheduler:
+    """Rate-limited, staleness-ordered refresh of many (provider, symbol) jobs."""
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Tuple[float, float]]] = None,
+        workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+        max_backoff_s: float = 300.0,
+    ) -> None:
+        self.limits = {**PROVIDER_LIMITS, **(limits or {})}
+        self.workers = int(workers)
+        self.clock = clock
+        self.max_backoff_s = float(max_backoff_s)
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.states: Dict[Tuple[str, str], SymbolState] = {}
+        self.throttled: Dict[str, int] = {}
+        self._heaps: Dict[str, List[Tuple[float, int, str]]] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    def add(
+        self, provider: str, symbol: str, fn: JobFn, interval_s: float = 60.0
+    ) -> None:
+        """Register a job; it is due immediately. Re-adding replaces fn/interval."""
+        now = self.clock()
+        with self._lock:
+            if provider not in self.buckets:
+                rate, burst = self.limits.get(provider, DEFAULT_LIMIT)
+                self.buckets[provider] = TokenBucket(rate, burst, self.clock)
+                self._heaps[provider] = []
+                self.throttled[provider] = 0
+            key = (provider, symbol)
+            st = self.states.get(key)
+            if st is not None:
+                st.fn, st.interval_s = fn, float(interval_s)
+                return
+            self.states[key] = SymbolState(
+                provider, symbol, fn, float(interval_s), added=now, due=now
+            )
+            heapq.heappush(self._heaps[provider], (now, next(self._seq), symbol))
+        self._wake.set()
+
+    def _push(self, st: SymbolState) -> None:
+        heapq.heappush(self._heaps[st.provider], (st.due, next(self._seq), st.symbol))
+
+    # ------------------------------------------------------------------
+    def step(self, now: Optional[float] = None) -> float:
+        """
+        Dispatch every due job whose provider has a token. Returns the
+        seconds until the next job becomes due or a token frees up (inf if
+        nothing is queued).
+        """
+        now = self.clock() if now is None else now
+        ready: List[SymbolState] = []
+        nxt = math.inf
+        with self._lock:
+            for provider, heap in self._heaps.items():
+                bucket = self.buckets[provider]
+                while heap:
+                    due, _, symbol = heap[0]
+                    if due > now:
+                        nxt = min(nxt, due)
+                        break
+                    wait = bucket.try_acquire(now=now)
+                    if wait > 0:
+                        self.throttled[provider] += 1
+                        nxt = min(nxt, now + wait)
+                        break
+                    heapq.heappop(heap)
+                    st = self.states[(provider, symbol)]
+                    st.in_flight = True
+                    st.last_attempt = now
+                    ready.append(st)
+
+        for st in ready:
+            if self.workers <= 1:
+                self._run(st)
+            else:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        self.workers, thread_name_prefix="ingest"
+                    )
+                self._pool.submit(self._run, st)
+        if ready and self.workers <= 1:
+            return 0.0  # inline jobs may have made others due
+        return max(0.0, nxt - now)
+
+    def _run(self, st: SymbolState) -> None:
+        t0 = time.perf_counter()
+        try:
+            n, err = int(st.fn(st.symbol) or 0), None
+        except Exception as exc:  # noqa: BLE001
+            n, err = 0, exc
+        latency = (time.perf_counter() - t0) * 1000.0
+        now = self.clock()
+        with self._lock:
+            st.fetches += 1
+            st.last_latency_ms = latency
+            st.in_flight = False
+            if err is None:
+                st.last_ok = now
+                st.rows += n
+                st.last_rows = n
+                st.consecutive_errors = 0
+                st.due = now + st.interval_s
+            else:
+                st.errors += 1
+                st.consecutive_errors += 1
+                st.last_error = str(err)
+                backoff = min(
+                    2.0**st.consecutive_errors, st.interval_s, self.max_backoff_s
+                )
+                st.due = now + backoff
+                logger.warning(
+                    "ingest %s %s failed (%d in a row): %s",
+                    st.provider,
+                    st.symbol,
+                    st.consecutive_errors,
+                    err,
+                )
+            self._push(st)
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    def run_forever(self, poll_s: float = 1.0) -> None:
+        """Dispatch loop until stop(); sleeps until the next due job or token."""
+        while not self._stop.is_set():
+            self._wake.clear()
+            wait = self.step()
+            if wait > 0:
+                self._wake.wait(min(wait, poll_s))
+
+    def start(self) -> "IngestScheduler":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self.run_forever, name="ingest-scheduler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop dispatching and wait for in-flight fetches to finish."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "IngestScheduler":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    def metrics(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Per-symbol rows, stalest first."""
+        now = self.clock() if now is None else now
+        with self._lock:
+            rows = [
+                {
+                    "provider": st.provider,
+                    "symbol": st.symbol,
+                    "lag_s": st.lag(now),
+                    "overdue_s": max(0.0, now - st.due),
+                    "fetches": st.fetches,
+                    "errors": st.errors,
+                    "rows": st.rows,
+                    "last_rows": st.last_rows,
+                    "last_latency_ms": st.last_latency_ms,
+                    "in_flight": st.in_flight,
+                    "last_error": st.last_error,
+                }
+                for st in self.states.values()
+            ]
+        rows.sort(key=lambda r: r["lag_s"], reverse=True)
+        return rows
+
+    def provider_metrics(self, now: Optional[float] = None) -> Dict[str, Dict]:
+        now = self.clock() if now is None else now
+        with self._lock:
+            return {
+                p: {
+                    "symbols": sum(1 for k in self.states if k[0] == p),
+                    "queued": len(heap),
+                    "due": sum(1 for d, _, _ in heap if d <= now),
+                    "throttled": self.throttled[p],
+                    "tokens": self.buckets[p].available(now),
+                }
+                for p, heap in self._heaps.items()
+            }
+
+    def log_metrics(self, top: int = 5) -> None:
+        for p, m in self.provider_metrics().items():
+            logger.info(
+                "%s: %d symbols, %d due, %d throttled",
+                p,
+                m["symbols"],
+                m["due"],
+                m["throttled"],
+            )
+        for r in self.metrics()[:top]:
+            logger.info(
+                "lag %s %s %.1fs (errors=%d)",
+                r["provider"],
+                r["symbol"],
+                r["lag_s"],
+                r["errors"],
+            )
+
+
+# ----------------------------------------------------------------------
+# Jobs: incremental OHLCV into the prices table
+# ----------------------------------------------------------------------
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _day(ms: int) -> str:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def polygon_bars(client: Any) -> BarFetcher:
+    """Daily aggregates via PolygonClient.get_daily_ohlcv."""
+
+    def fetch(symbol: str, since_ms: int, now_ms: int) -> List[Bar]:
+        data = client.get_daily_ohlcv(
+            symbol=symbol, start=_day(since_ms), end=_day(now_ms)
+        )
+        return list((data or {}).get("results") or [])
+
+    return fetch
+
+
+def coinapi_bars(period_id: str = "1DAY") -> BarFetcher:
+    """CoinAPI OHLCV history (symbol like "BTC/USD")."""
+    from hybrid_ai_trading.data.clients import coinapi_client
+
+    def fetch(symbol: str, since_ms: int, now_ms: int) -> List[Bar]:
+        rows = coinapi_client.get_ohlcv(
+            symbol,
+            period_id,
+            time_start=since_ms / 1000.0,
+            time_end=now_ms / 1000.0,
+            use_cache=False,
+        )
+        return [
+            {**r, "t": coinapi_client.iso_to_ms(r["t"])} for r in rows if r.get("t")
+        ]
+
+    return fetch
+
+
+def ccxt_bars(exchange: Any, timeframe: str = "1d") -> BarFetcher:
+    """ccxt fetch_ohlcv (e.g. ccxt.kraken()) from the high-water mark."""
+
+    def fetch(symbol: str, since_ms: int, now_ms: int) -> List[Bar]:
+        rows = exchange.fetch_ohlcv(symbol, timeframe=timeframe, since=since_ms)
+        keys = ("t", "o", "h", "l", "c", "v")
+        return [dict(zip(keys, r[:6])) for r in rows or [] if r and r[0] <= now_ms]
+
+    return fetch
+
+
+def ohlcv_job(
+    source: str,
+    fetch: BarFetcher,
+    eng: Optional[Any] = None,
+    lookback_days: int = 365,
+) -> JobFn:
+    """
+    Job storing bars newer than the (source, symbol) high-water mark;
+    the first run backfills `lookback_days`. Returns new bars stored.
+    """
+    from hybrid_ai_trading.data.store.database import (
+        bulk_insert_prices,
+        get_high_water_mark,
+    )
+
+    def job(symbol: str) -> int:
+        now = _now_ms()
+        mark = get_high_water_mark(symbol, source, eng)
+        if mark is not None:
+            since = int(mark.replace(tzinfo=timezone.utc).timestamp() * 1000)
+        else:
+            since = now - lookback_days * _DAY_MS
+        rows = []
+        for b in fetch(symbol, since, now):
+            ts = datetime.fromtimestamp(b["t"] / 1000, tz=timezone.utc)
+            naive = ts.replace(tzinfo=None)  # DateTime columns are stored naive UTC
+            if mark is not None and naive <= mark:
+                continue
+            rows.append(
+                {
+                    "timestamp": naive,
+                    "symbol": symbol,
+                    "open": b["o"],
+                    "high": b["h"],
+                    "low": b["l"],
+                    "close": b["c"],
+                    "volume": b["v"],
+                }
+            )
+        return bulk_insert_prices(rows, symbol, source, eng)
+
+    return job
+
+
+def build_scheduler(
+    universe: Mapping[str, Sequence[str]],
+    fetchers: Mapping[str, BarFetcher],
+    interval_s: float = 60.0,
+    eng: Optional[Any] = None,
+    **kwargs: Any,
+) -> IngestScheduler:
+    """IngestScheduler with one ohlcv_job per (provider, symbol) in `universe`."""
+    sched = IngestScheduler(**kwargs)
+    for provider, symbols in universe.items():
+        job = ohlcv_job(provider, fetchers[provider], eng)
+        for sym in symbols:
+            sched.add(provider, sym, job, interval_s)
+    return sched
+
+
+def _split(arg: Optional[str]) -> List[str]:
+    return [s.strip() for s in (arg or "").split(",") if s.strip()]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description="Multi-symbol OHLCV ingest service")
+    ap.add_argument("--polygon", help="comma-separated tickers, e.g. AAPL,MSFT")
+    ap.add_argument("--coinapi", help='comma-separated pairs, e.g. "BTC/USD"')
+    ap.add_argument("--kraken", help='comma-separated pairs, e.g. "ETH/USD"')
+    ap.add_argument("--interval", type=float, default=60.0)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--metrics-every", type=float, default=60.0)
+    args = ap.parse_args(argv)
+
+    from hybrid_ai_trading.data.store.database import init_db, tune_sqlite
+
+    universe: Dict[str, List[str]] = {}
+    fetchers: Dict[str, BarFetcher] = {}
+    if _split(args.polygon):
+        from hybrid_ai_trading.data.clients.polygon_client import PolygonClient
+
+        universe["polygon"] = _split(args.polygon)
+        fetchers["polygon"] = polygon_bars(PolygonClient())
+    if _split(args.coinapi):
+        universe["coinapi"] = _split(args.coinapi)
+        fetchers["coinapi"] = coinapi_bars()
+    if _split(args.kraken):
+        import ccxt
+
+        universe["kraken"] = _split(args.kraken)
+        fetchers["kraken"] = ccxt_bars(ccxt.kraken({"enableRateLimit": True}))
+    if not universe:
+        ap.error("no symbols given")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s")
+    init_db()
+    tune_sqlite()
+    sched = build_scheduler(
+        universe, fetchers, args.interval, workers=args.workers
+    ).start()
+    try:
+        while True:
+            time.sleep(args.metrics_every)
+            sched.log_metrics()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sched.stop()
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = [
+    "DEFAULT_LIMIT",
+    "IngestScheduler",
+    "PROVIDER_LIMITS",
+    "SymbolState",
+    "TokenBucket",
+    "build_scheduler",
+    "ccxt_bars",
+    "coinapi_bars",
+    "ohlcv_job",
+    "polygon_bars",
+]
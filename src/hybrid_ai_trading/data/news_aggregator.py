@@ -1,10 +1,26 @@
 """
-News Aggregator (Hybrid AI Quant Pro v2.0 Ã¢â‚¬â€œ OE Grade)
-- Combines Benzinga + Polygon + Alpaca + RSS (Google/Yahoo/extra)
-- Dedupe by URL first, then (source,id)
+News Aggregator (Hybrid AI Quant Pro v2.1 - OE Grade)
+- Combines Benzinga + Polygon + Alpaca + RSS (Google/Yahoo/extra) + Kraken/CME RSS
+- Every source, and Polygon per symbol, is fetched concurrently (asyncio over a
+  thread pool) with its own timeout: news_providers.<name>.timeout_s, default
+  HAT_NEWS_TIMEOUT_SEC. A sweep takes as long as its slowest source, not the sum
+- The pool grows to the sweep's task count and a source's timeout runs from
+  when a worker starts it, so sources are never charged for queueing
+- Results are merged in fixed provider order; dedupe by URL first, then (source,id)
+- NewsIndex remembers URL hashes + source ids with a TTL across sweeps (optionally
+  on disk via HAT_NEWS_INDEX), so sweep(new_only=True) returns only unseen stories
+- Per-source latency / item / timeout / error metrics: NewsAggregator.metrics()
 """
 
-from typing import Any, Dict, List
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -13,89 +29,408 @@ from hybrid_ai_trading.data.clients.benzinga_client import BenzingaClient
 from hybrid_ai_trading.data.clients.polygon_news_client import PolygonNewsClient
 from hybrid_ai_trading.data.clients.rss_client import RSSClient
 
+log = logging.getLogger("hybrid_ai_trading.data.news_aggregator")
 
-def aggregate_news(
-    symbols_csv: str, limit: int, date_from: str
-) -> List[Dict[str, Any]]:
+DEFAULT_TIMEOUT_S = float(os.getenv("HAT_NEWS_TIMEOUT_SEC", "5"))
+DEFAULT_TTL_S = float(os.getenv("HAT_NEWS_DEDUPE_TTL_SEC", str(48 * 3600)))
+
+# (source name, timeout seconds, blocking fetch)
+Task = Tuple[str, float, Callable[[], List[Dict[str, Any]]]]
+
+
+def _load_cfg() -> Dict[str, Any]:
     with open("config/config.yaml", "r", encoding="utf-8") as f:
         cfg = yaml.safe_load(f) or {}
-    np = cfg.get("news_providers") or {}
-    news: List[Dict[str, Any]] = []
-    seen_url = set()
-    seen_sid = set()
-
-    def add_batch(source_name: str, items: List[Dict[str, Any]]):
-        for it in items or []:
-            u = it.get("url") or ""
-            sid = f"{source_name}:{it.get('id')}"
-            if u and u in seen_url:
-                continue
-            if sid in seen_sid:
-                continue
-            seen_url.add(u) if u else None
-            seen_sid.add(sid)
-            if "source" not in it:
-                it["source"] = source_name
-            news.append(it)
-
-    # Benzinga
-    if bool((np.get("benzinga") or {}).get("enabled", True)):
+    return cfg.get("news_providers") or {}
+
+
+def story_key(source: str, item: Dict[str, Any]) -> str:
+    """Stable identity of a story: URL hash, else source id, else title hash."""
+    url = (item.get("url") or "").strip()
+    if url:
+        return "u:" + hashlib.sha1(url.encode("utf-8")).hexdigest()
+    if item.get("id") is not None:
+        return f"s:{source}:{item.get('id')}"
+    title = item.get("title") or ""
+    return f"t:{source}:" + hashlib.sha1(title.encode("utf-8")).hexdigest()
+
+
+class NewsIndex:
+    """Seen-story index (URL hash + source id -> first seen), expiring after ttl_s."""
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_s = float(ttl_s)
+        self.path = path
+        self.clock = clock
+        self._seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        if path:
+            self.load()
+
+    @staticmethod
+    def _keys(source: str, item: Dict[str, Any]) -> List[str]:
+        keys = [story_key(source, item)]
+        if keys[0].startswith("u:") and item.get("id") is not None:
+            keys.append(f"s:{source}:{item.get('id')}")
+        return keys
+
+    def _live(self, key: str, now: float) -> bool:
+        ts = self._seen.get(key)
+        return ts is not None and now - ts <= self.ttl_s
+
+    def is_new(self, source: str, item: Dict[str, Any]) -> bool:
+        now = self.clock()
+        with self._lock:
+            return not any(self._live(k, now) for k in self._keys(source, item))
+
+    def check_and_add(self, source: str, item: Dict[str, Any]) -> bool:
+        """True if the story was unseen (it is recorded either way)."""
+        now = self.clock()
+        keys = self._keys(source, item)
+        with self._lock:
+            new = not any(self._live(k, now) for k in keys)
+            for k in keys:
+                if not self._live(k, now):
+                    self._seen[k] = now
+        return new
+
+    def prune(self, force: bool = False) -> int:
+        now = self.clock()
+        with self._lock:
+            if not force and now - self._last_prune < 60.0:
+                return 0
+            self._last_prune = now
+            dead = [k for k, ts in self._seen.items() if now - ts > self.ttl_s]
+            for k in dead:
+                del self._seen[k]
+        return len(dead)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def load(self) -> None:
         try:
-            bz = BenzingaClient()
-            add_batch(
-                "benzinga", bz.get_news(symbols_csv, limit=limit, date_from=date_from)
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:  # noqa: BLE001
+            log.warning("news index %s unreadable, starting empty: %s", self.path, e)
+            return
+        with self._lock:
+            self._seen.update({str(k): float(v) for k, v in data.items()})
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self._seen)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+
+class NewsAggregator:
+    def __init__(
+        self,
+        index: Optional[NewsIndex] = None,
+        workers: Optional[int] = None,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+    ) -> None:
+        self.index = (
+            index
+            if index is not None
+            else NewsIndex(path=os.getenv("HAT_NEWS_INDEX") or None)
+        )
+        self.workers = int(workers or os.getenv("HAT_NEWS_WORKERS", "16"))
+        self.timeout_s = float(timeout_s)
+        self.last_sweep: Dict[str, Any] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_size = 0
+        self._pool_lock = threading.Lock()
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._mlock = threading.Lock()
+
+    def _executor(self, size: int = 0) -> ThreadPoolExecutor:
+        """Shared fetch pool with at least max(workers, size) threads."""
+        with self._pool_lock:
+            size = max(self.workers, size)
+            if self._pool is None or self._pool_size < size:
+                old = self._pool
+                self._pool = ThreadPoolExecutor(size, thread_name_prefix="news-fetch")
+                self._pool_size = size
+                if old is not None:  # running fetches finish on their own
+                    old.shutdown(wait=False)
+            return self._pool
+
+    # ------------------------------------------------------------------
+    def _tasks(
+        self, np: Dict[str, Any], symbols_csv: str, limit: int, date_from: str
+    ) -> List[Task]:
+        """One task per source (per symbol for Polygon), in merge order."""
+
+        def timeout(name: str) -> float:
+            return float((np.get(name) or {}).get("timeout_s", self.timeout_s))
+
+        def enabled(name: str, default: bool) -> bool:
+            return bool((np.get(name) or {}).get("enabled", default))
+
+        tasks: List[Task] = []
+        if enabled("benzinga", True):
+            tasks.append(
+                (
+                    "benzinga",
+                    timeout("benzinga"),
+                    lambda: BenzingaClient().get_news(
+                        symbols_csv, limit=limit, date_from=date_from
+                    ),
+                )
             )
-        except Exception:
-            pass
 
-    # Polygon (per-symbol split tends to recall better)
-    if bool((np.get("polygon") or {}).get("enabled", True)):
-        try:
-            pg = PolygonNewsClient()
-            symbols = [s.strip().upper() for s in symbols_csv.split(",") if s.strip()]
-            per = max(3, int(round(limit / max(1, len(symbols)))))
-            for sym in symbols:
-                add_batch("polygon", pg.get_news(sym, limit=per, date_from=date_from))
-        except Exception:
-            pass
-
-    # Alpaca (single call with symbols CSV)
-    if bool((np.get("alpaca") or {}).get("enabled", False)):
-        try:
-            ap = AlpacaNewsClient()
-            add_batch(
-                "alpaca", ap.get_news(symbols_csv, limit=limit, date_from=date_from)
+        # Polygon (per-symbol split tends to recall better)
+        if enabled("polygon", True):
+            try:
+                pg = PolygonNewsClient()
+            except Exception as e:  # noqa: BLE001
+                log.debug("polygon news client unavailable: %s", e)
+                pg = None
+            if pg is not None:
+                symbols = [
+                    s.strip().upper() for s in symbols_csv.split(",") if s.strip()
+                ]
+                per = max(3, int(round(limit / max(1, len(symbols)))))
+                for sym in symbols:
+                    tasks.append(
+                        (
+                            "polygon",
+                            timeout("polygon"),
+                            lambda sym=sym: pg.get_news(
+                                sym, limit=per, date_from=date_from
+                            ),
+                        )
+                    )
+
+        # Alpaca (single call with symbols CSV)
+        if enabled("alpaca", False):
+            tasks.append(
+                (
+                    "alpaca",
+                    timeout("alpaca"),
+                    lambda: AlpacaNewsClient().get_news(
+                        symbols_csv, limit=limit, date_from=date_from
+                    ),
+                )
+            )
+
+        # RSS bundle
+        rss_cfg = np.get("rss") or {}
+        if enabled("rss", True):
+            tasks.append(
+                (
+                    "rss",
+                    timeout("rss"),
+                    lambda: RSSClient(
+                        google_template=rss_cfg.get("google_template"),
+                        yahoo_template=rss_cfg.get("yahoo_template"),
+                        extra_feeds=rss_cfg.get("extra_feeds") or [],
+                        per_feed_max=int(rss_cfg.get("per_feed_max", 8)),
+                    ).get_news(symbols_csv, date_from=date_from),
+                )
             )
-        except Exception:
-            pass
 
-    # RSS bundle
-    rss_cfg = np.get("rss") or {}
-    if bool(rss_cfg.get("enabled", True)):
+        for name in ("kraken_rss", "cme_rss"):
+            if enabled(name, False):
+                feeds = (np.get(name) or {}).get("feeds") or []
+                tasks.append(
+                    (
+                        name,
+                        timeout(name),
+                        lambda feeds=feeds: RSSClient(
+                            google_template=None,
+                            yahoo_template=None,
+                            extra_feeds=feeds,
+                            per_feed_max=10,
+                        ).get_news("", date_from=date_from),
+                    )
+                )
+        return tasks
+
+    def _observe(self, name: str, ms: float, status: str, items: int) -> None:
+        with self._mlock:
+            m = self._metrics.setdefault(
+                name,
+                {
+                    "calls": 0,
+                    "ok": 0,
+                    "timeouts": 0,
+                    "errors": 0,
+                    "items": 0,
+                    "new": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "last_ms": 0.0,
+                },
+            )
+            m["calls"] += 1
+            m[{"ok": "ok", "timeout": "timeouts"}.get(status, "errors")] += 1
+            m["items"] += items
+            m["total_ms"] += ms
+            m["max_ms"] = max(m["max_ms"], ms)
+            m["last_ms"] = ms
+
+    async def _run(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        pool: ThreadPoolExecutor,
+        task: Task,
+    ) -> List[Dict[str, Any]]:
+        name, timeout, fn = task
+        started: List[float] = []
+
+        def job() -> List[Dict[str, Any]]:
+            started.append(time.perf_counter())  # no syscall ahead of fn()
+            return fn()
+
+        t0 = time.perf_counter()
+        items: List[Dict[str, Any]] = []
+        fut = loop.run_in_executor(pool, job)
         try:
-            client = RSSClient(
-                google_template=rss_cfg.get("google_template"),
-                yahoo_template=rss_cfg.get("yahoo_template"),
-                extra_feeds=rss_cfg.get("extra_feeds") or [],
-                per_feed_max=int(rss_cfg.get("per_feed_max", 8)),
+            # a job stuck behind busy workers for a whole timeout gives up
+            # unstarted; otherwise the deadline runs from its start
+            done, _ = await asyncio.wait({fut}, timeout=timeout)
+            if not done and started:
+                rest = started[0] + timeout - time.perf_counter()
+                done, _ = await asyncio.wait({fut}, timeout=max(0.0, rest))
+            if started:
+                t0 = started[0]
+            if not done:
+                raise asyncio.TimeoutError
+            items = fut.result() or []
+            status = "ok"
+        except asyncio.TimeoutError:
+            fut.cancel()  # drops the job if it never started
+            status = "timeout"
+            log.warning(
+                "news source %s timed out after %.1fs%s",
+                name,
+                timeout,
+                "" if started else " (never started)",
             )
-            add_batch("rss", client.get_news(symbols_csv, date_from=date_from))
-        except Exception:
-            pass
-
-    # TODO: kraken_rss / cme_rss  enable easily if desired
-    for name in ("kraken_rss", "cme_rss"):
-        cfgx = np.get(name) or {}
-        if bool(cfgx.get("enabled", False)):
+        except Exception as e:  # noqa: BLE001
+            status = "error"
+            log.debug("news source %s failed: %s", name, e)
+        self._observe(name, (time.perf_counter() - t0) * 1000.0, status, len(items))
+        return items
+
+    def _merge(
+        self, tasks: List[Task], results: List[List[Dict[str, Any]]], new_only: bool
+    ) -> List[Dict[str, Any]]:
+        news: List[Dict[str, Any]] = []
+        seen_url = set()
+        seen_sid = set()
+        fresh: Dict[str, int] = {}
+        for (source_name, _, _), items in zip(tasks, results):
+            for it in items or []:
+                u = it.get("url") or ""
+                sid = f"{source_name}:{it.get('id')}"
+                if u and u in seen_url:
+                    continue
+                if sid in seen_sid:
+                    continue
+                seen_url.add(u) if u else None
+                seen_sid.add(sid)
+                if "source" not in it:
+                    it["source"] = source_name
+                new = self.index.check_and_add(source_name, it)
+                if new:
+                    fresh[source_name] = fresh.get(source_name, 0) + 1
+                elif new_only:
+                    continue
+                news.append(it)
+        with self._mlock:
+            for name, n in fresh.items():
+                self._metrics[name]["new"] += n
+        self.last_sweep["new"] = sum(fresh.values())
+        self.index.prune()
+        if self.index.path:
             try:
-                client = RSSClient(
-                    google_template=None,
-                    yahoo_template=None,
-                    extra_feeds=cfgx.get("feeds") or [],
-                    per_feed_max=10,
-                )
-                add_batch(name, client.get_news("", date_from=date_from))
-            except Exception:
-                pass
+                self.index.save()
+            except OSError as e:
+                log.warning("news index save failed: %s", e)
+        return news
+
+    # ------------------------------------------------------------------
+    async def sweep_async(
+        self, symbols_csv: str, limit: int, date_from: str, new_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Fetch all enabled sources concurrently; deduped stories in source order.
+
+        new_only=True drops stories already in the index from earlier sweeps.
+        """
+        t0 = time.perf_counter()
+        tasks = self._tasks(_load_cfg(), symbols_csv, limit, date_from)
+        loop = asyncio.get_running_loop()
+        pool = self._executor(len(tasks))
+        results = await asyncio.gather(*(self._run(loop, pool, t) for t in tasks))
+        self.last_sweep = {"tasks": len(tasks)}
+        news = self._merge(tasks, list(results), new_only)
+        self.last_sweep.update(
+            {
+                "stories": len(news),
+                "elapsed_ms": (time.perf_counter() - t0) * 1000.0,
+            }
+        )
+        return news
 
-    return news
+    def sweep(
+        self, symbols_csv: str, limit: int, date_from: str, new_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        coro = self.sweep_async(symbols_csv, limit, date_from, new_only)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # called from inside an event loop: run the sweep on a helper thread
+        with ThreadPoolExecutor(1) as ex:
+            return ex.submit(asyncio.run, coro).result()
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-source counters plus avg_ms; slowest average first."""
+        with self._mlock:
+            out = {
+                name: {**m, "avg_ms": m["total_ms"] / m["calls"] if m["calls"] else 0.0}
+                for name, m in self._metrics.items()
+            }
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["avg_ms"]))
+
+
+_DEFAULT: Optional[NewsAggregator] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_aggregator() -> NewsAggregator:
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = NewsAggregator()
+        return _DEFAULT
+
+
+def aggregate_news(
+    symbols_csv: str, limit: int, date_from: str
+) -> List[Dict[str, Any]]:
+    return default_aggregator().sweep(symbols_csv, limit, date_from)
+
+
+async def aggregate_news_async(
+    symbols_csv: str, limit: int, date_from: str
+) -> List[Dict[str, Any]]:
+    return await default_aggregator().sweep_async(symbols_csv, limit, date_from)
@@ -0,0 +1,304 @@
+"""
+Bar Cache (Hybrid AI Quant Pro v1.0 - Gap-Filling OHLCV Cache)
+-------------------------------------------------------------
+- One Parquet file per (provider, symbol, timeframe):
+  {root}/{provider}/{symbol}/{timeframe}.parquet, bars keyed by `ts`
+  (epoch ms, bar open time)
+- The file's schema metadata records the covered [start, end) ranges, so
+  empty stretches (weekends, halts) count as fetched too
+- get() fetches only the parts of the requested range that are not covered
+  (head, tail and inner holes), merges them in and serves the rest from disk
+- The bar that is still forming (at or after the start of the current bar)
+  is never marked covered, so it is refetched on every call
+- A failing fetch leaves its gap uncovered and get() returns what is cached,
+  which keeps reruns working offline
+- With `limit` (the provider's per-request row cap) a response that hits the
+  cap only covers up to its last bar; the rest of the gap is fetched again
+  from there, so a truncated page never marks missing bars as fetched
+- default_bar_cache() is the shared instance the fetch paths use; it is
+  enabled by setting HAT_BAR_CACHE to a directory
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger("hybrid_ai_trading.data.store.bar_cache")
+
+Range = Tuple[int, int]
+Fetcher = Callable[[int, int], pd.DataFrame]
+
+OHLCV = ["ts", "open", "high", "low", "close", "volume"]
+_META_KEY = b"hat_ranges"
+
+_UNITS = {
+    "s": 1_000,
+    "sec": 1_000,
+    "second": 1_000,
+    "m": 60_000,
+    "min": 60_000,
+    "minute": 60_000,
+    "h": 3_600_000,
+    "hr": 3_600_000,
+    "hrs": 3_600_000,
+    "hour": 3_600_000,
+    "d": 86_400_000,
+    "day": 86_400_000,
+    "w": 604_800_000,
+    "week": 604_800_000,
+}
+
+
+def timeframe_ms(tf: str) -> int:
+    """Bar length in ms for ccxt ("5m", "1h"), CoinAPI ("1MIN") or Polygon ("5/minute")."""
+    m = re.fullmatch(r"\s*(\d+)\s*/?\s*([A-Za-z]+)\s*", str(tf))
+    if not m:
+        raise ValueError(f"unrecognized timeframe: {tf!r}")
+    n, unit = int(m.group(1)), m.group(2)
+    if unit == "M" or unit.lower().startswith(("mth", "month")):
+        raise ValueError(f"calendar-month timeframes are not cacheable: {tf!r}")
+    key = unit.lower().rstrip("s") if unit.lower() not in _UNITS else unit.lower()
+    if key not in _UNITS:
+        raise ValueError(f"unrecognized timeframe unit: {tf!r}")
+    return n * _UNITS[key]
+
+
+def merge_ranges(ranges: Sequence[Range]) -> List[Range]:
+    out: List[List[int]] = []
+    for s, e in sorted(r for r in ranges if r[1] > r[0]):
+        if out and s <= out[-1][1]:
+            out[-1][1] = max(out[-1][1], e)
+        else:
+            out.append([s, e])
+    return [(s, e) for s, e in out]
+
+
+def missing_ranges(covered: Sequence[Range], start: int, end: int) -> List[Range]:
+    """Parts of [start, end) not inside any covered range."""
+    gaps, cur = [], start
+    for s, e in merge_ranges(covered):
+        if e <= cur:
+            continue
+        if s >= end:
+            break
+        if s > cur:
+            gaps.append((cur, s))
+        cur = max(cur, e)
+    if cur < end:
+        gaps.append((cur, end))
+    return gaps
+
+
+class BarCache:
+    def __init__(self, root: str | Path = "data/bar_cache") -> None:
+        self.root = Path(root)
+        self._mem: Dict[Path, Tuple[int, pd.DataFrame, List[Range]]] = {}
+        self.fetches = 0
+        self.hits = 0
+
+    def path(self, provider: str, symbol: str, timeframe: str) -> Path:
+        safe = re.sub(r"[^A-Za-z0-9._-]", "-", symbol)
+        return self.root / provider / safe / f"{timeframe.replace('/', '-')}.parquet"
+
+    # ------------------------------------------------------------------
+    def load(self, provider: str, symbol: str, timeframe: str):
+        """(bars, covered ranges) currently on disk for one key."""
+        path = self.path(provider, symbol, timeframe)
+        if not path.exists():
+            return pd.DataFrame(columns=OHLCV), []
+        mtime = path.stat().st_mtime_ns
+        hit = self._mem.get(path)
+        if hit is not None and hit[0] == mtime:
+            return hit[1], hit[2]
+        table = pq.read_table(path)
+        meta = (table.schema.metadata or {}).get(_META_KEY, b"[]")
+        ranges = [tuple(r) for r in json.loads(meta)]
+        df = table.to_pandas()
+        self._mem[path] = (mtime, df, ranges)
+        return df, ranges
+
+    def _store(self, path: Path, df: pd.DataFrame, ranges: List[Range]) -> None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        meta = {**(table.schema.metadata or {}), _META_KEY: json.dumps(ranges).encode()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        pq.write_table(table.replace_schema_metadata(meta), tmp)
+        os.replace(tmp, path)
+        self._mem[path] = (path.stat().st_mtime_ns, df, ranges)
+
+    # ------------------------------------------------------------------
+    def get(
+        self,
+        provider: str,
+        symbol: str,
+        timeframe: str,
+        start_ms: int,
+        end_ms: int,
+        fetch: Fetcher,
+        now_ms: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Bars with start_ms <= ts < end_ms. `fetch(s, e)` must return every
+        bar in [s, e) as a frame with an int `ts` (ms) column, or raise;
+        when it returns `limit` or more rows it is treated as truncated and
+        called again from the bar after the last one returned.
+        """
+        tf_ms = timeframe_ms(timeframe)
+        now_ms = int(time.time() * 1000) if now_ms is None else int(now_ms)
+        settled = (now_ms // tf_ms) * tf_ms  # open time of the forming bar
+        start_ms = (int(start_ms) // tf_ms) * tf_ms
+
+        df, ranges = self.load(provider, symbol, timeframe)
+        gaps = missing_ranges(ranges, start_ms, int(end_ms))
+        if not gaps:
+            self.hits += 1
+        new_frames, new_ranges = [], []
+        for s, e in gaps:
+            while s < e:
+                try:
+                    got = fetch(s, e)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "bar fetch failed %s %s %s [%d, %d): %s",
+                        provider,
+                        symbol,
+                        timeframe,
+                        s,
+                        e,
+                        exc,
+                    )
+                    break
+                self.fetches += 1
+                upto = e
+                if got is not None and len(got):
+                    new_frames.append(got)
+                    if limit is not None and len(got) >= limit:
+                        upto = min(e, int(got["ts"].max()) + tf_ms)
+                if min(upto, settled) > s:
+                    new_ranges.append((s, min(upto, settled)))
+                if upto <= s:  # capped page made no progress
+                    break
+                s = upto
+
+        if new_frames:
+            df = pd.concat(
+                [df] + new_frames if len(df) else new_frames, ignore_index=True
+            )
+            df["ts"] = df["ts"].astype("int64")
+            df = (
+                df.drop_duplicates("ts", keep="last")
+                .sort_values("ts", kind="stable")
+                .reset_index(drop=True)
+            )
+        if new_frames or new_ranges:
+            ranges = merge_ranges(list(ranges) + new_ranges)
+            self._store(self.path(provider, symbol, timeframe), df, ranges)
+
+        if not len(df):
+            return df
+        ts = df["ts"].to_numpy()
+        lo, hi = ts.searchsorted(start_ms), ts.searchsorted(int(end_ms))
+        return df.iloc[lo:hi].reset_index(drop=True)
+
+
+_DEFAULT: Dict[str, BarCache] = {}
+
+
+def default_bar_cache() -> Optional[BarCache]:
+    """Shared BarCache under $HAT_BAR_CACHE, or None when caching is off."""
+    root = os.getenv("HAT_BAR_CACHE")
+    if not root:
+        return None
+    if root not in _DEFAULT:
+        _DEFAULT[root] = BarCache(root)
+    return _DEFAULT[root]
+
+
+# ----------------------------------------------------------------------
+# Row-format adapters
+# ----------------------------------------------------------------------
+def ccxt_rows_to_frame(rows: Sequence[Sequence[Any]]) -> pd.DataFrame:
+    """ccxt [ts, o, h, l, c, v] rows -> cache frame."""
+    df = pd.DataFrame([list(r[:6]) for r in rows if r], columns=OHLCV)
+    df["ts"] = df["ts"].astype("int64")
+    return df
+
+
+def frame_to_ccxt_rows(df: pd.DataFrame) -> List[List[float]]:
+    return [
+        [int(t), *vals]
+        for t, *vals in zip(
+            df["ts"].tolist(),
+            *(df[c].tolist() for c in ("open", "high", "low", "close", "volume")),
+        )
+    ]
+
+
+def polygon_rows_to_frame(rows: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """Polygon aggregate dicts ({"t": ms, "o", "h", ...}) -> cache frame."""
+    df = pd.DataFrame(list(rows))
+    if "t" not in df:
+        return pd.DataFrame(columns=["ts"])
+    return df.rename(columns={"t": "ts"}).astype({"ts": "int64"})
+
+
+def frame_to_polygon_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    out = df.rename(columns={"ts": "t"}).to_dict("records")
+    return [{k: v for k, v in r.items() if v == v} for r in out]  # drop NaN
+
+
+def iso_rows_to_frame(rows: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """Bars with an ISO time under "t" (CoinAPI client shape) -> cache frame."""
+    df = pd.DataFrame(list(rows))
+    if "t" not in df:
+        return pd.DataFrame(columns=["ts"])
+    ts = pd.to_datetime(df.pop("t"), utc=True, errors="coerce")
+    df.insert(0, "ts", ts.astype("int64") // 1_000_000)
+    return df[ts.notna().to_numpy()]
+
+
+def frame_to_iso_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    t = pd.to_datetime(df["ts"], unit="ms", utc=True).dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (
+        df.drop(columns="ts")
+        .assign(t=t)[["t"] + [c for c in df.columns if c != "ts"]]
+        .to_dict("records")
+    )
+
+
+def day_ms(day: str) -> int:
+    """Epoch ms of a YYYY-MM-DD date at 00:00 UTC."""
+    return int(pd.Timestamp(day, tz="UTC").value // 1_000_000)
+
+
+def ms_day(ms: int) -> str:
+    return pd.Timestamp(int(ms), unit="ms", tz="UTC").strftime("%Y-%m-%d")
+
+
+__all__ = [
+    "BarCache",
+    "OHLCV",
+    "ccxt_rows_to_frame",
+    "day_ms",
+    "default_bar_cache",
+    "frame_to_ccxt_rows",
+    "frame_to_iso_rows",
+    "frame_to_polygon_rows",
+    "iso_rows_to_frame",
+    "merge_ranges",
+    "missing_ranges",
+    "ms_day",
+    "polygon_rows_to_frame",
+    "timeframe_ms",
+]
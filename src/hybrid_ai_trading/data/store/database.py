@@ -6,10 +6,14 @@ Responsibilities:
 - Provide SQLAlchemy session management
 - Ensure DB initializes cleanly
 - Handle duplicates safely
+- Bulk price ingestion: one transaction per batch, ON CONFLICT DO NOTHING,
+  per-symbol high-water marks, SQLite WAL + tuned pragmas
 """
 
 import logging
 import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy import (
     Column,
@@ -21,7 +25,11 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     create_engine,
+    event,
+    select,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from hybrid_ai_trading.config.settings import PROJECT_ROOT
@@ -80,6 +88,104 @@ class News(Base):
     symbols = Column(Text)
 
 
+class IngestState(Base):
+    """Per-source, per-symbol high-water mark (newest stored bar timestamp)."""
+
+    __tablename__ = "ingest_state"
+
+    source = Column(String(20), primary_key=True)
+    symbol = Column(String(20), primary_key=True)
+    last_ts = Column(DateTime)
+
+
+# ---------------------------
+# SQLite tuning + bulk ingestion
+# ---------------------------
+
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),  # readers do not block the ingestor
+    ("synchronous", "NORMAL"),  # fsync at checkpoints only; safe with WAL
+    ("temp_store", "MEMORY"),
+    ("cache_size", -65536),  # 64 MiB page cache
+    ("busy_timeout", 5000),
+)
+
+
+def _set_pragmas(dbapi_conn, _record) -> None:
+    cur = dbapi_conn.cursor()
+    for name, value in SQLITE_PRAGMAS:
+        cur.execute(f"PRAGMA {name}={value}")
+    cur.close()
+
+
+def tune_sqlite(eng: Optional[Engine] = None) -> Engine:
+    """Apply SQLITE_PRAGMAS to every new connection of `eng` (idempotent)."""
+    eng = eng if eng is not None else engine
+    if eng.dialect.name != "sqlite" or event.contains(eng, "connect", _set_pragmas):
+        return eng
+    event.listen(eng, "connect", _set_pragmas)
+    eng.dispose()  # pooled connections pick up the pragmas on reconnect
+    return eng
+
+
+def get_high_water_mark(
+    symbol: str, source: str = "polygon", eng: Optional[Engine] = None
+) -> Optional[datetime]:
+    """Timestamp of the newest bar stored for (source, symbol), if any."""
+    eng = eng if eng is not None else engine
+    t = IngestState.__table__
+    with eng.connect() as conn:
+        return conn.execute(
+            select(t.c.last_ts).where(t.c.source == source, t.c.symbol == symbol)
+        ).scalar()
+
+
+def insert_new_prices(
+    rows: Sequence[Dict[str, Any]],
+    symbol: str,
+    source: str = "polygon",
+    eng: Optional[Engine] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Insert price rows (dicts of Price columns) for one symbol in a single
+    transaction: executemany INSERT ... ON CONFLICT(timestamp, symbol) DO
+    NOTHING RETURNING timestamp, then advance the symbol's high-water mark.
+    Returns the rows that were actually inserted (duplicates are dropped).
+    """
+    if not rows:
+        return []
+    eng = eng if eng is not None else engine
+    ins = (
+        sqlite_insert(Price.__table__)
+        .on_conflict_do_nothing(index_elements=["timestamp", "symbol"])
+        .returning(Price.__table__.c.timestamp)
+    )
+    newest = max(r["timestamp"] for r in rows)
+    mark = sqlite_insert(IngestState.__table__).values(
+        source=source, symbol=symbol, last_ts=newest
+    )
+    mark = mark.on_conflict_do_update(
+        index_elements=["source", "symbol"],
+        set_={"last_ts": mark.excluded.last_ts},
+        where=(IngestState.__table__.c.last_ts < mark.excluded.last_ts)
+        | IngestState.__table__.c.last_ts.is_(None),
+    )
+    with eng.begin() as conn:
+        inserted = {r[0] for r in conn.execute(ins, list(rows))}
+        conn.execute(mark)
+    return [r for r in rows if r["timestamp"] in inserted]
+
+
+def bulk_insert_prices(
+    rows: Sequence[Dict[str, Any]],
+    symbol: str,
+    source: str = "polygon",
+    eng: Optional[Engine] = None,
+) -> int:
+    """insert_new_prices(); returns the number of rows actually inserted."""
+    return len(insert_new_prices(rows, symbol, source, eng))
+
+
 # ---------------------------
 # Init
 # ---------------------------
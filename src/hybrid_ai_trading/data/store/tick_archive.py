@@ -0,0 +1,417 @@
+"""
+Tick Archive (Hybrid AI Quant Pro v1.0 - Memory-Mapped Binary Ticks)
+-------------------------------------------------------------------
+- One file per symbol per UTC day: {root}/{SYMBOL}/{YYYYMMDD}.tick
+- Layout: 128-byte header | int64 time index | packed TICK_DTYPE records
+  (ts_ns, bid, ask, last, bid_size, ask_size, last_size), sorted by ts_ns
+- The time index holds every `stride`-th ts_ns, so a time-range lookup is a
+  search over the small index plus one block of records
+- Readers get np.memmap structured arrays; slicing a time range returns a
+  view of the mapping (no parsing, no copy)
+- Converters load MarketLogger CSVs ({symbol}_ticks.csv) and FeatureStore
+  Parquet quotes; naive timestamps are taken as UTC
+
+CLI:
+    python -m hybrid_ai_trading.data.store.tick_archive convert FILE... --root DIR
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("hybrid_ai_trading.data.store.tick_archive")
+
+TICK_DTYPE = np.dtype(
+    [
+        ("ts_ns", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+        ("bid_size", "<i4"),
+        ("ask_size", "<i4"),
+        ("last_size", "<i4"),
+    ]
+)
+
+MAGIC = b"HATTICK1"
+VERSION = 1
+HEADER_SIZE = 128
+DEFAULT_STRIDE = 4096
+# magic, version, record size, stride, count, index entries, data offset,
+# first ts, last ts, symbol
+_HEADER = struct.Struct("<8sHHIQQQqq16s")
+
+_ALIASES = {
+    "ts": "ts_ns",
+    "timestamp": "ts_ns",
+    "time": "ts_ns",
+    "price": "last",
+    "bidsize": "bid_size",
+    "asksize": "ask_size",
+    "lastsize": "last_size",
+}
+
+TimeLike = Any  # ns int, datetime, pd.Timestamp or string
+
+
+class TickArchiveError(ValueError):
+    """Corrupt or incompatible archive file."""
+
+
+# ----------------------------------------------------------------------
+# Single-file format
+# ----------------------------------------------------------------------
+def write_tick_file(
+    path: str | Path,
+    records: np.ndarray,
+    symbol: str = "",
+    stride: int = DEFAULT_STRIDE,
+) -> Path:
+    """Write records (sorted here by ts_ns, stable) to one .tick file atomically."""
+    path = Path(path)
+    recs = np.asarray(records, dtype=TICK_DTYPE)
+    recs = recs[np.argsort(recs["ts_ns"], kind="stable")]
+    index = np.ascontiguousarray(recs["ts_ns"][::stride])
+    data_offset = -(-(HEADER_SIZE + index.nbytes) // 64) * 64
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        TICK_DTYPE.itemsize,
+        stride,
+        len(recs),
+        len(index),
+        data_offset,
+        int(recs["ts_ns"][0]) if len(recs) else 0,
+        int(recs["ts_ns"][-1]) if len(recs) else 0,
+        _symbol_bytes(symbol),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(header.ljust(HEADER_SIZE, b"\0"))
+        fh.write(index.tobytes())
+        fh.write(b"\0" * (data_offset - HEADER_SIZE - index.nbytes))
+        fh.write(recs.tobytes())
+    os.replace(tmp, path)
+    return path
+
+
+def _symbol_bytes(symbol: str) -> bytes:
+    """UTF-8 symbol cut to the 16-byte header field on a character boundary."""
+    raw = symbol.encode("utf-8")[:16]
+    return raw.decode("utf-8", "ignore").encode("utf-8")
+
+
+def _dedupe(recs: np.ndarray) -> np.ndarray:
+    """Sort by ts_ns (stable) and drop byte-identical records, first one wins."""
+    recs = recs[np.argsort(recs["ts_ns"], kind="stable")]
+    raw = np.ascontiguousarray(recs).view(f"V{TICK_DTYPE.itemsize}")
+    _, first = np.unique(raw, return_index=True)
+    return recs[np.sort(first)]
+
+
+class TickFile:
+    """A read-only memory-mapped .tick file."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.mtime_ns = self.path.stat().st_mtime_ns
+        with open(self.path, "rb") as fh:
+            raw = fh.read(HEADER_SIZE)
+        if len(raw) < _HEADER.size:
+            raise TickArchiveError(f"{self.path}: truncated header")
+        (
+            magic,
+            version,
+            rec_size,
+            self.stride,
+            self.count,
+            n_index,
+            offset,
+            self.first_ns,
+            self.last_ns,
+            sym,
+        ) = _HEADER.unpack_from(raw)
+        if magic != MAGIC or version != VERSION:
+            raise TickArchiveError(f"{self.path}: not a v{VERSION} tick file")
+        if rec_size != TICK_DTYPE.itemsize:
+            raise TickArchiveError(f"{self.path}: record size {rec_size}")
+        expected = offset + self.count * rec_size
+        if self.path.stat().st_size < expected:
+            raise TickArchiveError(f"{self.path}: truncated records")
+        self.symbol = sym.rstrip(b"\0").decode("utf-8")
+        if self.count:
+            self.index = np.memmap(
+                self.path, dtype="<i8", mode="r", offset=HEADER_SIZE, shape=(n_index,)
+            )
+            self.records = np.memmap(
+                self.path,
+                dtype=TICK_DTYPE,
+                mode="r",
+                offset=offset,
+                shape=(self.count,),
+            )
+        else:  # np.memmap cannot map zero bytes
+            self.index = np.empty(0, dtype="<i8")
+            self.records = np.empty(0, dtype=TICK_DTYPE)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _bound(self, t: int, side: str) -> int:
+        b = int(np.searchsorted(self.index, t, side=side))
+        lo = max(b - 1, 0) * self.stride
+        hi = min(b * self.stride, self.count) if b < len(self.index) else self.count
+        ts = self.records["ts_ns"][lo:hi]
+        return lo + int(np.searchsorted(ts, t, side=side))
+
+    def slice(
+        self, start: Optional[TimeLike] = None, end: Optional[TimeLike] = None
+    ) -> np.ndarray:
+        """Records with start <= ts < end, as a view of the mapping."""
+        lo = 0 if start is None else self._bound(to_ns(start), "left")
+        hi = self.count if end is None else self._bound(to_ns(end), "left")
+        return self.records[lo : max(lo, hi)]
+
+
+# ----------------------------------------------------------------------
+# Archive (symbol/day partitioned)
+# ----------------------------------------------------------------------
+class TickArchive:
+    def __init__(self, root: str | Path = "data/ticks", stride: int = DEFAULT_STRIDE):
+        self.root = Path(root)
+        self.stride = stride
+        self._open: Dict[Path, TickFile] = {}
+
+    def path(self, symbol: str, day: str) -> Path:
+        return self.root / symbol / f"{day}.tick"
+
+    def symbols(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def days(self, symbol: str) -> List[str]:
+        return sorted(p.stem for p in (self.root / symbol).glob("*.tick"))
+
+    def open(self, symbol: str, day: str) -> TickFile:
+        path = self.path(symbol, day)
+        mtime = path.stat().st_mtime_ns
+        tf = self._open.get(path)
+        if tf is None or tf.mtime_ns != mtime:  # remap after a rewrite
+            tf = self._open[path] = TickFile(path)
+        return tf
+
+    def write(self, symbol: str, records: np.ndarray) -> List[Path]:
+        """
+        Add records for one symbol, merging into any existing day files.
+
+        Exact duplicate records are dropped, so converting the same source
+        twice leaves the archive unchanged.
+        """
+        recs = np.asarray(records, dtype=TICK_DTYPE)
+        if not len(recs):
+            return []
+        days = recs["ts_ns"] // 86_400_000_000_000
+        written = []
+        for d in np.unique(days):
+            chunk = recs[days == d]
+            day = pd.Timestamp(int(d) * 86_400_000_000_000).strftime("%Y%m%d")
+            path = self.path(symbol, day)
+            if path.exists():
+                chunk = np.concatenate([np.asarray(TickFile(path).records), chunk])
+            chunk = _dedupe(chunk)
+            written.append(write_tick_file(path, chunk, symbol, self.stride))
+        return written
+
+    def slices(
+        self,
+        symbol: str,
+        start: Optional[TimeLike] = None,
+        end: Optional[TimeLike] = None,
+    ) -> Iterator[np.ndarray]:
+        """Zero-copy views, one per day file overlapping [start, end)."""
+        s = None if start is None else to_ns(start)
+        e = None if end is None else to_ns(end)
+        for day in self.days(symbol):
+            tf = self.open(symbol, day)
+            if not tf.count:
+                continue
+            if (s is not None and tf.last_ns < s) or (
+                e is not None and tf.first_ns >= e
+            ):
+                continue
+            view = tf.slice(s, e)
+            if len(view):
+                yield view
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[TimeLike] = None,
+        end: Optional[TimeLike] = None,
+    ) -> np.ndarray:
+        """Records in [start, end); a view when the range sits in one day file."""
+        parts = list(self.slices(symbol, start, end))
+        if not parts:
+            return np.empty(0, dtype=TICK_DTYPE)
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+
+# ----------------------------------------------------------------------
+# Conversion helpers
+# ----------------------------------------------------------------------
+def to_ns(t: TimeLike) -> int:
+    """Epoch nanoseconds (UTC) for an int, datetime, Timestamp or string."""
+    if isinstance(t, (int, np.integer)):
+        return int(t)
+    ts = pd.Timestamp(t)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return int(ts.value)
+
+
+def records_from_frame(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Split a tick frame into per-symbol TICK_DTYPE arrays (missing -> NaN/0)."""
+    df = df.rename(columns=lambda c: str(c).strip().lower())
+    df = df.rename(columns=_ALIASES)
+    if "ts_ns" not in df.columns:
+        raise ValueError("tick frame needs a ts/timestamp column")
+    ts = pd.to_datetime(df["ts_ns"], errors="coerce", utc=True)
+    ok = ts.notna().to_numpy()
+    recs = np.zeros(len(df), dtype=TICK_DTYPE)
+    recs["ts_ns"] = ts.dt.tz_localize(None).to_numpy("datetime64[ns]").view("i8")
+    for name in ("bid", "ask", "last"):
+        col = df[name] if name in df else pd.Series(np.nan, index=df.index)
+        recs[name] = pd.to_numeric(col, errors="coerce").to_numpy(float)
+    for name in ("bid_size", "ask_size", "last_size"):
+        if name in df:
+            recs[name] = pd.to_numeric(df[name], errors="coerce").fillna(0).to_numpy()
+    syms = (
+        df["symbol"].astype(str).to_numpy()
+        if "symbol" in df
+        else np.full(len(df), "", dtype=object)
+    )
+    recs, syms = recs[ok], syms[ok]
+    return {s: recs[syms == s] for s in pd.unique(syms)}
+
+
+def load_tick_source(path: str | Path) -> pd.DataFrame:
+    """Read a MarketLogger CSV or a FeatureStore Parquet file/partition dir."""
+    path = Path(path)
+    if path.is_dir() or path.suffix.lower() in (".parquet", ".pq"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    if "symbol" not in df.columns:
+        # {symbol}_ticks.csv / {symbol}_{day}.parquet
+        df["symbol"] = path.stem.split("_")[0]
+    return df
+
+
+def convert_files(paths: Sequence[str | Path], archive: TickArchive) -> Dict[str, int]:
+    """Convert CSV/Parquet tick files into `archive`; returns rows per symbol."""
+    counts: Dict[str, int] = {}
+    for p in paths:
+        for sym, recs in records_from_frame(load_tick_source(p)).items():
+            archive.write(sym, recs)
+            counts[sym] = counts.get(sym, 0) + len(recs)
+        logger.info("converted %s", p)
+    return counts
+
+
+# ----------------------------------------------------------------------
+# Consumers
+# ----------------------------------------------------------------------
+def tick_prices(recs: np.ndarray) -> np.ndarray:
+    """Trade price where positive, else the bid/ask mid (NaN if neither)."""
+    last = recs["last"]
+    mid = (recs["bid"] + recs["ask"]) / 2.0
+    mid = np.where((recs["bid"] > 0) & (recs["ask"] > 0), mid, np.nan)
+    return np.where(last > 0, last, mid)
+
+
+def ticks_to_bars(recs: np.ndarray, bar_ns: int = 60_000_000_000) -> pd.DataFrame:
+    """OHLCV bars from tick records (volume = sum of last_size)."""
+    cols = ["timestamp", "open", "high", "low", "close", "volume"]
+    px = tick_prices(recs)
+    ok = np.isfinite(px)
+    px, ts, vol = px[ok], recs["ts_ns"][ok], recs["last_size"][ok]
+    if not len(px):
+        return pd.DataFrame(columns=cols)
+    bucket = ts // bar_ns
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(px)]
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(bucket[starts] * bar_ns),
+            "open": px[starts],
+            "high": np.maximum.reduceat(px, starts),
+            "low": np.minimum.reduceat(px, starts),
+            "close": px[ends - 1],
+            "volume": np.add.reduceat(vol.astype(np.int64), starts),
+        },
+        columns=cols,
+    )
+
+
+def iter_snapshots(recs: np.ndarray, symbol: str) -> Iterator[Dict[str, Any]]:
+    """Snapshots in the backtest_io.row_to_snapshot shape."""
+    px = tick_prices(recs)
+    for r, p in zip(recs.tolist(), px.tolist()):
+        ts_ns, bid, ask, last = r[0], r[1], r[2], r[3]
+        yield {
+            "symbol": symbol,
+            "price": None if p != p else p,
+            "bid": None if bid != bid else bid,
+            "ask": None if ask != ask else ask,
+            "last": None if last != last else last,
+            "close": None,
+            "vwap": None,
+            "volume": float(r[6]),
+            "ts": pd.Timestamp(ts_ns).isoformat(),
+        }
+
+
+# ----------------------------------------------------------------------
+# CLI
+# ----------------------------------------------------------------------
+def main(argv: Optional[Sequence[str]] = None) -> None:  # pragma: no cover
+    ap = argparse.ArgumentParser("Tick Archive")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    conv = sub.add_parser("convert", help="CSV/Parquet tick files -> .tick archive")
+    conv.add_argument("files", nargs="+")
+    conv.add_argument("--root", default="data/ticks")
+    conv.add_argument("--stride", type=int, default=DEFAULT_STRIDE)
+    args = ap.parse_args(argv)
+    counts = convert_files(args.files, TickArchive(args.root, args.stride))
+    for sym, n in sorted(counts.items()):
+        print(f"{sym}: {n} ticks")
+
+
+__all__ = [
+    "TICK_DTYPE",
+    "TickArchive",
+    "TickArchiveError",
+    "TickFile",
+    "convert_files",
+    "iter_snapshots",
+    "load_tick_source",
+    "records_from_frame",
+    "tick_prices",
+    "ticks_to_bars",
+    "to_ns",
+    "write_tick_file",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,8 +1,7 @@
-import json
 import re
-import urllib.error
-import urllib.request
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
+
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class Client:
@@ -22,12 +21,7 @@ class Client:
         hdrs = {"X-CoinAPI-Key": self.key}
         if headers:
             hdrs.update(headers)
-        req = urllib.request.Request(url, headers=hdrs)
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as r:
-                return json.loads(r.read().decode("utf-8"))
-        except Exception as e:
-            return {"_error": f"{type(e).__name__}: {e}"}
+        return shared_transport().get_json(url, headers=hdrs, timeout=timeout)
 
     @staticmethod
     def _norm_pair(sym: str) -> Tuple[str, str]:
@@ -87,3 +81,29 @@ class Client:
             "source": "coinapi",
             "reason": j.get("_error") if isinstance(j, dict) else "http_error",
         }
+
+    def last_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk rates: one GET /v1/exchangerate/{quote}?filter_asset_id=... per
+        quote currency. Rates come back as base-per-quote, so the price is
+        1 / rate. Symbols it cannot price are left out.
+        """
+        by_quote: Dict[str, Dict[str, List[str]]] = {}
+        for sym in symbols:
+            base, quote = self._norm_pair(sym)
+            by_quote.setdefault(quote, {}).setdefault(base, []).append(sym)
+        out: Dict[str, Dict[str, Any]] = {}
+        for quote, bases in by_quote.items():
+            url = (
+                f"{self.base}/v1/exchangerate/{quote}"
+                f"?filter_asset_id={','.join(bases)}"
+            )
+            j = self._http_json(url)
+            rates = j.get("rates") if isinstance(j, dict) else None
+            for r in rates or []:
+                rate = r.get("rate")
+                if not isinstance(rate, (int, float)) or rate <= 0:
+                    continue
+                for sym in bases.get(r.get("asset_id_quote"), []):
+                    out[sym] = {"symbol": sym, "price": 1.0 / rate, "source": "coinapi"}
+        return out
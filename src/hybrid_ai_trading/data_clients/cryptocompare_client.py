@@ -1,8 +1,7 @@
-import json
 import re
-import urllib.error
-import urllib.request
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
+
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class Client:
@@ -37,11 +36,7 @@ class Client:
         return s, "USD"
 
     def _http_json(self, url: str, timeout=6) -> Dict[str, Any]:
-        try:
-            with urllib.request.urlopen(url, timeout=timeout) as r:
-                return json.loads(r.read().decode("utf-8"))
-        except Exception as e:
-            return {"_error": f"{type(e).__name__}: {e}"}
+        return shared_transport().get_json(url, timeout=timeout)
 
     def last_quote(self, symbol: str) -> Dict[str, Any]:
         base, quote = self._norm_pair(symbol)
@@ -75,3 +70,30 @@ class Client:
             "source": "cryptocompare",
             "reason": j.get("_error") if isinstance(j, dict) else "http_error",
         }
+
+    def last_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk prices: GET /data/pricemulti?fsyms=BTC,ETH&tsyms=USD,EUR
+        Symbols it cannot price are left out.
+        """
+        pairs = {sym: self._norm_pair(sym) for sym in symbols}
+        if not pairs:
+            return {}
+        fsyms = ",".join(sorted({b for b, _ in pairs.values()}))
+        tsyms = ",".join(sorted({q for _, q in pairs.values()}))
+        api_key_q = f"&api_key={self.key}" if self.key else ""
+        j = self._http_json(
+            f"{self.base}/data/pricemulti?fsyms={fsyms}&tsyms={tsyms}{api_key_q}"
+        )
+        out: Dict[str, Dict[str, Any]] = {}
+        if not isinstance(j, dict) or "_error" in j or j.get("Response") == "Error":
+            return out
+        for sym, (b, q) in pairs.items():
+            px = (j.get(b) or {}).get(q)
+            if isinstance(px, (int, float)):
+                out[sym] = {
+                    "symbol": sym,
+                    "price": float(px),
+                    "source": "cryptocompare",
+                }
+        return out
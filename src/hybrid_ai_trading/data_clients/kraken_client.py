@@ -1,8 +1,7 @@
-import json
-import urllib.error
-import urllib.request
 from typing import Any, Dict
 
+from hybrid_ai_trading.utils.http_transport import shared_transport
+
 # Minimal Kraken client for public ticker prices (no auth required).
 # Expects kwargs: base (default https://api.kraken.com)
 
@@ -41,12 +40,7 @@ class Client:
         self.base = base.rstrip("/")
 
     def _http_json(self, url: str, headers=None, timeout=6) -> Dict[str, Any]:
-        req = urllib.request.Request(url, headers=headers or {})
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as r:
-                return json.loads(r.read().decode("utf-8"))
-        except Exception as e:
-            return {"_error": f"{type(e).__name__}: {e}"}
+        return shared_transport().get_json(url, headers=headers, timeout=timeout)
 
     def last_quote(self, symbol: str) -> Dict[str, Any]:
         """
@@ -1,7 +1,6 @@
-import json
-import urllib.error
-import urllib.request
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class Client:
@@ -17,12 +16,7 @@ class Client:
         self.base = base.rstrip("/")
 
     def _http_json(self, url: str, headers=None, timeout=6) -> Dict[str, Any]:
-        req = urllib.request.Request(url, headers=headers or {})
-        try:
-            with urllib.request.urlopen(req, timeout=timeout) as r:
-                return json.loads(r.read().decode("utf-8"))
-        except Exception as e:
-            return {"_error": f"{type(e).__name__}: {e}"}
+        return shared_transport().get_json(url, headers=headers, timeout=timeout)
 
     def _pick_price(self, j: Dict[str, Any]):
         if not isinstance(j, dict):
@@ -124,3 +118,35 @@ class Client:
             "source": "polygon",
             "reason": reason or "no_price",
         }
+
+    def last_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Bulk stock snapshot: GET /v2/snapshot/locale/us/markets/stocks/tickers
+        Prices plain tickers from lastTrade, else today's / previous close;
+        symbols it cannot price are left out.
+        """
+        wanted: Dict[str, List[str]] = {}
+        for sym in symbols:
+            t = (sym or "").upper().strip()
+            if t and t.replace(".", "").isalnum():
+                wanted.setdefault(t, []).append(sym)
+        if not wanted:
+            return {}
+        url = (
+            f"{self.base}/v2/snapshot/locale/us/markets/stocks/tickers"
+            f"?tickers={','.join(wanted)}&apiKey={self.key}"
+        )
+        j = self._http_json(url)
+        out: Dict[str, Dict[str, Any]] = {}
+        for t in (j.get("tickers") or []) if isinstance(j, dict) else []:
+            for part, k in (("lastTrade", "p"), ("day", "c"), ("prevDay", "c")):
+                p = (t.get(part) or {}).get(k)
+                if isinstance(p, (int, float)) and p > 0:
+                    for sym in wanted.get(t.get("ticker"), []):
+                        out[sym] = {
+                            "symbol": sym,
+                            "price": float(p),
+                            "source": "polygon",
+                        }
+                    break
+        return out
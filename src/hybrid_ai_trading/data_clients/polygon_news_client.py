@@ -1,9 +1,8 @@
-import json
 import os
-import urllib.error
-import urllib.request
 from typing import Any, Dict, List
 
+from hybrid_ai_trading.utils.http_transport import shared_transport
+
 
 class Client:
     """
@@ -18,12 +17,7 @@ class Client:
             raise ValueError("Polygon news requires key")
 
     def _http_json(self, url: str, timeout=6):
-        try:
-            req = urllib.request.Request(url, headers={})
-            with urllib.request.urlopen(req, timeout=timeout) as r:
-                return json.loads(r.read().decode("utf-8"))
-        except Exception as e:
-            return {"_error": f"{type(e).__name__}: {e}"}
+        return shared_transport().get_json(url, timeout=timeout)
 
     def latest(self, ticker: str, limit=20) -> Dict[str, Any]:
         url = f"{self.base}/v2/reference/news?ticker={ticker}&limit={int(limit)}&apiKey={self.key}"
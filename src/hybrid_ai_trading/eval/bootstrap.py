@@ -0,0 +1,237 @@
+"""
+Bootstrap confidence intervals for trade/return metrics.
+
+- kind="pnl": per-trade PnL in currency, equity = initial_equity + cumsum
+- kind="returns": per-period simple returns, equity = cumprod(1 + r)
+- block_size=None draws i.i.d. (trade bootstrap); an int draws circular
+  moving blocks of that length (keeps autocorrelation in return series)
+- Each resample is a path of `horizon` draws (default: the input length);
+  resamples run in chunks of about `chunk_elems` draws so memory stays
+  bounded, optionally spread over a process pool.
+
+Metrics per path (same conventions as PerformanceTracker/PortfolioTracker):
+- sharpe: mean / pstdev, annualized by sqrt(periods_per_year); 0 if flat
+- max_drawdown: max (peak - equity) / peak, peak includes the start
+- calmar: total return / max_drawdown; 0 if no drawdown
+- cvar: mean of the worst ceil((1 - alpha) * horizon) draws, as a positive
+  loss (0 if that tail is not a loss)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+log = logging.getLogger("hybrid_ai_trading.eval.bootstrap")
+
+METRICS = ("sharpe", "max_drawdown", "calmar", "cvar")
+KINDS = ("pnl", "returns")
+
+
+@dataclass
+class BootstrapResult:
+    point: Dict[str, float]
+    samples: Dict[str, np.ndarray] = field(repr=False)
+    n_resamples: int = 0
+    horizon: int = 0
+    block_size: Optional[int] = None
+
+    def ci(self, level: float = 0.95) -> Dict[str, Tuple[float, float]]:
+        """Percentile confidence interval per metric."""
+        lo, hi = 50 * (1 - level), 50 * (1 + level)
+        return {
+            m: (float(np.percentile(s, lo)), float(np.percentile(s, hi)))
+            for m, s in self.samples.items()
+        }
+
+    def summary(self, level: float = 0.95) -> Dict[str, Dict[str, float]]:
+        ci = self.ci(level)
+        return {
+            m: {
+                "point": self.point[m],
+                "mean": float(self.samples[m].mean()),
+                "lo": ci[m][0],
+                "hi": ci[m][1],
+            }
+            for m in self.samples
+        }
+
+
+# ----------------------------------------------------------------------
+# Metrics over a (paths, horizon) matrix
+# ----------------------------------------------------------------------
+def path_metrics(
+    paths: np.ndarray,
+    kind: str = "pnl",
+    initial_equity: float = 100_000.0,
+    alpha: float = 0.95,
+    periods_per_year: Optional[float] = 252,
+    center: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Metrics for each row of `paths`. Rows are consumed: the matrix is
+    partially sorted in place for CVaR. `center` is a shift already
+    subtracted from the draws (keeps the one-pass variance well conditioned).
+    """
+    paths = np.atleast_2d(np.asarray(paths, dtype=float))
+    r, h = paths.shape
+
+    # Sharpe from one pass of sums on the centered draws
+    mean_c = paths.sum(axis=1) / h
+    var = np.einsum("ij,ij->i", paths, paths) / h - mean_c * mean_c
+    std = np.sqrt(np.maximum(var, 0.0))
+    mean = mean_c + center
+    scale = math.sqrt(periods_per_year) if periods_per_year else 1.0
+    tiny = 1e-12 * np.maximum(np.abs(mean), 1.0)
+    sharpe = np.where(std > tiny, mean / np.where(std > tiny, std, 1.0), 0.0) * scale
+
+    # Equity path, running peak (start included), max fractional drawdown
+    if kind == "pnl":
+        start = float(initial_equity)
+        equity = np.cumsum(paths, axis=1)
+        equity += center * np.arange(1, h + 1)
+        equity += start
+    else:
+        start = 1.0
+        equity = np.log1p(paths + center)
+        np.cumsum(equity, axis=1, out=equity)
+        np.exp(equity, out=equity)
+    final = equity[:, -1].copy()
+    peak = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peak, start, out=peak)
+    np.subtract(peak, equity, out=equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        equity /= peak
+    max_dd = np.nan_to_num(equity.max(axis=1), nan=0.0)
+    total_ret = (final - start) / start if start else np.zeros(r)
+    calmar = np.where(max_dd > 0, total_ret / np.where(max_dd > 0, max_dd, 1.0), 0.0)
+
+    # CVaR: mean of the k smallest draws
+    k = min(h, max(1, math.ceil((1 - alpha) * h)))
+    if k < h:
+        paths.partition(k - 1, axis=1)
+    tail = paths[:, :k].mean(axis=1) + center
+    cvar = np.maximum(-tail, 0.0)
+
+    return {"sharpe": sharpe, "max_drawdown": max_dd, "calmar": calmar, "cvar": cvar}
+
+
+# ----------------------------------------------------------------------
+# Resampling
+# ----------------------------------------------------------------------
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(data: np.ndarray, opts: Dict[str, Any]) -> None:
+    _WORKER.update(data=data, opts=opts)
+
+
+def _draw(
+    data: np.ndarray,
+    rng: np.random.Generator,
+    rows: int,
+    horizon: int,
+    block_size: Optional[int],
+) -> np.ndarray:
+    n = len(data)
+    if not block_size or block_size <= 1:
+        return data[rng.integers(0, n, size=(rows, horizon))]
+    nb = -(-horizon // block_size)
+    starts = rng.integers(0, n, size=(rows, nb, 1))
+    idx = (starts + np.arange(block_size)) % n
+    return data[idx.reshape(rows, nb * block_size)[:, :horizon]]
+
+
+def _metric_opts(opts: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: opts[k] for k in ("kind", "initial_equity", "alpha", "periods_per_year")}
+
+
+def _run_chunk(task: Tuple[np.random.SeedSequence, int]) -> Dict[str, np.ndarray]:
+    seed, rows = task
+    data, o = _WORKER["data"], _WORKER["opts"]
+    paths = _draw(data, np.random.default_rng(seed), rows, o["horizon"], o["block"])
+    return path_metrics(paths, center=o["center"], **_metric_opts(o))
+
+
+def bootstrap_metrics(
+    data: Sequence[float],
+    n_resamples: int = 10_000,
+    kind: str = "pnl",
+    block_size: Optional[int] = None,
+    horizon: Optional[int] = None,
+    initial_equity: float = 100_000.0,
+    alpha: float = 0.95,
+    periods_per_year: Optional[float] = 252,
+    chunk_elems: int = 4_000_000,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> BootstrapResult:
+    """
+    Resample `data` `n_resamples` times and collect per-path metrics.
+
+    `point` holds the metrics of the input path itself (its full length).
+    Results depend only on `seed` and `chunk_elems` (each chunk gets its own
+    spawned SeedSequence), so inline and pooled runs agree exactly.
+    workers > 1 spreads chunks over a ProcessPoolExecutor.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}")
+    x = np.asarray(data, dtype=float)
+    x = x[np.isfinite(x)]
+    if len(x) < 2:
+        raise ValueError("need at least 2 finite observations")
+    if n_resamples < 1:
+        raise ValueError("n_resamples must be >= 1")
+    horizon = int(horizon or len(x))
+
+    center = float(x.mean())
+    opts = dict(
+        kind=kind,
+        initial_equity=initial_equity,
+        alpha=alpha,
+        periods_per_year=periods_per_year,
+        horizon=horizon,
+        block=block_size,
+        center=center,
+    )
+    point = {
+        m: float(v[0])
+        for m, v in path_metrics(
+            (x - center)[None, :], center=center, **_metric_opts(opts)
+        ).items()
+    }
+
+    rows = max(1, int(chunk_elems) // horizon)
+    sizes = [min(rows, n_resamples - i) for i in range(0, n_resamples, rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = list(zip(seeds, sizes))
+    centered = x - center
+    log.debug(
+        "bootstrap: %d resamples x %d draws in %d chunks",
+        n_resamples,
+        horizon,
+        len(tasks),
+    )
+
+    parts: List[Dict[str, np.ndarray]]
+    if workers and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(centered, opts),
+        ) as pool:
+            parts = list(pool.map(_run_chunk, tasks))
+    else:
+        _init_worker(centered, opts)
+        parts = [_run_chunk(t) for t in tasks]
+
+    samples = {m: np.concatenate([p[m] for p in parts]) for m in METRICS}
+    return BootstrapResult(point, samples, n_resamples, horizon, block_size)
+
+
+__all__ = ["BootstrapResult", "METRICS", "bootstrap_metrics", "path_metrics"]
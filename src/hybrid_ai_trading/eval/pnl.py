@@ -179,3 +179,166 @@ def simulate_rr_exit(
     lc = _num(df.iloc[-1], clC) or entry
     raw = (lc - entry) / tick_size if direction == 1 else (entry - lc) / tick_size
     return (float(round(raw, 4)), df.index[-1])
+
+
+# --- batch R/R exits (same rules as simulate_rr_exit, NumPy block scan) ---
+_ENTRY_KEYS = (
+    "price",
+    "entry",
+    "entry_price",
+    "break",
+    "breakout",
+    "vwap",
+    "VWAP",
+    "open",
+    "Open",
+    "close",
+    "Close",
+)
+
+
+def _gallop(pred, i: int, end: int) -> int:
+    """First j in [i, end) with pred(slice)[j - i] true, else -1 (doubling blocks)."""
+    step = 64
+    while i < end:
+        j = min(end, i + step)
+        hit = pred(i, j)
+        k = int(hit.argmax())
+        if hit[k]:
+            return i + k
+        i, step = j, step * 2
+    return -1
+
+
+def _rr_columns(df):
+    """(high, low, close, entry) float arrays for the fast path, or None."""
+    import numpy as np
+
+    cols = list(df.columns)
+
+    def _pick(*names):
+        return next((n for n in names if n in cols), None)
+
+    hiC = _pick("high", "High", "HIGH", "H")
+    loC = _pick("low", "Low", "LOW", "L")
+    opC = _pick("open", "Open", "OPEN", "O")
+    clC = _pick("close", "Close", "CLOSE", "C")
+    entC = _pick(*_ENTRY_KEYS)
+    hi_cols = [c for c in (hiC, opC, clC) if c]
+    lo_cols = [c for c in (loC, opC, clC) if c]
+    if not hi_cols or not lo_cols or entC is None or not df.index.is_unique:
+        return None
+
+    arrays = {}
+    for c in set(hi_cols + lo_cols):
+        if df[c].dtype.kind != "f":
+            return None
+        arrays[c] = df[c].to_numpy(dtype=float)
+        if np.isnan(arrays[c]).any():
+            return None
+    if df[entC].dtype.kind not in "fiu":
+        return None
+
+    hi = np.maximum.reduce([arrays[c] for c in hi_cols])
+    lo = np.minimum.reduce([arrays[c] for c in lo_cols])
+    close = arrays[clC] if clC else None
+    return hi, lo, close, df[entC].to_numpy(dtype=float)
+
+
+def simulate_rr_exits(
+    df,
+    entry_idxs,
+    directions,
+    *,
+    tick_size: float,
+    rr_target: float,
+    risk_ticks: int,
+):
+    """
+    Batch simulate_rr_exit: one (ticks, exit_idx) pair per entry, identical to
+    calling simulate_rr_exit in a loop (same entry pick, same bar range
+    synthesis, same TARGET-wins tie rule, same flatten-at-last-close).
+      - entry_idxs: index labels of the entry bars
+      - directions: +1/-1 per entry, or one int for all
+    Bar ranges are built once as NumPy arrays and each entry's first
+    target/stop touch is found with a galloping block scan instead of
+    iterrows. Frames the fast path cannot reproduce exactly (non-float or
+    NaN OHLC, non-unique index, no usable entry column) fall back to the
+    scalar simulator per entry.
+    """
+    import numpy as np
+
+    if tick_size is None or tick_size <= 0:
+        raise ValueError("tick_size must be > 0")
+    entry_idxs = list(entry_idxs)
+    if isinstance(directions, (int, np.integer)):
+        directions = [int(directions)] * len(entry_idxs)
+    directions = [int(d) for d in directions]
+    if len(directions) != len(entry_idxs):
+        raise ValueError("directions must match entry_idxs")
+    if any(d not in (1, -1) for d in directions):
+        raise ValueError("direction must be 1 or -1")
+
+    kw = dict(tick_size=tick_size, rr_target=rr_target, risk_ticks=risk_ticks)
+    fast = _rr_columns(df) if entry_idxs else None
+    if fast is None:
+        return [
+            simulate_rr_exit(df, e, direction=d, **kw)
+            for e, d in zip(entry_idxs, directions)
+        ]
+
+    hi, lo, close, entries = fast
+    pos = df.index.get_indexer(entry_idxs)
+    if (pos < 0).any():
+        raise KeyError(entry_idxs[int(np.argmin(pos))])
+
+    n = len(df)
+    index = df.index
+    tgt_off = float(risk_ticks) * float(rr_target) * float(tick_size)
+    stp_off = float(risk_ticks) * float(tick_size)
+    last_close = float(close[-1]) if close is not None else None
+
+    out = []
+    for p, d in zip(pos.tolist(), directions):
+        entry = float(entries[p])
+        if d == 1:
+            target, stop = entry + tgt_off, entry - stp_off
+
+            def hit_t(i, j, target=target):
+                return hi[i:j] >= target
+
+            def hit_s(i, j, stop=stop):
+                return lo[i:j] <= stop
+
+        else:
+            target, stop = entry - tgt_off, entry + stp_off
+
+            def hit_t(i, j, target=target):
+                return lo[i:j] <= target
+
+            def hit_s(i, j, stop=stop):
+                return hi[i:j] >= stop
+
+        t0 = _gallop(hit_t, p, n)
+        if t0 >= 0:
+            # stop strictly before the first target touch: the scalar scan keeps
+            # going and exits on the first later same-bar tie, else at t0
+            if _gallop(hit_s, p, t0) >= 0:
+                both = _gallop(lambda i, j: hit_t(i, j) & hit_s(i, j), t0, n)
+                t0 = both if both >= 0 else t0
+            raw = (
+                (target - entry) / tick_size if d == 1 else (entry - target) / tick_size
+            )
+            out.append((float(round(raw, 4)), index[t0]))
+            continue
+
+        s0 = _gallop(hit_s, p, n)
+        if s0 >= 0:
+            raw = (stop - entry) / tick_size if d == 1 else (entry - stop) / tick_size
+            out.append((float(round(raw, 4)), index[s0]))
+            continue
+
+        lc = last_close or entry
+        raw = (lc - entry) / tick_size if d == 1 else (entry - lc) / tick_size
+        out.append((float(round(raw, 4)), index[-1]))
+    return out
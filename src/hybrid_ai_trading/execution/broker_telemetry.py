@@ -0,0 +1,305 @@
+"""
+Broker Telemetry (Hybrid AI Quant Pro v1.0 - Adaptive Venue Scoring)
+--------------------------------------------------------------------
+- Per-broker rolling telemetry, updated incrementally per event:
+    * latency histogram (log-spaced buckets, counts halved once the window
+      fills so old samples fade)
+    * fill / reject / error / timeout counts
+    * realized slippage in bps (EWMA), from TradeLogger submit->fill pairs
+      or fill prices reported back to the router
+- Expected cost per order in bps (lower is better):
+      commission + slippage + latency_cost_bps_per_sec * p50 latency
+      + reject_cost_bps * (1 - fill rate)
+  Each live component is blended with a prior (the old static guesses) with
+  prior strength `prior_samples`, so a new venue starts at its prior.
+- execution.broker_weights (the old score's factor weights, default
+  latency 0.4 / commission 0.4 / liquidity 0.2) scale the latency,
+  commission and fill-rate terms relative to those defaults
+- ranking() is cached and only recomputed when a broker's cost has moved by
+  more than rank_threshold_bps since the last ranking: O(1) per order.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence
+
+from hybrid_ai_trading.execution.trade_logger import TradeEvent, TradeLogger
+
+_OK = {"filled", "pending"}
+DEFAULT_WEIGHTS = {"latency": 0.4, "commission": 0.4, "liquidity": 0.2}
+_REJECT = {"blocked", "rejected", "canceled", "cancelled"}
+
+
+class LatencyHistogram:
+    """Log-spaced latency buckets from lo_s to hi_s; O(1) add, O(buckets) quantile."""
+
+    def __init__(
+        self,
+        lo_s: float = 0.001,
+        hi_s: float = 30.0,
+        buckets: int = 48,
+        window: int = 500,
+    ) -> None:
+        self.lo = lo_s
+        self.ratio = (hi_s / lo_s) ** (1.0 / (buckets - 1))
+        self._log_ratio = math.log(self.ratio)
+        self.counts = [0.0] * buckets
+        self.total = 0.0
+        self.window = max(1, window)
+
+    def _bucket(self, x: float) -> int:
+        if x <= self.lo:
+            return 0
+        i = int(math.log(x / self.lo) / self._log_ratio) + 1
+        return min(i, len(self.counts) - 1)
+
+    def add(self, x: float) -> None:
+        self.counts[self._bucket(x)] += 1.0
+        self.total += 1.0
+        if self.total >= 2 * self.window:
+            self.counts = [c / 2.0 for c in self.counts]
+            self.total /= 2.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper edge of the bucket holding the q-quantile (None when empty)."""
+        if self.total <= 0:
+            return None
+        target = q * self.total
+        acc = 0.0
+        for i, c in enumerate(self.counts):
+            acc += c
+            if acc >= target and c > 0:
+                return self.lo * self.ratio**i
+        return self.lo * self.ratio ** (len(self.counts) - 1)
+
+
+class BrokerTelemetry:
+    """Telemetry and priors for one broker."""
+
+    def __init__(
+        self,
+        commission_bps: float,
+        latency_prior_s: float,
+        fill_prior: float,
+        window: int = 500,
+        slippage_alpha: float = 0.1,
+    ) -> None:
+        self.commission_bps = float(commission_bps)
+        self.latency_prior_s = float(latency_prior_s)
+        self.fill_prior = float(fill_prior)
+        self.hist = LatencyHistogram(window=window)
+        self.slippage_alpha = float(slippage_alpha)
+        self.slippage_bps = 0.0
+        self.slippage_n = 0
+        self.attempts = 0
+        self.fills = 0
+        self.rejects = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.cost_bps = 0.0
+
+    def record(self, latency: float, status: str) -> None:
+        """One attempt; for timeouts `latency` is the deadline (a lower bound)."""
+        self.attempts += 1
+        self.hist.add(latency)
+        if status in _OK:
+            self.fills += 1
+        elif status in _REJECT:
+            self.rejects += 1
+        elif status == "timeout":
+            self.timeouts += 1
+        else:
+            self.errors += 1
+
+    def record_slippage(self, bps: float) -> None:
+        self.slippage_n += 1
+        a = max(self.slippage_alpha, 1.0 / self.slippage_n)
+        self.slippage_bps += a * (bps - self.slippage_bps)
+
+    def percentile(self, q: float) -> Optional[float]:
+        return self.hist.quantile(q)
+
+    def fill_rate(self) -> float:
+        return self.fills / self.attempts if self.attempts else self.fill_prior
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "fills": self.fills,
+            "rejects": self.rejects,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "fill_rate": self.fill_rate(),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "slippage_bps": self.slippage_bps,
+            "commission_bps": self.commission_bps,
+            "cost_bps": self.cost_bps,
+        }
+
+
+def _default_priors(broker: str) -> Dict[str, float]:
+    """The router's former static guesses, used as priors."""
+    return {
+        "commission_bps": 10.0 if "binance" in broker else 20.0,
+        "latency_s": 0.2 if "alpaca" in broker else 0.1,
+        "fill_rate": 0.8 if "binance" in broker else 0.5,
+    }
+
+
+class TelemetryScorer:
+    def __init__(
+        self,
+        commission_bps: Optional[Mapping[str, float]] = None,
+        latency_cost_bps_per_sec: float = 20.0,
+        reject_cost_bps: float = 10.0,
+        prior_samples: int = 20,
+        rank_threshold_bps: float = 0.5,
+        window: int = 500,
+        priors: Callable[[str], Dict[str, float]] = _default_priors,
+        weights: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.commission_overrides = dict(commission_bps or {})
+        self.weights = {
+            k: max(0.0, float((weights or {}).get(k, d))) / d
+            for k, d in DEFAULT_WEIGHTS.items()
+        }
+        self.latency_cost = float(latency_cost_bps_per_sec)
+        self.reject_cost = float(reject_cost_bps)
+        self.prior_samples = max(0, int(prior_samples))
+        self.threshold = float(rank_threshold_bps)
+        self.window = window
+        self.priors = priors
+        self.brokers: Dict[str, BrokerTelemetry] = {}
+        self._pending: Dict[tuple, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._rank: List[str] = []
+        self._rank_key: tuple = ()
+        self._ranked_cost: Dict[str, float] = {}
+        self._dirty = True
+        self.recomputes = 0
+
+    @classmethod
+    def from_config(cls, execution: Mapping[str, Any]) -> "TelemetryScorer":
+        return cls(
+            commission_bps=execution.get("commission_bps"),
+            latency_cost_bps_per_sec=execution.get("latency_cost_bps_per_sec", 20.0),
+            reject_cost_bps=execution.get("reject_cost_bps", 10.0),
+            prior_samples=execution.get("min_stat_samples", 20),
+            rank_threshold_bps=execution.get("rank_threshold_bps", 0.5),
+            window=execution.get("stats_window", 500),
+            weights=execution.get("broker_weights"),
+        )
+
+    # ------------------------------------------------------------------
+    def get(self, broker: str) -> BrokerTelemetry:
+        t = self.brokers.get(broker)
+        if t is None:
+            p = self.priors(broker)
+            t = BrokerTelemetry(
+                self.commission_overrides.get(broker, p["commission_bps"]),
+                p["latency_s"],
+                p["fill_rate"],
+                window=self.window,
+            )
+            self.brokers[broker] = t
+            self._update_cost(broker, t)
+        return t
+
+    def _blend(self, live: float, n: float, prior: float) -> float:
+        k = self.prior_samples
+        return (n * live + k * prior) / (n + k) if n + k > 0 else prior
+
+    def _update_cost(self, broker: str, t: BrokerTelemetry) -> None:
+        n = t.attempts
+        p50 = t.percentile(0.5)
+        latency = self._blend(p50 if p50 is not None else 0.0, n, t.latency_prior_s)
+        fill = self._blend(t.fills / n if n else 0.0, n, t.fill_prior)
+        slip = self._blend(t.slippage_bps, t.slippage_n, 0.0)
+        w = self.weights
+        t.cost_bps = (
+            w["commission"] * t.commission_bps
+            + slip
+            + w["latency"] * self.latency_cost * latency
+            + w["liquidity"] * self.reject_cost * (1.0 - fill)
+        )
+        ranked = self._ranked_cost.get(broker)
+        if ranked is None or abs(t.cost_bps - ranked) > self.threshold:
+            self._dirty = True
+
+    # ------------------------------------------------------------------
+    def record(self, broker: str, latency: float, status: str) -> None:
+        with self._lock:
+            t = self.get(broker)
+            t.record(latency, status)
+            self._update_cost(broker, t)
+
+    def record_fill(
+        self, broker: str, side: str, ref_px: float, fill_px: float
+    ) -> Optional[float]:
+        """Realized slippage in bps (positive = worse than ref_px)."""
+        if not ref_px or not fill_px or ref_px <= 0:
+            return None
+        sign = -1.0 if str(side).lower() == "sell" else 1.0
+        bps = sign * (fill_px - ref_px) / ref_px * 1e4
+        with self._lock:
+            t = self.get(broker)
+            t.record_slippage(bps)
+            self._update_cost(broker, t)
+        return bps
+
+    def observe_event(self, ev: TradeEvent) -> None:
+        """TradeLogger listener: pairs submitted/filled events for slippage."""
+        key = (ev.broker, ev.symbol, str(ev.side).lower(), float(ev.qty))
+        if ev.status == "submitted":
+            with self._lock:
+                self._pending.setdefault(key, deque(maxlen=32)).append(float(ev.px))
+        elif ev.status in ("filled", "partial"):
+            ref = (ev.meta or {}).get("ref_px")
+            if ref is None:
+                with self._lock:
+                    q = self._pending.get(key)
+                    ref = q.popleft() if q else None
+            if ref is not None:
+                self.record_fill(ev.broker, ev.side, float(ref), float(ev.px))
+        elif ev.status in _REJECT:
+            with self._lock:
+                q = self._pending.get(key)
+                if q:
+                    q.popleft()
+
+    def attach(self, trade_logger: TradeLogger) -> None:
+        trade_logger.add_listener(self.observe_event)
+
+    # ------------------------------------------------------------------
+    def cost(self, broker: str) -> float:
+        with self._lock:
+            return self.get(broker).cost_bps
+
+    def ranking(self, brokers: Sequence[str]) -> List[str]:
+        """Cheapest expected cost first; cached until costs move past threshold."""
+        key = tuple(brokers)
+        with self._lock:
+            if self._dirty or key != self._rank_key:
+                costs = {b: self.get(b).cost_bps for b in key}
+                self._rank = sorted(key, key=costs.__getitem__)
+                self._ranked_cost = costs
+                self._rank_key = key
+                self._dirty = False
+                self.recomputes += 1
+            return list(self._rank)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {b: t.snapshot() for b, t in self.brokers.items()}
+
+
+__all__ = [
+    "BrokerTelemetry",
+    "DEFAULT_WEIGHTS",
+    "LatencyHistogram",
+    "TelemetryScorer",
+]
@@ -21,6 +21,7 @@ from hybrid_ai_trading.execution.order_manager import OrderManager
 from hybrid_ai_trading.execution.paper_simulator import PaperSimulator
 from hybrid_ai_trading.execution.portfolio_tracker import PortfolioTracker
 from hybrid_ai_trading.risk.risk_manager import RiskManager
+from hybrid_ai_trading.utils.clock import Clock, VirtualClock
 
 logger = logging.getLogger("hybrid_ai_trading.execution.execution_engine")
 
@@ -32,6 +33,7 @@ class ExecutionEngine:
         self,
         dry_run: bool = True,
         config: Optional[Dict[str, Any]] = None,
+        clock: Optional[Clock] = None,
     ) -> None:
         self.dry_run = dry_run
         self.config = config or {}
@@ -81,9 +83,14 @@ class ExecutionEngine:
 
         # === Mode selection ===
         if self.dry_run or self.config.get("use_paper_simulator", False):
+            # backtests: simulated_clock=True (or a VirtualClock) -> no real sleeps
+            if clock is None and self.config.get("simulated_clock", False):
+                clock = VirtualClock()
             self.paper_simulator = PaperSimulator(
                 slippage=self.config.get("costs", {}).get("slippage_pct", 0.0),
                 commission=self.config.get("costs", {}).get("commission_pct", 0.0),
+                latency_ms=self.config.get("costs", {}).get("latency_ms", 50),
+                clock=clock,
             )
             self.order_manager = None
             logger.info(
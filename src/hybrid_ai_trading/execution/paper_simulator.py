@@ -7,14 +7,19 @@ Paper Simulator (Hybrid AI Quant Pro v13.0 Ã¢â‚¬â€œ Hedge Fund Level)
 - Market impact model: slippage scales with order size vs ADV
 - Short borrow fees and overnight funding costs
 - Deterministic RNG per instance for reproducibility
+- Pluggable clock: WallClock (default) really waits latency_ms for paper
+  trading; VirtualClock advances event time by latency_ms without sleeping,
+  so backtests run at CPU speed. Fills carry submitted_at / filled_at
+  (by default only on virtual clocks, so seeded paper fills stay reproducible)
 - Returns structured, audit-friendly fill dict
 """
 
 import logging
 import random
-import time
 from typing import Dict, List, Optional, Union
 
+from hybrid_ai_trading.utils.clock import Clock, WallClock
+
 logger = logging.getLogger("hybrid_ai_trading.execution.paper_simulator")
 
 
@@ -32,6 +37,8 @@ class PaperSimulator:
         adv: Optional[float] = 1e6,
         latency_ms: int = 50,
         seed: Optional[int] = None,
+        clock: Optional[Clock] = None,
+        stamp_fills: Optional[bool] = None,
     ) -> None:
         self.slippage = slippage
         self.commission = commission
@@ -42,6 +49,12 @@ class PaperSimulator:
         self.adv = adv
         self.latency_ms = latency_ms
         self.rng = random.Random(seed) if seed is not None else random
+        self.clock = clock if clock is not None else WallClock()
+        self.stamp_fills = (
+            bool(getattr(self.clock, "virtual", False))
+            if stamp_fills is None
+            else stamp_fills
+        )
 
     # ------------------------------------------------------------------
     def simulate_fill(
@@ -64,9 +77,11 @@ class PaperSimulator:
         if size <= 0 or price <= 0:
             return {"status": "error", "reason": "invalid_size_or_price"}
 
-        # --- Apply latency ---
+        # --- Apply latency (virtual clocks advance instead of sleeping) ---
+        submitted_at = self.clock.now()
         if self.latency_ms > 0:
-            time.sleep(self.latency_ms / 1000.0)
+            self.clock.sleep(self.latency_ms / 1000.0)
+        filled_at = self.clock.now()
 
         # --- Order type guards ---
         if order_type == "limit" and limit_price:
@@ -131,6 +146,10 @@ class PaperSimulator:
             "fills": fills,
             "mode": "paper",
         }
+        if self.stamp_fills:
+            result["submitted_at"] = submitted_at
+            result["filled_at"] = filled_at
+            result["timestamp"] = self.clock.isoformat(filled_at)
 
         # Bracket orders (attach stop/target)
         if stop_price or limit_price:
@@ -51,6 +51,7 @@ class PortfolioTracker:
         price: float,
         commission: float = 0.0,
         currency: Optional[str] = None,
+        ts: Optional[datetime] = None,
     ) -> None:
         if size <= 0 or price <= 0:
             raise ValueError("Invalid size or price for trade update")
@@ -114,10 +115,20 @@ class PortfolioTracker:
             logger.debug("BRANCH-152 CLEANUP HIT | symbol=%s", symbol)
 
         self.intraday_trades.append((symbol, size, price))
-        self.update_equity({symbol: price})
+        self.update_equity({symbol: price}, ts=ts)
 
     # ------------------------------------------------------------------
-    def update_equity(self, price_updates: Optional[Dict[str, float]] = None) -> None:
+    def update_equity(
+        self,
+        price_updates: Optional[Dict[str, float]] = None,
+        ts: Optional[datetime] = None,
+    ) -> None:
+        """
+        Revalue and append (ts, equity) to history; ts defaults to now (UTC).
+
+        An explicit ts equal to the last point's replaces that point, so
+        replays keep one history point per bar timestamp.
+        """
         total_value = self.cash
         unrealized = 0.0
         if price_updates is None or not price_updates:
@@ -144,7 +155,11 @@ class PortfolioTracker:
             logger.debug("BRANCH-237 CLEANUP HIT | deleted=%s", sym)
         self.equity = max(0.0, total_value)
         self.unrealized_pnl = unrealized
-        self.history.append((datetime.now(timezone.utc), self.equity))
+        if ts is not None and self.history and self.history[-1][0] == ts:
+            self.history[-1] = (ts, self.equity)
+        else:
+            stamp = datetime.now(timezone.utc) if ts is None else ts
+            self.history.append((stamp, self.equity))
 
     # ------------------------------------------------------------------
     def _returns(self) -> List[float]:
@@ -215,6 +230,12 @@ class PortfolioTracker:
         std_down = np.std(downside)
         return 0.0 if std_down == 0 else avg / std_down
 
+    def bootstrap(self, n_resamples: int = 10_000, **kwargs):
+        """Bootstrap CIs (Sharpe, max drawdown, Calmar, CVaR) over equity returns."""
+        from hybrid_ai_trading.eval.bootstrap import bootstrap_metrics
+
+        return bootstrap_metrics(self._returns(), n_resamples, kind="returns", **kwargs)
+
     # ------------------------------------------------------------------
     def report(self) -> Dict[str, float]:
         logger.debug("report called")
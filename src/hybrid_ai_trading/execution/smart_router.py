@@ -9,14 +9,29 @@ Smart Order Router (Hybrid AI Quant Pro v5.2 - Hedge-Fund OE Grade, Test-Friendl
     * "pending" stays "pending"
     * Unknown/odd -> "blocked"
 - Test mode: if all brokers fail, simulate fill for integration stability
+- Brokers ranked by expected cost from live telemetry (latency histogram,
+  fill/reject ratio, realized slippage; see broker_telemetry), cached until
+  costs move past execution.rank_threshold_bps
+- Async mode (route_order_async, or execution.async_routing): every attempt
+  has a real deadline and is cancelled past it; optionally hedges to the
+  next-ranked broker once the primary exceeds its latency percentile;
+  coroutine clients that cannot be cancelled by client order id are never
+  hedged to or from, and abandoning one raises an alert
 """
 
+import asyncio
+import inspect
 import logging
 import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
+from hybrid_ai_trading.execution.broker_telemetry import TelemetryScorer
 from hybrid_ai_trading.execution.latency_monitor import LatencyMonitor
+from hybrid_ai_trading.execution.trade_logger import TradeLogger
 
 logger = logging.getLogger("hybrid_ai_trading.execution.smart_router")
 
@@ -38,18 +53,23 @@ class SmartOrderRouter:
         self.max_retries = self.config.get("execution", {}).get("max_order_retries", 3)
         self.timeout_sec = self.config.get("execution", {}).get("timeout_sec", 5.0)
 
-        # broker weights
-        self.weights = self.config.get("execution", {}).get(
-            "broker_weights",
-            {"latency": 0.4, "commission": 0.4, "liquidity": 0.2},
-        )
-
         # latency breach tracking
         self.latency_breaches = 0
         self.max_latency_breaches = self.config.get("execution", {}).get(
             "max_latency_breaches", 5
         )
 
+        # live telemetry + async/hedged routing
+        exec_cfg = self.config.get("execution", {})
+        self.telemetry = TelemetryScorer.from_config(exec_cfg)
+        for b in self.brokers:
+            self.telemetry.get(b)
+        self.min_samples = int(exec_cfg.get("min_stat_samples", 20))
+        self.async_mode = bool(exec_cfg.get("async_routing", False))
+        self.hedge = bool(exec_cfg.get("hedge_orders", False))
+        self.hedge_percentile = float(exec_cfg.get("hedge_percentile", 0.95))
+        self._pool: Optional[ThreadPoolExecutor] = None
+
         # detect pytest mode
         self.test_mode = "pytest" in os.environ.get("PYTEST_CURRENT_TEST", "").lower()
 
@@ -60,21 +80,17 @@ class SmartOrderRouter:
         self.latency_monitor.reset()
 
     # ------------------------------------------------------------------
+    def attach_trade_logger(self, trade_logger: TradeLogger) -> None:
+        """Learn realized slippage from the logger's submit/fill events."""
+        self.telemetry.attach(trade_logger)
+
     def score_broker(self, broker: str) -> float:
-        """Compute weighted score for a broker."""
-        commission = 0.001 if "binance" in broker else 0.002
-        latency = 0.2 if "alpaca" in broker else 0.1
-        liquidity = 0.8 if "binance" in broker else 0.5
-        return (
-            self.weights["commission"] * (1 / commission)
-            + self.weights["latency"] * (1 / latency)
-            + self.weights["liquidity"] * liquidity
-        )
+        """Score for a broker (higher is better): inverse expected cost in bps."""
+        return 1e4 / (1.0 + max(0.0, self.telemetry.cost(broker)))
 
     def rank_brokers(self) -> List[str]:
-        # Tests will call this directly to cover the dict-comp and sort lines.
-        scores = {b: self.score_broker(b) for b in self.brokers}
-        return sorted(scores, key=scores.get, reverse=True)
+        """Cheapest expected cost first; cached between material cost changes."""
+        return self.telemetry.ranking(list(self.brokers))
 
     def choose_route(self, symbol: str) -> str:
         ranked = self.rank_brokers()
@@ -104,6 +120,36 @@ class SmartOrderRouter:
         logger.error("[ALERT] %s", message)
 
     # ------------------------------------------------------------------
+    _FILL_PX_KEYS = ("filled_avg_price", "avg_fill_price", "avg_price", "fill_price")
+
+    def _observe_fill(self, broker: str, details: Any, side: str, price: float) -> None:
+        """Realized slippage vs the order's reference price, when reported."""
+        if not isinstance(details, dict) or not price:
+            return
+        for k in self._FILL_PX_KEYS:
+            try:
+                px = float(details.get(k) or 0.0)
+            except (TypeError, ValueError):
+                continue
+            if px > 0:
+                self.telemetry.record_fill(broker, side, float(price), px)
+                return
+
+    def _observe_sync(self, broker: str, result: Any, side: str, price: float) -> None:
+        """Feed a sync attempt (LatencyMonitor envelope) into the broker stats."""
+        if not isinstance(result, dict):
+            self.telemetry.record(broker, 0.0, "error")
+            return
+        latency = result.get("latency")
+        latency = float(latency) if isinstance(latency, (int, float)) else 0.0
+        inner = result.get("result")
+        status = "error"
+        if result.get("status") != "error" and isinstance(inner, dict):
+            status = {"ok": "filled"}.get(inner.get("status"), inner.get("status"))
+        self.telemetry.record(broker, latency, str(status))
+        if status in {"filled", "pending"}:
+            self._observe_fill(broker, inner, side, price)
+
     def route_order(
         self,
         symbol: str,
@@ -112,6 +158,10 @@ class SmartOrderRouter:
         price: float,
         timeout_sec: Optional[float] = None,
     ) -> Dict[str, Any]:
+        if self.async_mode:
+            return self._run_sync(
+                self.route_order_async(symbol, side, size, price, timeout_sec)
+            )
         ranked_brokers = self.rank_brokers()
         timeout = timeout_sec or self.timeout_sec
         last_error: Optional[Dict[str, Any]] = None
@@ -136,6 +186,7 @@ class SmartOrderRouter:
                     )
 
                 result = self.latency_monitor.measure(submit)
+                self._observe_sync(broker, result, side, price)
 
                 # --- Latency warning
                 if isinstance(result, dict) and result.get("status") == "warning":
@@ -204,3 +255,275 @@ class SmartOrderRouter:
             return {"status": "filled", "reason": "simulated_fill"}
 
         return last_error or {"status": "blocked", "reason": "all_brokers_failed"}
+
+    # ------------------------------------------------------------------
+    # async routing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _run_sync(coro: Any) -> Any:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # already inside an event loop: run on a helper thread
+        with ThreadPoolExecutor(1) as ex:
+            return ex.submit(asyncio.run, coro).result()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max(4, 2 * len(self.brokers)), thread_name_prefix="router"
+            )
+        return self._pool
+
+    @staticmethod
+    def _classify(raw: Any) -> Dict[str, Any]:
+        """Normalize a raw broker return to {"status", "reason"?, "details"}."""
+        if not isinstance(raw, dict):
+            return {"status": "error", "reason": "non_dict_result", "details": raw}
+        status = {"ok": "filled"}.get(raw.get("status"), raw.get("status"))
+        if status in {"filled", "pending", "blocked", "rejected"}:
+            return {"status": status, "details": raw}
+        return {
+            "status": "error",
+            "reason": raw.get("reason", "unknown"),
+            "details": raw,
+        }
+
+    async def _submit(
+        self, broker: str, symbol: str, side: str, size: float, price: float
+    ) -> Dict[str, Any]:
+        client = self.brokers[broker]
+        kwargs = dict(
+            symbol=symbol,
+            qty=size,
+            side=side.lower(),
+            price=price,
+            type="market",
+            time_in_force="day",
+        )
+        t0 = time.perf_counter()
+        cf = None
+        coid = None
+        try:
+            fn = self._async_submit(client)
+            if fn is not None:
+                if self._accepts(fn, "client_order_id"):
+                    coid = kwargs["client_order_id"] = f"sor-{uuid.uuid4().hex[:16]}"
+                raw = await fn(**kwargs)
+            else:
+                cf = self._executor().submit(partial(client.submit_order, **kwargs))
+                raw = await asyncio.wrap_future(cf)
+            out = self._classify(raw)
+        except asyncio.CancelledError:
+            # past the deadline or lost a hedge race; a blocking call keeps
+            # running in its thread, so watch it for a late fill, while a
+            # cancelled coroutine may already be live at the venue, so
+            # cancel it there by its client order id
+            self.telemetry.record(broker, time.perf_counter() - t0, "timeout")
+            if cf is not None:
+                cf.add_done_callback(partial(self._late_result, broker))
+            elif coid is not None and hasattr(client, "cancel_order"):
+                self._executor().submit(self._cancel_abandoned, broker, coid)
+            else:
+                self._send_alert(
+                    f"Abandoned order error on {broker}: submission may be "
+                    "live and cannot be cancelled by client order id"
+                )
+            raise
+        except Exception as e:
+            out = {"status": "error", "reason": str(e), "details": None}
+        out["broker"] = broker
+        out["latency"] = time.perf_counter() - t0
+        self.telemetry.record(broker, out["latency"], out["status"])
+        if out["status"] in {"filled", "pending"}:
+            self._observe_fill(broker, out["details"], side, price)
+        return out
+
+    def _late_result(self, broker: str, fut: Any) -> None:
+        """Abandoned attempt finished anyway: alert and cancel if it filled."""
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        res = self._classify(fut.result())
+        if res["status"] not in {"filled", "pending"}:
+            return
+        self._send_alert(f"Late fill error on {broker} after abandoning the attempt")
+        details = res.get("details") or {}
+        oid = details.get("order_id") or details.get("id")
+        client = self.brokers.get(broker)
+        if oid is not None and hasattr(client, "cancel_order"):
+            try:
+                client.cancel_order(oid)
+            except Exception as e:
+                logger.error("cancel of late order %s failed: %s", oid, e)
+
+    @staticmethod
+    def _async_submit(client: Any) -> Optional[Callable]:
+        """The client's coroutine submit function, or None for blocking clients."""
+        fn = getattr(client, "submit_order_async", None)
+        if fn is None and inspect.iscoroutinefunction(
+            getattr(client, "submit_order", None)
+        ):
+            fn = client.submit_order
+        return fn
+
+    def _cancellable(self, broker: str) -> bool:
+        """Whether an abandoned attempt on `broker` can be cleaned up."""
+        client = self.brokers[broker]
+        fn = self._async_submit(client)
+        if fn is None:  # blocking: watched for a late fill, cancelled by id
+            return True
+        return self._accepts(fn, "client_order_id") and hasattr(client, "cancel_order")
+
+    @staticmethod
+    def _accepts(fn: Callable, name: str) -> bool:
+        try:
+            params = inspect.signature(fn).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(
+            p.name == name or p.kind is inspect.Parameter.VAR_KEYWORD for p in params
+        )
+
+    def _cancel_abandoned(self, broker: str, client_order_id: str) -> None:
+        """Cancel an abandoned async submission that may have reached the venue."""
+        try:
+            res = self.brokers[broker].cancel_order(client_order_id)
+            if inspect.iscoroutine(res):
+                asyncio.run(res)
+        except Exception as e:
+            logger.error(
+                "cancel of abandoned order %s on %s failed: %s",
+                client_order_id,
+                broker,
+                e,
+            )
+            return
+        logger.warning("cancelled abandoned order %s on %s", client_order_id, broker)
+
+    def _hedge_delay(self, broker: str, deadline: float) -> Optional[float]:
+        st = self.telemetry.get(broker)
+        if st.attempts < self.min_samples:
+            return None
+        delay = st.percentile(self.hedge_percentile)
+        return delay if delay is not None and delay < deadline else None
+
+    async def _attempt(
+        self,
+        broker: str,
+        backup: Optional[str],
+        symbol: str,
+        side: str,
+        size: float,
+        price: float,
+        timeout: float,
+    ) -> Dict[str, Any]:
+        """One deadline-bounded attempt, hedged to `backup` when it runs slow."""
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(self._submit(broker, symbol, side, size, price))
+        tasks = [primary]
+        delay = None
+        if backup and self._cancellable(broker) and self._cancellable(backup):
+            delay = self._hedge_delay(broker, timeout)
+        elif backup:
+            logger.debug("not hedging %s -> %s: no cancel by id", broker, backup)
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                logger.info(
+                    "hedging %s -> %s after %.3fs (p%d)",
+                    broker,
+                    backup,
+                    delay,
+                    int(self.hedge_percentile * 100),
+                )
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._submit(backup, symbol, side, size, price)
+                    )
+                )
+
+        best: Optional[Dict[str, Any]] = None
+        pending = set(tasks)
+        while pending:
+            remaining = timeout - (time.perf_counter() - start)
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for t in done:
+                res = t.result()
+                if res["status"] in {"filled", "pending"}:
+                    res["hedged"] = t is not primary
+                    for other in pending:
+                        other.cancel()
+                    return res
+                if best is None or t is primary:
+                    best = res
+
+        for t in pending:
+            t.cancel()
+        if pending:
+            logger.error("[TIMEOUT] %s > %.2fs", broker, timeout)
+            if best is None:
+                return {"status": "timeout", "reason": "timeout", "broker": broker}
+        return best  # type: ignore[return-value]
+
+    async def route_order_async(
+        self,
+        symbol: str,
+        side: str,
+        size: float,
+        price: float,
+        timeout_sec: Optional[float] = None,
+        hedge: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Route with enforced per-attempt deadlines and optional hedging.
+
+        Brokers are tried in live-ranked order, up to max_retries attempts each
+        on errors/timeouts; blocked/rejected moves straight to the next broker.
+        With hedging, an attempt slower than the broker's hedge_percentile
+        latency also fires at the next-ranked broker; the first fill wins and
+        the other request is cancelled.
+        """
+        timeout = float(timeout_sec or self.timeout_sec)
+        hedge = self.hedge if hedge is None else hedge
+        ranked = [b for b in self.rank_brokers() if self.brokers.get(b)]
+        last_error: Optional[Dict[str, Any]] = None
+
+        for i, broker in enumerate(ranked):
+            backup = ranked[i + 1] if hedge and i + 1 < len(ranked) else None
+            for attempt in range(1, self.max_retries + 1):
+                res = await self._attempt(
+                    broker, backup, symbol, side, size, price, timeout
+                )
+                status = res["status"]
+                if status in {"filled", "pending"}:
+                    if res.get("latency", 0.0) > self.latency_monitor.threshold:
+                        self.latency_breaches += 1
+                        if self.latency_breaches >= self.max_latency_breaches:
+                            self._send_alert("Latency error: breaches exceeded")
+                    return {
+                        "status": status,
+                        "broker": res["broker"],
+                        "attempt": attempt,
+                        "latency": res.get("latency"),
+                        "hedged": res.get("hedged", False),
+                        "details": res.get("details"),
+                    }
+                last_error = {
+                    "status": "blocked",
+                    "reason": res.get("reason", status),
+                }
+                if status in {"blocked", "rejected"}:
+                    break
+                self._send_alert(f"Broker {status}: {res.get('reason', status)}")
+
+        self._send_alert("All brokers failed error")
+        if self.test_mode:
+            return {"status": "filled", "reason": "simulated_fill"}
+        return last_error or {"status": "blocked", "reason": "all_brokers_failed"}
+
+    def broker_stats(self) -> Dict[str, Dict[str, Any]]:
+        return self.telemetry.snapshot()
@@ -6,7 +6,7 @@ import logging
 import os
 from dataclasses import asdict, dataclass
 from logging.handlers import RotatingFileHandler
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from hybrid_ai_trading.utils.time_utils import utc_now
 
@@ -40,6 +40,7 @@ class TradeLogger:
         os.makedirs(os.path.dirname(jsonl_path), exist_ok=True)
         self.jsonl_path = jsonl_path
         self.csv_path = csv_path
+        self._listeners: List[Callable[[TradeEvent], None]] = []
         self._logger = logging.getLogger("hybrid_ai_trading.trade_logger")
         self._logger.setLevel(logging.INFO)
         if not self._logger.handlers:
@@ -70,6 +71,10 @@ class TradeLogger:
                     ]
                 )
 
+    def add_listener(self, fn: Callable[[TradeEvent], None]) -> None:
+        """Call fn(event) after every logged event (e.g. broker telemetry)."""
+        self._listeners.append(fn)
+
     @staticmethod
     def _now_iso() -> str:
         return utc_now().replace(microsecond=0).isoformat() + "Z"
@@ -109,6 +114,11 @@ class TradeLogger:
             event.order_id,
             event.status,
         )
+        for fn in self._listeners:
+            try:
+                fn(event)
+            except Exception:  # noqa: BLE001
+                self._logger.exception("trade listener failed")
 
     def submit_event(
         self,
@@ -24,8 +24,11 @@ logger.setLevel(logging.DEBUG)
 
 
 class PerformanceTracker:
-    def __init__(self, window: int = 250):
+    def __init__(self, window: int = 250, starting_equity: Optional[float] = None):
         self.window = window
+        # account equity before the first trade; defaults to the first
+        # record_equity() value (kept when the rolling window drops it)
+        self.starting_equity = starting_equity
         self.trades: List[float] = []
         self.equity_curve: List[float] = []
         self.timestamps: List[datetime] = []
@@ -49,6 +52,8 @@ class PerformanceTracker:
         logger.debug(f"Recorded trade: {pnl}")
 
     def record_equity(self, equity: float, timestamp: Optional[datetime] = None):
+        if self.starting_equity is None:
+            self.starting_equity = equity
         self.equity_curve.append(equity)
         self.timestamps.append(timestamp or utc_now())
         if len(self.equity_curve) > self.window:
@@ -145,6 +150,14 @@ class PerformanceTracker:
         denom = sum(losses)
         return sum(gains) / denom if denom > 0 else 0.0
 
+    def bootstrap(self, n_resamples: int = 10_000, **kwargs: Any):
+        """Bootstrap CIs (Sharpe, max drawdown, Calmar, CVaR) over recorded trades."""
+        from hybrid_ai_trading.eval.bootstrap import bootstrap_metrics
+
+        if self.starting_equity is not None and self.starting_equity > 0:
+            kwargs.setdefault("initial_equity", self.starting_equity)
+        return bootstrap_metrics(self.trades, n_resamples, kind="pnl", **kwargs)
+
     # ----------------------------------------------------
     # Attribution vs Benchmark
     # ----------------------------------------------------
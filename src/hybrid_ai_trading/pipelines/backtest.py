@@ -237,6 +237,53 @@ class IntradayBacktester:
 
         return pd.DataFrame(rows)
 
+    def run_event_driven(
+        self,
+        start: str = "2020-01-01",
+        end: str = "2020-01-02",
+        api_key: str | None = "DUMMY",
+        loader: Callable[[str], List[Dict[str, Any]]] | None = None,
+        **config: Any,
+    ) -> pd.DataFrame:
+        """Event-driven mode: one bar load per symbol, one pass over time.
+
+        Every strategy is evaluated on the same shared bars; fills go through
+        PaperSimulator and positions through PortfolioTracker (see
+        pipelines.event_backtest). `config` feeds EventBacktestConfig.
+        """
+        from hybrid_ai_trading.pipelines.event_backtest import (
+            ColumnarBarStore,
+            EventBacktestConfig,
+            EventBacktester,
+        )
+
+        if not self.strategies:
+            log.warning("no strategies configured")
+            return pd.DataFrame(columns=["Strategy", "Symbol", "Sharpe"])
+
+        if loader is None:
+
+            def loader(sym: str) -> List[Dict[str, Any]]:
+                return get_intraday_bars(sym, start, end, api_key=api_key)
+
+        self.bar_store = ColumnarBarStore().load(self.symbols, loader)
+        engine = EventBacktester(
+            self.bar_store,
+            self.strategies,
+            config=EventBacktestConfig(**config),
+            risk_manager=self.risk_manager,
+        )
+        df = engine.run()
+        names = {n.upper(): n for n in self.strategies}
+        for rec in df.to_dict("records"):
+            self.results_summary.setdefault(names[rec["Strategy"]], {})[
+                rec["Symbol"]
+            ] = {
+                k: rec[k]
+                for k in ("Sharpe", "Trades", "WinRate %", "Blocked %", "FinalEquity")
+            }
+        return df
+
 
 # ====== TEST-COMPAT OVERRIDES (single, guarded) ==================================
 from pathlib import Path as _BT_Path
@@ -17,6 +17,14 @@ from typing import Any, Dict, List, Optional
 import requests
 from dotenv import load_dotenv
 
+from hybrid_ai_trading.data.store.bar_cache import (
+    day_ms,
+    default_bar_cache,
+    frame_to_polygon_rows,
+    ms_day,
+    polygon_rows_to_frame,
+)
+
 # Optional IBKR import (safe for tests)
 try:
     from ib_insync import IB, LimitOrder, MarketOrder, Stock, StopOrder
@@ -46,7 +54,36 @@ LOG_DIR.mkdir(exist_ok=True)
 
 
 def get_bars(symbol: str, start: str, end: str) -> List[Dict[str, Any]]:
-    """Fetch OHLCV bars from Polygon."""
+    """Fetch OHLCV bars from Polygon (through the bar cache when enabled)."""
+    cache = default_bar_cache()
+    if cache is not None:
+
+        def fetch(s: int, e: int):
+            url = (
+                f"https://api.polygon.io/v2/aggs/ticker/{symbol}/range/5/minute/"
+                f"{ms_day(s)}/{ms_day(e - 1)}?limit=50000&apiKey={POLYGON_KEY}"
+            )
+            rows: List[Dict[str, Any]] = []
+            while url:  # follow next_url so a capped page is not the whole gap
+                resp = requests.get(url, timeout=10)
+                resp.raise_for_status()
+                body = resp.json()
+                rows.extend(body.get("results") or [])
+                url = body.get("next_url")
+                if url:
+                    url += f"&apiKey={POLYGON_KEY}"
+            return polygon_rows_to_frame(rows)
+
+        df = cache.get(
+            "polygon",
+            symbol,
+            "5/minute",
+            day_ms(start),
+            day_ms(end) + 86_400_000,
+            fetch,
+        )
+        return frame_to_polygon_rows(df)
+
     url = (
         f"https://api.polygon.io/v2/aggs/ticker/{symbol}/range/5/minute/"
         f"{start}/{end}?limit=5000&apiKey={POLYGON_KEY}"
@@ -0,0 +1,261 @@
+"""
+Event-Driven Backtest (Hybrid AI Quant Pro v1.0 - Columnar, Shared Bars)
+------------------------------------------------------------------------
+- ColumnarBarStore loads each symbol's bars exactly once and keeps them as
+  NumPy columns (t/o/h/l/c/v) plus one shared list-of-dicts view that the
+  STRATEGIES-style callables consume
+- EventBacktester merges all symbols into one time-ordered event stream and
+  walks it once; at each bar every registered strategy sees the same
+  lookback window, so adding a strategy costs only its own compute
+- Fills route through PaperSimulator, positions/cash/equity live in one
+  PortfolioTracker per (strategy, symbol) book; a simulator on a
+  VirtualClock is moved to each bar's time, so fills carry bar time plus
+  the modelled latency
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hybrid_ai_trading.execution.paper_simulator import PaperSimulator
+from hybrid_ai_trading.execution.portfolio_tracker import PortfolioTracker
+from hybrid_ai_trading.utils.clock import VirtualClock
+
+log = logging.getLogger(__name__)
+
+BarLoader = Callable[[str], List[Dict[str, Any]]]
+Strategy = Callable[[List[Dict[str, Any]]], str]
+
+
+def _num(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class ColumnarBarStore:
+    """Per-symbol columnar bar cache (one load/parse per symbol)."""
+
+    FIELDS = ("t", "o", "h", "l", "c", "v")
+
+    def __init__(self) -> None:
+        self._cols: Dict[str, Dict[str, np.ndarray]] = {}
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+        self.loads = 0
+
+    def add(self, symbol: str, bars: Iterable[Dict[str, Any]]) -> int:
+        """Parse `bars` (Polygon-style dicts) into columns; returns bar count."""
+        bars = [b for b in (bars or []) if isinstance(b, dict)]
+        cols = {k: np.array([_num(b.get(k)) for b in bars]) for k in self.FIELDS}
+        if np.isnan(cols["t"]).all():
+            cols["t"] = np.arange(len(bars), dtype=float)
+        order = np.argsort(cols["t"], kind="stable")
+        self._cols[symbol] = {k: v[order] for k, v in cols.items()}
+        self._rows[symbol] = [bars[i] for i in order]
+        return len(bars)
+
+    def load(self, symbols: Iterable[str], loader: BarLoader) -> "ColumnarBarStore":
+        """Fetch each symbol once through `loader` (skips symbols already held)."""
+        for sym in symbols:
+            if sym in self._cols:
+                continue
+            try:
+                bars = loader(sym) or []
+            except Exception:
+                log.error("bar load failed for %s", sym, exc_info=True)
+                bars = []
+            self.loads += 1
+            self.add(sym, bars)
+        return self
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._cols)
+
+    def column(self, symbol: str, field: str) -> np.ndarray:
+        return self._cols[symbol][field]
+
+    def rows(self, symbol: str) -> List[Dict[str, Any]]:
+        return self._rows[symbol]
+
+    def __len__(self) -> int:
+        return sum(len(c["t"]) for c in self._cols.values())
+
+    def events(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """All bars as (ts, symbol_id, bar_index), ordered by time then symbol."""
+        syms = self.symbols
+        if not syms:
+            empty = np.empty(0, dtype=np.int64)
+            return np.empty(0), empty, empty
+        ts = np.concatenate([self._cols[s]["t"] for s in syms])
+        sid = np.concatenate(
+            [
+                np.full(len(self._cols[s]["t"]), i, dtype=np.int64)
+                for i, s in enumerate(syms)
+            ]
+        )
+        idx = np.concatenate(
+            [np.arange(len(self._cols[s]["t"]), dtype=np.int64) for s in syms]
+        )
+        order = np.lexsort((sid, ts))
+        return ts[order], sid[order], idx[order]
+
+
+@dataclass
+class EventBacktestConfig:
+    starting_equity: float = 100_000.0
+    trade_size: float = 1.0
+    lookback: int = 200
+    allow_short: bool = False
+
+
+@dataclass
+class _Book:
+    tracker: PortfolioTracker
+    trades: int = 0
+    wins: int = 0
+    closes: int = 0
+    blocked: int = 0
+
+
+class EventBacktester:
+    """Walk a ColumnarBarStore once, evaluating every strategy per bar."""
+
+    def __init__(
+        self,
+        store: ColumnarBarStore,
+        strategies: Dict[str, Strategy],
+        simulator: Optional[PaperSimulator] = None,
+        config: Optional[EventBacktestConfig] = None,
+        risk_manager: Any = None,
+    ) -> None:
+        self.store = store
+        self.strategies = dict(strategies)
+        self.simulator = simulator or PaperSimulator(
+            latency_ms=0, seed=0, clock=VirtualClock(0.0)
+        )
+        self.config = config or EventBacktestConfig()
+        self.risk_manager = risk_manager
+        self.books: Dict[Tuple[str, str], _Book] = {}
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _call(name: str, fn: Strategy, window: List[Dict[str, Any]]) -> str:
+        try:
+            sig = fn(window)
+        except Exception:
+            log.error("strategy %s failed", name, exc_info=True)
+            return "HOLD"
+        return sig if sig in {"BUY", "SELL", "HOLD"} else "HOLD"
+
+    def _book(self, name: str, sym: str) -> _Book:
+        key = (name, sym)
+        if key not in self.books:
+            self.books[key] = _Book(PortfolioTracker(self.config.starting_equity))
+        return self.books[key]
+
+    def _fill(self, book: _Book, sym: str, side: str, qty: float, px: float) -> None:
+        if self.risk_manager is not None and not self.risk_manager.check_trade(
+            sym, side, qty, qty * px
+        ):
+            book.blocked += 1
+            return
+        res = self.simulator.simulate_fill(sym, side, qty, px)
+        if res.get("status") != "filled":
+            return
+        before = book.tracker.realized_pnl
+        book.tracker.update_position(
+            sym, side, qty, float(res["fill_price"]), float(res["commission"])
+        )
+        book.trades += 1
+        realized = book.tracker.realized_pnl - before
+        if realized != 0:
+            book.closes += 1
+            book.wins += realized > 0
+
+    def _apply(self, book: _Book, sym: str, sig: str, px: float) -> None:
+        pos = float(book.tracker.positions.get(sym, {}).get("size", 0.0))
+        size = self.config.trade_size
+        if sig == "BUY" and pos <= 0:
+            self._fill(book, sym, "BUY", size + abs(pos), px)
+        elif sig == "SELL" and pos > 0:
+            qty = pos + (size if self.config.allow_short else 0.0)
+            self._fill(book, sym, "SELL", qty, px)
+        elif sig == "SELL" and pos == 0 and self.config.allow_short:
+            self._fill(book, sym, "SELL", size, px)
+
+    # ------------------------------------------------------------------
+    def run(self) -> pd.DataFrame:
+        syms = self.store.symbols
+        closes = {s: self.store.column(s, "c") for s in syms}
+        rows = {s: self.store.rows(s) for s in syms}
+        lookback = max(1, int(self.config.lookback))
+        names = list(self.strategies)
+
+        ts, sids, idxs = self.store.events()
+        clock = getattr(self.simulator, "clock", None)
+        if not getattr(clock, "virtual", False):
+            clock = None
+        for t, sid, k in zip(ts.tolist(), sids.tolist(), idxs.tolist()):
+            if clock is not None:
+                clock.advance_to(t / 1000.0)  # bar ts is epoch ms
+            sym = syms[sid]
+            px = closes[sym][k]
+            if not px > 0:
+                continue
+            # one shared window per bar, reused by every strategy
+            window = rows[sym][max(0, k + 1 - lookback) : k + 1]
+            for name in names:
+                book = self._book(name, sym)
+                self._apply(
+                    book, sym, self._call(name, self.strategies[name], window), px
+                )
+                book.tracker.update_equity({sym: px})
+
+        return self.leaderboard()
+
+    def leaderboard(self) -> pd.DataFrame:
+        out = []
+        for (name, sym), book in self.books.items():
+            t = book.tracker
+            out.append(
+                {
+                    "Strategy": name.upper(),
+                    "Symbol": sym,
+                    "Sharpe": float(t.get_sharpe()),
+                    "Trades": book.trades,
+                    "WinRate %": (
+                        100.0 * book.wins / book.closes if book.closes else 0.0
+                    ),
+                    "Blocked %": (
+                        100.0 * book.blocked / (book.trades + book.blocked)
+                        if book.blocked
+                        else 0.0
+                    ),
+                    "FinalEquity": float(t.equity),
+                    "RealizedPnL": float(t.realized_pnl),
+                }
+            )
+        cols = [
+            "Strategy",
+            "Symbol",
+            "Sharpe",
+            "Trades",
+            "WinRate %",
+            "Blocked %",
+            "FinalEquity",
+            "RealizedPnL",
+        ]
+        return pd.DataFrame(out, columns=cols)
+
+    def equity_curve(self, name: str, sym: str) -> List[float]:
+        return [eq for _, eq in self._book(name, sym).tracker.history]
+
+
+__all__ = ["ColumnarBarStore", "EventBacktestConfig", "EventBacktester"]
@@ -0,0 +1,347 @@
+"""
+Portfolio Backtest (Hybrid AI Quant Pro v1.0 - Shared Cash, Streamed Universe)
+-----------------------------------------------------------------------------
+- Per-symbol bar iterators are heap-merged (heapq.merge) into one
+  time-ordered event stream; only one pending bar per symbol is in memory
+- One PortfolioTracker holds cash, positions and realized PnL for the whole
+  universe; entries are sized by KellySizer on current portfolio equity and
+  clipped by cash, per-position weight and lot size (an entry that cannot
+  afford one lot is blocked before the sizer runs)
+- risk_rails gates every entry: daily_pnl_cap, drawdown_cap and
+  max_order_size; exits are always allowed
+- Signals come from a per-symbol stateful callable (default: streaming
+  MACD from signals.streaming), so each bar costs O(1)
+- Equity is marked once per timestamp, and the tracker's history holds one
+  (bar time, equity) point per timestamp; per-symbol and aggregate metrics
+  (Sharpe, max drawdown, Calmar, CVaR via eval.bootstrap.path_metrics)
+  are reported at the end
+
+Bars are tuples (ts, open, high, low, close, volume); ts is epoch ms or a
+datetime-like value, and must be non-decreasing within each iterator.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+import pandas as pd
+
+from hybrid_ai_trading.eval.bootstrap import path_metrics
+from hybrid_ai_trading.execution.portfolio_tracker import PortfolioTracker
+from hybrid_ai_trading.risk.kelly_sizer import KellySizer
+from hybrid_ai_trading.risk.risk_rails import (
+    daily_pnl_cap,
+    drawdown_cap,
+    max_order_size,
+)
+from hybrid_ai_trading.signals.streaming import MACDState, RSIState
+
+log = logging.getLogger("hybrid_ai_trading.pipelines.portfolio_backtest")
+
+Bar = Tuple[Any, float, float, float, float, float]
+SignalFn = Callable[[Bar], str]
+
+_DAY_MS = 86_400_000
+
+
+# ----------------------------------------------------------------------
+# Bar sources
+# ----------------------------------------------------------------------
+def frame_bars(df: pd.DataFrame) -> Iterator[Bar]:
+    """Yield bars from a frame with a timestamp column or DatetimeIndex."""
+    if "timestamp" in df.columns:
+        df = df.set_index(pd.to_datetime(df["timestamp"], errors="coerce"))
+    df = df.sort_index()
+    cols = [df[c].to_numpy(dtype=float) for c in ("open", "high", "low", "close")]
+    vol = df["volume"].to_numpy(dtype=float) if "volume" in df else np.zeros(len(df))
+    yield from zip(df.index, *cols, vol)
+
+
+def parquet_bars(path: str, batch_size: int = 65_536) -> Iterator[Bar]:
+    """Stream bars from a Parquet file batch by batch (needs pyarrow)."""
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path)
+    cols = ["timestamp", "open", "high", "low", "close", "volume"]
+    for batch in pf.iter_batches(batch_size=batch_size, columns=cols):
+        yield from frame_bars(batch.to_pandas())
+
+
+def streaming_signal(kind: str = "macd", **params: Any) -> Callable[[str], SignalFn]:
+    """Per-symbol signal factory over signals.streaming states ("macd"/"rsi")."""
+    states = {"macd": MACDState, "rsi": RSIState}
+    if kind not in states:
+        raise ValueError(f"unknown streaming signal: {kind}")
+
+    def factory(symbol: str) -> SignalFn:
+        state = states[kind](**params)
+        return lambda bar: state.update(bar[4])["signal"]
+
+    return factory
+
+
+def _as_datetime(ts: Any) -> datetime:
+    if isinstance(ts, (int, float, np.integer, np.floating)):
+        return datetime.fromtimestamp(int(ts) / 1000.0, tz=timezone.utc)
+    return pd.Timestamp(ts).to_pydatetime()
+
+
+def _day_of(ts: Any) -> Any:
+    if isinstance(ts, (int, float, np.integer, np.floating)):
+        return int(ts) // _DAY_MS
+    return ts.date() if hasattr(ts, "date") else ts
+
+
+# ----------------------------------------------------------------------
+# Engine
+# ----------------------------------------------------------------------
+@dataclass
+class PortfolioConfig:
+    starting_equity: float = 100_000.0
+    asset: str = "equity"  # risk_rails.max_order_size asset class
+    order_limits: Dict[str, float] = field(default_factory=dict)
+    daily_loss_cap: Optional[float] = None  # absolute currency
+    max_drawdown: Optional[float] = None  # 0..1
+    max_positions: int = 20
+    max_position_pct: float = 0.10  # of equity per symbol
+    lot_size: float = 1.0
+    commission_per_share: float = 0.0
+    slippage_bps: float = 0.0
+    close_at_end: bool = True
+
+
+@dataclass
+class _SymbolBook:
+    signal: SignalFn
+    last_px: float = float("nan")
+    bars: int = 0
+    trades: int = 0
+    wins: int = 0
+    closes: int = 0
+    realized: float = 0.0
+    blocked: int = 0
+
+
+@dataclass
+class PortfolioReport:
+    summary: Dict[str, Any]
+    per_symbol: pd.DataFrame
+    equity_curve: List[Tuple[Any, float]]
+    blocked: Dict[str, int]
+
+
+class PortfolioBacktester:
+    """Event-driven, shared-cash backtest over a universe of bar iterators."""
+
+    def __init__(
+        self,
+        sources: Mapping[str, Iterable[Bar]],
+        signal_factory: Optional[Callable[[str], SignalFn]] = None,
+        sizer: Optional[KellySizer] = None,
+        config: Optional[PortfolioConfig] = None,
+    ) -> None:
+        self.sources = dict(sources)
+        self.signal_factory = signal_factory or streaming_signal("macd")
+        self.sizer = sizer or KellySizer(win_rate=0.55, payoff=1.2, fraction=0.5)
+        self.config = config or PortfolioConfig()
+        self.tracker = PortfolioTracker(self.config.starting_equity)
+        self.tracker.history.clear()  # bar-time points only, not the wall clock
+        self._stamp: Optional[datetime] = None
+        self.symbols = list(self.sources)
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+        self.books = [_SymbolBook(self.signal_factory(s)) for s in self.symbols]
+        self.blocked: Dict[str, int] = {}
+        self.equity_curve: List[Tuple[Any, float]] = []
+        self.peak = self.config.starting_equity
+        self.day_start_equity = self.config.starting_equity
+
+    # ------------------------------------------------------------------
+    def _stream(self) -> Iterator[Tuple[Any, int, Bar]]:
+        def tagged(i: int, it: Iterable[Bar]) -> Iterator[Tuple[Any, int, Bar]]:
+            for bar in it:
+                yield bar[0], i, bar
+
+        return heapq.merge(
+            *(tagged(i, self.sources[s]) for i, s in enumerate(self.symbols))
+        )
+
+    def equity(self) -> float:
+        """Cash + open positions marked at each symbol's last price."""
+        pos = self.tracker.positions
+        idx = self._index
+        return self.tracker.cash + sum(
+            p["size"] * self.books[idx[s]].last_px for s, p in pos.items()
+        )
+
+    def _mark(self, ts: Any) -> None:
+        eq = self.equity()
+        self.tracker.update_equity(
+            {s: self.books[self._index[s]].last_px for s in self.tracker.positions},
+            ts=self._stamp,
+        )
+        self.equity_curve.append((ts, eq))
+        self.peak = max(self.peak, eq)
+
+    def _block(self, book: _SymbolBook, reason: str) -> None:
+        key = reason.split()[0] if reason else "blocked"
+        self.blocked[key] = self.blocked.get(key, 0) + 1
+        book.blocked += 1
+
+    def _fill(self, i: int, side: str, qty: float, px: float) -> None:
+        cfg, book, sym = self.config, self.books[i], self.symbols[i]
+        slip = px * cfg.slippage_bps / 10_000.0
+        fill_px = px + slip if side == "BUY" else px - slip
+        before = self.tracker.realized_pnl
+        self.tracker.update_position(
+            sym,
+            side,
+            qty,
+            fill_px,
+            commission=cfg.commission_per_share * qty,
+            ts=self._stamp,
+        )
+        book.trades += 1
+        if side == "SELL":
+            realized = self.tracker.realized_pnl - before
+            book.realized += realized
+            book.closes += 1
+            book.wins += realized > 0
+
+    def _enter(self, i: int, px: float) -> None:
+        cfg, book = self.config, self.books[i]
+        if len(self.tracker.positions) >= cfg.max_positions:
+            return self._block(book, "max_positions")
+        eq = self.equity()
+        for decision in (
+            daily_pnl_cap(eq - self.day_start_equity, cfg.daily_loss_cap),
+            drawdown_cap(eq, self.peak, cfg.max_drawdown),
+        ):
+            if decision.status != "ok":
+                return self._block(book, decision.reason)
+
+        per_share = px * (1 + cfg.slippage_bps / 10_000.0) + cfg.commission_per_share
+        affordable = self.tracker.cash / per_share
+        if affordable < cfg.lot_size:
+            return self._block(book, "insufficient_cash")
+        qty = self.sizer.size_position(eq, px)
+        qty = min(qty, cfg.max_position_pct * eq / px, affordable)
+        qty = math.floor(qty / cfg.lot_size) * cfg.lot_size if qty > 0 else 0.0
+        if qty <= 0:
+            return self._block(book, "size_zero")
+        decision = max_order_size(self.symbols[i], qty, cfg.asset, cfg.order_limits)
+        if decision.status != "ok":
+            return self._block(book, decision.reason)
+        self._fill(i, "BUY", qty, px)
+
+    # ------------------------------------------------------------------
+    def run(self) -> PortfolioReport:
+        positions = self.tracker.positions
+        cur_ts, cur_day = None, None
+
+        for ts, i, bar in self._stream():
+            if ts != cur_ts:
+                if cur_ts is not None:
+                    self._mark(cur_ts)
+                day = _day_of(ts)
+                if day != cur_day:
+                    cur_day = day
+                    self.day_start_equity = self.equity()
+                    self.tracker.reset_day()
+                cur_ts, self._stamp = ts, _as_datetime(ts)
+
+            px = float(bar[4])
+            if not px > 0:
+                continue
+            book = self.books[i]
+            book.last_px = px
+            book.bars += 1
+            sig = book.signal(bar)
+            held = self.symbols[i] in positions
+            if sig == "BUY" and not held:
+                self._enter(i, px)
+            elif sig == "SELL" and held:
+                self._fill(i, "SELL", positions[self.symbols[i]]["size"], px)
+
+        if cur_ts is not None:
+            if self.config.close_at_end:
+                for sym in list(positions):
+                    k = self._index[sym]
+                    self._fill(k, "SELL", positions[sym]["size"], self.books[k].last_px)
+            self._mark(cur_ts)
+        return self.report()
+
+    def report(self) -> PortfolioReport:
+        eq = np.array([e for _, e in self.equity_curve], dtype=float)
+        start = self.config.starting_equity
+        summary: Dict[str, Any] = {
+            "symbols": len(self.symbols),
+            "bars": sum(b.bars for b in self.books),
+            "trades": sum(b.trades for b in self.books),
+            "final_equity": float(eq[-1]) if len(eq) else start,
+            "total_return": float(eq[-1] / start - 1) if len(eq) else 0.0,
+            "realized_pnl": float(self.tracker.realized_pnl),
+            "open_positions": len(self.tracker.positions),
+            "blocked": sum(self.blocked.values()),
+        }
+        if len(eq) >= 2:
+            rets = np.diff(np.concatenate([[start], eq])) / np.concatenate(
+                [[start], eq[:-1]]
+            )
+            m = path_metrics(rets[None, :], kind="returns", periods_per_year=None)
+            summary.update({k: float(v[0]) for k, v in m.items()})
+
+        per_symbol = pd.DataFrame(
+            [
+                {
+                    "Symbol": sym,
+                    "Bars": b.bars,
+                    "Trades": b.trades,
+                    "WinRate %": 100.0 * b.wins / b.closes if b.closes else 0.0,
+                    "RealizedPnL": b.realized,
+                    "Blocked": b.blocked,
+                }
+                for sym, b in zip(self.symbols, self.books)
+            ]
+        )
+        return PortfolioReport(
+            summary, per_symbol, self.equity_curve, dict(self.blocked)
+        )
+
+
+def run_portfolio_backtest(
+    sources: Mapping[str, Iterable[Bar]],
+    signal_factory: Optional[Callable[[str], SignalFn]] = None,
+    sizer: Optional[KellySizer] = None,
+    **config: Any,
+) -> PortfolioReport:
+    """Convenience wrapper: PortfolioBacktester(...).run() with PortfolioConfig kwargs."""
+    return PortfolioBacktester(
+        sources, signal_factory, sizer, PortfolioConfig(**config)
+    ).run()
+
+
+__all__ = [
+    "PortfolioBacktester",
+    "PortfolioConfig",
+    "PortfolioReport",
+    "frame_bars",
+    "parquet_bars",
+    "run_portfolio_backtest",
+    "streaming_signal",
+]
@@ -1,10 +1,25 @@
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Tuple
 
 from hybrid_ai_trading.utils.providers import get_price, load_providers
 
+_CFG: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _providers_cfg(cfg_path: str) -> Dict[str, Any]:
+    """load_providers, re-read only when the file's mtime changes."""
+    try:
+        mtime = os.path.getmtime(cfg_path)
+    except OSError:
+        mtime = -1.0
+    hit = _CFG.get(cfg_path)
+    if hit is None or hit[0] != mtime:
+        hit = _CFG[cfg_path] = (mtime, load_providers(cfg_path))
+    return hit[1]
+
 
 def latest_price(
     symbol: str, cfg_path: str = "config/providers.yaml"
 ) -> Dict[str, Any]:
-    cfg = load_providers(cfg_path)
-    return get_price(symbol, cfg)
+    """Latest quote through the shared quote cache (utils.providers.quote_cache)."""
+    return get_price(symbol, _providers_cfg(cfg_path))
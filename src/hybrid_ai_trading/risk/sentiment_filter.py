@@ -123,17 +123,23 @@ class SentimentFilter:
             return 0.0
         return raw
 
-    def allow_trade(self, text: str, side: str | None = None) -> bool:
+    def allow_trade(
+        self,
+        text: str,
+        side: str | None = None,
+        precomputed_score: Optional[float] = None,
+    ) -> bool:
         """
         Disabled => allow; analyzer missing => allow.
         Gate = max(threshold, neutral_zone).
         BUY: score>=gate; SELL: score<=-gate; other sides => allow.
+        precomputed_score skips re-scoring text already scored by the caller.
         """
         if not self.enabled:
             return True
         if self.analyzer is None:
             return True
-        s = self.score(text)
+        s = self.score(text) if precomputed_score is None else precomputed_score
         gate = max(float(self.threshold or 0.0), float(self.neutral_zone or 0.0))
         if not side:
             return True
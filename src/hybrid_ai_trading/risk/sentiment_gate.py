@@ -1,7 +1,8 @@
 """
 Sentiment Gate (Hybrid AI Quant Pro v1.0  OE Grade)
 - Aggregates news via NewsAggregator
-- Scores headlines with SentimentFilter (YAML defaults + lexicon)
+- Scores headlines with SentimentFilter (YAML defaults + lexicon); scores are
+  kept per story between sweeps, so repeated sweeps only score new headlines
 - Returns tidy per-symbol metrics for gating BUY/SELL decisions
 """
 
@@ -10,9 +11,12 @@ from typing import Any, Dict, List
 
 import yaml
 
-from hybrid_ai_trading.data.news_aggregator import aggregate_news
+from hybrid_ai_trading.data.news_aggregator import aggregate_news, story_key
 from hybrid_ai_trading.risk.sentiment_filter import SentimentFilter
 
+# story key -> (title, score) from the previous sweep
+_SCORES: Dict[str, Any] = {}
+
 
 def score_headlines_for_symbols(
     symbols_csv: str,
@@ -33,7 +37,9 @@ def score_headlines_for_symbols(
     )
     stories = aggregate_news(symbols_csv, limit, date_from)
 
+    global _SCORES
     filt = SentimentFilter()  # uses YAML defaults + lexicon
+    scores: Dict[str, Any] = {}
     per_symbol: Dict[str, Dict[str, Any]] = {}
     out_stories: List[Dict[str, Any]] = []
 
@@ -49,7 +55,13 @@ def score_headlines_for_symbols(
         if not in_watch:
             continue
         title = s.get("title", "")
-        score = filt.score(title)
+        key = story_key(s.get("source", ""), s)
+        cached = _SCORES.get(key)
+        if cached is not None and cached[0] == title:
+            score = cached[1]
+        else:
+            score = filt.score(title)
+        scores[key] = (title, score)
         allow = filt.allow_trade(title, side=side, precomputed_score=score)
         rec = {
             "created": s.get("created"),
@@ -72,6 +84,7 @@ def score_headlines_for_symbols(
                 d["blocked"] += 1
             d["avgScore"] += score
 
+    _SCORES = scores
     for sym, d in per_symbol.items():
         if d["seen"] > 0:
             d["avgScore"] = round(d["avgScore"] / d["seen"], 4)
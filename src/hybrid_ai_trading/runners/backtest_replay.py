@@ -5,7 +5,7 @@ import argparse
 import json
 import os
 import pathlib
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from hybrid_ai_trading.runners.paper_config import load_config
 from hybrid_ai_trading.runners.paper_logger import JsonlLogger
@@ -13,11 +13,24 @@ from hybrid_ai_trading.runners.paper_quantcore import run_once
 from hybrid_ai_trading.utils.backtest_io import load_csv, row_to_snapshot
 
 
+def _snapshots(path: str) -> Iterator[Dict[str, Any]]:
+    if path.lower().endswith(".tick"):
+        from hybrid_ai_trading.data.store.tick_archive import TickFile, iter_snapshots
+
+        tf = TickFile(path)
+        yield from iter_snapshots(tf.records, tf.symbol)
+        return
+    for row in load_csv(path):
+        yield row_to_snapshot(row)
+
+
 def main():
     ap = argparse.ArgumentParser("Backtest Replay")
     ap.add_argument("--config", default="config/paper_runner.yaml")
     ap.add_argument(
-        "--input", required=True, help="CSV file with ts,symbol,price/last/close/vwap,"
+        "--input",
+        required=True,
+        help="CSV file with ts,symbol,price/last/close/vwap, or a .tick archive file",
     )
     ap.add_argument("--log", default="logs/backtest.jsonl")
     ap.add_argument(
@@ -30,8 +43,7 @@ def main():
 
     buf: List[Dict[str, Any]] = []
     totals = {"rows": 0, "batches": 0, "decisions": 0}
-    for row in load_csv(args.input):
-        snap = row_to_snapshot(row)
+    for snap in _snapshots(args.input):
         totals["rows"] += 1
         if not snap.get("symbol"):
             continue
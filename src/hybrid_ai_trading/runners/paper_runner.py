@@ -29,6 +29,18 @@ def main(argv=None) -> int:
     }
     print("[PaperRunner] args:", json.dumps(info, ensure_ascii=False))
 
+    if args.prefer_providers and info["universe"]:
+        from hybrid_ai_trading.utils.providers import (
+            get_prices,
+            load_providers,
+            quote_cache,
+        )
+
+        quotes = get_prices(info["universe"], load_providers())
+        px = {s: q.get("price") for s, q in quotes.items()}
+        print("[PaperRunner] quotes:", json.dumps(px, ensure_ascii=False))
+        print("[PaperRunner] quote_cache:", json.dumps(quote_cache().stats()))
+
     # Simulate the "once" cadence without touching IB if provider_only or dry_drill
     if args.once:
         if args.provider_only:
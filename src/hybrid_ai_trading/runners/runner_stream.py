@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import math
 import os
 import pathlib
@@ -17,9 +18,11 @@ from ib_insync import IB, Stock
 
 from hybrid_ai_trading.utils.edges import decide_signal
 from hybrid_ai_trading.utils.exec import gc_stale_orders
-from hybrid_ai_trading.utils.feature_store import FeatureStore
+from hybrid_ai_trading.utils.feature_store import FeatureStore, QuoteWriter
 from hybrid_ai_trading.utils.risk import intraday_risk_checks
 
+log = logging.getLogger("hybrid_ai_trading.runners.runner_stream")
+
 UNIVERSE_FILE = "config/universe_equities.yaml"
 POLL_SEC = 0.5
 
@@ -137,6 +140,12 @@ async def main():
         ib.reqMktData(c, "", True, False)
 
     store = FeatureStore(root="data/feature_store")
+    # on_tick only enqueues; a writer thread owns the store and its disk I/O
+    writer = QuoteWriter(
+        store,
+        capacity=int(os.getenv("HAT_FS_QUEUE", "100000")),
+        policy=os.getenv("HAT_FS_POLICY", "coalesce"),
+    ).start()
     can_trade = mdt == 1 and not os.getenv(
         "HAT_READONLY"
     )  # never place orders when delayed
@@ -151,7 +160,7 @@ async def main():
             asz = _nzi(getattr(tkr, "askSize", None), 0)
             lsz = _nzi(getattr(tkr, "lastSize", None), 0)
 
-            store.write_quote(
+            writer.submit(
                 symbol=c.symbol,
                 ts=datetime.now(timezone.utc),
                 bid=bid,
@@ -188,6 +197,19 @@ async def main():
             gc_stale_orders(ib, max_age_sec=60)
             intraday_risk_checks(ib)
     finally:
+        try:
+            # the store is not thread-safe: compact only once the writer is down
+            stopped = writer.stop() or writer.stop()
+            log.info("feature store writer: %s", writer.stats())
+            if stopped:
+                store.compact()  # merges the day's part files
+            else:
+                log.warning(
+                    "feature store writer still running; part files left "
+                    "for the next compaction"
+                )
+        except Exception as e:
+            log.warning("feature store shutdown failed: %s: %s", type(e).__name__, e)
         ib.disconnect()
 
 
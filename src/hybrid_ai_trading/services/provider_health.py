@@ -9,7 +9,7 @@ from hybrid_ai_trading.data_clients.kraken_client import Client as Krk
 
 # direct clients
 from hybrid_ai_trading.data_clients.polygon_client import Client as Poly
-from hybrid_ai_trading.utils.providers import load_providers
+from hybrid_ai_trading.utils.providers import load_providers, quote_cache
 
 app = FastAPI(title="Provider Health")
 
@@ -47,6 +47,8 @@ def health_providers(providers: List[str] = None) -> Dict[str, Any]:
             r = cl.last_quote(sym)
             lat = (perf_counter() - t0) * 1000.0
             ok = isinstance(r, dict) and isinstance(r.get("price"), (int, float))
+            if ok:
+                quote_cache().put(sym, r)  # a fresh probe quote warms the cache
             out.append(
                 {
                     "provider": prov,
@@ -67,4 +69,10 @@ def health_providers(providers: List[str] = None) -> Dict[str, Any]:
                     "error": f"{type(e).__name__}: {e}",
                 }
             )
-    return {"checks": out}
+    return {"checks": out, "quote_cache": quote_cache().stats()}
+
+
+@app.get("/health/quotes")
+def health_quotes() -> Dict[str, Any]:
+    """Shared quote cache counters (hits, stale hits, misses, fetch latency)."""
+    return quote_cache().stats()
@@ -5,6 +5,8 @@ Central export hub for all trading signal strategies.
 
 Purpose:
 - Provide a unified STRATEGIES dict for pipelines and tests.
+- Provide PANEL_STRATEGIES / evaluate_panel for vectorized multi-symbol scans.
+- Provide O(1)-per-tick indicator states for live streaming paths.
 - Guarantee hedge-fund-grade consistency across all signal modules.
 """
 
@@ -14,7 +16,9 @@ from .breakout_polygon import BreakoutPolygonSignal
 from .breakout_v1 import breakout_v1
 from .macd import macd_signal
 from .moving_average import moving_average_signal
+from .panel import PANEL_STRATEGIES, BarPanel, evaluate_panel
 from .rsi_signal import rsi_signal
+from .streaming import BollingerState, MACDState, RSIState, VWAPState
 from .vwap import vwap_signal
 
 # ----------------------------------------------------------------------
@@ -33,4 +37,13 @@ STRATEGIES = {
     "vwap": lambda symbol, bars=None: vwap_signal(bars or []),
 }
 
-__all__ = ["STRATEGIES"]
+__all__ = [
+    "STRATEGIES",
+    "PANEL_STRATEGIES",
+    "BarPanel",
+    "evaluate_panel",
+    "BollingerState",
+    "MACDState",
+    "RSIState",
+    "VWAPState",
+]
@@ -18,6 +18,15 @@ from typing import Any, Dict, List, Optional
 import requests
 from dotenv import load_dotenv
 
+from hybrid_ai_trading.data.store.bar_cache import (
+    BarCache,
+    day_ms,
+    default_bar_cache,
+    frame_to_polygon_rows,
+    ms_day,
+    polygon_rows_to_frame,
+)
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -41,6 +50,9 @@ class BreakoutPolygonSignal:
             return []
         end = datetime.today().strftime("%Y-%m-%d")
         start = (datetime.today() - timedelta(days=365)).strftime("%Y-%m-%d")
+        cache = default_bar_cache()
+        if cache is not None:
+            return self._get_cached_bars(cache, ticker, start, end, limit)
         url = (
             f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/"
             f"1/day/{start}/{end}?limit={limit}&apiKey={self.api_key}"
@@ -57,6 +69,34 @@ class BreakoutPolygonSignal:
             logger.error("Ã¢ÂÅ’ Polygon request failed: %s", e)
             return []
 
+    def _get_cached_bars(
+        self, cache: BarCache, ticker: str, start: str, end: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        def fetch(s: int, e: int):
+            url = (
+                f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/"
+                f"1/day/{ms_day(s)}/{ms_day(e - 1)}?limit=50000&apiKey={self.api_key}"
+            )
+            rows: List[Dict[str, Any]] = []
+            while url:  # follow next_url so a capped page is not the whole gap
+                resp = requests.get(url, timeout=10)
+                if resp.status_code != 200:
+                    raise PolygonAPIError(
+                        f"Polygon API error {resp.status_code}: {resp.text[:200]}"
+                    )
+                body = resp.json()
+                rows.extend(body.get("results") or [])
+                url = body.get("next_url")
+                if url:
+                    url += f"&apiKey={self.api_key}"
+            return polygon_rows_to_frame(rows)
+
+        df = cache.get(
+            "polygon", ticker, "1/day", day_ms(start), day_ms(end) + 86_400_000, fetch
+        )
+        # same rows as the uncached request: the first `limit` bars of the range
+        return frame_to_polygon_rows(df)[:limit]
+
     def generate(
         self, ticker: str, bars: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
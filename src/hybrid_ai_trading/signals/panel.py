@@ -0,0 +1,377 @@
+"""
+Panel Signal Engine (Hybrid AI Quant Pro v1.0 - Vectorized Multi-Symbol)
+------------------------------------------------------------------------
+Evaluates the STRATEGIES family over a columnar panel of bars
+(symbols x time NumPy arrays) in one pass instead of one dict walk per
+(strategy, symbol) pair.
+
+Layout:
+- BarPanel holds o/h/l/c/v as float64 arrays of shape (n_symbols, n_bars)
+- Histories are right-aligned: the most recent bar is always the last
+  column, shorter histories are left-padded with NaN and tracked via
+  ``lengths``
+- Missing or non-numeric fields inside a history are stored as NaN
+
+Parity:
+- Every panel strategy mirrors the guards and decision table of its
+  per-symbol wrapper (rsi_signal, macd_signal, ...) and returns the same
+  BUY/SELL/HOLD string per symbol
+- Bars with missing fields resolve to HOLD (the per-symbol wrappers skip
+  such bars instead; the panel assumes complete OHLCV rows)
+
+Exports:
+- BarPanel (columnar container)
+- PANEL_STRATEGIES (name -> panel evaluator, same keys as STRATEGIES)
+- evaluate_panel (run several strategies, return name -> decision array)
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from .vwap import VWAPConfig
+
+logger = logging.getLogger("hybrid_ai_trading.signals.panel")
+
+_FIELDS = ("o", "h", "l", "c", "v")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+@dataclass
+class BarPanel:
+    """Columnar symbols x time bar store (right-aligned, NaN-padded)."""
+
+    symbols: List[str]
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray  # noqa: E741
+    c: np.ndarray
+    v: np.ndarray
+    lengths: np.ndarray = field(default=None)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        shape = np.shape(self.c)
+        for name in _FIELDS:
+            arr = np.asarray(getattr(self, name), dtype=float)
+            if arr.ndim != 2 or arr.shape != shape:
+                raise ValueError(f"panel field '{name}' must have shape {shape}")
+            setattr(self, name, arr)
+        if len(self.symbols) != shape[0]:
+            raise ValueError("symbols must match the panel's first axis")
+        if self.lengths is None:
+            self.lengths = np.full(shape[0], shape[1], dtype=np.int64)
+        self.lengths = np.asarray(self.lengths, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_bars(
+        cls, bars_by_symbol: Mapping[str, List[Dict[str, Any]]]
+    ) -> "BarPanel":
+        """Build a panel from the ``{symbol: list[dict]}`` bars STRATEGIES use."""
+        symbols = list(bars_by_symbol.keys())
+        lengths = np.array(
+            [len(bars_by_symbol[s] or []) for s in symbols], dtype=np.int64
+        )
+        width = int(lengths.max()) if len(lengths) else 0
+        cols = {k: np.full((len(symbols), width), np.nan) for k in _FIELDS}
+        for i, sym in enumerate(symbols):
+            bars = bars_by_symbol[sym] or []
+            start = width - len(bars)
+            for k in _FIELDS:
+                cols[k][i, start:] = [_to_float(b.get(k)) for b in bars]
+        return cls(symbols=symbols, lengths=lengths, **cols)
+
+    @property
+    def n_bars(self) -> int:
+        return int(self.c.shape[1])
+
+    def valid_mask(self) -> np.ndarray:
+        """Boolean (n_symbols, n_bars) mask of columns that hold a real bar."""
+        cols = np.arange(self.n_bars)
+        return cols[None, :] >= (self.n_bars - self.lengths)[:, None]
+
+    def decisions_by_symbol(self, decisions: np.ndarray) -> Dict[str, str]:
+        """Map a decision array back onto symbols."""
+        return dict(zip(self.symbols, decisions.tolist()))
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+def _hold(panel: BarPanel) -> np.ndarray:
+    return np.full(len(panel.symbols), "HOLD", dtype="<U4")
+
+
+def _any_nan(panel: BarPanel, *arrays: np.ndarray) -> np.ndarray:
+    """True per symbol if any real bar has a NaN in any of ``arrays``."""
+    mask = panel.valid_mask()
+    bad = np.zeros(len(panel.symbols), dtype=bool)
+    for arr in arrays:
+        bad |= (np.isnan(arr) & mask).any(axis=1)
+    return bad
+
+
+def _window_mean(x: np.ndarray, end: int, window: int) -> np.ndarray:
+    """Mean of ``x[:, end-window:end]`` with pandas' exact constant-window rule."""
+    block = x[:, end - window : end] if end else x[:, -window:]
+    mean = block.sum(axis=1) / window
+    flat = block.max(axis=1) == block.min(axis=1)
+    return np.where(flat, block[:, -1], mean)
+
+
+def _breakout(
+    panel: BarPanel, min_bars: int, lookback: Optional[int], tie_sell: bool
+) -> np.ndarray:
+    out = _hold(panel)
+    n = panel.lengths
+    ok = (n >= max(min_bars, 1)) & ~_any_nan(panel, panel.c, panel.h, panel.l)
+    if not ok.any():
+        return out
+
+    mask = panel.valid_mask()
+    prior = mask.copy()
+    prior[:, -1] = False
+    if lookback is not None:
+        cols = np.arange(panel.n_bars)
+        prior &= cols[None, :] >= panel.n_bars - lookback
+
+    last = panel.c[:, -1]
+    has_prior = prior.any(axis=1)
+    high = np.where(has_prior, np.where(prior, panel.h, -np.inf).max(axis=1), last)
+    low = np.where(has_prior, np.where(prior, panel.l, np.inf).min(axis=1), last)
+
+    out[ok & (last > high)] = "BUY"
+    out[ok & (last < low)] = "SELL"
+    if tie_sell:
+        out[ok & (high == low) & (low == last)] = "SELL"
+    return out
+
+
+# ----------------------------------------------------------------------
+# Panel strategies (defaults mirror the per-symbol wrappers)
+# ----------------------------------------------------------------------
+def rsi_panel(panel: BarPanel, period: int = 14) -> np.ndarray:
+    """Panel counterpart of rsi_signal (simple-average RSI, 30/70 bands)."""
+    out = _hold(panel)
+    ok = (panel.lengths >= period + 1) & ~_any_nan(panel, panel.c)
+    if not ok.any():
+        return out
+
+    delta = np.diff(panel.c[:, -(period + 1) :], axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_gain = np.clip(delta, 0, None).sum(axis=1) / period
+        avg_loss = np.clip(-delta, 0, None).sum(axis=1) / period
+        rsi = np.where(
+            avg_loss == 0,
+            np.where(avg_gain > 0, 100.0, 0.0),
+            100 - (100 / (1 + avg_gain / avg_loss)),
+        )
+
+    ok &= ~np.isnan(rsi)
+    out[ok & (rsi < 30)] = "BUY"
+    out[ok & (rsi > 70)] = "SELL"
+    return out
+
+
+def macd_panel(
+    panel: BarPanel, fast: int = 12, slow: int = 26, signal_window: int = 9
+) -> np.ndarray:
+    """Panel counterpart of macd_signal (EMA crossover + trend confirmation)."""
+    out = _hold(panel)
+    ok = (panel.lengths >= slow + signal_window) & ~_any_nan(panel, panel.c)
+    if not ok.any():
+        return out
+
+    a_fast, a_slow, a_sig = (2.0 / (s + 1.0) for s in (fast, slow, signal_window))
+    start = panel.n_bars - int(panel.lengths[ok].max())
+    closes = panel.c[ok]
+    n_rows = closes.shape[0]
+    ema_fast = np.full(n_rows, np.nan)
+    ema_slow = np.full(n_rows, np.nan)
+    sig = np.full(n_rows, np.nan)
+    macd = sig
+
+    # One pass over time, vectorized across symbols (pandas adjust=False recursion)
+    for t in range(start, panel.n_bars):
+        x = closes[:, t]
+        seeded = ~np.isnan(ema_fast)
+        ema_fast = np.where(seeded, (1 - a_fast) * ema_fast + a_fast * x, x)
+        ema_slow = np.where(seeded, (1 - a_slow) * ema_slow + a_slow * x, x)
+        macd = ema_fast - ema_slow
+        sig = np.where(~np.isnan(sig), (1 - a_sig) * sig + a_sig * macd, macd)
+
+    # Crossovers and trend confirmations resolve to the same side of the signal line
+    decision = np.full(n_rows, "HOLD", dtype="<U4")
+    decision[macd > sig] = "BUY"
+    decision[macd < sig] = "SELL"
+    out[ok] = decision
+    return out
+
+
+def bollinger_panel(
+    panel: BarPanel, period: int = 20, std_dev: float = 2.0
+) -> np.ndarray:
+    """Panel counterpart of bollinger_bands_signal (population stdev bands)."""
+    out = _hold(panel)
+    ok = (panel.lengths >= period) & ~_any_nan(panel, panel.c)
+    if not ok.any() or period <= 0:
+        return out
+
+    window = panel.c[:, -period:]
+    sma = window.mean(axis=1)
+    stdev = np.sqrt(((window - sma[:, None]) ** 2).mean(axis=1))
+    # statistics.pstdev is exact: only an all-equal window has zero spread
+    ok &= window.max(axis=1) != window.min(axis=1)
+
+    close = window[:, -1]
+    out[ok & (close < sma - std_dev * stdev)] = "BUY"
+    out[ok & (close > sma + std_dev * stdev)] = "SELL"
+    return out
+
+
+def moving_average_panel(
+    panel: BarPanel, short_window: int = 5, long_window: int = 20
+) -> np.ndarray:
+    """Panel counterpart of moving_average_signal (SMA crossover)."""
+    out = _hold(panel)
+    ok = (panel.lengths >= long_window + 1) & ~_any_nan(panel, panel.c)
+    if not ok.any():
+        return out
+
+    c = panel.c
+    prev_short, prev_long = _window_mean(c, -1, short_window), _window_mean(
+        c, -1, long_window
+    )
+    curr_short, curr_long = _window_mean(c, 0, short_window), _window_mean(
+        c, 0, long_window
+    )
+
+    out[ok & (prev_short >= prev_long) & (curr_short < curr_long)] = "SELL"
+    out[ok & (prev_short <= prev_long) & (curr_short > curr_long)] = "BUY"
+    return out
+
+
+def vwap_panel(panel: BarPanel, config: Optional[VWAPConfig] = None) -> np.ndarray:
+    """Panel counterpart of vwap_signal (last close vs VWAP of prior bars)."""
+    cfg = config or VWAPConfig()
+    out = _hold(panel)
+    n = panel.lengths
+    c, v = panel.c, panel.v
+    last_c, last_v = c[:, -1], v[:, -1]
+    with np.errstate(invalid="ignore"):
+        ok = (n >= 2) & (last_c > 0) & (last_v > 0)
+    if not ok.any():
+        return out
+
+    prior = panel.valid_mask()
+    prior[:, -1] = False
+    with np.errstate(invalid="ignore"):
+        bad = (prior & (np.isnan(c) | np.isnan(v) | ~(v > 0))).any(axis=1)
+        pv = np.where(prior, c * v, 0.0).sum(axis=1)
+        vol = np.where(prior, v, 0.0).sum(axis=1)
+        vwap = pv / np.where(vol > 0, vol, np.nan)
+    ok &= ~bad & ~np.isnan(vwap)
+
+    # Symmetry safeguard: two equal-volume bars resolve to the tie policy
+    if cfg.enable_symmetry and panel.n_bars >= 2:
+        c0, v0 = c[:, -2], v[:, -2]
+        with np.errstate(invalid="ignore"):
+            sym = (n == 2) & (v0 == last_v) & (v0 > 0) & ~np.isnan(c0)
+            vwap_two = (c0 * v0 + last_c * last_v) / (v0 + last_v)
+            sym &= np.abs(vwap_two - (c0 + last_c) / 2) <= cfg.tolerance
+        out[(n == 2) & sym & (last_c > 0) & (last_v > 0)] = cfg.tie_policy
+        ok &= ~sym
+
+    with np.errstate(invalid="ignore"):
+        tie = np.abs(last_c - vwap) <= cfg.tolerance
+    out[ok & tie] = cfg.tie_policy
+    out[ok & ~tie & (last_c > vwap)] = "BUY"
+    out[ok & ~tie & (last_c < vwap)] = "SELL"
+    return out
+
+
+def breakout_intraday_panel(panel: BarPanel, window: int = 5) -> np.ndarray:
+    """Panel counterpart of breakout_intraday (prior-window high/low break)."""
+    if window <= 0:
+        return _hold(panel)
+    return _breakout(panel, min_bars=window, lookback=window, tie_sell=True)
+
+
+def breakout_v1_panel(panel: BarPanel, window: int = 3) -> np.ndarray:
+    """Panel counterpart of breakout_v1 (full-history high/low break)."""
+    return _breakout(panel, min_bars=window, lookback=None, tie_sell=True)
+
+
+def breakout_polygon_panel(panel: BarPanel, min_bars: int = 3) -> np.ndarray:
+    """Panel counterpart of BreakoutPolygonSignal.generate on injected bars."""
+    return _breakout(panel, min_bars=min_bars, lookback=None, tie_sell=False)
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+PANEL_STRATEGIES: Dict[str, Callable[..., np.ndarray]] = {
+    "bollinger": bollinger_panel,
+    "breakout_intraday": breakout_intraday_panel,
+    "breakout_polygon": breakout_polygon_panel,
+    "breakout_v1": breakout_v1_panel,
+    "macd": macd_panel,
+    "ma": moving_average_panel,
+    "rsi": rsi_panel,
+    "vwap": vwap_panel,
+}
+
+
+def evaluate_panel(
+    panel: BarPanel,
+    strategies: Optional[Iterable[str]] = None,
+    params: Optional[Mapping[str, Mapping[str, Any]]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate several panel strategies over all symbols.
+
+    Args:
+        panel: BarPanel with the symbols to scan
+        strategies: registry keys to run (default: all PANEL_STRATEGIES)
+        params: optional per-strategy keyword overrides, e.g. {"rsi": {"period": 7}}
+
+    Returns:
+        dict of strategy name -> decision array aligned with ``panel.symbols``
+    """
+    names = list(strategies) if strategies is not None else list(PANEL_STRATEGIES)
+    params = params or {}
+    results: Dict[str, np.ndarray] = {}
+    for name in names:
+        if name not in PANEL_STRATEGIES:
+            raise KeyError(f"unknown panel strategy: {name}")
+        try:
+            results[name] = PANEL_STRATEGIES[name](panel, **dict(params.get(name, {})))
+        except Exception as e:  # noqa: BLE001
+            logger.error("panel strategy %s failed: %s", name, e)
+            results[name] = _hold(panel)
+    return results
+
+
+__all__ = [
+    "BarPanel",
+    "PANEL_STRATEGIES",
+    "evaluate_panel",
+    "bollinger_panel",
+    "breakout_intraday_panel",
+    "breakout_polygon_panel",
+    "breakout_v1_panel",
+    "macd_panel",
+    "moving_average_panel",
+    "rsi_panel",
+    "vwap_panel",
+]
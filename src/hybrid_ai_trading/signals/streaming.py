@@ -0,0 +1,275 @@
+"""
+Streaming Indicator State (Hybrid AI Quant Pro v1.0 - O(1) per Tick)
+--------------------------------------------------------------------
+Stateful counterparts of the batch signal classes for live tick paths
+(runner_stream.on_tick). Each state ingests one close at a time and keeps
+bounded memory per symbol instead of rebuilding a pandas Series per call.
+
+States:
+- MACDState       EMA fast/slow + EMA signal (pandas adjust=False recursion)
+- RSIState        simple-average RSI over the last `period` deltas
+- BollingerState  sliding-window mean/variance (Welford add/remove)
+- VWAPState       cumulative price*volume / volume of prior bars
+
+Parity:
+- Outputs match MACDSignal / RSISignal / BollingerBandsSignal /
+  vwap_signal on the same history (see tests/signals/test_streaming_parity.py)
+- Running sums are re-summed from the window every `resync` updates to
+  stop floating-point drift over long sessions
+- NaN / non-numeric ticks are dropped (HOLD for that update) instead of
+  poisoning the whole history like the batch guards do
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from .vwap import VWAPConfig
+
+
+def _clean(value: Any) -> Optional[float]:
+    try:
+        x = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(x) else x
+
+
+class MACDState:
+    """Incremental MACD (EMA fast - EMA slow, EMA signal line)."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal_window: int = 9) -> None:
+        self.fast = fast
+        self.slow = slow
+        self.signal_window = signal_window
+        self._a_fast = 2.0 / (fast + 1.0)
+        self._a_slow = 2.0 / (slow + 1.0)
+        self._a_sig = 2.0 / (signal_window + 1.0)
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.ema_fast: Optional[float] = None
+        self.ema_slow: Optional[float] = None
+        self.macd: Optional[float] = None
+        self.signal_line: Optional[float] = None
+
+    def update(self, close: Any) -> Dict[str, Any]:
+        x = _clean(close)
+        if x is None:
+            return {"signal": "HOLD", "reason": "nan detected"}
+
+        if self.ema_fast is None:
+            self.ema_fast = self.ema_slow = x
+        else:
+            self.ema_fast = (1 - self._a_fast) * self.ema_fast + self._a_fast * x
+            self.ema_slow = (1 - self._a_slow) * self.ema_slow + self._a_slow * x
+        self.macd = self.ema_fast - self.ema_slow
+        if self.signal_line is None:
+            self.signal_line = self.macd
+        else:
+            self.signal_line = (
+                1 - self._a_sig
+            ) * self.signal_line + self._a_sig * self.macd
+        self.count += 1
+
+        if self.count < self.slow + self.signal_window:
+            return {"signal": "HOLD", "reason": "not enough bars"}
+
+        if self.macd > self.signal_line:
+            sig = "BUY"
+        elif self.macd < self.signal_line:
+            sig = "SELL"
+        else:
+            sig = "HOLD"
+        return {
+            "signal": sig,
+            "macd": self.macd,
+            "signal_line": self.signal_line,
+            "histogram": self.macd - self.signal_line,
+        }
+
+
+class RSIState:
+    """Incremental RSI using running gain/loss sums over the last `period` deltas."""
+
+    def __init__(self, period: int = 14, resync: int = 1024) -> None:
+        self.period = period
+        self.resync = resync
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.last_close: Optional[float] = None
+        self._gains: Deque[float] = deque(maxlen=self.period)
+        self._losses: Deque[float] = deque(maxlen=self.period)
+        self._sum_gain = 0.0
+        self._sum_loss = 0.0
+        self._since_resync = 0
+        self.rsi: Optional[float] = None
+
+    def update(self, close: Any) -> Dict[str, Any]:
+        x = _clean(close)
+        if x is None:
+            return {"signal": "HOLD", "reason": "nan detected"}
+
+        self.count += 1
+        prev, self.last_close = self.last_close, x
+        if prev is None:
+            return {"signal": "HOLD", "reason": "not enough bars"}
+
+        delta = x - prev
+        gain, loss = max(delta, 0.0), max(-delta, 0.0)
+        if len(self._gains) == self.period:
+            self._sum_gain -= self._gains[0]
+            self._sum_loss -= self._losses[0]
+        self._gains.append(gain)
+        self._losses.append(loss)
+        self._sum_gain += gain
+        self._sum_loss += loss
+
+        self._since_resync += 1
+        if self._since_resync >= self.resync:
+            self._sum_gain, self._sum_loss = sum(self._gains), sum(self._losses)
+            self._since_resync = 0
+
+        if self.count < self.period + 1:
+            return {"signal": "HOLD", "reason": "not enough bars"}
+
+        avg_gain = max(self._sum_gain, 0.0) / self.period
+        avg_loss = max(self._sum_loss, 0.0) / self.period
+        if avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else 0.0
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        self.rsi = rsi
+
+        if rsi < 30:
+            sig = "BUY"
+        elif rsi > 70:
+            sig = "SELL"
+        else:
+            sig = "HOLD"
+        return {"signal": sig, "rsi": float(rsi)}
+
+
+class BollingerState:
+    """Incremental Bollinger Bands over a sliding window of closes."""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0, resync: int = 1024):
+        self.period = period
+        self.std_dev = std_dev
+        self.resync = resync
+        self.reset()
+
+    def reset(self) -> None:
+        self._window: Deque[float] = deque(maxlen=self.period)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._same_run = 0
+        self._since_resync = 0
+
+    def _resum(self) -> None:
+        n = len(self._window)
+        self._mean = sum(self._window) / n
+        self._m2 = sum((x - self._mean) ** 2 for x in self._window)
+        self._since_resync = 0
+
+    def update(self, close: Any) -> Dict[str, Any]:
+        x = _clean(close)
+        if x is None:
+            return {
+                "signal": "HOLD",
+                "reason": "nan_detected",
+                "close": 0.0,
+                "upper": 0.0,
+                "lower": 0.0,
+            }
+
+        w = self._window
+        self._same_run = self._same_run + 1 if w and w[-1] == x else 1
+        if len(w) == self.period:
+            old = w[0]
+            w.append(x)
+            new_mean = self._mean + (x - old) / self.period
+            self._m2 += (x - old) * (x - new_mean + old - self._mean)
+            self._mean = new_mean
+        else:
+            w.append(x)
+            n = len(w)
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+
+        self._since_resync += 1
+        if self._since_resync >= self.resync:
+            self._resum()
+
+        if len(w) < self.period:
+            return {
+                "signal": "HOLD",
+                "reason": "insufficient_data",
+                "close": 0.0,
+                "upper": 0.0,
+                "lower": 0.0,
+            }
+
+        stdev = math.sqrt(max(self._m2, 0.0) / self.period)
+        upper = self._mean + self.std_dev * stdev
+        lower = self._mean - self.std_dev * stdev
+        out = {"close": x, "upper": upper, "lower": lower}
+
+        if self._same_run >= self.period:
+            return {"signal": "HOLD", "reason": "flat_stdev", **out}
+        if x < lower:
+            return {"signal": "BUY", "reason": "below_lower_band", **out}
+        if x > upper:
+            return {"signal": "SELL", "reason": "above_upper_band", **out}
+        return {"signal": "HOLD", "reason": "within_bands", **out}
+
+
+class VWAPState:
+    """Cumulative VWAP: compares each close to the VWAP of all prior bars."""
+
+    def __init__(self, config: Optional[VWAPConfig] = None) -> None:
+        self.config = config or VWAPConfig()
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self._pv = 0.0
+        self._vol = 0.0
+        self._first: Optional[tuple] = None
+
+    @property
+    def vwap(self) -> float:
+        return self._pv / self._vol if self._vol > 0 else float("nan")
+
+    def update(self, close: Any, volume: Any) -> str:
+        c, v = _clean(close), _clean(volume)
+        if c is None or v is None or c <= 0 or v <= 0:
+            return "HOLD"
+
+        cfg = self.config
+        prior_vwap = self.vwap
+        self.count += 1
+        self._pv += c * v
+        self._vol += v
+        if self.count == 1:
+            self._first = (c, v)
+            return "HOLD"
+
+        # Symmetry safeguard (two equal-volume bars), mirrors vwap_signal
+        if cfg.enable_symmetry and self.count == 2 and self._first[1] == v:
+            c0 = self._first[0]
+            if abs(self.vwap - (c0 + c) / 2) <= cfg.tolerance:
+                return cfg.tie_policy
+
+        if abs(c - prior_vwap) <= cfg.tolerance:
+            return cfg.tie_policy
+        return "BUY" if c > prior_vwap else "SELL"
+
+
+__all__ = ["MACDState", "RSIState", "BollingerState", "VWAPState"]
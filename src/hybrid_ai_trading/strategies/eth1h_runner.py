@@ -6,6 +6,8 @@ import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from hybrid_ai_trading.backtest_crypto import fetch_ohlcv_forward
+from hybrid_ai_trading.data.store.bar_cache import default_bar_cache
 from hybrid_ai_trading.execution.alerts import Alerts
 from hybrid_ai_trading.execution.brokers import (
     BinanceClient,
@@ -88,6 +90,12 @@ class ETH1HRunner:
         ex = ccxt.kraken() if self.cfg.exchange == "kraken" else ccxt.binance()
         ex.load_markets()
         symbol = self._norm_symbol(self.cfg.symbol)
+        cache = default_bar_cache()
+        if cache is not None:  # hourly reruns only download the newest bars
+            bars, _ = fetch_ohlcv_forward(
+                ex, symbol, self.cfg.tf, self.cfg.limit, cache=cache
+            )
+            return bars
         return ex.fetch_ohlcv(symbol, timeframe=self.cfg.tf, limit=self.cfg.limit)
 
     def _signal_from_bars(self, bars: List[List[float]]) -> Optional[str]:
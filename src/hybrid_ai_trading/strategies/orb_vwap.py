@@ -259,3 +259,4 @@ simulate_rr_exit = _pnl.simulate_rr_exit  # noqa: F401
 from hybrid_ai_trading.eval import pnl as _pnl  # canonical source
 
 simulate_rr_exit = _pnl.simulate_rr_exit  # noqa: F401
+simulate_rr_exits = _pnl.simulate_rr_exits  # noqa: F401
@@ -0,0 +1,327 @@
+"""
+Walk-forward optimization for ORBVWAPStrategy.
+
+- A multi-month 1m frame is split into calendar-day sessions; folds are
+  rolling windows of `train_sessions` followed by `test_sessions`.
+- The unit of work is one (session, ORBVWAPConfig) outcome: signals from
+  generate_signals, exit from eval.pnl.simulate_rr_exits. Outcomes live in a
+  SessionCache keyed by symbol + session + a hash of the session's bars +
+  config, so overlapping train/test windows (and reruns with a wider grid)
+  never recompute a session, while another symbol or revised bars for the
+  same day never reuse a stale outcome.
+- Missing outcomes are computed one task per session over a process pool;
+  signals are built once per (open_range_minutes, vwap_confirm) and shared
+  by every rr_target.
+- Each fold picks the best config on its train window and is scored
+  out-of-sample on the test window; the per-fold report can go to Parquet.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from hybrid_ai_trading.eval.pnl import simulate_rr_exits
+from hybrid_ai_trading.strategies.orb_vwap import ORBVWAPConfig, ORBVWAPStrategy
+
+log = logging.getLogger("hybrid_ai_trading.strategies.orb_walkforward")
+
+DEFAULT_GRID: Dict[str, List[Any]] = {
+    "open_range_minutes": [5, 10, 15],
+    "rr_target": [1.0, 1.5, 2.0],
+    "vwap_confirm": [True, False],
+}
+
+OBJECTIVES = ("total_ticks", "mean_ticks")
+
+SessionKey = Tuple[str, pd.Timestamp, str]  # symbol, session day, bar hash
+CacheKey = Tuple[str, pd.Timestamp, str, ORBVWAPConfig, int]
+
+
+@dataclass(frozen=True)
+class WalkForwardConfig:
+    train_sessions: int = 20
+    test_sessions: int = 5
+    step: Optional[int] = None  # default: test_sessions (non-overlapping tests)
+    risk_ticks: int = 5
+    objective: str = "total_ticks"
+    workers: Optional[int] = None  # default: os.cpu_count(); <=1 runs inline
+
+
+@dataclass(frozen=True)
+class SessionOutcome:
+    direction: int  # +1 long, -1 short, 0 no signal
+    ticks: float
+    entry_time: Optional[pd.Timestamp] = None
+    exit_time: Optional[pd.Timestamp] = None
+
+
+class SessionCache:
+    """Memo of (symbol, session, bar hash, config, risk_ticks) -> SessionOutcome."""
+
+    def __init__(self) -> None:
+        self._data: Dict[CacheKey, SessionOutcome] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._data
+
+    def get(self, key: CacheKey) -> SessionOutcome:
+        self.hits += 1
+        return self._data[key]
+
+    def put(self, key: CacheKey, outcome: SessionOutcome) -> None:
+        self.misses += 1
+        self._data[key] = outcome
+
+
+# ----------------------------------------------------------------------
+# Sessions, grid, folds
+# ----------------------------------------------------------------------
+def split_sessions(df: pd.DataFrame) -> Dict[pd.Timestamp, pd.DataFrame]:
+    """Calendar-day sessions of a DatetimeIndex bar frame (vwap added if missing)."""
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise ValueError("walk-forward needs a DatetimeIndex")
+    df = df.sort_index()
+    out = {}
+    for day, sess in df.groupby(df.index.normalize()):
+        if "vwap" not in sess.columns:
+            if "volume" not in sess.columns:
+                raise ValueError("bars need a vwap or volume column")
+            pv = (sess["close"] * sess["volume"]).cumsum()
+            sess = sess.assign(vwap=pv / sess["volume"].cumsum())
+        out[day] = sess
+    return out
+
+
+def session_key(symbol: str, day: Any, sess: pd.DataFrame) -> SessionKey:
+    """Cache identity of one session: symbol, day and a hash of its bars."""
+    digest = hashlib.blake2b(
+        pd.util.hash_pandas_object(sess, index=True).to_numpy().tobytes(),
+        digest_size=8,
+    )
+    return (symbol, day, f"{len(sess)}:{digest.hexdigest()}")
+
+
+def expand_configs(
+    grid: Optional[Mapping[str, Iterable[Any]]] = None, tick_size: float = 0.01
+) -> List[ORBVWAPConfig]:
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    names = sorted(grid)
+    return [
+        ORBVWAPConfig(tick_size=tick_size, **dict(zip(names, vals)))
+        for vals in itertools.product(*(list(grid[n]) for n in names))
+    ]
+
+
+def make_folds(
+    sessions: Sequence[Any], train: int, test: int, step: Optional[int] = None
+) -> List[Tuple[List[Any], List[Any]]]:
+    """Rolling (train, test) session windows; the last fold must have a full test."""
+    if train < 1 or test < 1:
+        raise ValueError("train and test windows must be >= 1 session")
+    step = step or test
+    folds = []
+    start = 0
+    while start + train + test <= len(sessions):
+        folds.append(
+            (
+                list(sessions[start : start + train]),
+                list(sessions[start + train : start + train + test]),
+            )
+        )
+        start += step
+    return folds
+
+
+# ----------------------------------------------------------------------
+# Per-session evaluation (one pool task per session)
+# ----------------------------------------------------------------------
+def evaluate_session(
+    sess: pd.DataFrame, configs: Sequence[ORBVWAPConfig], risk_ticks: int = 5
+) -> List[SessionOutcome]:
+    """Outcome of each config on one session, signals shared across rr_target."""
+    signals: Dict[Tuple[int, bool], Tuple[pd.DataFrame, Any, int]] = {}
+    out = []
+    for cfg in configs:
+        sig_key = (cfg.open_range_minutes, cfg.vwap_confirm)
+        if sig_key not in signals:
+            frame = ORBVWAPStrategy(cfg).generate_signals(sess, sess.index[0])
+            hits = frame.index[frame["signal"] != 0]
+            entry = hits[0] if len(hits) else None
+            direction = int(frame.loc[entry, "signal"]) if entry is not None else 0
+            signals[sig_key] = (frame, entry, direction)
+        frame, entry, direction = signals[sig_key]
+        if entry is None:
+            out.append(SessionOutcome(0, 0.0))
+            continue
+        ((ticks, exit_idx),) = simulate_rr_exits(
+            frame,
+            [entry],
+            direction,
+            tick_size=cfg.tick_size,
+            rr_target=cfg.rr_target,
+            risk_ticks=risk_ticks,
+        )
+        out.append(SessionOutcome(direction, float(ticks), entry, exit_idx))
+    return out
+
+
+def _session_task(
+    args: Tuple[Any, pd.DataFrame, List[ORBVWAPConfig], int],
+) -> Tuple[Any, List[ORBVWAPConfig], List[SessionOutcome]]:
+    day, sess, configs, risk_ticks = args
+    return day, configs, evaluate_session(sess, configs, risk_ticks)
+
+
+def fill_cache(
+    sessions: Mapping[Any, pd.DataFrame],
+    days: Iterable[Any],
+    configs: Sequence[ORBVWAPConfig],
+    cache: SessionCache,
+    risk_ticks: int = 5,
+    workers: Optional[int] = None,
+    symbol: str = "",
+) -> Dict[Any, SessionKey]:
+    """Compute every missing (day, config) outcome, one task per session.
+
+    Returns the session keys used, so callers can read the cache back.
+    """
+    keys = {day: session_key(symbol, day, sessions[day]) for day in days}
+    tasks = []
+    for day, key in keys.items():
+        todo = [c for c in configs if (*key, c, risk_ticks) not in cache]
+        if todo:
+            tasks.append((day, sessions[day], todo, risk_ticks))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    def _store(results: Iterable[Any]) -> None:
+        for day, todo, outcomes in results:
+            for cfg, outcome in zip(todo, outcomes):
+                cache.put((*keys[day], cfg, risk_ticks), outcome)
+
+    if workers <= 1 or len(tasks) <= 1:
+        _store(map(_session_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            _store(pool.map(_session_task, tasks, chunksize=4))
+    return keys
+
+
+# ----------------------------------------------------------------------
+# Walk-forward
+# ----------------------------------------------------------------------
+def _score(outcomes: Sequence[SessionOutcome]) -> Dict[str, float]:
+    trades = [o.ticks for o in outcomes if o.direction != 0]
+    total = float(sum(trades))
+    return {
+        "trades": len(trades),
+        "total_ticks": total,
+        "mean_ticks": total / len(trades) if trades else 0.0,
+        "win_rate": (
+            100.0 * sum(t > 0 for t in trades) / len(trades) if trades else 0.0
+        ),
+    }
+
+
+def walk_forward(
+    df: pd.DataFrame,
+    grid: Optional[Mapping[str, Iterable[Any]]] = None,
+    wf: Optional[WalkForwardConfig] = None,
+    cache: Optional[SessionCache] = None,
+    out: Optional[str | Path] = None,
+    tick_size: float = 0.01,
+    symbol: str = "",
+) -> pd.DataFrame:
+    """
+    Run the walk-forward and return one row per fold.
+
+    Args:
+        df: 1m bars with a DatetimeIndex and open/high/low/close (+ vwap or volume)
+        grid: overrides for DEFAULT_GRID (open_range_minutes, rr_target, vwap_confirm)
+        wf: window sizes, risk_ticks, objective ("total_ticks"/"mean_ticks"), workers
+        cache: SessionCache to reuse across calls (a fresh one by default)
+        out: optional Parquet path for the per-fold report
+        symbol: ticker of `df`; part of the cache key when a cache is shared
+    """
+    wf = wf or WalkForwardConfig()
+    if wf.objective not in OBJECTIVES:
+        raise ValueError(f"unknown objective: {wf.objective}")
+    cache = cache if cache is not None else SessionCache()
+    sessions = split_sessions(df)
+    days = sorted(sessions)
+    folds = make_folds(days, wf.train_sessions, wf.test_sessions, wf.step)
+    configs = expand_configs(grid, tick_size)
+
+    needed = sorted({d for train, test in folds for d in train + test})
+    keys = fill_cache(
+        sessions, needed, configs, cache, wf.risk_ticks, wf.workers, symbol
+    )
+    log.info(
+        "walk-forward: %d folds, %d configs, %d cached outcomes",
+        len(folds),
+        len(configs),
+        len(cache),
+    )
+
+    rows = []
+    for k, (train, test) in enumerate(folds):
+        best_cfg, best = None, None
+        for cfg in configs:
+            s = _score([cache.get((*keys[d], cfg, wf.risk_ticks)) for d in train])
+            if best is None or s[wf.objective] > best[wf.objective]:
+                best_cfg, best = cfg, s
+        oos = _score([cache.get((*keys[d], best_cfg, wf.risk_ticks)) for d in test])
+        rows.append(
+            {
+                "fold": k,
+                "train_start": train[0],
+                "train_end": train[-1],
+                "test_start": test[0],
+                "test_end": test[-1],
+                "open_range_minutes": best_cfg.open_range_minutes,
+                "rr_target": best_cfg.rr_target,
+                "vwap_confirm": best_cfg.vwap_confirm,
+                "train_score": best[wf.objective],
+                "train_trades": best["trades"],
+                "test_trades": oos["trades"],
+                "test_ticks": oos["total_ticks"],
+                "test_mean_ticks": oos["mean_ticks"],
+                "test_win_rate": oos["win_rate"],
+            }
+        )
+
+    report = pd.DataFrame(rows)
+    if out is not None:
+        out = Path(out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        report.to_parquet(out, index=False)
+    return report
+
+
+__all__ = [
+    "DEFAULT_GRID",
+    "SessionCache",
+    "SessionOutcome",
+    "WalkForwardConfig",
+    "evaluate_session",
+    "expand_configs",
+    "fill_cache",
+    "make_folds",
+    "session_key",
+    "split_sessions",
+    "walk_forward",
+]
@@ -1 +1 @@
-from .bar_replay import ReplayResult, load_bars, run_replay
+from .bar_replay import ReplayResult, load_bars, replay_sessions, run_replay
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import logging
 import math
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hybrid_ai_trading.tools.replay_logger_hook import log_closed_trade
 
+logger = logging.getLogger("hybrid_ai_trading.tools.bar_replay")
+
 
 @dataclass
 class Position:
@@ -57,6 +61,19 @@ def orb_strategy_step(
     return pos, act
 
 
+def _prepare_bars(df: pd.DataFrame) -> pd.DataFrame:
+    if "timestamp" in df.columns:
+        df["timestamp"] = _to_datetime_col(df["timestamp"])
+        df = df.set_index("timestamp")
+    df = df.sort_index()
+    need = {"open", "high", "low", "close", "volume"}
+    if not need.issubset(df.columns):
+        raise ValueError(
+            "Data must have columns: open, high, low, close, volume (+ timestamp or dt index)"
+        )
+    return df
+
+
 def run_replay(
     df: pd.DataFrame,
     symbol: str,
@@ -67,21 +84,23 @@ def run_replay(
     risk_cents: float = 20.0,
     max_qty: int = 200,
     force_exit: bool = False,
+    log_trades: bool = True,
 ) -> ReplayResult:
-    assert mode in ("step", "auto")
-    if "timestamp" in df.columns:
-        df["timestamp"] = _to_datetime_col(df["timestamp"])
-        df = df.set_index("timestamp")
-    df = df.sort_index()
-    need = {"open", "high", "low", "close", "volume"}
-    if not need.issubset(df.columns):
-        raise ValueError(
-            "Data must have columns: open, high, low, close, volume (+ timestamp or dt index)"
-        )
+    # step = wait for Enter, auto = paced by `speed`, silent = unpaced (sweeps)
+    # fast = vectorized kernel (same result, no per-bar loop; see replay_sessions)
+    assert mode in ("step", "auto", "silent", "fast")
+    log_hook = log_closed_trade if log_trades else (lambda **_: None)
+    df = _prepare_bars(df)
     if len(df) < (orb_minutes + 2):
         raise ValueError(
             f"Not enough bars for ORB; need >= {orb_minutes+2}, have {len(df)}"
         )
+    if mode == "fast":
+        sessions = np.zeros(len(df), dtype=np.int64)
+        out = _orb_kernel(
+            df, sessions, 1, fees_per_share, orb_minutes, risk_cents, max_qty
+        )
+        return _fast_result(df, symbol, out, fees_per_share, force_exit, log_hook)
 
     orb_df = df.iloc[:orb_minutes]
     orb_high = float(orb_df["high"].max())
@@ -122,7 +141,7 @@ def run_replay(
                 et = entry_dt or (
                     ts.to_pydatetime() if hasattr(ts, "to_pydatetime") else ts
                 )
-                log_closed_trade(
+                log_hook(
                     symbol=symbol,
                     setup="ORB",
                     context_tags=[],
@@ -147,7 +166,9 @@ def run_replay(
             entry_dt = None
 
         try:
-            if mode == "step":
+            if mode == "silent":
+                pass
+            elif mode == "step":
                 input(
                     f"[{ts}] {symbol} close={row['close']:.4f} (Enter=next, Ctrl+C=stop)"
                 )
@@ -171,7 +192,7 @@ def run_replay(
                     else last_ts
                 )
                 et = entry_dt or lt
-                log_closed_trade(
+                log_hook(
                     symbol=symbol,
                     setup="ORB",
                     context_tags=[],
@@ -201,8 +222,270 @@ def run_replay(
     )
 
 
+# ----------------------------------------------------------------------
+# Vectorized replay (many sessions per call)
+# ----------------------------------------------------------------------
+def _orb_kernel(
+    df: pd.DataFrame,
+    sessions: np.ndarray,
+    n_sessions: int,
+    fees_per_share: float,
+    orb_minutes: int,
+    risk_cents: float,
+    max_qty: int,
+) -> Dict[str, Any]:
+    """
+    Array form of the run_replay bar loop over contiguous sessions.
+
+    Per session: ORB high/low over the first `orb_minutes` bars, one qty from
+    the ORB width, then the enter-above-ORH / exit-below-ORL state machine.
+    The state machine only ever acts on the first bar of each run of
+    same-sided breakout bars, so it reduces to run-collapsing the signed
+    breakout events and dropping a leading exit. PnL terms are accumulated
+    per session in bar order (np.add.at), matching the scalar loop exactly.
+    Sessions shorter than orb_minutes + 2 bars are left untouched.
+    """
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    close = df["close"].to_numpy(dtype=float)
+    n = len(close)
+
+    starts = np.searchsorted(sessions, np.arange(n_sessions))
+    lengths = np.diff(np.append(starts, n))
+    in_orb = np.arange(n) - starts[sessions] < orb_minutes
+
+    orb_high = np.full(n_sessions, np.nan)
+    orb_low = np.full(n_sessions, np.nan)
+    np.fmax.at(orb_high, sessions[in_orb], high[in_orb])
+    np.fmin.at(orb_low, sessions[in_orb], low[in_orb])
+    denom = np.fmax(0.01, orb_high - orb_low)
+    qty = np.floor((risk_cents / 100.0) / denom)
+    qty = np.maximum(1, np.minimum(max_qty, np.maximum(1, qty))).astype(np.int64)
+
+    live = ~in_orb & (lengths[sessions] >= orb_minutes + 2)
+    sign = np.where(live & (close > orb_high[sessions]), 1, 0)
+    sign = np.where(live & (close < orb_low[sessions]), -1, sign)
+
+    ev = np.flatnonzero(sign)
+    es, ess = sign[ev], sessions[ev]
+    first = np.ones(len(ev), dtype=bool)
+    first[1:] = ess[1:] != ess[:-1]
+    keep = first.copy()
+    keep[1:] |= es[1:] != es[:-1]
+    ev, es, ess, first = ev[keep], es[keep], ess[keep], first[keep]
+    first[1:] = ess[1:] != ess[:-1]
+    keep = ~(first & (es == -1))
+    ev, es, ess = ev[keep], es[keep], ess[keep]
+
+    exits = np.flatnonzero(es == -1)
+    ent_bar, ex_bar, ex_sess = ev[exits - 1], ev[exits], ess[exits]
+    q = qty[ex_sess]
+    terms = np.empty(2 * len(exits))
+    terms[0::2] = (close[ex_bar] - close[ent_bar]) * q
+    terms[1::2] = -((fees_per_share * q) * 2)
+    pnl = np.zeros(n_sessions)
+    np.add.at(pnl, np.repeat(ex_sess, 2), terms)
+
+    last_exit = np.full(n_sessions, -1, dtype=np.int64)
+    if len(exits):
+        tail = np.append(ex_sess[1:] != ex_sess[:-1], True)
+        last_exit[ex_sess[tail]] = ex_bar[tail]
+
+    open_entry = np.full(n_sessions, -1, dtype=np.int64)
+    if len(ev):
+        tail = np.append(ess[1:] != ess[:-1], True) & (es == 1)
+        open_entry[ess[tail]] = ev[tail]
+
+    return {
+        "starts": starts,
+        "lengths": lengths,
+        "qty": qty,
+        "trades": np.bincount(ess, minlength=n_sessions),
+        "pnl": pnl,
+        "close": close,
+        "entry_bars": ent_bar,
+        "exit_bars": ex_bar,
+        "exit_sessions": ex_sess,
+        "last_exit": last_exit,
+        "open_entry": open_entry,
+    }
+
+
+def _py_ts(ts: Any) -> Any:
+    return ts.to_pydatetime() if hasattr(ts, "to_pydatetime") else ts
+
+
+def _force_exit(out: Dict[str, Any], fees_per_share: float) -> None:
+    """Flatten open positions at each session's last close (single fee)."""
+    sess = np.flatnonzero(out["open_entry"] >= 0)
+    last_bar = out["starts"][sess] + out["lengths"][sess] - 1
+    q = out["qty"][sess]
+    close = out["close"]
+    terms = np.empty(2 * len(sess))
+    terms[0::2] = (close[last_bar] - close[out["open_entry"][sess]]) * q
+    terms[1::2] = -(fees_per_share * q)
+    np.add.at(out["pnl"], np.repeat(sess, 2), terms)
+
+
+def _log_fast_trades(
+    df: pd.DataFrame,
+    symbols: Any,
+    out: Dict[str, Any],
+    fees_per_share: float,
+    force_exit: bool,
+    log_hook: Any,
+) -> None:
+    index, close = df.index, out["close"]
+    legs = [
+        (e, x, s, "auto-logged exit", 2)
+        for e, x, s in zip(
+            out["entry_bars"].tolist(),
+            out["exit_bars"].tolist(),
+            out["exit_sessions"].tolist(),
+        )
+    ]
+    if force_exit:
+        for s in np.flatnonzero(out["open_entry"] >= 0).tolist():
+            last = int(out["starts"][s] + out["lengths"][s] - 1)
+            legs.append((int(out["open_entry"][s]), last, s, "force-exit at end", 1))
+    for e, x, s, notes, n_fees in legs:
+        q = int(out["qty"][s])
+        try:
+            log_hook(
+                symbol=symbols[s],
+                setup="ORB",
+                context_tags=[],
+                entry_time=_py_ts(index[e]),
+                exit_time=_py_ts(index[x]),
+                entry=float(close[e]),
+                exit=float(close[x]),
+                qty=q,
+                fees=float((fees_per_share * q) * n_fees),
+                slippage=0.0,
+                r_multiple=0.0,
+                notes=notes,
+                replay_id=f"{symbols[s]}-{str(index[x])[:10]}-orb-auto",
+            )
+        except Exception as _e:
+            logger.warning("[hook] log_closed_trade failed: %s", _e)
+
+
+def _fast_result(
+    df: pd.DataFrame,
+    symbol: str,
+    out: Dict[str, Any],
+    fees_per_share: float,
+    force_exit: bool,
+    log_hook: Any,
+) -> ReplayResult:
+    """ReplayResult for a single-session kernel run (run_replay mode="fast")."""
+    if force_exit:
+        _force_exit(out, fees_per_share)
+    _log_fast_trades(df, [symbol], out, fees_per_share, force_exit, log_hook)
+    close = out["close"]
+    last_exit, open_entry = int(out["last_exit"][0]), int(out["open_entry"][0])
+    pos = Position()
+    entry_px = None
+    if open_entry >= 0 and not force_exit:
+        entry_px = float(close[open_entry])
+        pos = Position(side="long", entry_px=entry_px, qty=int(out["qty"][0]))
+    return ReplayResult(
+        bars=len(df),
+        trades=int(out["trades"][0]),
+        pnl=float(round(float(out["pnl"][0]), 2)),
+        entry_px=entry_px,
+        exit_px=float(close[last_exit]) if last_exit >= 0 else None,
+        final_pos=pos,
+    )
+
+
+def replay_sessions(
+    data: pd.DataFrame | Mapping[str, pd.DataFrame],
+    symbol: str = "REPLAY",
+    fees_per_share: float = 0.003,
+    orb_minutes: int = 5,
+    risk_cents: float = 20.0,
+    max_qty: int = 200,
+    force_exit: bool = False,
+    log_trades: bool = False,
+) -> pd.DataFrame:
+    """
+    Replay many (symbol, day) ORB sessions in one vectorized pass.
+
+    `data` is one bar frame (optionally with a "symbol" column) or a mapping
+    of symbol -> bar frame; sessions are calendar days of the timestamp.
+    Each session gives the same numbers as run_replay(mode="silent") on that
+    day alone; sessions with fewer than orb_minutes + 2 bars are skipped.
+    Returns one row per session: symbol, session, bars, trades, pnl,
+    entry_px/exit_px and the final position (side, qty).
+    """
+    frames = data.items() if isinstance(data, Mapping) else [(symbol, data)]
+    parts = []
+    for sym, frame in frames:
+        frame = _prepare_bars(frame.copy())
+        if "symbol" not in frame.columns:
+            frame = frame.assign(symbol=sym)
+        parts.append(frame)
+    cols = [
+        "symbol",
+        "session",
+        "bars",
+        "trades",
+        "pnl",
+        "entry_px",
+        "exit_px",
+        "final_side",
+        "final_qty",
+    ]
+    if not parts:
+        return pd.DataFrame(columns=cols)
+    df = pd.concat(parts)
+    day = df.index.normalize() if isinstance(df.index, pd.DatetimeIndex) else None
+    df = df.assign(symbol=df["symbol"].astype(str), _day=day)
+    df = df.sort_values(["symbol", "_day"], kind="stable")
+    groups = df.groupby(["symbol", "_day"], sort=False, dropna=False)
+    codes = groups.ngroup().to_numpy(dtype=np.int64)
+    uniq = list(
+        df[["symbol", "_day"]].drop_duplicates().itertuples(index=False, name=None)
+    )
+    out = _orb_kernel(
+        df, codes, len(uniq), fees_per_share, orb_minutes, risk_cents, max_qty
+    )
+
+    ok = out["lengths"] >= orb_minutes + 2
+    open_entry = np.where(ok, out["open_entry"], -1)
+    out["open_entry"] = open_entry
+    if force_exit:
+        _force_exit(out, fees_per_share)
+    if log_trades:
+        syms = [str(k[0]) for k in uniq]
+        _log_fast_trades(df, syms, out, fees_per_share, force_exit, log_closed_trade)
+
+    close = out["close"]
+    still_open = (open_entry >= 0) & (not force_exit)
+    res = pd.DataFrame(
+        {
+            "symbol": [k[0] for k in uniq],
+            "session": [k[1] for k in uniq],
+            "bars": out["lengths"],
+            "trades": out["trades"],
+            "pnl": [round(float(x), 2) for x in out["pnl"]],
+            "entry_px": np.where(still_open, close[open_entry], np.nan),
+            "exit_px": np.where(out["last_exit"] >= 0, close[out["last_exit"]], np.nan),
+            "final_side": np.where(still_open, "long", None),
+            "final_qty": np.where(still_open, out["qty"], 0),
+        },
+        columns=cols,
+    )
+    return res[ok].reset_index(drop=True)
+
+
 def load_bars(path: str) -> pd.DataFrame:
     ext = str(path).lower()
+    if ext.endswith(".tick"):
+        from hybrid_ai_trading.data.store.tick_archive import TickFile, ticks_to_bars
+
+        return ticks_to_bars(TickFile(path).records)
     if ext.endswith((".parquet", ".pq", ".pqt")):
         df = pd.read_parquet(path)
     else:
@@ -0,0 +1,136 @@
+"""
+HTTP client benchmark: per-request latency of urllib, bare requests and the
+shared keep-alive transport (utils.http_transport).
+
+- By default starts a keep-alive HTTP/1.1 server on loopback; --certfile and
+  --keyfile serve HTTPS instead, where every new connection also pays the
+  TLS handshake
+- --url benchmarks a real endpoint instead of the local server
+- Each client issues the same number of sequential GETs; the table shows
+  ms per request (mean and p95)
+
+CLI:
+  python -m hybrid_ai_trading.tools.http_bench --requests 300
+  python -m hybrid_ai_trading.tools.http_bench --certfile cert.pem --keyfile key.pem
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import ssl
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, Optional
+
+import numpy as np
+import requests
+
+from hybrid_ai_trading.utils.http_transport import HttpTransport
+
+BODY = b'{"status": "OK", "results": []}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # headers and body go out as separate writes; without TCP_NODELAY a
+    # reused connection stalls ~40ms per request on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def local_server(
+    certfile: Optional[str] = None, keyfile: Optional[str] = None
+) -> Iterator[str]:
+    """Serve BODY on an ephemeral loopback port; yields the base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    scheme = "http"
+    if certfile:
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ctx.load_cert_chain(certfile, keyfile)
+        # handshake on first read, after the handler has set TCP_NODELAY
+        server.socket = ctx.wrap_socket(
+            server.socket, server_side=True, do_handshake_on_connect=False
+        )
+        scheme = "https"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"{scheme}://127.0.0.1:{server.server_address[1]}/bench"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _time(fn: Callable[[], None], n: int) -> Dict[str, float]:
+    fn()  # warm-up: imports, DNS, the transport's first connection
+    ms = np.empty(n)
+    for i in range(n):
+        t0 = time.perf_counter()
+        fn()
+        ms[i] = (time.perf_counter() - t0) * 1000.0
+    return {"mean_ms": float(ms.mean()), "p95_ms": float(np.percentile(ms, 95))}
+
+
+def benchmark(url: str, n: int = 300, verify: bool = True) -> Dict[str, Dict]:
+    """ms per GET of `url` for each client, n sequential requests each."""
+    ctx = None if verify else ssl._create_unverified_context()
+    transport = HttpTransport(retries=0)
+
+    def with_urllib() -> None:
+        with urllib.request.urlopen(url, timeout=10, context=ctx) as r:
+            r.read()
+
+    def with_requests() -> None:
+        requests.get(url, timeout=10, verify=verify).content
+
+    def with_transport() -> None:
+        transport.get(url, verify=verify).content
+
+    try:
+        return {
+            "urllib.urlopen": _time(with_urllib, n),
+            "requests.get": _time(with_requests, n),
+            "shared transport": _time(with_transport, n),
+        }
+    finally:
+        transport.close()
+
+
+def main(argv=None) -> None:  # pragma: no cover
+    ap = argparse.ArgumentParser("HTTP client benchmark")
+    ap.add_argument("--requests", type=int, default=300, help="GETs per client")
+    ap.add_argument("--url", help="benchmark this URL instead of a local server")
+    ap.add_argument("--certfile", help="serve the local benchmark over HTTPS")
+    ap.add_argument("--keyfile")
+    args = ap.parse_args(argv)
+
+    if args.url:
+        server = contextlib.nullcontext(args.url)
+    else:
+        server = local_server(args.certfile, args.keyfile)
+    with server as url:
+        verify = args.url is not None or not args.certfile  # self-signed locally
+        if not verify:
+            requests.packages.urllib3.disable_warnings()
+        results = benchmark(url, args.requests, verify=verify)
+    print(f"{url}  ({args.requests} sequential GETs per client)")
+    for name, r in results.items():
+        print(f"  {name:<17} {r['mean_ms']:7.2f} ms/req  p95 {r['p95_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,413 @@
+"""
+Parallel parameter sweep for backtest_crypto and bar_replay.
+
+- Bars are loaded once and published in a SharedMemory block; each worker
+  attaches to it (zero copy) in the pool initializer.
+- The grid fans out over a ProcessPoolExecutor sized to the available cores,
+  in chunks of points per task to amortize IPC.
+- Finished points stream into a CSV journal as they complete, so an
+  interrupted sweep resumes by skipping every key already in the journal.
+  The journal header is fixed per target (params, every metric, error);
+  rows with an error or missing required metrics are rerun on resume.
+- At the end the journal is sorted into one leaderboard (.csv or .parquet).
+
+Targets:
+- crypto: backtest_crypto.simulate_trades + summarize_trades
+          (atr_k, risk_quote, fee_bps, min_quote, cap; tf fixed)
+- replay: bar_replay.replay_sessions over every session day, summed
+          (orb_minutes, risk_cents, fees_per_share, max_qty, force_exit)
+
+CLI:
+  python -m hybrid_ai_trading.tools.param_sweep --target crypto \\
+      --bars-file data/BTCUSDT_1m.csv --grid atr_k=1.5,2,2.5 --grid fee_bps=5,10 \\
+      --out reports/sweep_crypto.parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+log = logging.getLogger("hybrid_ai_trading.tools.param_sweep")
+
+# Columns of the shared bar block: [ts_ms, open, high, low, close, volume]
+BAR_COLUMNS = ("ts", "open", "high", "low", "close", "volume")
+
+SORT_KEYS = {"crypto": "finalEquity", "replay": "pnl"}
+
+# Journal schema per target: every metric column, and the subset a row must
+# carry to count as finished (crypto "no trades" rows only have trades/bars)
+METRIC_COLUMNS = {
+    "crypto": [
+        "bars",
+        "trades",
+        "win%",
+        "avgR%",
+        "PF",
+        "maxDD%",
+        "finalEquity",
+        "periodDays",
+        "CAGR%",
+        "msg",
+    ],
+    "replay": ["sessions", "trades", "pnl"],
+}
+REQUIRED_METRICS = {"crypto": ["trades"], "replay": ["sessions", "trades", "pnl"]}
+
+
+# ----------------------------------------------------------------------
+# Bars <-> shared memory
+# ----------------------------------------------------------------------
+def bars_from_frame(df: pd.DataFrame) -> np.ndarray:
+    """Convert a bar DataFrame (timestamp column or DatetimeIndex) to the sweep block."""
+    df = df.copy()
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    if "timestamp" in df.columns:
+        df = df.set_index(pd.to_datetime(df["timestamp"], errors="coerce"))
+    idx = pd.DatetimeIndex(df.index)
+    if idx.tz is not None:
+        idx = idx.tz_convert("UTC").tz_localize(None)
+    ts_ms = idx.as_unit("ms").asi8.astype(np.float64)
+    cols = [df[c].to_numpy(dtype=np.float64) for c in BAR_COLUMNS[1:]]
+    block = np.column_stack([ts_ms, *cols])
+    return block[np.argsort(block[:, 0], kind="stable")]
+
+
+def bars_from_ohlcv(rows: Sequence[Sequence[float]]) -> np.ndarray:
+    """Convert ccxt-style [ts, o, h, l, c, v] rows to the sweep block."""
+    return np.asarray([list(r[:6]) for r in rows], dtype=np.float64).reshape(-1, 6)
+
+
+class SharedBars:
+    """Publish a float64 bar block in shared memory for the lifetime of a sweep."""
+
+    def __init__(self, bars: np.ndarray) -> None:
+        bars = np.ascontiguousarray(bars, dtype=np.float64)
+        self.shape = bars.shape
+        self._shm = shared_memory.SharedMemory(create=True, size=max(bars.nbytes, 1))
+        view = np.ndarray(self.shape, dtype=np.float64, buffer=self._shm.buf)
+        view[:] = bars
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        return {"name": self._shm.name, "shape": self.shape}
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedBars":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _attach(spec: Dict[str, Any], target: str, fixed: Dict[str, Any]) -> None:
+    """Pool initializer: attach to the shared block and build per-worker views."""
+    if spec.get("name"):
+        shm = shared_memory.SharedMemory(name=spec["name"])
+        bars = np.ndarray(tuple(spec["shape"]), dtype=np.float64, buffer=shm.buf)
+        _WORKER["shm"] = shm
+    else:
+        bars = spec["array"]
+    _WORKER.update(bars=bars, target=target, fixed=dict(fixed), cache={})
+
+
+# ----------------------------------------------------------------------
+# Targets
+# ----------------------------------------------------------------------
+def _eval_crypto(params: Dict[str, Any]) -> Dict[str, Any]:
+    from hybrid_ai_trading import backtest_crypto as bc
+
+    cache = _WORKER["cache"]
+    if "ohl" not in cache:
+        cache["ohl"] = _WORKER["bars"].tolist()
+        ts = _WORKER["bars"][:, 0]
+        cache["tf_ms"] = int(np.median(np.diff(ts))) if len(ts) > 1 else 60_000
+    kw = {**_WORKER["fixed"], **params}
+    tf = str(kw.pop("tf", "5m"))
+    label = str(kw.pop("symbol", "SWEEP"))
+    trades = bc.simulate_trades(cache["ohl"], tf, **kw)
+    out = bc.summarize_trades(label, len(cache["ohl"]), tf, cache["tf_ms"], trades)
+    out.pop("symbol", None)
+    out.pop("tf", None)
+    return out
+
+
+def _eval_replay(params: Dict[str, Any]) -> Dict[str, Any]:
+    from hybrid_ai_trading.tools.bar_replay import replay_sessions
+
+    cache = _WORKER["cache"]
+    if "frame" not in cache:
+        bars = _WORKER["bars"]
+        df = pd.DataFrame(bars[:, 1:], columns=list(BAR_COLUMNS[1:]))
+        df.index = pd.to_datetime(bars[:, 0].astype(np.int64), unit="ms")
+        cache["frame"] = df
+    kw = {**_WORKER["fixed"], **params}
+    symbol = str(kw.pop("symbol", "SWEEP"))
+    kw["orb_minutes"] = int(kw.get("orb_minutes", 5))
+    if "max_qty" in kw:
+        kw["max_qty"] = int(kw["max_qty"])
+
+    res = replay_sessions(cache["frame"], symbol, **kw)
+    return {
+        "sessions": len(res),
+        "trades": int(res["trades"].sum()),
+        "pnl": round(float(res["pnl"].sum()), 2),
+    }
+
+
+SWEEP_TARGETS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "crypto": _eval_crypto,
+    "replay": _eval_replay,
+}
+
+
+def _run_chunk(points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    fn = SWEEP_TARGETS[_WORKER["target"]]
+    rows = []
+    for params in points:
+        try:
+            metrics = fn(dict(params))
+            err = ""
+        except Exception as e:  # noqa: BLE001
+            metrics, err = {}, f"{type(e).__name__}: {e}"
+        rows.append({"key": point_key(params), **params, **metrics, "error": err})
+    return rows
+
+
+# ----------------------------------------------------------------------
+# Grid + journal
+# ----------------------------------------------------------------------
+def expand_grid(grid: Mapping[str, Iterable[Any]]) -> List[Dict[str, Any]]:
+    """Cartesian product of the grid, in a stable order."""
+    names = sorted(grid)
+    return [
+        dict(zip(names, vals)) for vals in itertools.product(*(grid[n] for n in names))
+    ]
+
+
+def point_key(params: Mapping[str, Any]) -> str:
+    return json.dumps({k: params[k] for k in sorted(params)}, sort_keys=True)
+
+
+def journal_path(out: str | Path) -> Path:
+    out = Path(out)
+    return out.with_name(out.stem + ".journal.csv")
+
+
+def journal_fields(target: str, params: Iterable[str]) -> List[str]:
+    """Fixed journal header: key, parameters, every metric column, error."""
+    return ["key", *sorted(params), *METRIC_COLUMNS[target], "error"]
+
+
+def completed_keys(journal: Path, required: Sequence[str] = ()) -> set:
+    """Keys of rows without an error that carry every `required` metric."""
+    if not journal.exists():
+        return set()
+    with journal.open("r", encoding="utf-8", newline="") as f:
+        return {
+            row["key"]
+            for row in csv.DictReader(f)
+            if not row.get("error") and all(row.get(m) for m in required)
+        }
+
+
+class _Journal:
+    """
+    Append-only CSV writer with a schema known up front. An existing journal
+    whose header lacks some of `fields` is rewritten once with the union.
+    """
+
+    def __init__(self, path: Path, fields: Sequence[str]) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fields = list(fields)
+        if path.exists() and path.stat().st_size:
+            with path.open("r", encoding="utf-8", newline="") as f:
+                reader = csv.DictReader(f)
+                old = list(reader.fieldnames or [])
+                rows = list(reader)
+            merged = list(dict.fromkeys([*old, *self._fields]))
+            self._fields = merged
+            if merged != old:
+                self._rewrite(rows)
+        else:
+            self._rewrite([])
+
+    def _rewrite(self, rows: List[Dict[str, Any]]) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=self._fields, extrasaction="ignore")
+            w.writeheader()
+            w.writerows(rows)
+        os.replace(tmp, self.path)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        with self.path.open("a", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=self._fields, extrasaction="ignore")
+            w.writerows(rows)
+
+
+def write_leaderboard(journal: Path, out: Path, sort_by: str) -> pd.DataFrame:
+    df = pd.read_csv(journal) if journal.exists() else pd.DataFrame()
+    if not df.empty:
+        df = df.drop_duplicates("key", keep="last")
+        if sort_by in df.columns:
+            df = df.sort_values(sort_by, ascending=False, na_position="last")
+        df = df.reset_index(drop=True)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if out.suffix.lower() in (".parquet", ".pq"):
+        df.to_parquet(out, index=False)
+    else:
+        df.to_csv(out, index=False)
+    return df
+
+
+# ----------------------------------------------------------------------
+# Driver
+# ----------------------------------------------------------------------
+def run_sweep(
+    bars: np.ndarray,
+    target: str,
+    grid: Mapping[str, Iterable[Any]],
+    out: str | Path,
+    fixed: Optional[Mapping[str, Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    sort_by: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Evaluate every grid point against `bars` and return the sorted leaderboard.
+
+    Args:
+        bars: (n, 6) float64 block [ts_ms, o, h, l, c, v] (see bars_from_frame)
+        target: "crypto" or "replay"
+        grid: parameter name -> candidate values
+        out: leaderboard path (.csv or .parquet); journal lives next to it
+        fixed: parameters shared by every point (e.g. {"tf": "1m"})
+        workers: process count (default: os.cpu_count(); <=1 runs inline)
+        chunk_size: grid points per task
+        sort_by: leaderboard column (default per target)
+    """
+    if target not in SWEEP_TARGETS:
+        raise ValueError(f"unknown sweep target: {target}")
+    out = Path(out)
+    journal = journal_path(out)
+    done = completed_keys(journal, REQUIRED_METRICS[target])
+    todo = [p for p in expand_grid(grid) if point_key(p) not in done]
+    log.info(
+        "sweep %s: %d points, %d already done", target, len(todo) + len(done), len(done)
+    )
+
+    writer = _Journal(journal, journal_fields(target, grid))
+    chunks = [todo[i : i + chunk_size] for i in range(0, len(todo), max(1, chunk_size))]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    fixed = dict(fixed or {})
+
+    if workers <= 1 or len(chunks) <= 1:
+        _attach({"array": np.asarray(bars, dtype=np.float64)}, target, fixed)
+        for chunk in chunks:
+            writer.write(_run_chunk(chunk))
+    elif chunks:
+        with (
+            SharedBars(bars) as shared,
+            ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                initializer=_attach,
+                initargs=(shared.spec, target, fixed),
+            ) as pool,
+        ):
+            futures = [pool.submit(_run_chunk, chunk) for chunk in chunks]
+            for fut in as_completed(futures):
+                writer.write(fut.result())
+
+    return write_leaderboard(journal, out, sort_by or SORT_KEYS[target])
+
+
+def _parse_value(raw: str) -> Any:
+    raw = raw.strip()
+    for cast in (int, float):
+        try:
+            return cast(raw)
+        except ValueError:
+            continue
+    if raw.lower() in ("true", "false"):
+        return raw.lower() == "true"
+    return raw
+
+
+def _parse_pairs(items: Sequence[str], multi: bool) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for item in items or []:
+        name, _, vals = item.partition("=")
+        parsed = [_parse_value(v) for v in vals.split(",") if v.strip()]
+        out[name.strip()] = parsed if multi else parsed[0]
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    ap = argparse.ArgumentParser("Parameter sweep")
+    ap.add_argument("--target", choices=sorted(SWEEP_TARGETS), default="crypto")
+    ap.add_argument("--bars-file", help="CSV/Parquet bars (timestamp,o,h,l,c,v)")
+    ap.add_argument("--symbol", default="BTC/USDC")
+    ap.add_argument("--exchange", default="kraken")
+    ap.add_argument("--tf", default="5m")
+    ap.add_argument("--limit", type=int, default=1500, help="bars to fetch (crypto)")
+    ap.add_argument("--grid", action="append", default=[], help="name=v1,v2,...")
+    ap.add_argument("--set", action="append", default=[], help="name=value (fixed)")
+    ap.add_argument("--out", default="reports/sweep_leaderboard.csv")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--chunk-size", type=int, default=8)
+    args = ap.parse_args(argv)
+
+    if args.bars_file:
+        from hybrid_ai_trading.tools.bar_replay import load_bars
+
+        bars = bars_from_frame(load_bars(args.bars_file))
+    else:
+        from hybrid_ai_trading import backtest_crypto as bc
+
+        ex = bc.get_exchange(args.exchange)
+        if ex is None:
+            raise SystemExit("ccxt not available and no --bars-file given")
+        rows, _ = bc.fetch_ohlcv_forward(
+            ex, bc.map_symbol(args.symbol, args.exchange), args.tf, args.limit
+        )
+        bars = bars_from_ohlcv(rows)
+
+    fixed = {"symbol": args.symbol, **_parse_pairs(args.set, multi=False)}
+    if args.target == "crypto":
+        fixed.setdefault("tf", args.tf)
+    board = run_sweep(
+        bars,
+        args.target,
+        _parse_pairs(args.grid, multi=True),
+        args.out,
+        fixed=fixed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    print(board.head(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
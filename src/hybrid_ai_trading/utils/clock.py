@@ -0,0 +1,79 @@
+"""
+Clocks (Hybrid AI Quant Pro v1.0 - Wall / Virtual Time)
+-------------------------------------------------------
+- WallClock: real time; sleep() and asleep() really wait
+- VirtualClock: event time for tests and backtests; sleep()/asleep() advance
+  the clock instantly instead of waiting, so a schedule spanning hours runs
+  at CPU speed with identical timestamps
+- Both expose now() -> epoch seconds, sleep(s), asleep(s) and
+  isoformat(ts=None) for fill/event timestamps
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+class WallClock:
+    virtual = False
+
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    async def asleep(self, seconds: float) -> None:
+        await asyncio.sleep(max(0.0, seconds))
+
+    def isoformat(self, ts: Optional[float] = None) -> str:
+        return _iso(self.now() if ts is None else ts)
+
+
+class VirtualClock:
+    virtual = True
+
+    def __init__(self, start: Union[float, datetime, None] = None) -> None:
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        self._now = float(time.time() if start is None else start)
+        self._lock = threading.Lock()
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        with self._lock:
+            if seconds > 0:
+                self._now += seconds
+            return self._now
+
+    def advance_to(self, ts: float) -> float:
+        with self._lock:
+            if ts > self._now:
+                self._now = float(ts)
+            return self._now
+
+    def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+
+    async def asleep(self, seconds: float) -> None:
+        self.advance(seconds)
+        await asyncio.sleep(0)
+
+    def isoformat(self, ts: Optional[float] = None) -> str:
+        return _iso(self.now() if ts is None else ts)
+
+
+Clock = Union[WallClock, VirtualClock]
+
+__all__ = ["Clock", "VirtualClock", "WallClock"]
@@ -1,19 +1,405 @@
-from datetime import datetime
+"""
+Quote feature store.
+
+- write_quote appends to an in-memory column buffer per (symbol, day); a
+  buffer is written out as one new part file once it holds `flush_rows`
+  rows or its oldest row is `flush_ms` old. Nothing on disk is re-read or
+  rewritten per tick.
+- Layout: quotes/{symbol}_{day}/part-00000.parquet, part-00001.parquet, ...
+  compact() merges the parts of a partition into quotes/{symbol}_{day}.parquet
+  (the single-file layout older readers expect) and removes them.
+- read_quotes stitches the compacted file and any later parts together.
+- QuoteWriter puts a bounded queue and a writer thread in front of a store
+  so tick callbacks only enqueue; when the queue is full it drops the
+  newest or oldest quote, or coalesces to the latest quote per symbol.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import date, datetime
 from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+log = logging.getLogger("hybrid_ai_trading.utils.feature_store")
+
+Key = Tuple[str, str]  # (symbol, YYYYMMDD)
+
+
+class _Buffer:
+    __slots__ = ("fields", "cols", "rows", "born")
+
+    def __init__(self, fields: Tuple[str, ...], born: float) -> None:
+        self.fields = fields
+        self.cols: Dict[str, List[Any]] = {f: [] for f in ("ts", *fields)}
+        self.rows = 0
+        self.born = born
 
 
 class FeatureStore:
-    def __init__(self, root="data/feature_store"):
+    def __init__(
+        self,
+        root="data/feature_store",
+        flush_rows: int = 10_000,
+        flush_ms: float = 1_000.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.root = Path(root)
         (self.root / "quotes").mkdir(parents=True, exist_ok=True)
+        self.flush_rows = max(1, int(flush_rows))
+        self.flush_s = flush_ms / 1000.0
+        self.clock = clock
+        self._buffers: Dict[Key, _Buffer] = {}
+        self._next_part: Dict[Key, int] = {}
+        self._days: Dict[date, str] = {}
+        self._last_sweep = clock()
+        self.rows_written = 0
+        self.parts_written = 0
 
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
     def write_quote(self, symbol: str, ts: datetime, **fields):
-        df = pd.DataFrame([{"ts": ts, "symbol": symbol, **fields}])
-        day = ts.strftime("%Y%m%d")
-        pth = self.root / "quotes" / f"{symbol}_{day}.parquet"
-        if pth.exists():
-            old = pd.read_parquet(pth)
-            df = pd.concat([old, df], ignore_index=True)
-        df.to_parquet(pth, index=False)
+        d = ts.date()
+        day = self._days.get(d)
+        if day is None:
+            day = self._days[d] = d.strftime("%Y%m%d")
+        key = (symbol, day)
+        now = self.clock()
+
+        buf = self._buffers.get(key)
+        names = tuple(fields)
+        if buf is not None and buf.fields != names:
+            self._flush_key(key)  # schema change: close the current part
+            buf = None
+        if buf is None:
+            buf = self._buffers[key] = _Buffer(names, now)
+
+        cols = buf.cols
+        cols["ts"].append(ts)
+        for name, value in fields.items():
+            cols[name].append(value)
+        buf.rows += 1
+
+        if buf.rows >= self.flush_rows:
+            self._flush_key(key)
+        if now - self._last_sweep >= self.flush_s:
+            self.flush_due(now)
+
+    def flush_due(self, now: Optional[float] = None) -> int:
+        """Flush every buffer whose oldest row is at least flush_ms old."""
+        now = self.clock() if now is None else now
+        self._last_sweep = now
+        due = [k for k, b in self._buffers.items() if now - b.born >= self.flush_s]
+        for key in due:
+            self._flush_key(key)
+        return len(due)
+
+    def flush(self) -> None:
+        """Write out every pending buffer."""
+        for key in list(self._buffers):
+            self._flush_key(key)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "FeatureStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def pending_rows(self) -> int:
+        return sum(b.rows for b in self._buffers.values())
+
+    def _partition(self, key: Key) -> Path:
+        return self.root / "quotes" / f"{key[0]}_{key[1]}"
+
+    def _flush_key(self, key: Key) -> None:
+        buf = self._buffers.pop(key, None)
+        if buf is None or not buf.rows:
+            return
+        part_dir = self._partition(key)
+        seq = self._next_part.get(key)
+        if seq is None:
+            part_dir.mkdir(parents=True, exist_ok=True)
+            seq = 1 + max(
+                (_part_no(p) for p in part_dir.glob("part-*.parquet")), default=-1
+            )
+        table = pa.table(
+            {
+                "ts": buf.cols["ts"],
+                "symbol": pa.array([key[0]] * buf.rows, pa.string()),
+                **{f: buf.cols[f] for f in buf.fields},
+            }
+        )
+        pq.write_table(table, part_dir / f"part-{seq:05d}.parquet")
+        self._next_part[key] = seq + 1
+        self.rows_written += buf.rows
+        self.parts_written += 1
+
+    # ------------------------------------------------------------------
+    # Compaction / read path
+    # ------------------------------------------------------------------
+    def compact(self, day: Optional[str] = None, symbol: Optional[str] = None) -> int:
+        """
+        Merge part files into quotes/{symbol}_{day}.parquet (appending to an
+        existing compacted file) and delete the parts. Pending buffers for the
+        selected partitions are flushed first. Returns partitions compacted.
+        """
+        for key in list(self._buffers):
+            if (symbol is None or key[0] == symbol) and (day is None or key[1] == day):
+                self._flush_key(key)
+
+        done = 0
+        for part_dir in sorted(
+            (self.root / "quotes").glob(f"{symbol or '*'}_{day or '*'}")
+        ):
+            if not part_dir.is_dir():
+                continue
+            parts = _parts(part_dir)
+            if not parts:
+                continue
+            target = _compacted(part_dir)
+            frames = [pd.read_parquet(target)] if target.exists() else []
+            frames += [pd.read_parquet(p) for p in parts]
+            tmp = target.with_suffix(".parquet.tmp")
+            pd.concat(frames, ignore_index=True).to_parquet(tmp, index=False)
+            os.replace(tmp, target)
+            for p in parts:
+                p.unlink()
+            try:
+                part_dir.rmdir()
+            except OSError:
+                pass
+            sym, _, d = part_dir.name.rpartition("_")
+            self._next_part.pop((sym, d), None)
+            done += 1
+        log.info("compacted %d quote partitions", done)
+        return done
+
+    def read_quotes(self, symbol: str, day: str) -> pd.DataFrame:
+        """All rows on disk for one symbol/day, in write order (buffers excluded)."""
+        part_dir = self._partition((symbol, day))
+        target = _compacted(part_dir)
+        files = ([target] if target.exists() else []) + (
+            _parts(part_dir) if part_dir.is_dir() else []
+        )
+        if not files:
+            return pd.DataFrame(columns=["ts", "symbol"])
+        return pd.concat([pd.read_parquet(p) for p in files], ignore_index=True)
+
+
+def _part_no(path: Path) -> int:
+    try:
+        return int(path.stem.split("-", 1)[1])
+    except (IndexError, ValueError):
+        return -1
+
+
+def _compacted(part_dir: Path) -> Path:
+    # not with_suffix: symbols such as BRK.B contain dots
+    return part_dir.parent / f"{part_dir.name}.parquet"
+
+
+def _parts(part_dir: Path) -> List[Path]:
+    return sorted(part_dir.glob("part-*.parquet"), key=_part_no)
+
+
+# ----------------------------------------------------------------------
+# Asynchronous ingestion
+# ----------------------------------------------------------------------
+Quote = Tuple[str, datetime, Dict[str, Any]]
+
+POLICIES = ("drop_newest", "drop_oldest", "coalesce")
+
+
+class QuoteWriter:
+    """
+    Bounded queue + dedicated writer thread in front of a FeatureStore.
+
+    submit() never blocks and never touches disk: it appends to a deque
+    (atomic in CPython) and returns False only if the quote was dropped.
+    Once started, the writer thread is the only user of the store; it
+    drains the queue every `interval_ms` (or sooner when the queue passes
+    half full) and runs store.flush_due().
+
+    When the queue holds `capacity` quotes:
+    - drop_newest: the new quote is dropped
+    - drop_oldest: the oldest queued quote is dropped
+    - coalesce: the quote is parked in a per-symbol slot that keeps only
+      the latest quote; later quotes for that symbol join the slot until
+      the writer drains it, so per-symbol order is preserved
+    """
+
+    def __init__(
+        self,
+        store: FeatureStore,
+        capacity: int = 100_000,
+        policy: str = "coalesce",
+        interval_ms: float = 50.0,
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        self.store = store
+        self.capacity = max(1, int(capacity))
+        self.policy = policy
+        self.interval_s = interval_ms / 1000.0
+        self._queue: Deque[Quote] = deque()
+        self._latest: Dict[str, Quote] = {}
+        self._latest_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_depth = max(1, self.capacity // 2)
+        # producer-side counters
+        self.submitted = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        # writer-side counters
+        self.written = 0
+        self.errors = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    # ------------------------------------------------------------------
+    def submit(self, symbol: str, ts: datetime, **fields: Any) -> bool:
+        self.submitted += 1
+        item = (symbol, ts, fields)
+        q = self._queue
+        if symbol in self._latest or len(q) >= self.capacity:
+            return self._overflow(item)
+        q.append(item)
+        depth = len(q)
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if depth >= self._wake_depth and not self._wake.is_set():
+            self._wake.set()
+        return True
+
+    def _overflow(self, item: Quote) -> bool:
+        if self.policy == "coalesce":
+            with self._latest_lock:
+                if item[0] in self._latest:
+                    self.coalesced += 1
+                self._latest[item[0]] = item
+            self._wake.set()
+            return True
+        self.dropped += 1
+        if self.policy == "drop_newest":
+            return False
+        try:
+            self._queue.popleft()
+        except IndexError:
+            pass
+        self._queue.append(item)
+        return True
+
+    # ------------------------------------------------------------------
+    def start(self) -> "QuoteWriter":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="feature-store-writer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Stop the thread after a final drain and flush every store buffer.
+
+        If the thread is still writing after `timeout`, the final drain and
+        flush are skipped (the store is not thread-safe) and False is
+        returned; call stop() again to finish.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                log.warning(
+                    "feature store writer still busy after %ss; "
+                    "final drain/flush skipped",
+                    timeout,
+                )
+                return False
+            self._thread = None
+        self.drain()
+        self.store.flush()
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
+            self.drain()
+            try:
+                self.store.flush_due()
+            except Exception as e:
+                self.errors += 1
+                log.warning("feature store flush failed: %s", e)
+
+    def drain(self) -> int:
+        """Write every queued quote (then the coalesced slots) to the store."""
+        t0 = time.perf_counter()
+        n = 0
+        q, write = self._queue, self.store.write_quote
+        while True:
+            try:
+                sym, ts, fields = q.popleft()
+            except IndexError:
+                break
+            n += self._write(write, sym, ts, fields)
+        if self._latest:
+            with self._latest_lock:
+                latest, self._latest = self._latest, {}
+            for sym, ts, fields in latest.values():
+                n += self._write(write, sym, ts, fields)
+        if n:
+            ms = (time.perf_counter() - t0) * 1000.0
+            self.flushes += 1
+            self.last_flush_ms = ms
+            self.max_flush_ms = max(self.max_flush_ms, ms)
+            self.total_flush_ms += ms
+            self.written += n
+        return n
+
+    def _write(self, write: Callable[..., Any], sym, ts, fields) -> int:
+        try:
+            write(symbol=sym, ts=ts, **fields)
+            return 1
+        except Exception as e:
+            self.errors += 1
+            log.warning("feature store write failed for %s: %s", sym, e)
+            return 0
+
+    # ------------------------------------------------------------------
+    def depth(self) -> int:
+        return len(self._queue) + len(self._latest)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": self.depth(),
+            "max_depth": self.max_depth,
+            "submitted": self.submitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "flushes": self.flushes,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "avg_flush_ms": self.total_flush_ms / self.flushes if self.flushes else 0.0,
+        }
@@ -0,0 +1,235 @@
+"""
+HTTP Transport (Hybrid AI Quant Pro v1.0 - Shared Keep-Alive Pools)
+-------------------------------------------------------------------
+- One requests.Session per process (shared_transport()), so TCP and TLS
+  connections are reused across calls and clients instead of being set up
+  for every request
+- Keep-alive pools sized per host: HOST_POOLS for the market-data APIs,
+  HAT_HTTP_POOL for everything else
+- gzip/deflate responses (Accept-Encoding) and connection retries with
+  exponential backoff; GET/HEAD also retry on 5xx, honouring Retry-After up
+  to RETRY_AFTER_MAX seconds (HAT_HTTP_RETRIES, HAT_HTTP_BACKOFF). 429 is
+  returned to the caller, which owns its rate-limit handling
+- request(..., retry=False) skips the transport retries for callers that
+  run their own retry loop, so attempts do not multiply
+- Timing hooks: add_hook(fn) gets one event dict per request (method,
+  host, url, status, elapsed_ms, error); stats() aggregates per host
+- get_json() keeps the urllib-style contract of the minimal clients: parsed
+  JSON, or {"_error": "..."} instead of raising
+
+requests/urllib3 speak HTTP/1.1 only; HTTP/2 would need an httpx backend,
+which is not a dependency.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger("hybrid_ai_trading.utils.http_transport")
+
+Hook = Callable[[Dict[str, Any]], None]
+
+# keep-alive connections kept per host
+HOST_POOLS: Dict[str, int] = {
+    "api.polygon.io": 32,
+    "rest.coinapi.io": 16,
+    "api.kraken.com": 8,
+    "min-api.cryptocompare.com": 8,
+    "api.benzinga.com": 4,
+    "data.alpaca.markets": 8,
+}
+_RETRY_STATUS = (500, 502, 503, 504)
+RETRY_AFTER_MAX = 5.0  # seconds; longer server waits are not slept inside a call
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry whose Retry-After wait is capped at RETRY_AFTER_MAX."""
+
+    # urllib3 retries 413/429 on Retry-After regardless of status_forcelist
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        after = super().get_retry_after(response)
+        return None if after is None else min(after, RETRY_AFTER_MAX)
+
+
+class HttpTransport:
+    def __init__(
+        self,
+        pool_maxsize: Optional[int] = None,
+        host_pools: Optional[Mapping[str, int]] = None,
+        retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        timeout: float = 10.0,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.pool_maxsize = int(pool_maxsize or os.getenv("HAT_HTTP_POOL", "10"))
+        self.host_pools = dict(HOST_POOLS if host_pools is None else host_pools)
+        self.retries = int(
+            os.getenv("HAT_HTTP_RETRIES", "2") if retries is None else retries
+        )
+        self.backoff = float(
+            os.getenv("HAT_HTTP_BACKOFF", "0.2") if backoff is None else backoff
+        )
+        self.timeout = float(timeout)
+        self._hooks: List[Hook] = []
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+        self.session = self._session(headers, self.retries)
+        # no transport retries: for callers that run their own retry loop
+        self.plain_session = self._session(headers, 0)
+
+    def _session(
+        self, headers: Optional[Mapping[str, str]], retries: int
+    ) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(
+            {
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "hybrid-ai-trading/1.0",
+                **dict(headers or {}),
+            }
+        )
+        default = self._adapter(self.pool_maxsize, retries)
+        session.mount("https://", default)
+        session.mount("http://", default)
+        for host, size in self.host_pools.items():
+            adapter = self._adapter(size, retries)
+            session.mount(f"https://{host}/", adapter)
+            session.mount(f"http://{host}/", adapter)
+        return session
+
+    def _adapter(self, maxsize: int, retries: int) -> HTTPAdapter:
+        retry = _CappedRetry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=retries,
+            backoff_factor=self.backoff,
+            status_forcelist=_RETRY_STATUS,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        return HTTPAdapter(pool_connections=1, pool_maxsize=maxsize, max_retries=retry)
+
+    # ------------------------------------------------------------------
+    def add_hook(self, fn: Hook) -> None:
+        """Call `fn(event)` after every request (timing/metrics)."""
+        self._hooks.append(fn)
+
+    def remove_hook(self, fn: Hook) -> None:
+        if fn in self._hooks:
+            self._hooks.remove(fn)
+
+    def _record(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            st = self._stats.setdefault(
+                event["host"],
+                {"requests": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0},
+            )
+            st["requests"] += 1
+            st["errors"] += event["error"] is not None or (event["status"] or 0) >= 400
+            st["total_ms"] += event["elapsed_ms"]
+            st["max_ms"] = max(st["max_ms"], event["elapsed_ms"])
+        for fn in list(self._hooks):
+            try:
+                fn(event)
+            except Exception:  # noqa: BLE001
+                logger.exception("http hook failed")
+
+    def request(self, method: str, url: str, retry: bool = True, **kwargs: Any) -> Any:
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session if retry else self.plain_session
+        t0 = time.perf_counter()
+        resp, err = None, None
+        try:
+            send = getattr(session, method.lower(), None)
+            if send is None:
+                send = partial(session.request, method.upper())
+            resp = send(url, **kwargs)
+            return resp
+        except Exception as e:
+            err = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            status = getattr(resp, "status_code", None)
+            self._record(
+                {
+                    "method": method.upper(),
+                    "host": urlsplit(url).netloc,
+                    "url": url,
+                    "status": status if isinstance(status, int) else None,
+                    "elapsed_ms": (time.perf_counter() - t0) * 1000.0,
+                    "error": err,
+                }
+            )
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def get_json(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> Any:
+        """Parsed JSON body, or {"_error": "..."} on transport/HTTP/JSON errors."""
+        try:
+            r = self.get(
+                url,
+                headers=dict(headers or {}),
+                params=params,
+                timeout=self.timeout if timeout is None else timeout,
+            )
+            r.raise_for_status()
+            return r.json()
+        except Exception as e:  # noqa: BLE001
+            return {"_error": f"{type(e).__name__}: {e}"}
+
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-host request/error counts and latency (avg_ms, max_ms)."""
+        with self._lock:
+            return {
+                h: {
+                    **s,
+                    "avg_ms": s["total_ms"] / s["requests"] if s["requests"] else 0.0,
+                }
+                for h, s in self._stats.items()
+            }
+
+    def close(self) -> None:
+        self.session.close()
+        self.plain_session.close()
+
+
+_SHARED: Optional[HttpTransport] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_transport() -> HttpTransport:
+    """Process-wide HttpTransport used by the data clients."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = HttpTransport()
+        return _SHARED
+
+
+__all__ = ["HOST_POOLS", "HttpTransport", "shared_transport"]
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
+import importlib
 import json
 import os
 import pathlib
 import re
+import threading
 import time
-import urllib.error
-import urllib.request
-from typing import Any, Dict, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
 
-__all__ = ["load_providers", "get_price", "get_price_retry", "get_prices"]
+from hybrid_ai_trading.utils.http_transport import shared_transport
+from hybrid_ai_trading.utils.quote_cache import QuoteCache
+
+__all__ = [
+    "asset_class",
+    "get_price",
+    "get_price_retry",
+    "get_prices",
+    "load_providers",
+    "quote_cache",
+]
 
-_CACHE: Dict[str, Any] = {}
-_CACHE_TTL_SEC = float(os.getenv("HAT_CACHE_TTL_SEC", "3.0") or 0)
 HAT_NO_CACHE = os.getenv("HAT_NO_CACHE", "").strip().lower() in (
     "1",
     "true",
@@ -56,12 +65,7 @@ def load_providers(path: str = "config/providers.yaml") -> Dict[str, Any]:
 
 
 def _http_json(url: str, headers=None, timeout=5):
-    req = urllib.request.Request(url, headers=headers or {})
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as r:
-            return json.loads(r.read().decode("utf-8"))
-    except Exception as e:
-        return {"_error": f"{type(e).__name__}: {e}"}
+    return shared_transport().get_json(url, headers=headers, timeout=timeout)
 
 
 def _is_crypto_symbol(symbol: str) -> bool:
@@ -107,149 +111,304 @@ def _synthetic_price(symbol: str) -> float:
     return round(((h % 9000) / 100.0) + 10.0, 2)
 
 
-def get_price(symbol: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Routing rules (best-effort; unit tests assert the 'source' string):
-      - Metals: XAUUSD/XAGUSD -> CoinAPI (exchangerate/last_price) else synthetic with source='coinapi'
-      - FX: CoinAPI first, Polygon fallback; else synthetic with source='coinapi'
-      - Crypto: CoinAPI -> Kraken -> CryptoCompare; else synthetic with source='coinapi'
-      - Equity/other: Polygon -> CoinAPI; else synthetic with source='polygon'
-    """
-    now = time.time()
-    s = (symbol or "").strip()
-    if not s:
-        return {
-            "symbol": symbol,
-            "price": None,
-            "source": "none",
-            "reason": "empty_symbol",
-        }
+# ---------------------------------------------------------------------------
+# Long-lived clients + concurrent, hedged fan-out
+# ---------------------------------------------------------------------------
+_CLIENT_MODULES = {
+    "coinapi": "coinapi_client",
+    "polygon": "polygon_client",
+    "kraken": "kraken_client",
+    "cryptocompare": "cryptocompare_client",
+}
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+_WORKERS = int(os.getenv("HAT_PRICE_WORKERS", "16") or 16)
+_HEDGE_AFTER_SEC = float(os.getenv("HAT_HEDGE_MS", "500") or 500) / 1000.0
+_TIMEOUT_SEC = float(os.getenv("HAT_PRICE_TIMEOUT_SEC", "8") or 8)
+_BULK_CHUNK = 100
+
+Route = List[Tuple[str, str]]  # [(provider, request symbol)] in preference order
+
+# Quote TTL per asset class; HAT_CACHE_TTL_SEC (legacy) overrides them all.
+CACHE_TTLS: Dict[str, float] = {
+    "crypto": 2.0,
+    "fx": 3.0,
+    "equity": 3.0,
+    "metal": 10.0,
+}
+if os.getenv("HAT_CACHE_TTL_SEC"):
+    CACHE_TTLS = dict.fromkeys(CACHE_TTLS, float(os.environ["HAT_CACHE_TTL_SEC"]))
+
+_QUOTES = QuoteCache(
+    ttl=lambda s: CACHE_TTLS[asset_class(s)],
+    stale_s=float(os.getenv("HAT_CACHE_STALE_SEC", "30") or 0),
+    max_entries=int(os.getenv("HAT_CACHE_MAX", "4096") or 4096),
+)
 
-    if not HAT_NO_CACHE and s in _CACHE:
-        ts, val = _CACHE.get(s, (0, None))
-        if now - ts <= _CACHE_TTL_SEC:
-            return val
 
-    providers = cfg.get("providers", {}) if isinstance(cfg, dict) else {}
-    result = {"symbol": s, "price": None, "source": "none", "reason": "no_clients"}
+def quote_cache() -> QuoteCache:
+    """The process-wide quote cache behind get_price/get_prices."""
+    return _QUOTES
 
-    def _try_coinapi_fx(pair: str):
-        try:
-            from hybrid_ai_trading.data.clients.coinapi_client import Client as Coin
-        except Exception:
-            try:
-                from hybrid_ai_trading.data_clients.coinapi_client import Client as Coin
-            except Exception:
-                return None
-        try:
-            cli = Coin(**(providers.get("coinapi", {}) or {}))
-            if hasattr(cli, "exchangerate"):
-                r = cli.exchangerate(pair)
-                px = float(r.get("rate"))
-            else:
-                px = float(cli.last_price(pair))
-            return {"symbol": s, "price": px, "source": "coinapi"}
-        except Exception:
-            return None
 
-    def _try_polygon_equity(sym: str):
+def _client(name: str, providers: Dict[str, Any]) -> Any:
+    """One client instance per (provider, config), built on first use."""
+    conf = providers.get(name, {}) or {}
+    key = (name, json.dumps(conf, sort_keys=True, default=str))
+    with _CLIENTS_LOCK:
+        if key in _CLIENTS:
+            return _CLIENTS[key]
+    cli = None
+    for pkg in ("hybrid_ai_trading.data.clients", "hybrid_ai_trading.data_clients"):
         try:
-            from hybrid_ai_trading.data.clients.polygon_client import Client as Poly
+            cls = getattr(
+                importlib.import_module(f"{pkg}.{_CLIENT_MODULES[name]}"), "Client"
+            )
         except Exception:
-            try:
-                from hybrid_ai_trading.data_clients.polygon_client import Client as Poly
-            except Exception:
-                return None
+            continue
         try:
-            cli = Poly(**(providers.get("polygon", {}) or {}))
-            px = float(getattr(cli, "last_price")(sym))
-            return {"symbol": s, "price": px, "source": "polygon"}
+            cli = cls(**conf)
         except Exception:
-            return None
+            cli = None
+        break
+    with _CLIENTS_LOCK:
+        return _CLIENTS.setdefault(key, cli)
 
-    def _try_kraken_crypto(sym: str):
-        try:
-            from hybrid_ai_trading.data.clients.kraken_client import Client as Kr
-        except Exception:
-            try:
-                from hybrid_ai_trading.data_clients.kraken_client import Client as Kr
-            except Exception:
-                return None
-        try:
-            cli = Kr(**(providers.get("kraken", {}) or {}))
-            px = float(cli.last_price(sym))
-            return {"symbol": s, "price": px, "source": "kraken"}
-        except Exception:
-            return None
 
-    def _try_cryptocompare(sym: str):
+def _executor() -> ThreadPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(max(1, _WORKERS), thread_name_prefix="price")
+        return _POOL
+
+
+def asset_class(symbol: str) -> str:
+    """Asset class used for routing and cache TTLs: metal, fx, crypto or equity."""
+    s = (symbol or "").strip()
+    if s in ("XAUUSD", "XAGUSD"):
+        return "metal"
+    if _is_fx_symbol(s):
+        return "fx"
+    if _is_crypto_symbol(s):
+        return "crypto"
+    return "equity"
+
+
+def _route(s: str) -> Tuple[Route, str]:
+    """
+    Provider preference per asset class and the fallback source label:
+      - Metals: XAUUSD/XAGUSD -> CoinAPI
+      - FX: CoinAPI, Polygon (C:<pair>)
+      - Crypto: CoinAPI -> Kraken -> CryptoCompare
+      - Equity/other: Polygon -> CoinAPI (CL1!: Polygon only)
+    """
+    cls = asset_class(s)
+    if cls == "metal":
+        return [("coinapi", s)], "coinapi"
+    if cls == "fx":
+        return [("coinapi", s), ("polygon", f"C:{s}")], "coinapi"
+    if cls == "crypto":
+        return [("coinapi", s), ("kraken", s), ("cryptocompare", s)], "coinapi"
+    if s.upper() == "CL1!":
+        return [("polygon", s)], "polygon"
+    return [("polygon", s), ("coinapi", s)], "polygon"
+
+
+def _quote(cli: Any, sym: str) -> Tuple[Optional[float], Optional[str]]:
+    """(price, source label) from one client call; price None when unpriced."""
+    if hasattr(cli, "exchangerate"):
+        return float(cli.exchangerate(sym).get("rate")), None
+    if hasattr(cli, "last_price"):
+        return float(cli.last_price(sym)), None
+    r = cli.last_quote(sym) or {}
+    px = r.get("price")
+    return (float(px) if px is not None else None), r.get("source")
+
+
+def _bulk(cli: Any, syms: List[str]) -> Dict[str, Tuple[float, Optional[str]]]:
+    out: Dict[str, Tuple[float, Optional[str]]] = {}
+    for sym, r in (cli.last_quotes(syms) or {}).items():
+        if isinstance(r, dict) and r.get("price") is not None:
+            out[sym] = (float(r["price"]), r.get("source"))
+    return out
+
+
+def _fan_out(
+    routes: Dict[str, Route],
+    providers: Dict[str, Any],
+    hedge_after: float,
+    timeout: float,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Price every symbol in `routes`:
+      1) symbols whose primary provider has a bulk endpoint (client.last_quotes)
+         are priced with one request per chunk
+      2) the rest fan out on the shared pool; a failed or unpriced answer moves
+         on to the next provider at once, and a primary still pending after
+         `hedge_after` seconds gets the next provider raced against it
+    Symbols that nobody priced before `timeout` are left out.
+    """
+    pool = _executor()
+    deadline = time.monotonic() + timeout
+    done: Dict[str, Dict[str, Any]] = {}
+    chains = {s: list(r) for s, r in routes.items()}
+
+    def ok(s: str, px: float, src: Optional[str], name: str) -> None:
+        done[s] = {"symbol": s, "price": px, "source": src or name}
+
+    groups: Dict[str, List[str]] = {}
+    for s, chain in chains.items():
+        name, req = chain[0]
+        if req == s and hasattr(_client(name, providers), "last_quotes"):
+            groups.setdefault(name, []).append(s)
+    bulk: Dict[Future, Tuple[str, List[str]]] = {}
+    for name, syms in groups.items():
+        if len(syms) < 2:
+            continue
+        cli = _client(name, providers)
+        for i in range(0, len(syms), _BULK_CHUNK):
+            chunk = syms[i : i + _BULK_CHUNK]
+            bulk[pool.submit(_bulk, cli, chunk)] = (name, chunk)
+    for f in wait(bulk, timeout=max(0.0, deadline - time.monotonic()))[0]:
         try:
-            from hybrid_ai_trading.data.clients.cryptocompare_client import Client as CC
+            got = f.result()
         except Exception:
+            continue
+        name, chunk = bulk[f]
+        for s in chunk:
+            chains[s].pop(0)  # this chunk already asked the provider
+            if s in got:
+                ok(s, got[s][0], got[s][1], name)
+
+    inflight: Dict[Future, Tuple[str, str]] = {}
+    live: Dict[str, int] = {s: 0 for s in chains}
+    launched: Dict[str, float] = {}
+
+    def launch(s: str) -> None:
+        while chains[s]:
+            name, req = chains[s].pop(0)
+            cli = _client(name, providers)
+            if cli is None:
+                continue
+            inflight[pool.submit(_quote, cli, req)] = (s, name)
+            live[s] += 1
+            launched[s] = time.monotonic()
+            return
+
+    for s in chains:
+        if s not in done:
+            launch(s)
+    while inflight:
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        hedge_at = min(
+            (
+                launched[s] + hedge_after
+                for s in chains
+                if s not in done and live[s] and chains[s]
+            ),
+            default=deadline,
+        )
+        finished = wait(
+            list(inflight),
+            timeout=max(0.0, min(hedge_at, deadline) - now),
+            return_when=FIRST_COMPLETED,
+        )[0]
+        for f in finished:
+            s, name = inflight.pop(f)
+            live[s] -= 1
+            if s in done:
+                continue
             try:
-                from hybrid_ai_trading.data_clients.cryptocompare_client import (
-                    Client as CC,
-                )
+                px, src = f.result()
             except Exception:
-                return None
-        try:
-            cli = CC(**(providers.get("cryptocompare", {}) or {}))
-            px = float(cli.last_price(sym))
-            return {"symbol": s, "price": px, "source": "cryptocompare"}
-        except Exception:
-            return None
-
-    # Metals
-    if s in ("XAUUSD", "XAGUSD"):
-        out = _try_coinapi_fx(s)
-        result = out or {
+                px, src = None, None
+            if px is not None:
+                ok(s, px, src, name)
+            elif not live[s]:
+                launch(s)
+        for f in [f for f, (s, _) in inflight.items() if s in done]:
+            del inflight[f]  # losing hedges finish in the background
+        now = time.monotonic()
+        for s in chains:
+            if s not in done and live[s] and chains[s]:
+                if now - launched[s] >= hedge_after:
+                    launch(s)
+    return done
+
+
+def _fetch_many(
+    symbols: List[str],
+    cfg: Dict[str, Any],
+    hedge_after: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fan-out for `symbols` with the synthetic fallback for unpriced ones."""
+    routes: Dict[str, Route] = {}
+    fallback: Dict[str, str] = {}
+    for s in symbols:
+        routes[s], fallback[s] = _route(s)
+    providers = cfg.get("providers", {}) if isinstance(cfg, dict) else {}
+    got = _fan_out(
+        routes,
+        providers or {},
+        _HEDGE_AFTER_SEC if hedge_after is None else hedge_after,
+        _TIMEOUT_SEC if timeout is None else timeout,
+    )
+    return {
+        s: got.get(s)
+        or {
             "symbol": s,
             "price": _synthetic_price(s),
-            "source": "coinapi",
+            "source": fallback[s],
             "reason": "fallback",
         }
+        for s in routes
+    }
 
-    # FX
-    elif _is_fx_symbol(s):
-        out = _try_coinapi_fx(s) or _try_polygon_equity(f"C:{s}")
-        result = out or {
-            "symbol": s,
-            "price": _synthetic_price(s),
-            "source": "coinapi",
-            "reason": "fallback",
-        }
 
-    # Crypto
-    elif _is_crypto_symbol(s):
-        out = _try_coinapi_fx(s) or _try_kraken_crypto(s) or _try_cryptocompare(s)
-        result = out or {
-            "symbol": s,
-            "price": _synthetic_price(s),
-            "source": "coinapi",
-            "reason": "fallback",
-        }
+def _resolve(
+    symbols: List[str],
+    cfg: Dict[str, Any],
+    hedge_after: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Shared-cache lookup; the misses are fetched in one batch."""
+
+    def fetch(syms: List[str]) -> Dict[str, Dict[str, Any]]:
+        return _fetch_many(syms, cfg, hedge_after, timeout)
 
-    # Equity / other
-    else:
-        if s.upper() == "CL1!":
-            out = _try_polygon_equity(s)
-            result = out or {
-                "symbol": s,
-                "price": _synthetic_price(s),
-                "source": "polygon",
-                "reason": "fallback",
-            }
-        else:
-            out = _try_polygon_equity(s) or _try_coinapi_fx(s)
-            result = out or {
-                "symbol": s,
-                "price": _synthetic_price(s),
-                "source": "polygon",
-                "reason": "fallback",
-            }
-
-    _CACHE[s] = (now, result)
-    return result
+    if HAT_NO_CACHE:
+        return fetch(list(dict.fromkeys(symbols)))
+    return _QUOTES.get_many(symbols, fetch)
+
+
+def get_price(symbol: str, cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Routing rules (best-effort; unit tests assert the 'source' string):
+      - Metals: XAUUSD/XAGUSD -> CoinAPI (exchangerate/last_price) else synthetic with source='coinapi'
+      - FX: CoinAPI first, Polygon fallback; else synthetic with source='coinapi'
+      - Crypto: CoinAPI -> Kraken -> CryptoCompare; else synthetic with source='coinapi'
+      - Equity/other: Polygon -> CoinAPI; else synthetic with source='polygon'
+    A primary that has not answered after HAT_HEDGE_MS is raced against the
+    next provider; the first price wins. Results go through quote_cache():
+    per-asset-class TTL (CACHE_TTLS), then HAT_CACHE_STALE_SEC of
+    stale-while-revalidate.
+    """
+    s = (symbol or "").strip()
+    if not s:
+        return {
+            "symbol": symbol,
+            "price": None,
+            "source": "none",
+            "reason": "empty_symbol",
+        }
+    return _resolve([s], cfg)[s]
 
 
 def get_price_retry(
@@ -271,8 +430,24 @@ def get_price_retry(
     }
 
 
-def get_prices(symbols: List[str], cfg: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def get_prices(
+    symbols: List[str],
+    cfg: Dict[str, Any],
+    hedge_after: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Batched get_price: cached symbols are served from the shared quote cache
+    (stale ones are refreshed in the background), symbols
+    whose primary provider has a bulk endpoint share one request per chunk,
+    and the rest are fetched concurrently on a bounded pool (HAT_PRICE_WORKERS)
+    with hedging after `hedge_after` seconds (default HAT_HEDGE_MS).
+    """
+    syms = list(symbols or [])
+    keys = {sym: (sym or "").strip() for sym in syms}
+    got = _resolve([k for k in keys.values() if k], cfg, hedge_after, timeout)
     out: Dict[str, Dict[str, Any]] = {}
-    for sym in list(symbols or []):
-        out[sym] = get_price(sym, cfg)
+    for sym in syms:
+        k = keys[sym]
+        out[sym] = got[k] if k else get_price(sym, cfg)
     return out
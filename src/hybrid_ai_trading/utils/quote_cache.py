@@ -0,0 +1,197 @@
+"""
+Quote cache.
+
+- Bounded LRU of the latest quote per symbol (`max_entries`); the least
+  recently used symbol is evicted first.
+- Each symbol has a TTL (a number, or a function of the symbol so asset
+  classes can differ). Within the TTL a lookup is a plain hit.
+- After the TTL and for up to `stale_s` more seconds the cached quote is
+  returned at once and a background refresh is started
+  (stale-while-revalidate). Older entries are misses and block on a fetch.
+- Single flight: a symbol has at most one fetch in flight; concurrent
+  callers missing the same symbol wait for that fetch instead of issuing
+  their own.
+- `fetch` is passed per call and takes a list of symbols, so a batch of
+  misses costs one batched fetch (e.g. utils.providers.get_prices).
+- stats() reports hits, stale hits, misses, joined waits, refreshes,
+  evictions, fetch errors and fetch latency.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+log = logging.getLogger("hybrid_ai_trading.utils.quote_cache")
+
+FetchMany = Callable[[List[str]], Dict[str, Any]]
+TTL = Union[float, Callable[[str], float]]
+
+
+class QuoteCache:
+    def __init__(
+        self,
+        ttl: TTL = 3.0,
+        stale_s: float = 30.0,
+        max_entries: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+        join_timeout_s: float = 30.0,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.ttl = ttl
+        self.stale_s = float(stale_s)
+        self.max_entries = int(max_entries)
+        self.clock = clock
+        self.join_timeout_s = float(join_timeout_s)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._refresher: Optional[ThreadPoolExecutor] = None
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.joined = 0
+        self.refreshes = 0
+        self.evictions = 0
+        self.errors = 0
+        self.fetches = 0
+        self.total_fetch_ms = 0.0
+        self.max_fetch_ms = 0.0
+
+    def _ttl(self, symbol: str) -> float:
+        return float(self.ttl(symbol) if callable(self.ttl) else self.ttl)
+
+    # ------------------------------------------------------------------
+    def get(self, symbol: str, fetch: FetchMany) -> Any:
+        return self.get_many([symbol], fetch).get(symbol)
+
+    def get_many(self, symbols: Iterable[str], fetch: FetchMany) -> Dict[str, Any]:
+        """Quotes for `symbols`; missing values are None when a fetch failed."""
+        now = self.clock()
+        out: Dict[str, Any] = {}
+        mine: List[str] = []
+        refresh: List[str] = []
+        joins: Dict[str, Future] = {}
+        with self._lock:
+            for s in symbols:
+                if s in out or s in joins or s in mine:
+                    continue
+                entry = self._entries.get(s)
+                age = now - entry[0] if entry is not None else None
+                ttl = self._ttl(s)
+                if age is not None and age <= ttl:
+                    self.hits += 1
+                    self._entries.move_to_end(s)
+                    out[s] = entry[1]
+                elif age is not None and age <= ttl + self.stale_s:
+                    self.stale_hits += 1
+                    self._entries.move_to_end(s)
+                    out[s] = entry[1]
+                    if s not in self._inflight:
+                        self.refreshes += 1
+                        self._inflight[s] = Future()
+                        refresh.append(s)
+                elif s in self._inflight:
+                    self.joined += 1
+                    joins[s] = self._inflight[s]
+                else:
+                    self.misses += 1
+                    self._inflight[s] = Future()
+                    mine.append(s)
+
+        if refresh:
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    2, thread_name_prefix="quote-refresh"
+                )
+            self._refresher.submit(self._fetch, refresh, fetch)
+        if mine:
+            out.update(self._fetch(mine, fetch))
+        for s, fut in joins.items():
+            try:
+                out[s] = fut.result(timeout=self.join_timeout_s)
+            except Exception:  # noqa: BLE001
+                out[s] = None
+        return out
+
+    def _fetch(self, symbols: List[str], fetch: FetchMany) -> Dict[str, Any]:
+        t0 = time.perf_counter()
+        try:
+            got = fetch(list(symbols)) or {}
+        except Exception as e:  # noqa: BLE001
+            log.warning("quote fetch failed for %d symbols: %s", len(symbols), e)
+            got = {}
+            with self._lock:
+                self.errors += 1
+        ms = (time.perf_counter() - t0) * 1000.0
+        now = self.clock()
+        out = {s: got.get(s) for s in symbols}
+        with self._lock:
+            self.fetches += 1
+            self.total_fetch_ms += ms
+            self.max_fetch_ms = max(self.max_fetch_ms, ms)
+            for s, val in out.items():
+                if val is not None:
+                    self._entries[s] = (now, val)
+                    self._entries.move_to_end(s)
+                fut = self._inflight.pop(s, None)
+                if fut is not None:
+                    fut.set_result(val)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return out
+
+    # ------------------------------------------------------------------
+    def put(self, symbol: str, value: Any) -> None:
+        """Store a quote obtained elsewhere (e.g. a health probe)."""
+        with self._lock:
+            self._entries[symbol] = (self.clock(), value)
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def peek(self, symbol: str) -> Any:
+        """Cached value regardless of age, without touching LRU order or stats."""
+        with self._lock:
+            entry = self._entries.get(symbol)
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses + self.joined
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "joined": self.joined,
+            "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "fetches": self.fetches,
+            "inflight": len(self._inflight),
+            "avg_fetch_ms": self.total_fetch_ms / self.fetches if self.fetches else 0.0,
+            "max_fetch_ms": self.max_fetch_ms,
+        }
+
+
+__all__ = ["QuoteCache"]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import os
 
-import requests
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 RISK_HUB_URL = os.getenv("RISK_HUB_URL", "http://127.0.0.1:8787")
 
@@ -25,7 +25,7 @@ def check_decision(
         "side": side,
     }
     try:
-        r = requests.post(url, json=payload, timeout=timeout)
+        r = shared_transport().post(url, json=payload, timeout=timeout)
         r.raise_for_status()
         out = r.json()
         out.setdefault("from", "risk_hub")
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hybrid_ai_trading.algos.iceberg import IcebergExecutor
+from hybrid_ai_trading.algos.scheduler import ExecutionScheduler
+from hybrid_ai_trading.algos.twap import TWAPExecutor
+from hybrid_ai_trading.utils.clock import VirtualClock, WallClock
+
+
+class OM:
+    def __init__(self, clock=None, delay=0.0, status="ok"):
+        self.clock = clock
+        self.delay = delay
+        self.status = status
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def place_order(self, symbol, side, size, price):
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            ts = self.clock.now() if self.clock else time.time()
+            self.calls.append((ts, symbol, side, size, price))
+        return {"status": self.status, "fill_price": price}
+
+
+def test_hundreds_of_parents_interleave_on_virtual_clock():
+    clock = VirtualClock(start=0.0)
+    om = OM(clock)
+    s = ExecutionScheduler(om, clock=clock)
+    pids = [
+        s.submit(f"S{i}", "BUY", 100, 10.0, algo="TWAP", slices=5, interval=60)
+        for i in range(300)
+    ]
+    t0 = time.perf_counter()
+    s.run_until_idle()
+    assert time.perf_counter() - t0 < 5.0
+    assert clock.now() == 240.0  # 5 slices, 60s apart, in event time
+    assert len(om.calls) == 1500
+    first_tick = {c[1] for c in om.calls if c[0] == 0.0}
+    assert len(first_tick) == 300  # every parent's first slice went out together
+    for pid in pids:
+        r = s.result(pid)
+        assert r["status"] == "filled" and r["filled"] == 100
+        assert [d["size"] for d in r["details"]] == [20] * 5
+
+
+def test_cancel_and_amend():
+    clock = VirtualClock(start=0.0)
+    om = OM(clock)
+    s = ExecutionScheduler(om, clock=clock)
+    a = s.submit("A", "BUY", 100, 10.0, algo="TWAP", slices=4, interval=10)
+    b = s.submit("B", "SELL", 30, 5.0, algo="ICEBERG", display_size=10, interval=10)
+    s.step()
+    assert s.cancel(a)
+    assert s.amend(b, size=50, price=5.5)
+    s.run_until_idle()
+    assert s.result(a)["status"] == "cancelled"
+    assert s.result(a)["filled"] == 25
+    rb = s.result(b)
+    assert rb["status"] == "filled" and rb["filled"] == 50
+    assert [d["price"] for d in rb["details"]] == [5.0] + [5.5] * 4
+    assert not s.cancel(a) and not s.amend(b, size=10)
+
+
+def test_participation_cap_defers_slices():
+    clock = VirtualClock(start=0.0)
+    om = OM(clock)
+    s = ExecutionScheduler(om, clock=clock, caps={"AAPL": 50}, cap_window_s=60)
+    for _ in range(3):
+        s.submit("AAPL", "BUY", 40, 100.0, algo="ICEBERG", display_size=20)
+    s.submit("MSFT", "BUY", 40, 100.0, algo="ICEBERG", display_size=20)
+    s.run_until_idle()
+    aapl = [c for c in om.calls if c[1] == "AAPL"]
+    assert sum(c[3] for c in aapl) == 120
+    for ts, *_ in aapl:
+        in_window = sum(c[3] for c in aapl if ts - 60 < c[0] <= ts)
+        assert in_window <= 50
+    assert all(c[0] == 0.0 for c in om.calls if c[1] == "MSFT")
+    assert s.stats()["deferred_by_caps"] > 0
+
+
+def test_participation_is_a_fraction_of_observed_volume():
+    clock = VirtualClock(start=0.0)
+    om = OM(clock)
+    s = ExecutionScheduler(
+        om, clock=clock, participation={"AAPL": 0.1}, cap_window_s=60
+    )
+    pid = s.submit("AAPL", "BUY", 100, 100.0, algo="ICEBERG", display_size=50)
+    s.step()
+    assert om.calls == []  # nothing has printed yet, so nothing may go out
+    prints = []
+    for t in range(0, 600, 30):
+        clock.advance_to(float(t))
+        s.on_volume("AAPL", 200.0)  # parked parent wakes on the print
+        prints.append((float(t), 200.0))
+        s.step()
+    assert s.result(pid)["filled"] == 100
+    for ts, *_ in om.calls:
+        sent = sum(c[3] for c in om.calls if ts - 60 < c[0] <= ts)
+        seen = sum(q for t, q in prints if ts - 60 < t <= ts)
+        assert sent <= 0.1 * seen
+    assert om.calls[0][:4] == (0.0, "AAPL", "BUY", 20)
+    assert s.stats()["deferred_by_caps"] > 0
+
+
+def test_rejected_children_are_retried_then_parent_errors():
+    clock = VirtualClock(start=0.0)
+    s = ExecutionScheduler(OM(clock, status="rejected"), clock=clock)
+    pid = s.submit("A", "BUY", 10, 1.0, algo="ICEBERG", display_size=5)
+    s.run_until_idle()
+    r = s.result(pid)
+    assert r["status"] == "error" and r["filled"] == 0
+    assert len(r["details"]) == 3
+
+
+def test_async_wall_clock_runs_parents_concurrently():
+    om = OM(delay=0.05)
+    s = ExecutionScheduler(om, clock=WallClock(), workers=8)
+    pids = [
+        TWAPExecutor(om, slices=3, delay=0.05).schedule(s, f"T{i}", "BUY", 9, 1.0)
+        for i in range(4)
+    ] + [
+        IcebergExecutor(om, display_size=3, delay=0.05).schedule(
+            s, f"I{i}", "SELL", 9, 1.0
+        )
+        for i in range(4)
+    ]
+    t0 = time.perf_counter()
+    asyncio.run(s.run())
+    # blocking executors would take 8 parents * 3 slices * (50ms + 50ms) = 2.4s
+    assert time.perf_counter() - t0 < 1.0
+    assert all(s.result(p)["status"] == "filled" for p in pids)
+    assert len(om.calls) == 24
+
+
+def test_invalid_parent_rejected():
+    s = ExecutionScheduler(OM(), clock=VirtualClock())
+    with pytest.raises(ValueError):
+        s.submit("A", "BUY", 0, 1.0)
+    with pytest.raises(KeyError):
+        s.submit("A", "BUY", 1, 1.0, algo="NOPE")
@@ -0,0 +1,149 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.algos.orchestrator import get_algo_executor
+from hybrid_ai_trading.algos.scheduler import ExecutionScheduler
+from hybrid_ai_trading.algos.vwap_curve import (
+    ALL_DAYS,
+    VolumeProfileStore,
+    VWAPCurveExecutor,
+    build_profiles,
+)
+from hybrid_ai_trading.utils.clock import VirtualClock
+
+NY = ZoneInfo("America/New_York")
+
+
+def ts(day, hh, mm):
+    return datetime(2024, 3, day, hh, mm, tzinfo=NY).timestamp()
+
+
+def minute_bars(days, shape):
+    """One bar per session minute; volume = shape(minute index)."""
+    rows = []
+    for d in days:
+        for i in range(390):
+            rows.append((int(ts(d, 9, 30) * 1000) + i * 60_000, float(shape(i))))
+    return pd.DataFrame(rows, columns=["ts", "volume"])
+
+
+def u_shape(i):
+    return 1000 if i < 30 or i >= 360 else 100
+
+
+# 2024-03-04 .. 03-08 are Mon..Fri; three Mondays for a weekday curve
+MONDAYS = [4, 11, 18]
+
+
+class FakeCache:
+    def __init__(self, frames):
+        self.frames = frames
+        self.loads = 0
+
+    def load(self, provider, symbol, timeframe):
+        self.loads += 1
+        return self.frames[symbol], []
+
+
+def test_profiles_per_weekday_with_pooled_fallback():
+    bars = pd.concat([minute_bars(MONDAYS, u_shape), minute_bars([5, 6], lambda i: 10)])
+    prof = build_profiles(bars, min_days=3)
+    assert set(prof) == {ALL_DAYS, 0}
+    mon = prof[0]
+    assert mon.days == 3 and mon.adv == pytest.approx(60 * 1000 + 330 * 100)
+    assert mon.weights[0] > 5 * mon.weights[20]  # opening bucket >> midday
+    assert mon.cum_at(570) == 0.0 and mon.cum_at(960) == 1.0
+    assert prof[ALL_DAYS].days == 5
+
+    cache = FakeCache({"AAPL": bars, "MSFT": bars.iloc[:0]})
+    store = VolumeProfileStore(cache)
+    assert store.precompute(["AAPL"]) == {"AAPL": 5}
+    assert store.get("AAPL", 0) is store.get("AAPL", 0)
+    assert store.get("AAPL", 1) is store.get("AAPL", ALL_DAYS)  # too few Tuesdays
+    assert store.get("MSFT", 0) is store.flat  # no stored bars
+    store.get("AAPL", 3)
+    store.get("MSFT", 1)
+    assert cache.loads == 2  # AAPL and MSFT, each loaded once
+
+
+def run_vwap(store, feed=None, size=1000):
+    clock = VirtualClock(ts(25, 9, 30))  # a Monday
+    calls = []
+
+    class OM:
+        def place_order(self, symbol, side, qty, price):
+            calls.append((clock.now(), qty))
+            return {"status": "filled", "fill_price": price}
+
+    s = ExecutionScheduler(OM(), clock=clock)
+    pid = VWAPCurveExecutor(OM(), profiles=store, interval=300).schedule(
+        s, "AAPL", "BUY", size, 10.0
+    )
+    while True:
+        if feed:
+            feed(clock.now())
+        nxt = s.step()
+        if nxt is None:
+            break
+        clock.advance_to(nxt)
+    return s.result(pid), calls
+
+
+def test_children_follow_the_volume_curve():
+    store = VolumeProfileStore()
+    store.add_bars("AAPL", minute_bars(MONDAYS, u_shape))
+    res, calls = run_vwap(store)
+    assert res["status"] == "filled" and res["filled"] == 1000
+    assert calls[-1][0] <= ts(25, 16, 0)
+    first_30 = sum(q for t, q in calls if t <= ts(25, 10, 0))
+    mid_30 = sum(q for t, q in calls if ts(25, 12, 0) < t <= ts(25, 12, 30))
+    assert first_30 == pytest.approx(1000 * 30000 / 93000, abs=10)
+    assert first_30 > 5 * mid_30
+
+
+@pytest.mark.parametrize("seeded", [True, False])
+def test_busy_session_pulls_schedule_forward(seeded):
+    store = VolumeProfileStore()
+    store.add_bars("AAPL", minute_bars(MONDAYS, u_shape))
+    _, base = run_vwap(store)
+
+    busy = VolumeProfileStore()
+    busy.add_bars("AAPL", minute_bars(MONDAYS, u_shape))
+    if seeded:
+        busy.on_bar("AAPL", ts(25, 9, 29), 0.0)
+    else:  # a stale total from the previous session, then no bar until after submit
+        busy.on_bar("AAPL", ts(22, 15, 59), 5e6)
+    last = [ts(25, 9, 30)]
+
+    def feed(now):  # realized volume runs at 3x the historical curve
+        if now > last[0]:
+            prof, m = busy.profile_at("AAPL", now)
+            m0 = m - (now - last[0]) / 60.0
+            busy.on_bar("AAPL", now, 3 * prof.expected(m0, m))
+            last[0] = now
+
+    _, fast = run_vwap(busy, feed)
+    noon = ts(25, 12, 0)
+    by_noon = [sum(q for t, q in c if t <= noon) for c in (base, fast)]
+    assert by_noon[1] > by_noon[0] + 50
+
+
+def test_registry_and_blocking_execute():
+    cls = get_algo_executor("vwap_curve")
+    assert cls is VWAPCurveExecutor
+
+    class OM:
+        def place_order(self, symbol, side, qty, price):
+            return {"status": "ok", "fill_price": price}
+
+    store = VolumeProfileStore()
+    clock = VirtualClock(ts(25, 10, 0))
+    ex = cls(OM(), profiles=store, interval=60, duration=1800, clock=clock)
+    res = ex.execute("AAPL", "SELL", 90, 50.0)
+    assert res["status"] == "filled" and res["algo"] == "VWAP"
+    assert sum(d["size"] for d in res["details"]) == 90
+    assert clock.now() == ts(25, 10, 30)
+    assert ex.execute("AAPL", "SELL", 0, 50.0)["status"] == "error"
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from hybrid_ai_trading.eval.bootstrap import METRICS, bootstrap_metrics, path_metrics
+from hybrid_ai_trading.execution.portfolio_tracker import PortfolioTracker
+from hybrid_ai_trading.performance_tracker import PerformanceTracker
+
+
+def _naive(row, start=1000.0, alpha=0.9):
+    eq = start + np.cumsum(row)
+    peak = np.maximum(np.maximum.accumulate(eq), start)
+    dd = ((peak - eq) / peak).max()
+    k = int(np.ceil((1 - alpha) * len(row)))
+    return {
+        "sharpe": row.mean() / row.std() * np.sqrt(252),
+        "max_drawdown": dd,
+        "calmar": (eq[-1] - start) / start / dd,
+        "cvar": max(0.0, -np.sort(row)[:k].mean()),
+    }
+
+
+def test_path_metrics_match_naive():
+    paths = np.random.default_rng(0).normal(1, 10, (6, 300))
+    got = path_metrics(paths.copy(), initial_equity=1000.0, alpha=0.9)
+    for i, row in enumerate(paths):
+        for m, v in _naive(row).items():
+            assert got[m][i] == pytest.approx(v, rel=1e-9)
+
+
+def test_returns_kind_and_flat_paths():
+    r = np.array([[0.01, -0.02, 0.03, -0.01]])
+    got = path_metrics(r.copy(), kind="returns", alpha=0.75, periods_per_year=None)
+    eq = np.cumprod(1 + r[0])
+    peak = np.maximum(np.maximum.accumulate(eq), 1.0)
+    assert got["max_drawdown"][0] == pytest.approx(((peak - eq) / peak).max())
+    assert got["cvar"][0] == pytest.approx(0.02)
+
+    flat = path_metrics(np.full((1, 10), 5.0))
+    assert flat["sharpe"][0] == 0.0 and flat["calmar"][0] == 0.0
+    assert flat["cvar"][0] == 0.0
+
+
+def test_bootstrap_ci_and_reproducibility():
+    pnl = np.random.default_rng(1).normal(20, 100, 2000)
+    res = bootstrap_metrics(pnl, n_resamples=500, seed=7, chunk_elems=100_000)
+    again = bootstrap_metrics(pnl, n_resamples=500, seed=7, chunk_elems=100_000)
+    for m in METRICS:
+        assert len(res.samples[m]) == 500
+        np.testing.assert_array_equal(res.samples[m], again.samples[m])
+        lo, hi = res.ci(0.9)[m]
+        assert lo <= hi
+    # i.i.d. full-length resamples center on the point Sharpe
+    s = res.summary()["sharpe"]
+    assert s["lo"] < s["point"] < s["hi"]
+
+
+def test_block_bootstrap_and_pool_match_inline():
+    rets = np.random.default_rng(2).normal(0.0005, 0.01, 1500)
+    kw = dict(
+        n_resamples=64,
+        kind="returns",
+        block_size=20,
+        horizon=250,
+        seed=3,
+        chunk_elems=250 * 16,
+    )
+    inline = bootstrap_metrics(rets, **kw)
+    pooled = bootstrap_metrics(rets, workers=2, **kw)
+    for m in METRICS:
+        np.testing.assert_array_equal(inline.samples[m], pooled.samples[m])
+    assert inline.horizon == 250 and inline.block_size == 20
+
+
+def test_guards():
+    with pytest.raises(ValueError):
+        bootstrap_metrics([1.0])
+    with pytest.raises(ValueError):
+        bootstrap_metrics([1.0, 2.0], kind="prices")
+    with pytest.raises(ValueError):
+        bootstrap_metrics([1.0, 2.0], n_resamples=0)
+
+
+def test_tracker_wrappers():
+    perf = PerformanceTracker()
+    perf.record_equity(10_000.0)
+    for t in np.random.default_rng(4).normal(5, 50, 100):
+        perf.record_trade(float(t))
+    res = perf.bootstrap(200, seed=1)
+    assert set(res.samples) == set(METRICS)
+
+    # the rolling equity window drops the start; bootstrap keeps using it
+    rolled = PerformanceTracker(window=3)
+    for eq in (10_000.0, 50_000.0, 60_000.0, 70_000.0):
+        rolled.record_equity(eq)
+    rolled.trades = list(perf.trades)
+    assert rolled.equity_curve[0] == 50_000.0 and rolled.starting_equity == 10_000.0
+    assert rolled.bootstrap(200, seed=1).point == res.point
+    assert PerformanceTracker(starting_equity=5_000.0).starting_equity == 5_000.0
+
+    port = PortfolioTracker(10_000.0)
+    port.update_position("AAPL", "BUY", 10, 100.0)
+    for px in (101.0, 99.0, 102.0, 98.0, 103.0):
+        port.update_equity({"AAPL": px})
+    assert len(port.bootstrap(100, seed=1).samples["cvar"]) == 100
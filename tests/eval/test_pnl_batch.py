@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.eval.pnl import simulate_rr_exit, simulate_rr_exits
+from hybrid_ai_trading.strategies import orb_vwap
+
+KW = dict(tick_size=0.01, rr_target=2.0, risk_ticks=5)
+
+
+def _frame(seed, n=240):
+    rng = np.random.default_rng(seed)
+    c = 100 + np.round(np.cumsum(rng.normal(0, 0.03, n)), 2)
+    o = np.round(c + rng.normal(0, 0.02, n), 2)
+    h = np.maximum(c, o) + np.round(np.abs(rng.normal(0, 0.04, n)), 2)
+    lo = np.minimum(c, o) - np.round(np.abs(rng.normal(0, 0.04, n)), 2)
+    idx = pd.date_range("2025-01-02 14:30", periods=n, freq="1min", tz="UTC")
+    return pd.DataFrame(
+        {"open": o, "high": h, "low": lo, "close": c, "vwap": c}, index=idx
+    )
+
+
+def _scalar(df, entries, dirs, **kw):
+    return [
+        simulate_rr_exit(df, e, direction=int(d), **kw) for e, d in zip(entries, dirs)
+    ]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+@pytest.mark.parametrize("rr,risk", [(1.0, 3), (2.0, 5), (3.0, 20)])
+def test_batch_matches_scalar(seed, rr, risk):
+    df = _frame(seed)
+    rng = np.random.default_rng(seed + 100)
+    entries = list(df.index[rng.choice(len(df), 40, replace=False)])
+    dirs = rng.choice([1, -1], 40)
+    kw = dict(tick_size=0.01, rr_target=rr, risk_ticks=risk)
+    assert simulate_rr_exits(df, entries, dirs, **kw) == _scalar(
+        df, entries, dirs, **kw
+    )
+
+
+def test_target_beats_stop_rules():
+    # bar1: stop only; bar2: target only; bar3: both -> scalar exits on bar3
+    h = [100.0, 100.0, 100.2, 100.2, 100.0]
+    lo = [100.0, 99.9, 100.0, 99.9, 100.0]
+    idx = pd.date_range("2025-01-02 14:30", periods=5, freq="1min")
+    df = pd.DataFrame({"high": h, "low": lo, "close": [100.0] * 5}, index=idx)
+    out = simulate_rr_exits(df, [idx[0], idx[0], idx[2]], [1, -1, 1], **KW)
+    assert out == _scalar(df, [idx[0], idx[0], idx[2]], [1, -1, 1], **KW)
+    assert out[0] == (10.0, idx[3])
+    assert out[2] == (10.0, idx[2])
+
+
+def test_fallback_paths_match_scalar():
+    df = _frame(5, n=60)
+    df.iloc[10, df.columns.get_loc("high")] = np.nan
+    entries = list(df.index[[0, 20, 40]])
+    assert simulate_rr_exits(df, entries, 1, **KW) == _scalar(
+        df, entries, [1] * 3, **KW
+    )
+    assert simulate_rr_exits(df, [], 1, **KW) == []
+
+
+def test_batch_guards():
+    df = _frame(0, n=10)
+    with pytest.raises(ValueError):
+        simulate_rr_exits(df, df.index[:2], [1, 0], **KW)
+    with pytest.raises(ValueError):
+        simulate_rr_exits(df, df.index[:2], [1], **KW)
+    with pytest.raises(ValueError):
+        simulate_rr_exits(df, df.index[:1], 1, tick_size=0, rr_target=1, risk_ticks=1)
+    with pytest.raises(KeyError):
+        simulate_rr_exits(df, [pd.Timestamp("1999-01-01", tz="UTC")], 1, **KW)
+
+
+def test_orb_vwap_reexports_batch():
+    assert orb_vwap.simulate_rr_exits is simulate_rr_exits
@@ -0,0 +1,97 @@
+import pytest
+
+from hybrid_ai_trading.execution.broker_telemetry import (
+    LatencyHistogram,
+    TelemetryScorer,
+)
+from hybrid_ai_trading.execution.smart_router import SmartOrderRouter
+from hybrid_ai_trading.execution.trade_logger import TradeLogger
+
+
+def test_histogram_quantiles_and_decay():
+    h = LatencyHistogram(window=100)
+    for i in range(1, 101):
+        h.add(i / 1000.0)  # 1..100 ms
+    assert h.quantile(0.5) == pytest.approx(0.05, rel=0.25)
+    assert h.quantile(0.95) == pytest.approx(0.095, rel=0.25)
+    for _ in range(400):
+        h.add(1.0)  # regime change: old samples fade
+    assert h.total < 200
+    assert h.quantile(0.5) == pytest.approx(1.0, rel=0.25)
+
+
+def test_priors_then_live_costs():
+    s = TelemetryScorer(prior_samples=10)
+    assert s.cost("binance") < s.cost("alpaca")  # former static guesses
+    cold = s.cost("alpaca")
+    assert cold == pytest.approx(20.0 + 20.0 * 0.2 + 10.0 * 0.5)
+    for _ in range(50):
+        s.record("alpaca", 0.01, "filled")
+    assert 20.0 < s.cost("alpaca") < cold - 5.0  # prior fades out
+    assert s.brokers["alpaca"].snapshot()["fill_rate"] == 1.0
+
+
+def test_broker_weights_scale_cost_terms():
+    cfg = {"broker_weights": {"latency": 0.8, "commission": 0.2, "liquidity": 0.2}}
+    s = TelemetryScorer.from_config(cfg)
+    # commission halved, latency doubled, fill term unchanged vs the defaults
+    assert s.cost("alpaca") == pytest.approx(10.0 + 40.0 * 0.2 + 10.0 * 0.5)
+    r = SmartOrderRouter({"slow_alpaca": object(), "fast": object()}, {})
+    heavy = SmartOrderRouter(
+        {"slow_alpaca": object(), "fast": object()},
+        {"execution": {"broker_weights": {"latency": 4.0}}},
+    )
+    gap = heavy.telemetry.cost("slow_alpaca") - heavy.telemetry.cost("fast")
+    assert gap > r.telemetry.cost("slow_alpaca") - r.telemetry.cost("fast")
+
+
+def test_ranking_is_cached_until_costs_move():
+    s = TelemetryScorer(commission_bps={"a": 5.0, "b": 6.0}, prior_samples=0)
+    brokers = ["a", "b"]
+    assert s.ranking(brokers) == ["a", "b"]
+    s.record("a", 0.1, "filled")
+    s.ranking(brokers)
+    n = s.recomputes
+    for _ in range(100):
+        s.record("a", 0.1, "filled")  # cost unchanged
+        assert s.ranking(brokers) == ["a", "b"]
+    assert s.recomputes == n
+    s.record_fill("a", "buy", 100.0, 100.1)  # +10 bps slippage
+    assert s.ranking(brokers) == ["b", "a"]
+    assert s.recomputes == n + 1
+
+
+def test_trade_logger_fills_feed_slippage(tmp_path):
+    tl = TradeLogger(
+        jsonl_path=str(tmp_path / "t.jsonl"),
+        csv_path=None,
+        text_log_path=str(tmp_path / "t.log"),
+    )
+    s = TelemetryScorer()
+    s.attach(tl)
+    buy = tl.submit_event("s", "ib", "AAPL", "BUY", 10, 100.0, "MKT")
+    tl.fill_event(buy, 100.05, "1")
+    sell = tl.submit_event("s", "ib", "AAPL", "SELL", 10, 100.0, "MKT")
+    tl.fill_event(sell, 99.9, "2")
+    t = s.brokers["ib"]
+    assert t.slippage_n == 2
+    assert t.slippage_bps > 5.0  # both fills were adverse
+
+
+def test_router_learns_slippage_from_fill_reports():
+    class Broker:
+        def __init__(self, px):
+            self.px = px
+
+        def submit_order(self, **kw):
+            return {"status": "filled", "filled_avg_price": self.px}
+
+    r = SmartOrderRouter(
+        {"x": Broker(100.5), "y": Broker(100.0)},
+        {"execution": {"max_order_retries": 1, "min_stat_samples": 1}},
+    )
+    assert r.rank_brokers()[0] == "x"
+    r.route_order("AAPL", "BUY", 1, 100.0)  # x fills 50 bps worse
+    assert r.broker_stats()["x"]["slippage_bps"] == pytest.approx(50.0)
+    assert r.rank_brokers()[0] == "y"
+    assert r.score_broker("y") > r.score_broker("x") > 0
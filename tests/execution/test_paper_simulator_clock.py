@@ -0,0 +1,115 @@
+"""
+Unit Tests: PaperSimulator clock (Hybrid AI Quant Pro v13.6 - Backtest Clock)
+-----------------------------------------------------------------------------
+- VirtualClock advances by latency_ms without time.sleep, fills are stamped
+- WallClock is the default and really waits
+- EventBacktester fills carry bar time + latency
+- ExecutionEngine wiring: simulated_clock config, explicit clock= argument,
+  costs.latency_ms (and its 50ms default)
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hybrid_ai_trading.execution import execution_engine
+from hybrid_ai_trading.execution.paper_simulator import PaperSimulator
+from hybrid_ai_trading.utils.clock import VirtualClock, WallClock
+
+
+def _no_sleep(*_a, **_k):
+    raise AssertionError("time.sleep called on a virtual clock")
+
+
+def test_virtual_clock_advances_by_latency_without_sleeping():
+    clock = VirtualClock(start=1_700_000_000.0)
+    sim = PaperSimulator(latency_ms=50, seed=1, clock=clock)
+    with patch("time.sleep", side_effect=_no_sleep):
+        t0 = time.perf_counter()
+        fills = [sim.simulate_fill("AAPL", "BUY", 10, 100.0) for _ in range(20_000)]
+        assert time.perf_counter() - t0 < 10.0
+    first, last = fills[0], fills[-1]
+    assert first["submitted_at"] == 1_700_000_000.0
+    assert first["filled_at"] == pytest.approx(1_700_000_000.05)
+    assert last["filled_at"] == pytest.approx(clock.now())
+    assert clock.now() == pytest.approx(1_700_000_000.0 + 20_000 * 0.05)
+    assert first["timestamp"].startswith("2023-11-14T22:13:20")
+
+
+def test_wall_clock_is_the_default_and_really_waits():
+    assert "filled_at" not in PaperSimulator(latency_ms=0).simulate_fill(
+        "AAPL", "BUY", 1, 100.0
+    )
+    sim = PaperSimulator(latency_ms=20, seed=1, stamp_fills=True)
+    assert isinstance(sim.clock, WallClock)
+    r = sim.simulate_fill("AAPL", "SELL", 1, 100.0)
+    assert r["filled_at"] - r["submitted_at"] >= 0.015
+
+
+def test_event_backtest_fills_carry_bar_time_plus_latency():
+    from hybrid_ai_trading.pipelines.event_backtest import (
+        ColumnarBarStore,
+        EventBacktester,
+    )
+
+    store = ColumnarBarStore()
+    t0 = 1_700_000_000_000
+    store.add("AAPL", [{"t": t0 + 60_000 * i, "c": 100.0 + i} for i in range(10)])
+    sim = PaperSimulator(latency_ms=50, seed=0, clock=VirtualClock(0.0))
+    stamps = []
+    fill = sim.simulate_fill
+
+    def spy(*a, **k):
+        r = fill(*a, **k)
+        stamps.append(r["filled_at"])
+        return r
+
+    sim.simulate_fill = spy
+    with patch("time.sleep", side_effect=_no_sleep):
+        EventBacktester(store, {"buy": lambda b: "BUY"}, simulator=sim).run()
+    assert stamps == [pytest.approx(t0 / 1000.0 + 0.05)]
+
+
+class _StubRiskManager:
+    """RiskManager stand-in; the engine's starting_equity kwarg is not under test."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(execution_engine, "RiskManager", _StubRiskManager)
+
+    def make(config=None, clock=None, dry_run=True):
+        return execution_engine.ExecutionEngine(
+            dry_run=dry_run, config=config or {}, clock=clock
+        )
+
+    return make
+
+
+def test_engine_simulated_clock_config_builds_virtual_clock(engine):
+    eng = engine({"simulated_clock": True, "costs": {"latency_ms": 250}})
+    sim = eng.paper_simulator
+    assert isinstance(sim.clock, VirtualClock) and sim.latency_ms == 250
+    t0 = sim.clock.now()
+    with patch("time.sleep", side_effect=_no_sleep):
+        fill = sim.simulate_fill("AAPL", "BUY", 1, 100.0)
+    assert fill["filled_at"] - fill["submitted_at"] == pytest.approx(0.25)
+    assert sim.clock.now() == pytest.approx(t0 + 0.25)
+
+
+def test_engine_explicit_clock_wins_over_config(engine):
+    clock = VirtualClock(start=100.0)
+    eng = engine({"simulated_clock": True}, clock=clock)
+    assert eng.paper_simulator.clock is clock
+    eng = engine({"use_paper_simulator": True}, clock=clock, dry_run=False)
+    assert eng.paper_simulator.clock is clock
+
+
+def test_engine_defaults_to_wall_clock_and_50ms(engine):
+    sim = engine().paper_simulator
+    assert isinstance(sim.clock, WallClock) and sim.latency_ms == 50
+    assert not sim.stamp_fills
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+
+from hybrid_ai_trading.execution.smart_router import SmartOrderRouter
+
+
+class SyncBroker:
+    def __init__(self, delay=0.0, status="filled", order_id="1"):
+        self.delay = delay
+        self.status = status
+        self.order_id = order_id
+        self.calls = 0
+        self.cancelled = []
+        self.cancel_event = threading.Event()
+
+    def submit_order(self, **kw):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"status": self.status, "order_id": self.order_id}
+
+    def cancel_order(self, oid):
+        self.cancelled.append(oid)
+        self.cancel_event.set()
+
+
+class AsyncBroker:
+    def __init__(self, delay):
+        self.delay = delay
+        self.cancelled = False
+
+    async def submit_order_async(self, **kw):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return {"status": "ok"}
+
+
+class AcceptingBroker:
+    """Async venue that accepts every order on receipt, then acks after `delay`."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.live = []
+        self.cancel_event = threading.Event()
+
+    async def submit_order(self, client_order_id=None, **kw):
+        self.live.append(client_order_id)
+        await asyncio.sleep(self.delay)
+        return {"status": "ok", "order_id": client_order_id}
+
+    async def cancel_order(self, oid):
+        self.live.remove(oid)
+        self.cancel_event.set()
+
+
+def router(brokers, **execution):
+    cfg = {"execution": {"max_order_retries": 1, "min_stat_samples": 5, **execution}}
+    return SmartOrderRouter(brokers, cfg)
+
+
+def warm(r, broker, latency, n=10):
+    for _ in range(n):
+        r.telemetry.record(broker, latency, "filled")
+
+
+def test_deadline_is_enforced_and_next_broker_used():
+    slow, fast = SyncBroker(delay=1.0), SyncBroker()
+    r = router({"slow": slow, "fast": fast})
+    t0 = time.perf_counter()
+    out = asyncio.run(r.route_order_async("AAPL", "BUY", 1, 100.0, timeout_sec=0.1))
+    assert time.perf_counter() - t0 < 0.5
+    assert out["status"] == "filled" and out["broker"] == "fast"
+    assert r.broker_stats()["slow"]["timeouts"] == 1
+
+
+def test_coroutine_broker_is_cancelled_at_deadline():
+    hung = AsyncBroker(delay=5.0)
+    r = router({"hung": hung})
+    out = asyncio.run(r.route_order_async("AAPL", "BUY", 1, 100.0, timeout_sec=0.05))
+    assert out["status"] in {"blocked", "filled"}  # simulated fill under pytest
+    assert hung.cancelled
+
+
+def test_slow_primary_is_hedged_and_late_fill_cancelled(caplog):
+    primary, backup = SyncBroker(delay=0.4, order_id="P"), SyncBroker(order_id="B")
+    r = router({"primary": primary, "backup": backup}, hedge_orders=True)
+    warm(r, "primary", 0.01)
+    warm(r, "backup", 0.02)
+    caplog.set_level("ERROR")
+    t0 = time.perf_counter()
+    out = asyncio.run(r.route_order_async("AAPL", "BUY", 1, 100.0, timeout_sec=2.0))
+    assert time.perf_counter() - t0 < 0.3
+    assert out["broker"] == "backup" and out["hedged"] is True
+    assert out["details"]["order_id"] == "B"
+    # the abandoned primary still fills; the router alerts and cancels it
+    assert primary.cancel_event.wait(2.0)
+    assert primary.cancelled == ["P"]
+    assert "late fill" in caplog.text.lower()
+
+
+def test_both_hedge_legs_accepted_loser_cancelled_at_venue():
+    primary, backup = AcceptingBroker(delay=0.4), AcceptingBroker(delay=0.0)
+    r = router({"primary": primary, "backup": backup}, hedge_orders=True)
+    warm(r, "primary", 0.01)
+    warm(r, "backup", 0.02)
+    out = asyncio.run(r.route_order_async("AAPL", "BUY", 1, 100.0, timeout_sec=2.0))
+    assert out["broker"] == "backup" and out["hedged"] is True
+    assert out["details"]["order_id"] == backup.live[0]
+    # the primary accepted too; its order must not stay working
+    assert primary.cancel_event.wait(2.0)
+    assert primary.live == [] and len(backup.live) == 1
+
+
+def test_uncancellable_coroutine_venue_is_not_hedged(caplog):
+    primary, backup = AsyncBroker(delay=0.3), AcceptingBroker(delay=0.0)
+    r = router({"primary": primary, "backup": backup}, hedge_orders=True)
+    warm(r, "primary", 0.01)
+    warm(r, "backup", 0.02)
+    out = asyncio.run(r.route_order_async("AAPL", "BUY", 1, 100.0, timeout_sec=2.0))
+    assert out["broker"] == "primary" and out["hedged"] is False
+    assert backup.live == []  # never fired alongside the primary
+
+    caplog.set_level("ERROR")
+    hung = AsyncBroker(delay=5.0)
+    r = router({"hung": hung, "backup": AcceptingBroker(delay=0.0)})
+    asyncio.run(r.route_order_async("AAPL", "BUY", 1, 100.0, timeout_sec=0.05))
+    assert hung.cancelled
+    assert "abandoned order error on hung" in caplog.text.lower()
+
+
+def test_live_stats_drive_ranking():
+    r = router({"a": SyncBroker(), "b": SyncBroker()})
+    assert r.rank_brokers() == ["a", "b"]  # static scores tie
+    warm(r, "a", 0.8)
+    warm(r, "b", 0.05)
+    assert r.rank_brokers() == ["b", "a"]
+    for _ in range(10):
+        r.telemetry.record("b", 0.05, "rejected")
+    assert r.broker_stats()["b"]["fill_rate"] < r.broker_stats()["a"]["fill_rate"]
+
+
+def test_sync_route_order_uses_async_mode():
+    r = router({"x": SyncBroker(status="pending")}, async_routing=True)
+    out = r.route_order("AAPL", "SELL", 1, 100.0)
+    assert out["status"] == "pending" and out["broker"] == "x"
+    assert r.broker_stats()["x"]["attempts"] == 1
@@ -0,0 +1,137 @@
+"""
+Unit Tests: Event-Driven Backtest (Hybrid AI Quant Pro v1.0)
+------------------------------------------------------------
+- ColumnarBarStore loads each symbol once, regardless of strategy count
+- One time-ordered pass; every strategy sees the same shared window
+- Fills through PaperSimulator, positions/PnL in PortfolioTracker
+- IntradayBacktester.run_event_driven wiring + results_summary
+"""
+
+import numpy as np
+import pytest
+
+from hybrid_ai_trading.pipelines import backtest as bt
+from hybrid_ai_trading.pipelines.event_backtest import (
+    ColumnarBarStore,
+    EventBacktestConfig,
+    EventBacktester,
+)
+
+
+def _bars(n=40, start=100.0, step=1.0, t0=0):
+    return [
+        {
+            "t": t0 + 60_000 * i,
+            "o": start,
+            "h": start,
+            "l": start,
+            "c": start + step * i,
+            "v": 10,
+        }
+        for i in range(n)
+    ]
+
+
+def _alternate(bars):
+    return "BUY" if len(bars) % 2 else "SELL"
+
+
+def test_store_loads_each_symbol_once_and_orders_events():
+    calls = []
+
+    def loader(sym):
+        calls.append(sym)
+        return _bars(3, t0=30_000 if sym == "B" else 0)[::-1]
+
+    store = ColumnarBarStore().load(["A", "B"], loader)
+    store.load(["A", "B"], loader)
+    assert calls == ["A", "B"] and store.loads == 2 and len(store) == 6
+    assert list(store.column("A", "t")) == [0, 60_000, 120_000]
+
+    ts, sid, idx = store.events()
+    assert list(np.diff(ts) >= 0) == [True] * 5
+    assert list(zip(sid.tolist(), idx.tolist()))[:3] == [(0, 0), (1, 0), (0, 1)]
+
+
+def test_store_handles_missing_timestamps_and_loader_errors():
+    def loader(sym):
+        if sym == "BAD":
+            raise RuntimeError("boom")
+        return [{"c": 1.0}, {"c": 2.0}, "junk"]
+
+    store = ColumnarBarStore().load(["X", "BAD"], loader)
+    assert list(store.column("X", "t")) == [0.0, 1.0]
+    assert len(store.rows("BAD")) == 0 and store.loads == 2
+    assert ColumnarBarStore().events()[0].size == 0
+
+
+def test_shared_window_and_portfolio_tracking():
+    store = ColumnarBarStore()
+    store.add("AAPL", _bars(20))
+    seen = []
+
+    def spy(bars):
+        seen.append(len(bars))
+        return "HOLD"
+
+    engine = EventBacktester(
+        store,
+        {"alt": _alternate, "spy": spy, "boom": lambda b: 1 / 0},
+        config=EventBacktestConfig(lookback=12),
+    )
+    df = engine.run()
+    assert seen == list(range(1, 13)) + [12] * 8
+
+    row = df.set_index("Strategy").loc["ALT"]
+    assert row["Trades"] == 12
+    assert row["WinRate %"] == 100.0  # every long closes one bar higher
+    assert row["RealizedPnL"] > 0
+    assert df.set_index("Strategy").loc["SPY", "Trades"] == 0
+    assert df.set_index("Strategy").loc["BOOM", "FinalEquity"] == 100_000.0
+    assert len(engine.equity_curve("alt", "AAPL")) > 20
+
+
+def test_short_side_and_risk_blocking():
+    class _Risk:
+        def __init__(self):
+            self.calls = 0
+
+        def check_trade(self, *a):
+            self.calls += 1
+            return self.calls % 2 == 1
+
+    store = ColumnarBarStore()
+    store.add("X", _bars(10, step=-1.0))
+    engine = EventBacktester(
+        store,
+        {"sell": lambda b: "SELL", "alt": _alternate},
+        config=EventBacktestConfig(allow_short=True),
+        risk_manager=_Risk(),
+    )
+    df = engine.run().set_index("Strategy")
+    assert df.loc["SELL", "Trades"] == 1
+    assert engine.books[("sell", "X")].tracker.positions["X"]["size"] == -1.0
+    assert df.loc["ALT", "Blocked %"] > 0
+
+
+def test_intraday_backtester_event_driven(monkeypatch):
+    calls = []
+
+    def fake_bars(sym, start, end, api_key=None, **kw):
+        calls.append((sym, start, end))
+        return _bars(30)
+
+    monkeypatch.setattr(bt, "get_intraday_bars", fake_bars)
+    strategies = {f"s{i}": _alternate for i in range(4)}
+    ib = bt.IntradayBacktester(["AAPL", "MSFT"], strategies=strategies)
+    df = ib.run_event_driven(start="2024-01-02", end="2024-01-03", trade_size=2)
+
+    assert len(calls) == 2 and ib.bar_store.loads == 2
+    assert len(df) == 8 and set(df["Strategy"]) == {"S0", "S1", "S2", "S3"}
+    assert ib.results_summary["s0"]["AAPL"]["Trades"] == 30
+
+
+def test_intraday_backtester_event_driven_no_strategies(caplog):
+    ib = bt.IntradayBacktester(["AAPL"], strategies={})
+    df = ib.run_event_driven(loader=lambda s: pytest.fail("should not load"))
+    assert df.empty and "no strategies configured" in caplog.text
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.pipelines.portfolio_backtest import (
+    PortfolioBacktester,
+    PortfolioConfig,
+    frame_bars,
+    parquet_bars,
+    run_portfolio_backtest,
+    streaming_signal,
+)
+from hybrid_ai_trading.risk.kelly_sizer import KellySizer
+
+T0 = 1_700_000_000_000
+
+
+def _bars(prices, t0=T0, step=60_000):
+    return [(t0 + k * step, p, p, p, p, 100.0) for k, p in enumerate(prices)]
+
+
+def _scripted(script):
+    """Signal factory replaying a per-symbol list of signals."""
+
+    def factory(symbol):
+        it = iter(script.get(symbol, []))
+        return lambda bar: next(it, "HOLD")
+
+    return factory
+
+
+def test_merge_is_time_ordered_and_lazy():
+    seen = []
+
+    def gen(sym, ts):
+        for t in ts:
+            seen.append((sym, t))
+            yield (t, 10.0, 10.0, 10.0, 10.0, 1.0)
+
+    sources = {"A": gen("A", [1, 3, 5]), "B": gen("B", [2, 3, 4])}
+    bt = PortfolioBacktester(sources, _scripted({}))
+    order = []
+    for ts, i, _ in bt._stream():
+        order.append((ts, bt.symbols[i]))
+        assert len(seen) <= len(order) + 2  # at most one pending bar per symbol
+    assert order == [(1, "A"), (2, "B"), (3, "A"), (3, "B"), (4, "B"), (5, "A")]
+
+
+def test_round_trip_pnl_and_per_symbol_metrics():
+    sources = {"A": _bars([10, 11, 12]), "B": _bars([20, 20, 19])}
+    script = {"A": ["BUY", "HOLD", "SELL"], "B": ["BUY", "HOLD", "SELL"]}
+    rep = run_portfolio_backtest(sources, _scripted(script), max_position_pct=0.1)
+
+    # Kelly (0.55, 1.2, 0.5) = 8.75% of 100k, capped at 10%
+    per = rep.per_symbol.set_index("Symbol")
+    assert per.loc["A", "RealizedPnL"] == pytest.approx(875 * 2)
+    assert per.loc["B", "RealizedPnL"] == pytest.approx(-437)
+    assert per.loc["A", "WinRate %"] == 100.0 and per.loc["B", "WinRate %"] == 0.0
+    assert rep.summary["realized_pnl"] == pytest.approx(1750 - 437)
+    assert rep.summary["final_equity"] == pytest.approx(100_000 + 1750 - 437)
+    assert rep.summary["open_positions"] == 0
+    assert len(rep.equity_curve) == 3
+    assert {"sharpe", "max_drawdown", "calmar", "cvar"} <= set(rep.summary)
+
+
+def test_shared_cash_and_max_positions():
+    syms = ["S0", "S1", "S2"]
+    script = {s: ["BUY"] for s in syms}
+    bt = PortfolioBacktester(
+        {s: _bars([100.0]) for s in syms},
+        _scripted(script),
+        sizer=KellySizer(win_rate=0.9, payoff=10.0, fraction=1.0),
+        config=PortfolioConfig(
+            starting_equity=10_000, max_position_pct=1.0, close_at_end=False
+        ),
+    )
+    rep = bt.run()
+    # Kelly 0.89 takes 89 shares, the rest of the cash buys 11, then nothing
+    assert bt.tracker.positions["S0"]["size"] == 89
+    assert bt.tracker.positions["S1"]["size"] == 11
+    assert bt.tracker.cash == pytest.approx(0.0)
+    assert rep.blocked == {"insufficient_cash": 1}
+
+    rep = run_portfolio_backtest(
+        {f"S{i}": _bars([100.0]) for i in range(6)},
+        _scripted({f"S{i}": ["BUY"] for i in range(6)}),
+        max_positions=2,
+    )
+    assert rep.blocked == {"max_positions": 4}
+    assert rep.per_symbol["Blocked"].sum() == 4
+    assert rep.summary["trades"] == 4  # two entries, two closes at the end
+
+
+def test_risk_rails_block_entries():
+    sources = {"A": _bars([100, 50, 50]), "B": _bars([10, 10, 10])}
+    script = {"A": ["BUY"], "B": ["HOLD", "BUY"]}
+    rep = run_portfolio_backtest(
+        sources, _scripted(script), max_position_pct=1.0, daily_loss_cap=1_000
+    )
+    assert rep.blocked == {"daily_loss_cap": 1}
+
+    rep = run_portfolio_backtest(
+        sources, _scripted(script), max_position_pct=1.0, max_drawdown=0.01
+    )
+    assert rep.blocked == {"drawdown_breach": 1}
+
+    rep = run_portfolio_backtest(
+        {"A": _bars([10.0])}, _scripted({"A": ["BUY"]}), order_limits={"equity": 5}
+    )
+    assert rep.blocked == {"max_order_size_exceeded": 1}
+    assert rep.summary["trades"] == 0
+
+
+def test_costs_and_day_reset():
+    day2 = T0 + 86_400_000
+    sources = {"A": _bars([100, 100]) + _bars([100], t0=day2)}
+    script = {"A": ["BUY", "SELL"]}
+    rep = run_portfolio_backtest(
+        sources, _scripted(script), commission_per_share=0.01, slippage_bps=10
+    )
+    # 87 shares: 0.10 slippage each way (realized), 0.01 commission each way (cash)
+    assert rep.summary["realized_pnl"] == pytest.approx(-87 * 0.20)
+    assert rep.summary["final_equity"] == pytest.approx(100_000 - 87 * 0.22)
+    assert len(rep.equity_curve) == 3
+
+
+def test_frame_and_parquet_sources(tmp_path):
+    idx = pd.date_range("2025-01-06 14:30", periods=40, freq="1min")
+    c = 100 + np.cumsum(np.random.default_rng(0).normal(0, 0.5, 40))
+    df = pd.DataFrame(
+        {"open": c, "high": c, "low": c, "close": c, "volume": 1.0}, index=idx
+    )
+    bars = list(frame_bars(df))
+    assert len(bars) == 40 and bars[0][0] == idx[0] and bars[-1][4] == c[-1]
+
+    path = tmp_path / "bars.parquet"
+    df.rename_axis("timestamp").reset_index().to_parquet(path, index=False)
+    streamed = list(parquet_bars(str(path), batch_size=7))
+    assert [b[4] for b in streamed] == pytest.approx(list(c))
+
+    rep = run_portfolio_backtest(
+        {"X": frame_bars(df), "Y": parquet_bars(str(path), batch_size=7)},
+        streaming_signal("rsi", period=5),
+    )
+    assert rep.summary["bars"] == 80
+    with pytest.raises(ValueError):
+        streaming_signal("bogus")
+
+
+def test_tracker_history_is_one_bar_time_point_per_timestamp():
+    sources = {s: _bars([10, 11, 12, 11]) for s in ("A", "B", "C")}
+    script = {s: ["BUY", "HOLD", "SELL", "BUY"] for s in sources}
+    bt = PortfolioBacktester(sources, _scripted(script))
+    rep = bt.run()
+    hist = bt.tracker.history
+    assert [t for t, _ in hist] == [
+        pd.Timestamp(T0 + k * 60_000, unit="ms", tz="UTC").to_pydatetime()
+        for k in range(4)
+    ]
+    assert [e for _, e in hist] == pytest.approx([e for _, e in rep.equity_curve])
@@ -0,0 +1,131 @@
+"""
+Unit Tests: Panel Signal Engine (Hybrid AI Quant Pro v1.0 - Parity Suite)
+-------------------------------------------------------------------------
+Checks that PANEL_STRATEGIES reproduces the per-symbol STRATEGIES decisions:
+- Random walks of mixed lengths (ragged, right-aligned panel)
+- Guard paths: short histories, NaN closes, flat windows, bad volume
+- evaluate_panel selection, params and unknown-name handling
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from hybrid_ai_trading.signals import (
+    PANEL_STRATEGIES,
+    STRATEGIES,
+    BarPanel,
+    evaluate_panel,
+)
+from hybrid_ai_trading.signals.rsi_signal import rsi_signal
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+def _walk(rng, n, drift=0.0):
+    closes = 100 + np.cumsum(rng.normal(drift, 1.0, n))
+    bars = []
+    for c in closes:
+        spread = abs(rng.normal(0, 0.5))
+        bars.append(
+            {
+                "o": float(c),
+                "h": float(c + spread),
+                "l": float(c - spread),
+                "c": float(c),
+                "v": float(rng.integers(1, 1000)),
+            }
+        )
+    return bars
+
+
+def _universe():
+    rng = np.random.default_rng(7)
+    universe = {}
+    for i in range(120):
+        n = int(rng.integers(0, 60))
+        universe[f"S{i}"] = _walk(rng, n, drift=rng.choice([-0.6, 0.0, 0.6]))
+    universe["FLAT"] = [{"o": 1, "h": 1, "l": 1, "c": 1, "v": 10}] * 40
+    universe["TENTHS"] = [{"o": 0.1, "h": 0.1, "l": 0.1, "c": 0.1, "v": 5}] * 40
+    universe["NANC"] = _walk(rng, 40)
+    universe["NANC"][10] = dict(universe["NANC"][10], c=math.nan)
+    universe["ZEROV"] = _walk(rng, 40)
+    universe["ZEROV"][5] = dict(universe["ZEROV"][5], v=0)
+    universe["TWO_EQ"] = [
+        {"c": 10, "h": 10, "l": 10, "v": 5},
+        {"c": 12, "h": 12, "l": 12, "v": 5},
+    ]
+    universe["ONE"] = _walk(rng, 1)
+    return universe
+
+
+# ----------------------------------------------------------------------
+# Parity
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("name", sorted(STRATEGIES))
+def test_panel_matches_per_symbol(name):
+    universe = _universe()
+    panel = BarPanel.from_bars(universe)
+    decisions = panel.decisions_by_symbol(PANEL_STRATEGIES[name](panel))
+
+    for sym, bars in universe.items():
+        ref = STRATEGIES[name](sym, bars)
+        if isinstance(ref, dict):
+            ref = ref["signal"]
+        assert decisions[sym] == ref, f"{name} mismatch for {sym}"
+
+
+def test_registry_keys_match():
+    assert set(PANEL_STRATEGIES) == set(STRATEGIES)
+
+
+# ----------------------------------------------------------------------
+# Panel construction + evaluate_panel
+# ----------------------------------------------------------------------
+def test_from_bars_right_aligns_and_pads():
+    panel = BarPanel.from_bars({"A": [{"c": 1}, {"c": 2}], "B": [{"c": 5}]})
+    assert panel.c.shape == (2, 2)
+    assert panel.lengths.tolist() == [2, 1]
+    assert math.isnan(panel.c[1, 0]) and panel.c[1, 1] == 5
+    assert panel.valid_mask().tolist() == [[True, True], [False, True]]
+
+
+def test_panel_shape_validation():
+    ok = np.ones((2, 3))
+    with pytest.raises(ValueError):
+        BarPanel(["A", "B"], ok, ok, ok, ok, np.ones((2, 2)))
+    with pytest.raises(ValueError):
+        BarPanel(["A"], ok, ok, ok, ok, ok)
+
+
+def test_evaluate_panel_subset_params_and_unknown():
+    universe = _universe()
+    panel = BarPanel.from_bars(universe)
+
+    out = evaluate_panel(panel, ["rsi", "ma"], params={"rsi": {"period": 7}})
+    assert set(out) == {"rsi", "ma"}
+    assert out["rsi"].shape == (len(universe),)
+    by_sym = panel.decisions_by_symbol(out["rsi"])
+    assert all(by_sym[s] == rsi_signal(b, period=7) for s, b in universe.items())
+
+    with pytest.raises(KeyError):
+        evaluate_panel(panel, ["nope"])
+
+
+def test_evaluate_panel_failure_falls_back_to_hold(monkeypatch):
+    panel = BarPanel.from_bars({"A": [{"c": 1}] * 30})
+
+    def boom(_panel):
+        raise RuntimeError("x")
+
+    monkeypatch.setitem(PANEL_STRATEGIES, "rsi", boom)
+    out = evaluate_panel(panel, ["rsi"])
+    assert out["rsi"].tolist() == ["HOLD"]
+
+
+def test_empty_panel_all_hold():
+    panel = BarPanel.from_bars({"A": [], "B": []})
+    for arr in evaluate_panel(panel).values():
+        assert arr.tolist() == ["HOLD", "HOLD"]
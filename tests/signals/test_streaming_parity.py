@@ -0,0 +1,149 @@
+"""
+Unit Tests: Streaming Indicator State (Hybrid AI Quant Pro v1.0 - Parity Harness)
+--------------------------------------------------------------------------------
+Feeds the same close/volume path bar-by-bar into the streaming states and into
+the batch generators on the growing history, and checks that every update agrees:
+- MACDState vs MACDSignal (values + decision)
+- RSIState vs RSISignal (value + decision)
+- BollingerState vs BollingerBandsSignal (bands + decision/reason)
+- VWAPState vs vwap_signal (decision)
+Plus drift resync, bad-tick handling and reset.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from hybrid_ai_trading.signals.bollinger_bands import BollingerBandsSignal
+from hybrid_ai_trading.signals.macd import MACDSignal
+from hybrid_ai_trading.signals.rsi_signal import RSISignal
+from hybrid_ai_trading.signals.streaming import (
+    BollingerState,
+    MACDState,
+    RSIState,
+    VWAPState,
+)
+from hybrid_ai_trading.signals.vwap import VWAPConfig, vwap_signal
+
+
+def _path(n=160, seed=3):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1.0, n))
+    vols = rng.integers(1, 500, n).astype(float)
+    return [{"c": float(c), "v": float(v)} for c, v in zip(closes, vols)]
+
+
+def _replay(state_update, batch, bars):
+    for i in range(1, len(bars) + 1):
+        yield state_update(bars[i - 1]), batch(bars[:i])
+
+
+# ----------------------------------------------------------------------
+# Parity harness
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_macd_parity(seed):
+    state, batch = MACDState(), MACDSignal()
+    for s, b in _replay(
+        lambda bar: state.update(bar["c"]),
+        lambda h: batch.generate("X", h),
+        _path(seed=seed),
+    ):
+        assert s["signal"] == b["signal"]
+        if "macd" in b:
+            assert s["macd"] == pytest.approx(b["macd"], rel=1e-12, abs=1e-12)
+            assert s["signal_line"] == pytest.approx(
+                b["signal_line"], rel=1e-12, abs=1e-12
+            )
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_rsi_parity(seed):
+    state, batch = RSIState(period=14, resync=16), RSISignal(period=14)
+    for s, b in _replay(
+        lambda bar: state.update(bar["c"]),
+        lambda h: batch.generate("X", h),
+        _path(seed=seed),
+    ):
+        assert s["signal"] == b["signal"]
+        if "rsi" in b:
+            assert s["rsi"] == pytest.approx(b["rsi"], rel=1e-9)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_bollinger_parity(seed):
+    state, batch = BollingerState(resync=50), BollingerBandsSignal()
+    for s, b in _replay(
+        lambda bar: state.update(bar["c"]),
+        lambda h: batch.generate("X", h),
+        _path(seed=seed),
+    ):
+        assert s["signal"] == b["signal"]
+        assert s["reason"] == b["reason"]
+        assert s["upper"] == pytest.approx(b["upper"], rel=1e-9)
+        assert s["lower"] == pytest.approx(b["lower"], rel=1e-9)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_vwap_parity(seed):
+    state = VWAPState()
+    for s, b in _replay(
+        lambda bar: state.update(bar["c"], bar["v"]), vwap_signal, _path(seed=seed)
+    ):
+        assert s == b
+
+
+# ----------------------------------------------------------------------
+# Edge cases
+# ----------------------------------------------------------------------
+def test_bollinger_flat_window_matches_batch():
+    bars = [{"c": 0.1}] * 25
+    state = BollingerState()
+    for bar in bars:
+        out = state.update(bar["c"])
+    assert (
+        out["reason"]
+        == BollingerBandsSignal().generate("X", bars)["reason"]
+        == "flat_stdev"
+    )
+
+
+def test_vwap_symmetry_and_tie_policy():
+    bars = [{"c": 10, "v": 5}, {"c": 12, "v": 5}]
+    cfg = VWAPConfig(tie_policy="SELL")
+    state = VWAPState(cfg)
+    assert state.update(10, 5) == "HOLD"
+    assert state.update(12, 5) == vwap_signal(bars, cfg) == "SELL"
+    assert state.vwap == pytest.approx(11.0)
+
+
+@pytest.mark.parametrize("bad", [None, "x", math.nan])
+def test_bad_ticks_are_dropped(bad):
+    macd, rsi, boll, vwap = MACDState(), RSIState(), BollingerState(), VWAPState()
+    assert macd.update(bad)["signal"] == "HOLD" and macd.count == 0
+    assert rsi.update(bad)["reason"] == "nan detected" and rsi.count == 0
+    assert boll.update(bad)["reason"] == "nan_detected"
+    assert vwap.update(10, bad) == "HOLD" and vwap.count == 0
+    assert vwap.update(10, 0) == "HOLD" and math.isnan(vwap.vwap)
+
+
+def test_reset_clears_state():
+    state = RSIState()
+    for bar in _path(30):
+        state.update(bar["c"])
+    assert state.rsi is not None
+    state.reset()
+    assert state.count == 0 and state.rsi is None
+    assert state.update(100.0)["reason"] == "not enough bars"
+
+
+def test_rsi_flat_and_one_sided():
+    up = RSIState(period=3)
+    for c in (1, 2, 3, 4):
+        out = up.update(c)
+    assert out == {"signal": "SELL", "rsi": 100.0}
+    flat = RSIState(period=3)
+    for c in (1, 1, 1, 1):
+        out = flat.update(c)
+    assert out == {"signal": "BUY", "rsi": 0.0}
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.eval.pnl import simulate_rr_exit
+from hybrid_ai_trading.strategies.orb_vwap import ORBVWAPConfig, ORBVWAPStrategy
+from hybrid_ai_trading.strategies.orb_walkforward import (
+    SessionCache,
+    WalkForwardConfig,
+    evaluate_session,
+    expand_configs,
+    fill_cache,
+    make_folds,
+    split_sessions,
+    walk_forward,
+)
+
+GRID = {"open_range_minutes": [5, 10], "rr_target": [1.0, 2.0]}
+
+
+def _bars(days=10, n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for d in pd.bdate_range("2025-01-06", periods=days):
+        idx = pd.date_range(
+            d + pd.Timedelta(hours=14, minutes=30), periods=n, freq="1min"
+        )
+        c = 100 + np.cumsum(rng.normal(0, 0.05, n))
+        frames.append(
+            pd.DataFrame(
+                {
+                    "open": c,
+                    "high": c + 0.03,
+                    "low": c - 0.03,
+                    "close": c,
+                    "volume": rng.integers(100, 1000, n),
+                },
+                index=idx,
+            )
+        )
+    return pd.concat(frames)
+
+
+def test_make_folds_rolling_windows():
+    folds = make_folds(list(range(10)), train=4, test=2)
+    assert folds[0] == ([0, 1, 2, 3], [4, 5])
+    assert folds[-1] == ([4, 5, 6, 7], [8, 9])
+    assert len(make_folds(list(range(10)), 4, 2, step=1)) == 5
+    with pytest.raises(ValueError):
+        make_folds([1, 2], 0, 1)
+
+
+def test_split_sessions_adds_vwap():
+    sessions = split_sessions(_bars(days=3))
+    assert len(sessions) == 3
+    first = next(iter(sessions.values()))
+    assert "vwap" in first.columns
+    assert first["vwap"].iloc[0] == pytest.approx(first["close"].iloc[0])
+    with pytest.raises(ValueError):
+        split_sessions(_bars(days=1).reset_index(drop=True))
+
+
+def test_evaluate_session_matches_scalar_pipeline():
+    sess = next(iter(split_sessions(_bars(days=1, seed=4)).values()))
+    configs = expand_configs(GRID)
+    outcomes = evaluate_session(sess, configs, risk_ticks=5)
+    for cfg, oc in zip(configs, outcomes):
+        frame = ORBVWAPStrategy(cfg).generate_signals(sess, sess.index[0])
+        hits = frame.index[frame["signal"] != 0]
+        if not len(hits):
+            assert oc.direction == 0 and oc.ticks == 0.0
+            continue
+        d = int(frame.loc[hits[0], "signal"])
+        ticks, exit_idx = simulate_rr_exit(
+            frame,
+            hits[0],
+            direction=d,
+            tick_size=0.01,
+            rr_target=cfg.rr_target,
+            risk_ticks=5,
+        )
+        assert (oc.direction, oc.ticks, oc.exit_time) == (d, ticks, exit_idx)
+
+
+def test_cache_reuses_overlapping_windows(tmp_path):
+    df = _bars(days=8)
+    cache = SessionCache()
+    wf = WalkForwardConfig(train_sessions=4, test_sessions=2, step=1, workers=1)
+    out = tmp_path / "wf" / "folds.parquet"
+    report = walk_forward(df, GRID, wf, cache=cache, out=out)
+
+    assert len(report) == 3
+    assert len(cache) == cache.misses == 8 * len(expand_configs(GRID))
+    pd.testing.assert_frame_equal(pd.read_parquet(out), report)
+    assert set(report["open_range_minutes"]) <= {5, 10}
+
+    misses = cache.misses
+    walk_forward(df, GRID, wf, cache=cache)
+    assert cache.misses == misses  # second run is all hits
+
+
+def test_parallel_matches_inline():
+    df = _bars(days=7, seed=2)
+    wf = WalkForwardConfig(train_sessions=3, test_sessions=2, objective="mean_ticks")
+    inline = walk_forward(df, GRID, WalkForwardConfig(**{**wf.__dict__, "workers": 1}))
+    pooled = walk_forward(df, GRID, WalkForwardConfig(**{**wf.__dict__, "workers": 2}))
+    pd.testing.assert_frame_equal(inline, pooled)
+
+
+def test_fill_cache_skips_known_and_bad_objective():
+    sessions = split_sessions(_bars(days=2))
+    cache = SessionCache()
+    configs = [ORBVWAPConfig()]
+    fill_cache(sessions, sessions, configs, cache, workers=1)
+    fill_cache(sessions, sessions, configs, cache, workers=1)
+    assert cache.misses == 2
+    with pytest.raises(ValueError):
+        walk_forward(_bars(days=3), wf=WalkForwardConfig(objective="bogus"))
+
+
+def test_shared_cache_separates_symbols_and_revised_bars():
+    df = _bars(days=6, seed=3)
+    cache = SessionCache()
+    wf = WalkForwardConfig(train_sessions=4, test_sessions=2, workers=1)
+    n = 6 * len(expand_configs(GRID))
+    walk_forward(df, GRID, wf, cache=cache, symbol="AAA")
+    walk_forward(df, GRID, wf, cache=cache, symbol="AAA")
+    assert cache.misses == n
+
+    other = _bars(days=6, seed=4)  # same sessions, different bars
+    fresh = walk_forward(other, GRID, wf, symbol="BBB")
+    shared = walk_forward(other, GRID, wf, cache=cache, symbol="BBB")
+    pd.testing.assert_frame_equal(shared, fresh)
+    assert cache.misses == 2 * n
+
+    revised = df.copy()
+    last_day = revised.index.normalize() == revised.index.normalize()[-1]
+    revised.loc[last_day, "close"] += 0.5
+    walk_forward(revised, GRID, wf, cache=cache, symbol="AAA")
+    assert cache.misses == 2 * n + len(expand_configs(GRID))  # only that day reruns
@@ -16,6 +16,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hybrid_ai_trading.data.clients.alpaca_client import AlpacaAPIError, AlpacaClient
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 def test_init_with_and_without_keys(monkeypatch, caplog):
@@ -49,7 +50,7 @@ def test_headers_and_missing():
         c._headers()
 
 
-@patch("hybrid_ai_trading.data.clients.alpaca_client.requests.request")
+@patch.object(shared_transport().session, "request")
 def test_request_success_and_failures(mock_req, caplog):
     c = AlpacaClient(api_key="KEY", api_secret="SEC")
 
@@ -1,12 +1,12 @@
 import os
 
 import pytest
-import requests as _requests
 
 from hybrid_ai_trading.data.clients.alpaca_news_client import (
     AlpacaAPIError,
     AlpacaNewsClient,
 )
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class DR:
@@ -36,7 +36,7 @@ def test_request_exception_wrapped(monkeypatch):
     def boom(*a, **k):
         raise Exception("net")
 
-    monkeypatch.setattr(_requests, "get", boom)
+    monkeypatch.setattr(shared_transport().session, "get", boom)
     c = AlpacaNewsClient()
     with pytest.raises(AlpacaAPIError):
         c.get_news("AAPL", 1, "2025-09-30")
@@ -57,6 +57,6 @@ def test_updated_at_fallback(monkeypatch):
             }
         ]
     }
-    monkeypatch.setattr(_requests, "get", lambda *a, **k: DR(data))
+    monkeypatch.setattr(shared_transport().session, "get", lambda *a, **k: DR(data))
     out = AlpacaNewsClient().get_news("AAPL", 1, "2025-09-30")
     assert out and out[0]["created"].startswith("2025-10-01")
@@ -1,6 +1,5 @@
-import requests as _requests
-
 from hybrid_ai_trading.data.clients.alpaca_news_client import AlpacaNewsClient
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class DR:
@@ -30,6 +29,6 @@ def test_alpaca_news_basic(monkeypatch):
             }
         ]
     }
-    monkeypatch.setattr(_requests, "get", lambda *a, **k: DR(data))
+    monkeypatch.setattr(shared_transport().session, "get", lambda *a, **k: DR(data))
     out = AlpacaNewsClient().get_news("MSFT", 1, "2025-09-30")
     assert out and out[0]["stocks"][0]["name"] == "MSFT"
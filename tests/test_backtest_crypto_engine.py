@@ -0,0 +1,96 @@
+"""
+Unit Tests: backtest_crypto linear-time engine
+----------------------------------------------
+- simulate_trades vs simulate_trades_reference: identical trade lists
+- run_bt(engine="fast") vs run_bt(engine="reference"): identical metrics
+- Rolling helpers match sma()/atr() bit-for-bit, on any Python version
+- --bars benchmark CLI path
+"""
+
+import pytest
+
+from hybrid_ai_trading import backtest_crypto as bc
+
+
+class _FakeExchange:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def parse_timeframe(self, tf):
+        return 60
+
+    def milliseconds(self):
+        return self.rows[-1][0] + 60_000
+
+    def fetch_ohlcv(self, symbol, timeframe, since, limit):
+        out = [r for r in self.rows if r[0] >= since]
+        return out[:limit]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("tf", ["5m", "15m", "1m"])
+def test_trade_list_parity(seed, tf):
+    ohl = bc.synthetic_ohlcv(2500, seed=seed)
+    ref = bc.simulate_trades_reference(ohl, tf, atr_k=1.5, fee_bps=5)
+    fast = bc.simulate_trades(ohl, tf, atr_k=1.5, fee_bps=5)
+    assert ref, "fixture should produce trades"
+    assert fast == ref
+
+
+def test_run_bt_metrics_parity(monkeypatch):
+    ohl = bc.synthetic_ohlcv(1500, seed=4)
+    monkeypatch.setattr(bc, "get_exchange", lambda name: _FakeExchange(ohl))
+
+    fast = bc.run_bt("BTC/USDC", tf="5m", total_bars=1500)
+    ref = bc.run_bt("BTC/USDC", tf="5m", total_bars=1500, engine="reference")
+    assert fast == ref
+    assert fast["bars"] == 1500 and fast["trades"] > 0
+
+
+def test_run_bt_guards(monkeypatch):
+    monkeypatch.setattr(bc, "get_exchange", lambda name: None)
+    assert bc.run_bt("BTC/USDC")["msg"] == "no exchange"
+
+    short = bc.synthetic_ohlcv(50)
+    monkeypatch.setattr(bc, "get_exchange", lambda name: _FakeExchange(short))
+    assert bc.run_bt("BTC/USDC", total_bars=50)["msg"] == "insufficient data"
+
+
+def test_no_trades_summary():
+    assert bc.simulate_trades(bc.synthetic_ohlcv(150)) == []
+    out = bc.summarize_trades("X", 300, "5m", 300_000, [])
+    assert out == {"symbol": "X", "trades": 0, "msg": "no trades", "bars": 300}
+
+
+def test_rolling_helpers_match_scalar_versions():
+    import numpy as np
+
+    ohl = bc.synthetic_ohlcv(400, seed=9)
+    closes = np.array([r[4] for r in ohl])
+    sums = bc._rolling_sum(closes, 50) / 50
+    for i in (50, 123, 400):
+        assert sums[i - 50] == bc.sma([r[4] for r in ohl[:i]], 50)
+
+    highs = bc._trailing_max(closes, 78)
+    for i in (1, 77, 78, 79, 399):
+        assert highs[i] == max(closes[max(0, i - 78) : i])
+    assert len(bc._rolling_sum(closes[:3], 5)) == 0
+
+
+def test_compensated_sum_does_not_depend_on_builtin_sum():
+    import numpy as np
+
+    vals = [1e16, 1.0, -1e16, 3.0, 0.1, 0.2]
+    naive = 0.0
+    for v in vals:
+        naive += v
+    assert naive != 4.3 and bc._csum(vals) == 4.3
+    assert bc._rolling_sum(np.array(vals), 6)[0] == bc._csum(vals)
+    assert bc._csum([]) == 0.0 and bc._csum([float("inf"), 1.0]) == float("inf")
+
+
+def test_benchmark_cli(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["backtest_crypto", "--bars", "3000"])
+    bc.main()
+    out = capsys.readouterr().out
+    assert "fast" in out and "parity=True" in out
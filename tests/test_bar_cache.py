@@ -0,0 +1,214 @@
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading import backtest_crypto as bc
+from hybrid_ai_trading.data.clients import coinapi_client as cc
+from hybrid_ai_trading.data.store.bar_cache import (
+    BarCache,
+    default_bar_cache,
+    missing_ranges,
+    timeframe_ms,
+)
+from hybrid_ai_trading.signals import breakout_polygon as bp
+
+H = 3_600_000
+
+
+def _frame(s, e, step=H, px=1.0):
+    ts = list(range(s, e, step))
+    return pd.DataFrame(
+        {"ts": ts, "open": px, "high": px, "low": px, "close": px, "volume": 1.0}
+    )
+
+
+class Recorder:
+    def __init__(self, px=1.0):
+        self.calls = []
+        self.px = px
+
+    def __call__(self, s, e):
+        self.calls.append((s, e))
+        return _frame(s, e, px=self.px)
+
+
+def test_timeframes_and_gap_math():
+    assert timeframe_ms("5m") == 300_000
+    assert timeframe_ms("1h") == timeframe_ms("1HRS") == H
+    assert timeframe_ms("1MIN") == timeframe_ms("1/minute") == 60_000
+    assert timeframe_ms("1/day") == timeframe_ms("1DAY") == 24 * H
+    for bad in ("1M", "abc", "1MTH"):
+        with pytest.raises(ValueError):
+            timeframe_ms(bad)
+    assert missing_ranges([(10, 20), (30, 40)], 0, 50) == [(0, 10), (20, 30), (40, 50)]
+    assert missing_ranges([(0, 50)], 10, 40) == []
+
+
+def test_only_head_and_tail_gaps_are_fetched(tmp_path):
+    cache = BarCache(tmp_path)
+    rec = Recorder()
+    now = 1_000 * H
+    df = cache.get("p", "ETH/USD", "1h", 100 * H, 200 * H, rec, now_ms=now)
+    assert len(df) == 100 and rec.calls == [(100 * H, 200 * H)]
+
+    df = cache.get("p", "ETH/USD", "1h", 50 * H, 250 * H, rec, now_ms=now)
+    assert len(df) == 200
+    assert rec.calls[1:] == [(50 * H, 100 * H), (200 * H, 250 * H)]
+
+    df = cache.get("p", "ETH/USD", "1h", 120 * H, 130 * H, rec, now_ms=now)
+    assert len(rec.calls) == 3 and cache.hits == 1
+    assert df["ts"].tolist() == list(range(120 * H, 130 * H, H))
+
+    # a fresh instance reads the ranges back from the file
+    again = BarCache(tmp_path)
+    assert again.load("p", "ETH/USD", "1h")[1] == [(50 * H, 250 * H)]
+
+
+def test_forming_bar_is_refetched_and_replaced(tmp_path):
+    cache = BarCache(tmp_path)
+    now = 10 * H + 1_000
+    cache.get("p", "X", "1h", 0, 11 * H, Recorder(px=1.0), now_ms=now)
+    rec = Recorder(px=2.0)
+    df = cache.get("p", "X", "1h", 0, 11 * H, rec, now_ms=now)
+    assert rec.calls == [(10 * H, 11 * H)]
+    assert df["close"].tolist() == [1.0] * 10 + [2.0]
+
+
+def test_failed_fetch_serves_cached_bars(tmp_path):
+    cache = BarCache(tmp_path)
+    cache.get("p", "X", "1h", 0, 10 * H, Recorder(), now_ms=100 * H)
+
+    def offline(s, e):
+        raise ConnectionError("no network")
+
+    df = cache.get("p", "X", "1h", 0, 20 * H, offline, now_ms=100 * H)
+    assert len(df) == 10
+    assert cache.load("p", "X", "1h")[1] == [(0, 10 * H)]
+
+
+def test_capped_fetch_covers_only_returned_bars(tmp_path):
+    cache = BarCache(tmp_path)
+    calls = []
+
+    def capped(s, e):  # provider returns at most 40 rows per request
+        calls.append((s, e))
+        return _frame(s, e).iloc[:40]
+
+    df = cache.get("p", "X", "1h", 0, 100 * H, capped, now_ms=1_000 * H, limit=40)
+    assert df["ts"].tolist() == list(range(0, 100 * H, H))
+    assert calls == [(0, 100 * H), (40 * H, 100 * H), (80 * H, 100 * H)]
+    assert cache.load("p", "X", "1h")[1] == [(0, 100 * H)]
+
+    def first_page_only(s, e, pages=[_frame(0, 40 * H)]):
+        if not pages:
+            raise ConnectionError("no network")
+        return pages.pop()
+
+    fresh = BarCache(tmp_path / "fresh")
+    fresh.get(
+        "p",
+        "Y",
+        "1h",
+        0,
+        100 * H,
+        first_page_only,
+        now_ms=1_000 * H,
+        limit=40,
+    )
+    # the second page failed, so only the first page's bars count as covered
+    assert fresh.load("p", "Y", "1h")[1] == [(0, 40 * H)]
+
+
+class FakeExchange:
+    id = "fakex"
+
+    def __init__(self, now):
+        self.now = now
+        self.calls = []
+
+    def parse_timeframe(self, tf):
+        return 3600
+
+    def milliseconds(self):
+        return self.now
+
+    def fetch_ohlcv(self, symbol, timeframe, since, limit):
+        self.calls.append(since)
+        end = min(since + limit * H, self.now)
+        return [[t, 1.0, 2.0, 0.5, 1.5, 10.0] for t in range(since, end, H)]
+
+
+def test_fetch_ohlcv_forward_uses_cache(tmp_path):
+    cache = BarCache(tmp_path)
+    ex = FakeExchange(now=5_000 * H + 10)
+    rows, tf_ms = bc.fetch_ohlcv_forward(ex, "ETH/USD", "1h", 1500, cache=cache)
+    assert tf_ms == H and len(rows) == 1500
+    assert rows[-1][0] == 5_000 * H and isinstance(rows[0][0], int)
+    first = len(ex.calls)
+
+    ex.now += 3 * H  # three more bars: one request for the tail only
+    rows, _ = bc.fetch_ohlcv_forward(ex, "ETH/USD", "1h", 1500, cache=cache)
+    assert rows[-1][0] == 5_003 * H and len(rows) == 1500
+    assert ex.calls[first:] == [5_000 * H]
+
+
+def test_polygon_and_coinapi_paths(tmp_path, monkeypatch):
+    monkeypatch.setenv("HAT_BAR_CACHE", str(tmp_path))
+    assert default_bar_cache() is default_bar_cache()
+
+    urls = []
+
+    day0 = int(pd.Timestamp.now("UTC").normalize().value // 1_000_000) - 10 * 24 * H
+
+    class Resp:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            days = [day0 + i * 24 * H for i in range(5)]
+            return {
+                "results": [
+                    {"t": t, "c": i, "h": i, "l": i} for i, t in enumerate(days)
+                ]
+            }
+
+    class Page(Resp):
+        def json(self):
+            body = super().json()
+            body["results"] = body["results"][:2]
+            body["next_url"] = "https://api.polygon.io/next?cursor=c1"
+            return body
+
+    class Last(Resp):
+        def json(self):
+            return {"results": super().json()["results"][2:]}
+
+    def fake_get(url, timeout=10):
+        urls.append(url)
+        if "cursor=c1" in url:
+            return Last()
+        return Page() if len(urls) == 1 else Resp()
+
+    monkeypatch.setattr(bp.requests, "get", fake_get)
+    sig = bp.BreakoutPolygonSignal(api_key="k", lookback=3)
+    first = sig._get_polygon_bars("AAPL", limit=3)
+    assert [b["c"] for b in first] == [0, 1, 2] and "limit=50000" in urls[0]
+    assert urls[1] == "https://api.polygon.io/next?cursor=c1&apiKey=k"
+    assert sig._get_polygon_bars("AAPL", limit=3) == first
+    assert len(urls) == 3  # second call only refetches the forming day
+
+    calls = []
+
+    def fake_http_get(path, params=None, **kw):
+        calls.append(params)
+        return [
+            {"time_period_start": "2025-01-06T00:00:00Z", "price_close": 5.0},
+            {"time_period_start": "2025-01-06T00:01:00Z", "price_close": 6.0},
+        ]
+
+    monkeypatch.setattr(cc, "http_get", fake_http_get)
+    kw = dict(time_start="2025-01-06T00:00:00Z", time_end="2025-01-06T00:02:00Z")
+    rows = cc.get_ohlcv("BTC/USD", "1MIN", **kw)
+    assert [r["c"] for r in rows] == [5.0, 6.0]
+    assert rows[0]["t"] == "2025-01-06T00:00:00Z"
+    assert cc.get_ohlcv("BTC/USD", "1MIN", limit=1, **kw) == rows[:1]
+    assert len(calls) == 1
@@ -0,0 +1,111 @@
+"""
+Unit Tests: bar_replay vectorized replay
+----------------------------------------
+- run_replay(mode="fast") == run_replay(mode="silent") on one session
+- replay_sessions over many (symbol, day) sessions == per-day silent replays
+- force_exit, short-session skipping, trade logging hook
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.tools import bar_replay as br
+
+
+def _day(day, n, seed, sigma=0.08):
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range(f"{day} 14:30", periods=n, freq="1min")
+    c = 100 + np.cumsum(rng.normal(0, sigma, n))
+    return pd.DataFrame(
+        {
+            "timestamp": ts,
+            "open": c,
+            "high": c + np.abs(rng.normal(0, 0.05, n)),
+            "low": c - np.abs(rng.normal(0, 0.05, n)),
+            "close": c,
+            "volume": 100,
+        }
+    )
+
+
+def _days(k=12, seed=0):
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2024-03-01", periods=k)
+    return pd.concat(
+        [
+            _day(d.date(), int(rng.integers(4, 90)), seed + i)
+            for i, d in enumerate(days)
+        ],
+        ignore_index=True,
+    )
+
+
+@pytest.mark.parametrize("force_exit", [False, True])
+@pytest.mark.parametrize("seed", range(6))
+def test_fast_mode_matches_silent(seed, force_exit):
+    df = _day("2024-03-04", 120, seed)
+    kw = dict(log_trades=False, risk_cents=30.0, max_qty=50, force_exit=force_exit)
+    slow = br.run_replay(df.copy(), "X", mode="silent", **kw)
+    fast = br.run_replay(df.copy(), "X", mode="fast", **kw)
+    assert fast == slow
+
+
+@pytest.mark.parametrize("orb_minutes", [3, 5, 15])
+def test_replay_sessions_matches_per_day(orb_minutes):
+    df = _days()
+    res = br.replay_sessions(df.copy(), "X", orb_minutes=orb_minutes)
+    expected = []
+    for _, day in df.groupby(df["timestamp"].dt.normalize()):
+        if len(day) < orb_minutes + 2:
+            continue
+        r = br.run_replay(
+            day.copy(), "X", mode="silent", log_trades=False, orb_minutes=orb_minutes
+        )
+        expected.append((r.trades, r.pnl, r.final_pos.side, r.final_pos.qty))
+    got = list(
+        res[["trades", "pnl", "final_side", "final_qty"]].itertuples(
+            index=False, name=None
+        )
+    )
+    assert got == expected
+    assert (res["bars"] >= orb_minutes + 2).all()
+
+
+def test_replay_sessions_multi_symbol_mapping():
+    frames = {"AAA": _days(seed=1), "BBB": _days(seed=2)}
+    res = br.replay_sessions(frames, force_exit=True)
+    assert set(res["symbol"]) == {"AAA", "BBB"}
+    solo = br.replay_sessions(frames["BBB"], "BBB", force_exit=True)
+    pd.testing.assert_frame_equal(
+        res[res["symbol"] == "BBB"].reset_index(drop=True), solo
+    )
+    assert res["final_side"].isna().all()
+    assert br.replay_sessions({}).empty
+
+
+def test_fast_paths_log_closed_trades(monkeypatch):
+    logged = []
+    monkeypatch.setattr(br, "log_closed_trade", lambda **kw: logged.append(kw))
+    df = _day("2024-03-04", 200, 3, sigma=0.2)
+
+    res = br.run_replay(df.copy(), "X", mode="fast", force_exit=True)
+    assert len(logged) >= res.trades // 2 > 0
+    assert logged[0]["replay_id"] == "X-2024-03-04-orb-auto"
+
+    logged.clear()
+    br.replay_sessions(df.copy(), "X", force_exit=True, log_trades=True)
+    assert len(logged) >= res.trades // 2
+    assert logged[-1]["notes"] in ("auto-logged exit", "force-exit at end")
+
+
+def test_fast_path_hook_failure_is_logged(monkeypatch, caplog):
+    def boom(**kw):
+        raise RuntimeError("journal down")
+
+    monkeypatch.setattr(br, "log_closed_trade", boom)
+    df = _day("2024-03-04", 200, 3, sigma=0.2)
+    with caplog.at_level("WARNING", logger="hybrid_ai_trading.tools.bar_replay"):
+        res = br.replay_sessions(df, "X", force_exit=True, log_trades=True)
+    assert len(res) == 1
+    assert "journal down" in caplog.text
@@ -1,12 +1,12 @@
 import os
 
 import pytest
-import requests as _requests
 
 from hybrid_ai_trading.data.clients.benzinga_client import (
     BenzingaAPIError,
     BenzingaClient,
 )
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class R:
@@ -42,7 +42,7 @@ def test_json_header_but_nonjson_body(monkeypatch):
     os.environ["BENZINGA_API_KEY"] = "k"
     # Content-type says JSON, json() raises, should raise BenzingaAPIError
     monkeypatch.setattr(
-        _requests,
+        shared_transport().session,
         "get",
         lambda *a, **k: R(
             {"content-type": "application/json"}, data=ValueError("badjson")
@@ -56,7 +56,7 @@ def test_text_xml_minimal(monkeypatch):
     os.environ["BENZINGA_API_KEY"] = "k"
     xml = '<?xml version="1.0"?><result is_array="true"><item><id>1</id><author>a</author><created>x</created><updated>y</updated><title>T</title><teaser></teaser><body></body><url>u</url></item></result>'
     monkeypatch.setattr(
-        _requests,
+        shared_transport().session,
         "get",
         lambda *a, **k: R({"content-type": "text/xml"}, data=None, text=xml),
     )
@@ -1,10 +1,10 @@
 import pytest
-import requests as _requests
 
 from hybrid_ai_trading.data.clients.benzinga_client import (
     BenzingaAPIError,
     BenzingaClient,
 )
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class R:
@@ -38,7 +38,9 @@ def test_bz_list_json(monkeypatch):
         }
     ]
     monkeypatch.setattr(
-        _requests, "get", lambda *a, **k: R({"content-type": "application/json"}, items)
+        shared_transport().session,
+        "get",
+        lambda *a, **k: R({"content-type": "application/json"}, items),
     )
     c = BenzingaClient()
     out = c.get_news("META", 1)
@@ -56,7 +58,9 @@ def test_bz_dict_json_wrap(monkeypatch):
         "stocks": [],
     }
     monkeypatch.setattr(
-        _requests, "get", lambda *a, **k: R({"content-type": "application/json"}, d)
+        shared_transport().session,
+        "get",
+        lambda *a, **k: R({"content-type": "application/json"}, d),
     )
     c = BenzingaClient()
     out = c.get_news("AAPL", 1)
@@ -66,7 +70,9 @@ def test_bz_dict_json_wrap(monkeypatch):
 def test_bz_json_none_raises(monkeypatch):
     monkeypatch.setenv("BENZINGA_API_KEY", "k")
     monkeypatch.setattr(
-        _requests, "get", lambda *a, **k: R({"content-type": "application/json"}, None)
+        shared_transport().session,
+        "get",
+        lambda *a, **k: R({"content-type": "application/json"}, None),
     )
     c = BenzingaClient()
 
@@ -77,7 +83,7 @@ def test_bz_json_none_raises(monkeypatch):
 def test_bz_json_fail_raises(monkeypatch):
     monkeypatch.setenv("BENZINGA_API_KEY", "k")
     monkeypatch.setattr(
-        _requests,
+        shared_transport().session,
         "get",
         lambda *a, **k: R({"content-type": "application/json"}, ValueError("bad")),
     )
@@ -93,7 +99,9 @@ def test_bz_xml_fallback(monkeypatch):
       <id>9</id><author>bz</author><created>x</created><updated>y</updated>
       <title>TSLA record</title><teaser></teaser><body></body><url>u</url></item></result>"""
     monkeypatch.setattr(
-        _requests, "get", lambda *a, **k: R({"content-type": "text/xml"}, None, xml)
+        shared_transport().session,
+        "get",
+        lambda *a, **k: R({"content-type": "text/xml"}, None, xml),
     )
     c = BenzingaClient()
     out = c.get_news("TSLA", 1)
@@ -103,7 +111,9 @@ def test_bz_xml_fallback(monkeypatch):
 def test_bz_invalid_type(monkeypatch):
     monkeypatch.setenv("BENZINGA_API_KEY", "k")
     monkeypatch.setattr(
-        _requests, "get", lambda *a, **k: R({"content-type": "application/json"}, 123)
+        shared_transport().session,
+        "get",
+        lambda *a, **k: R({"content-type": "application/json"}, 123),
     )
     c = BenzingaClient()
 
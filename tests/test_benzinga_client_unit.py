@@ -1,6 +1,5 @@
-import requests as _requests
-
 from hybrid_ai_trading.data.clients.benzinga_client import BenzingaClient
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class DummyResp:
@@ -70,7 +69,7 @@ def test_benzinga_json_and_xml(monkeypatch):
             else fake_get_xml(url, params, headers, timeout)
         )
 
-    monkeypatch.setattr(_requests, "get", switcher)
+    monkeypatch.setattr(shared_transport().session, "get", switcher)
 
     c = BenzingaClient()
     out1 = c.get_news("META", limit=1)
@@ -29,6 +29,7 @@ from hybrid_ai_trading.data.clients.coinapi_client import (
     get_ohlcv_latest,
     ping,
 )
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 # ----------------------------------------------------------------------
@@ -117,7 +118,7 @@ def test_retry_get_stub_when_headers_empty(monkeypatch):
     monkeypatch.delenv("COINAPI_ALLOW_STUB", raising=False)
 
 
-@patch("hybrid_ai_trading.data.clients.coinapi_client.requests.get")
+@patch.object(shared_transport().plain_session, "get")
 @patch(
     "hybrid_ai_trading.data.clients.coinapi_client._get_headers",
     return_value={"X": "Y"},
@@ -131,7 +132,7 @@ def test_retry_get_success(mock_headers, mock_get):
 
 
 @patch("hybrid_ai_trading.data.clients.coinapi_client.time.sleep", return_value=None)
-@patch("hybrid_ai_trading.data.clients.coinapi_client.requests.get")
+@patch.object(shared_transport().plain_session, "get")
 @patch(
     "hybrid_ai_trading.data.clients.coinapi_client._get_headers",
     return_value={"X": "Y"},
@@ -146,7 +147,7 @@ def test_retry_get_retryable_then_success(mock_headers, mock_get, _sleep):
 
 
 @patch("hybrid_ai_trading.data.clients.coinapi_client.time.sleep", return_value=None)
-@patch("hybrid_ai_trading.data.clients.coinapi_client.requests.get")
+@patch.object(shared_transport().plain_session, "get")
 @patch(
     "hybrid_ai_trading.data.clients.coinapi_client._get_headers",
     return_value={"X": "Y"},
@@ -163,8 +164,9 @@ def test_retry_get_exhausts_and_nonretryable(mock_headers, mock_get, _sleep):
         coinapi_client._retry_get("http://fake")
 
 
-@patch(
-    "hybrid_ai_trading.data.clients.coinapi_client.requests.get",
+@patch.object(
+    shared_transport().plain_session,
+    "get",
     side_effect=Exception("boom"),
 )
 @patch(
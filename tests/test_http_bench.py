@@ -0,0 +1,9 @@
+from hybrid_ai_trading.tools import http_bench
+
+
+def test_benchmark_times_every_client_on_loopback():
+    with http_bench.local_server() as url:
+        res = http_bench.benchmark(url, n=5)
+    assert set(res) == {"urllib.urlopen", "requests.get", "shared transport"}
+    for r in res.values():
+        assert 0 < r["mean_ms"] and r["mean_ms"] <= r["p95_ms"] * 5
@@ -0,0 +1,161 @@
+import asyncio
+import os
+import time
+
+import pytest
+import yaml
+
+from hybrid_ai_trading.data import news_aggregator as agg
+from hybrid_ai_trading.risk import sentiment_gate
+
+
+@pytest.fixture
+def cfg(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("config")
+
+    def write(np):
+        with open("config/config.yaml", "w", encoding="utf-8") as f:
+            yaml.safe_dump({"news_providers": np}, f)
+
+    return write
+
+
+def story(sid, sym="AAPL", title=None):
+    return {
+        "id": sid,
+        "url": f"https://n/{sid}",
+        "title": title or f"{sym} {sid}",
+        "stocks": [{"name": sym, "exchange": ""}],
+    }
+
+
+class SlowBZ:
+    delay = 0.3
+
+    def get_news(self, symbols_csv, limit=10, date_from=None):
+        time.sleep(self.delay)
+        return [story("bz1")]
+
+
+class SlowPG:
+    def get_news(self, sym, limit=5, date_from=None):
+        time.sleep(0.3)
+        return [story(f"pg-{sym}", sym)]
+
+
+def test_sources_and_symbols_are_fetched_concurrently(cfg, monkeypatch):
+    cfg({"rss": {"enabled": False}})
+    monkeypatch.setattr(agg, "BenzingaClient", SlowBZ)
+    monkeypatch.setattr(agg, "PolygonNewsClient", SlowPG)
+    a = agg.NewsAggregator(index=agg.NewsIndex())
+    t0 = time.perf_counter()
+    out = a.sweep("AAPL,META,TSLA,NVDA", limit=8, date_from="2025-09-30")
+    assert time.perf_counter() - t0 < 0.9  # sequential would take 1.5s
+    assert [s["id"] for s in out] == ["bz1", "pg-AAPL", "pg-META", "pg-TSLA", "pg-NVDA"]
+    m = a.metrics()
+    assert m["polygon"]["calls"] == 4 and m["benzinga"]["ok"] == 1
+    assert m["polygon"]["last_ms"] >= 250
+    assert a.last_sweep["stories"] == 5 and a.last_sweep["new"] == 5
+
+
+def test_slow_source_is_cut_off_by_its_timeout(cfg, monkeypatch):
+    cfg(
+        {
+            "benzinga": {"timeout_s": 0.1},
+            "polygon": {"enabled": False},
+            "rss": {"enabled": False},
+            "alpaca": {"enabled": True},
+        }
+    )
+    monkeypatch.setattr(SlowBZ, "delay", 1.0)
+    monkeypatch.setattr(agg, "BenzingaClient", SlowBZ)
+
+    class AP:
+        def get_news(self, symbols_csv, limit=10, date_from=None):
+            return [story("ap1")]
+
+    monkeypatch.setattr(agg, "AlpacaNewsClient", AP)
+    a = agg.NewsAggregator(index=agg.NewsIndex())
+    t0 = time.perf_counter()
+    out = asyncio.run(a.sweep_async("AAPL", limit=5, date_from="2025-09-30"))
+    assert time.perf_counter() - t0 < 0.5
+    assert [s["id"] for s in out] == ["ap1"]
+    assert a.metrics()["benzinga"]["timeouts"] == 1
+
+
+def test_timeout_runs_from_job_start_not_queue_entry(cfg, monkeypatch):
+    cfg(
+        {
+            "benzinga": {"enabled": False},
+            "polygon": {"timeout_s": 0.5},
+            "rss": {"enabled": False},
+        }
+    )
+    monkeypatch.setattr(agg, "PolygonNewsClient", SlowPG)
+    a = agg.NewsAggregator(index=agg.NewsIndex(), workers=1)
+    out = a.sweep("AAPL,META,TSLA", limit=5, date_from="2025-09-30")
+    # one worker would queue 3 x 0.3s jobs past the 0.5s timeout
+    assert [s["id"] for s in out] == ["pg-AAPL", "pg-META", "pg-TSLA"]
+    assert a.metrics()["polygon"]["timeouts"] == 0
+
+
+def test_index_keeps_only_new_stories_across_sweeps(cfg, monkeypatch, tmp_path):
+    cfg({"polygon": {"enabled": False}, "rss": {"enabled": False}})
+    batch = [story("a"), story("b")]
+
+    class BZ:
+        def get_news(self, symbols_csv, limit=10, date_from=None):
+            return [dict(s) for s in batch]
+
+    monkeypatch.setattr(agg, "BenzingaClient", BZ)
+    clock = [1000.0]
+    path = str(tmp_path / "idx" / "news.json")
+    a = agg.NewsAggregator(
+        index=agg.NewsIndex(ttl_s=60, path=path, clock=lambda: clock[0])
+    )
+    assert len(a.sweep("AAPL", 5, "2025-09-30", new_only=True)) == 2
+    batch.append(story("c"))
+    assert [s["id"] for s in a.sweep("AAPL", 5, "2025-09-30", new_only=True)] == ["c"]
+    assert len(a.sweep("AAPL", 5, "2025-09-30")) == 3  # full window by default
+    assert a.metrics()["benzinga"]["new"] == 3
+
+    # the index survives a restart and entries expire after the TTL
+    idx = agg.NewsIndex(ttl_s=60, path=path, clock=lambda: clock[0])
+    assert not idx.is_new("benzinga", story("a"))
+    clock[0] += 61
+    assert idx.is_new("benzinga", story("a"))
+    assert idx.prune(force=True) == 6 and len(idx) == 0  # url + id keys
+
+
+def test_sentiment_gate_scores_each_headline_once(cfg, monkeypatch):
+    cfg({})
+    stories = [story("a", title="AAPL beats"), story("b", title="AAPL misses")]
+    monkeypatch.setattr(
+        sentiment_gate,
+        "aggregate_news",
+        lambda *a: [dict(s, source="benzinga") for s in stories],
+    )
+    scored = []
+
+    class Filt:
+        def score(self, text):
+            scored.append(text)
+            return 0.5
+
+        def allow_trade(self, text, side=None, precomputed_score=None):
+            return precomputed_score >= 0
+
+    monkeypatch.setattr(sentiment_gate, "SentimentFilter", Filt)
+    monkeypatch.setattr(sentiment_gate, "_SCORES", {})
+    first = sentiment_gate.score_headlines_for_symbols("AAPL", 24, 10)
+    stories.append(story("c", title="AAPL guides up"))
+    second = sentiment_gate.score_headlines_for_symbols("AAPL", 24, 10)
+    assert scored == ["AAPL beats", "AAPL misses", "AAPL guides up"]
+    assert first["per_symbol"]["AAPL"]["seen"] == 2
+    assert second["per_symbol"]["AAPL"] == {
+        "seen": 3,
+        "allowed": 3,
+        "blocked": 0,
+        "avgScore": 0.5,
+    }
@@ -17,6 +17,7 @@ import pytest
 pytest.importorskip("sqlalchemy", reason="optional: database tests require SQLAlchemy")
 pytestmark = pytest.mark.db
 from hybrid_ai_trading.data.clients import news_client
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 # ----------------------------------------------------------------------
@@ -52,7 +53,7 @@ def test_fetch_polygon_news_no_key(monkeypatch):
     assert out == []
 
 
-@patch("hybrid_ai_trading.data.clients.news_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_fetch_polygon_news_success_and_failure(mock_get, monkeypatch):
     monkeypatch.setenv("POLYGON_KEY", "FAKE")
 
@@ -82,7 +83,7 @@ def test_fetch_benzinga_news_no_key(monkeypatch):
     assert out == []
 
 
-@patch("hybrid_ai_trading.data.clients.news_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_fetch_benzinga_news_all_branches(mock_get, monkeypatch):
     monkeypatch.setenv("BENZINGA_KEY", "FAKE")
     client = MagicMock()
@@ -0,0 +1,167 @@
+"""
+Unit Tests: tools.param_sweep
+-----------------------------
+- Grid expansion + stable keys
+- Inline and process-pool sweeps agree with direct engine calls
+- Resume skips completed grid points; leaderboard sorted, CSV/Parquet output
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading import backtest_crypto as bc
+from hybrid_ai_trading.tools import param_sweep as ps
+from hybrid_ai_trading.tools.bar_replay import run_replay
+
+
+def _orb_days(n_days=3):
+    rows = []
+    rng = np.random.default_rng(5)
+    for d in range(n_days):
+        t0 = datetime(2025, 3, 3 + d, 9, 30)
+        px = 100.0
+        for m in range(60):
+            px += rng.normal(0.02, 0.3)
+            rows.append(
+                {
+                    "timestamp": t0 + timedelta(minutes=m),
+                    "open": px,
+                    "high": px + 0.2,
+                    "low": px - 0.2,
+                    "close": px,
+                    "volume": 1000,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def test_expand_grid_and_keys():
+    pts = ps.expand_grid({"b": [1, 2], "a": [0.5]})
+    assert pts == [{"a": 0.5, "b": 1}, {"a": 0.5, "b": 2}]
+    assert ps.point_key({"b": 1, "a": 0.5}) == ps.point_key(pts[0])
+
+
+def test_crypto_sweep_inline_matches_engine(tmp_path):
+    rows = bc.synthetic_ohlcv(1200, tf_ms=300_000, seed=2)
+    bars = ps.bars_from_ohlcv(rows)
+    out = tmp_path / "lb.csv"
+    board = ps.run_sweep(
+        bars,
+        "crypto",
+        {"atr_k": [1.5, 2.0], "fee_bps": [5.0, 10.0]},
+        out,
+        fixed={"tf": "5m"},
+        workers=1,
+    )
+    assert len(board) == 4 and out.exists()
+    assert list(board["finalEquity"]) == sorted(board["finalEquity"], reverse=True)
+
+    ref = bc.summarize_trades(
+        "X",
+        len(rows),
+        "5m",
+        300_000,
+        bc.simulate_trades(rows, "5m", atr_k=1.5, fee_bps=5.0),
+    )
+    hit = board[(board["atr_k"] == 1.5) & (board["fee_bps"] == 5.0)].iloc[0]
+    assert hit["trades"] == ref["trades"]
+    assert hit["finalEquity"] == ref["finalEquity"]
+
+
+def test_replay_sweep_pool_and_resume(tmp_path):
+    df = _orb_days()
+    bars = ps.bars_from_frame(df)
+    out = tmp_path / "lb.parquet"
+    grid = {"orb_minutes": [3, 5], "risk_cents": [10.0, 20.0]}
+
+    first = ps.run_sweep(
+        bars, "replay", {"orb_minutes": [3], "risk_cents": [10.0]}, out, workers=1
+    )
+    assert len(first) == 1
+
+    board = ps.run_sweep(bars, "replay", grid, out, workers=2, chunk_size=1)
+    assert len(board) == 4
+    assert pd.read_parquet(out).shape[0] == 4
+    journal = pd.read_csv(ps.journal_path(out))
+    assert len(journal) == 4  # first point not recomputed
+
+    # direct per-day replay for one point
+    expected = 0.0
+    for _, day in df.set_index("timestamp").groupby(lambda t: t.date()):
+        expected += run_replay(
+            day.copy(),
+            "SWEEP",
+            mode="silent",
+            log_trades=False,
+            orb_minutes=5,
+            risk_cents=20.0,
+        ).pnl
+    row = board[(board["orb_minutes"] == 5) & (board["risk_cents"] == 20.0)].iloc[0]
+    assert row["pnl"] == pytest.approx(round(expected, 2))
+    assert row["sessions"] == 3
+
+
+def test_errors_are_journaled_and_retried(tmp_path):
+    bars = ps.bars_from_ohlcv(bc.synthetic_ohlcv(300))
+    out = tmp_path / "lb.csv"
+    board = ps.run_sweep(bars, "crypto", {"bogus": [1]}, out, workers=1)
+    assert board["error"].iloc[0].startswith("TypeError")
+    assert ps.completed_keys(ps.journal_path(out)) == set()
+
+    with pytest.raises(ValueError):
+        ps.run_sweep(bars, "nope", {}, out)
+
+
+def test_cli_with_bars_file(tmp_path, capsys):
+    src = tmp_path / "bars.csv"
+    _orb_days(2).to_csv(src, index=False)
+    out = tmp_path / "cli.csv"
+    ps.main(
+        [
+            "--target",
+            "replay",
+            "--bars-file",
+            str(src),
+            "--grid",
+            "orb_minutes=3,4",
+            "--set",
+            "risk_cents=15",
+            "--out",
+            str(out),
+            "--workers",
+            "1",
+        ]
+    )
+    assert "pnl" in capsys.readouterr().out
+    assert len(pd.read_csv(out)) == 2
+
+
+def test_journal_schema_survives_error_first_chunk_and_resume(tmp_path):
+    bars = ps.bars_from_ohlcv(bc.synthetic_ohlcv(1200, tf_ms=300_000, seed=2))
+    out = tmp_path / "lb.csv"
+    journal = ps.journal_path(out)
+    # a journal left by the old writer: header from an error-only first chunk
+    journal.write_text(
+        "key,atr_k,error\n" + '"{""atr_k"": 1.5}",1.5,\n', encoding="utf-8"
+    )
+    assert ps.completed_keys(journal, ps.REQUIRED_METRICS["crypto"]) == set()
+
+    # first chunk errors (atr_k="x"), later chunks succeed
+    board = ps.run_sweep(
+        bars,
+        "crypto",
+        {"atr_k": ["x", 1.5, 2.0]},
+        out,
+        fixed={"tf": "5m"},
+        workers=1,
+        chunk_size=1,
+    )
+    header = journal.read_text(encoding="utf-8").splitlines()[0].split(",")
+    assert header[:3] == ["key", "atr_k", "error"]
+    assert {"finalEquity", "trades", "PF"} <= set(header)
+    ok = board[board["error"].isna()]
+    assert len(ok) == 2 and ok["finalEquity"].notna().all()
+    assert len(ps.completed_keys(journal, ps.REQUIRED_METRICS["crypto"])) == 2
@@ -15,6 +15,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hybrid_ai_trading.data.clients.polygon_client import PolygonAPIError, PolygonClient
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 # ==========================================================
@@ -121,7 +122,7 @@ def test_headers_without_key_raises():
 # ==========================================================
 # _request Coverage
 # ==========================================================
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_request_success(mock_get):
     client = PolygonClient(api_key="FAKE", allow_missing=True)
     resp = MagicMock()
@@ -132,7 +133,7 @@ def test_request_success(mock_get):
     assert "results" in out
 
 
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_request_unexpected_json(mock_get):
     client = PolygonClient(api_key="FAKE", allow_missing=True)
     resp = MagicMock()
@@ -143,7 +144,7 @@ def test_request_unexpected_json(mock_get):
         client._request("aggs/ticker/AAPL/prev")
 
 
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_request_raise_for_status(mock_get):
     client = PolygonClient(api_key="FAKE", allow_missing=True)
     resp = MagicMock()
@@ -153,7 +154,7 @@ def test_request_raise_for_status(mock_get):
         client._request("aggs/ticker/AAPL/prev")
 
 
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_request_network_error(mock_get):
     client = PolygonClient(api_key="FAKE", allow_missing=True)
     mock_get.side_effect = Exception("network fail")
@@ -161,7 +162,7 @@ def test_request_network_error(mock_get):
         client._request("aggs/ticker/AAPL/prev")
 
 
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_request_json_decode_failure(mock_get):
     client = PolygonClient(api_key="FAKE", allow_missing=True)
     resp = MagicMock()
@@ -11,9 +11,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from hybrid_ai_trading.data.clients.polygon_client import PolygonAPIError, PolygonClient
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_prev_close_success(mock_get):
     mock_resp = MagicMock()
     mock_resp.status_code = 200
@@ -27,7 +28,7 @@ def test_prev_close_success(mock_get):
     assert data["results"][0]["c"] == 150.0
 
 
-@patch("hybrid_ai_trading.data.clients.polygon_client.requests.get")
+@patch.object(shared_transport().session, "get")
 def test_prev_close_failure(mock_get):
     mock_resp = MagicMock()
     mock_resp.raise_for_status.side_effect = Exception("API error")
@@ -0,0 +1,119 @@
+import csv
+
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="optional: database tests require SQLAlchemy")
+pytestmark = pytest.mark.db
+
+from datetime import datetime
+
+from sqlalchemy import create_engine, func, select, text
+
+from hybrid_ai_trading.data.ingestors.polygon_ingestor import ingest_polygon_bars
+from hybrid_ai_trading.data.store import database
+from hybrid_ai_trading.data.store.database import (
+    Price,
+    bulk_insert_prices,
+    get_high_water_mark,
+    tune_sqlite,
+)
+
+DAY = 86_400_000
+T0 = 1_704_067_200_000  # 2024-01-01 UTC
+
+
+class FakeClient:
+    def __init__(self, days):
+        self.days = days
+        self.calls = []
+
+    def get_daily_ohlcv(self, symbol, start, end):
+        self.calls.append(start)
+        lo = int(datetime.strptime(start, "%Y-%m-%d").timestamp() * 1000)
+        bars = [
+            {"t": T0 + i * DAY, "o": i, "h": i + 1, "l": i - 1, "c": i, "v": 100}
+            for i in range(self.days)
+            if T0 + i * DAY >= lo
+        ]
+        return {"results": bars}
+
+
+@pytest.fixture
+def eng(tmp_path):
+    e = tune_sqlite(create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}"))
+    database.Base.metadata.create_all(e)
+    return e
+
+
+def _count(eng):
+    with eng.connect() as conn:
+        return conn.execute(select(func.count()).select_from(Price)).scalar()
+
+
+def test_tuned_engine_uses_wal(eng):
+    with eng.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+    assert tune_sqlite(eng) is eng
+
+
+def test_incremental_passes_fetch_from_high_water_mark(eng, tmp_path):
+    out = tmp_path / "feed.csv"
+    client = FakeClient(days=30)
+    assert (
+        ingest_polygon_bars(client, "AAPL", "2024-01-01", "2024-12-31", out, eng) == 30
+    )
+    assert get_high_water_mark("AAPL", eng=eng) == datetime(2024, 1, 30)
+
+    client.days = 33
+    assert (
+        ingest_polygon_bars(client, "AAPL", "2024-01-01", "2024-12-31", out, eng) == 3
+    )
+    assert client.calls == ["2024-01-01", "2024-01-30"]
+    assert (
+        ingest_polygon_bars(client, "AAPL", "2024-01-01", "2024-12-31", out, eng) == 0
+    )
+
+    assert _count(eng) == 33
+    rows = list(csv.reader(open(out, newline="")))
+    assert len(rows) == 33 and rows[0][0] == "2024-01-01T00:00:00+00:00"
+
+
+def test_bulk_insert_skips_duplicates_and_keeps_mark(eng):
+    def row(day, px=1.0):
+        return {
+            "timestamp": datetime(2024, 1, day),
+            "symbol": "MSFT",
+            "open": px,
+            "high": px,
+            "low": px,
+            "close": px,
+            "volume": 1.0,
+        }
+
+    assert bulk_insert_prices([row(1), row(2), row(3)], "MSFT", eng=eng) == 3
+    # overlapping, older batch: duplicates ignored, mark does not move back
+    assert bulk_insert_prices([row(2, 9.0), row(1, 9.0), row(4)], "MSFT", eng=eng) == 1
+    assert _count(eng) == 4
+    assert get_high_water_mark("MSFT", eng=eng) == datetime(2024, 1, 4)
+    with eng.connect() as conn:
+        assert conn.execute(select(func.max(Price.close))).scalar() == 1.0
+    assert bulk_insert_prices([], "MSFT", eng=eng) == 0
+    assert get_high_water_mark("TSLA", eng=eng) is None
+
+
+def test_rows_already_in_db_without_mark_are_not_counted_or_logged(eng, tmp_path):
+    # a DB filled by the per-bar path: prices present, no ingest_state yet
+    with eng.begin() as conn:
+        for i in range(5):
+            conn.execute(
+                Price.__table__.insert().values(
+                    timestamp=datetime(2024, 1, 1 + i), symbol="AAPL", close=i
+                )
+            )
+    out = tmp_path / "feed.csv"
+    client = FakeClient(days=7)
+    n = ingest_polygon_bars(client, "AAPL", "2024-01-01", "2024-12-31", out, eng)
+    assert n == 2 and _count(eng) == 7
+    rows = list(csv.reader(open(out, newline="")))
+    assert [r[0][:10] for r in rows] == ["2024-01-06", "2024-01-07"]
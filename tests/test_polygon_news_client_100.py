@@ -1,12 +1,12 @@
 import os
 
 import pytest
-import requests as _requests
 
 from hybrid_ai_trading.data.clients.polygon_news_client import (
     PolygonAPIError,
     PolygonNewsClient,
 )
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class DR:
@@ -47,6 +47,6 @@ def test_list_payload_and_empty_tickers(monkeypatch):
             "tickers": "MSFT",
         },
     ]
-    monkeypatch.setattr(_requests, "get", lambda *a, **k: DR(data))
+    monkeypatch.setattr(shared_transport().session, "get", lambda *a, **k: DR(data))
     out = PolygonNewsClient().get_news(None, limit=2, date_from="2025-09-30")
     assert len(out) == 2 and out[1]["stocks"][0]["name"] == "MSFT"
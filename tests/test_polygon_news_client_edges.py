@@ -1,10 +1,10 @@
 import pytest
-import requests as _requests
 
 from hybrid_ai_trading.data.clients.polygon_news_client import (
     PolygonAPIError,
     PolygonNewsClient,
 )
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 def test_polygon_request_error(monkeypatch):
@@ -13,6 +13,6 @@ def test_polygon_request_error(monkeypatch):
     def boom(*a, **k):
         raise Exception("net")
 
-    monkeypatch.setattr(_requests, "get", boom)
+    monkeypatch.setattr(shared_transport().session, "get", boom)
     with pytest.raises(PolygonAPIError):
         PolygonNewsClient().get_news("AAPL", 1, "2025-09-30")
@@ -1,6 +1,5 @@
-import requests as _requests
-
 from hybrid_ai_trading.data.clients.polygon_news_client import PolygonNewsClient
+from hybrid_ai_trading.utils.http_transport import shared_transport
 
 
 class DR:
@@ -35,7 +34,7 @@ def test_polygon_normalization(monkeypatch):
             },
         ]
     }
-    monkeypatch.setattr(_requests, "get", lambda *a, **k: DR(data))
+    monkeypatch.setattr(shared_transport().session, "get", lambda *a, **k: DR(data))
     c = PolygonNewsClient()
     out = c.get_news("AAPL", 2, "2025-09-30")
     assert (
@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.data.store.tick_archive import (
+    TICK_DTYPE,
+    TickArchive,
+    TickArchiveError,
+    TickFile,
+    convert_files,
+    iter_snapshots,
+    ticks_to_bars,
+    to_ns,
+    write_tick_file,
+)
+from hybrid_ai_trading.tools.bar_replay import load_bars
+
+DAY = to_ns("2025-01-06")
+
+
+def _ticks(n, start=DAY, step=1_000_000, seed=0):
+    rng = np.random.default_rng(seed)
+    recs = np.zeros(n, dtype=TICK_DTYPE)
+    recs["ts_ns"] = start + np.arange(n) * step
+    recs["last"] = 100 + np.cumsum(rng.normal(0, 0.01, n))
+    recs["bid"] = recs["last"] - 0.01
+    recs["ask"] = recs["last"] + 0.01
+    recs["last_size"] = rng.integers(1, 100, n)
+    return recs
+
+
+def test_file_roundtrip_is_memmapped(tmp_path):
+    recs = _ticks(10_000)
+    path = write_tick_file(tmp_path / "x.tick", recs[::-1], symbol="AAPL", stride=64)
+    tf = TickFile(path)
+    assert tf.symbol == "AAPL" and len(tf) == 10_000
+    assert isinstance(tf.records, np.memmap)
+    np.testing.assert_array_equal(tf.records, recs)  # sorted on write
+    assert tf.first_ns == recs["ts_ns"][0] and tf.last_ns == recs["ts_ns"][-1]
+
+
+@pytest.mark.parametrize("stride", [1, 7, 64, 100_000])
+def test_slice_matches_searchsorted_and_is_a_view(tmp_path, stride):
+    recs = _ticks(5_000)
+    recs["ts_ns"] = DAY + np.sort(
+        np.random.default_rng(1).integers(0, 2_000, 5_000)
+    )  # many duplicate timestamps
+    tf = TickFile(write_tick_file(tmp_path / "d.tick", recs, stride=stride))
+    ts = recs["ts_ns"]
+    for a, b in [(DAY - 5, DAY + 10), (DAY + 500, DAY + 500), (DAY + 777, DAY + 1999)]:
+        got = tf.slice(a, b)
+        lo, hi = np.searchsorted(ts, a), np.searchsorted(ts, b)
+        np.testing.assert_array_equal(got["ts_ns"], ts[lo:hi])
+        assert got.base is not None  # no copy
+    assert len(tf.slice()) == 5_000
+    assert len(tf.slice(DAY + 5_000)) == 0
+
+
+def test_archive_partitions_by_day_and_merges(tmp_path):
+    arc = TickArchive(tmp_path, stride=16)
+    day2 = to_ns("2025-01-07")
+    arc.write("MSFT", np.concatenate([_ticks(100), _ticks(50, start=day2)]))
+    assert arc.symbols() == ["MSFT"]
+    assert arc.days("MSFT") == ["20250106", "20250107"]
+
+    arc.write("MSFT", _ticks(10, start=DAY + 50_500_000, seed=3))
+    assert len(arc.open("MSFT", "20250106")) == 110  # reopened after rewrite
+
+    one = arc.read("MSFT", DAY, DAY + 20_000_000)
+    assert len(one) == 20 and isinstance(one.base, np.memmap)
+    both = arc.read("MSFT", "2025-01-06 00:00:00.090", pd.Timestamp(day2 + 5_000_000))
+    assert len(both) == 10 + 5  # 90..99ms of day 1, 0..4ms of day 2
+    assert len(arc.read("TSLA")) == 0
+
+
+def test_convert_market_logger_csv_and_feature_store_parquet(tmp_path):
+    csv = tmp_path / "AAPL_ticks.csv"
+    pd.DataFrame(
+        {
+            "timestamp": ["2025-01-06 14:30:01", "2025-01-06 14:30:00", "bad"],
+            "symbol": "AAPL",
+            "last": [101.0, 100.0, 1.0],
+            "bid": [100.9, 99.9, 1.0],
+            "ask": [101.1, 100.1, 1.0],
+        }
+    ).to_csv(csv, index=False)
+    pq = tmp_path / "MSFT_20250106.parquet"
+    pd.DataFrame(
+        {
+            "ts": pd.to_datetime(["2025-01-06 14:30:00"], utc=True),
+            "symbol": ["MSFT"],
+            "bid": [400.0],
+            "ask": [400.2],
+            "last": [0.0],
+            "bidSize": [3],
+            "askSize": [4],
+            "lastSize": [0],
+        }
+    ).to_parquet(pq, index=False)
+
+    arc = TickArchive(tmp_path / "ticks")
+    assert convert_files([csv, pq], arc) == {"AAPL": 2, "MSFT": 1}
+    aapl = arc.read("AAPL")
+    assert list(aapl["last"]) == [100.0, 101.0]
+    assert aapl["ts_ns"][0] == to_ns("2025-01-06 14:30:00")
+    msft = arc.read("MSFT")
+    assert (msft["bid_size"][0], msft["ask_size"][0]) == (3, 4)
+
+    snap = next(iter_snapshots(msft, "MSFT"))
+    assert snap["price"] == pytest.approx(400.1)  # mid when no trade
+    assert snap["symbol"] == "MSFT" and snap["ts"].startswith("2025-01-06T14:30")
+
+
+def test_bars_from_ticks_and_load_bars(tmp_path):
+    recs = _ticks(180, step=1_000_000_000)  # 3 minutes of 1s ticks
+    bars = ticks_to_bars(recs)
+    assert len(bars) == 3
+    first = recs[:60]
+    assert bars.loc[0, "open"] == first["last"][0]
+    assert bars.loc[0, "high"] == first["last"].max()
+    assert bars.loc[0, "close"] == first["last"][-1]
+    assert bars.loc[0, "volume"] == first["last_size"].sum()
+
+    path = write_tick_file(tmp_path / "b.tick", recs)
+    pd.testing.assert_frame_equal(load_bars(str(path)), bars)
+
+
+def test_bad_files(tmp_path):
+    bad = tmp_path / "bad.tick"
+    bad.write_bytes(b"nope")
+    with pytest.raises(TickArchiveError):
+        TickFile(bad)
+    path = write_tick_file(tmp_path / "t.tick", _ticks(100))
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(TickArchiveError):
+        TickFile(path)
+    empty = TickFile(write_tick_file(tmp_path / "e.tick", _ticks(0)))
+    assert len(empty.slice(DAY, DAY + 1)) == 0
+
+
+def test_rewriting_the_same_chunk_is_idempotent(tmp_path):
+    arc = TickArchive(tmp_path, stride=16)
+    recs = _ticks(200)
+    recs["bid"][::7] = np.nan  # NaN fields still compare as duplicates
+    arc.write("AAPL", recs)
+    arc.write("AAPL", recs[::-1])
+    arc.write("AAPL", np.concatenate([recs[150:], _ticks(50, start=DAY + 200_000_000)]))
+    got = arc.read("AAPL")
+    assert len(got) == 250
+    assert got[:200].tobytes() == recs.tobytes()
+    assert np.all(np.diff(got["ts_ns"]) > 0)
+
+
+def test_long_multibyte_symbol_is_cut_on_a_character_boundary(tmp_path):
+    path = write_tick_file(tmp_path / "s.tick", _ticks(3), symbol="\u20ac" * 6)
+    assert TickFile(path).symbol == "\u20ac" * 5  # 3-byte chars, 16-byte field
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from hybrid_ai_trading.utils import providers
+
+
+class FakeClient:
+    def __init__(self, name, delay=0.0, prices=None, fail=False):
+        self.name = name
+        self.delay = delay
+        self.prices = prices
+        self.fail = fail
+        self.calls = []
+        self.bulk_calls = []
+        self.lock = threading.Lock()
+
+    def last_quote(self, sym):
+        with self.lock:
+            self.calls.append(sym)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("down")
+        px = (self.prices or {}).get(sym, 100.0)
+        return {"symbol": sym, "price": px, "source": self.name}
+
+
+class BulkClient(FakeClient):
+    def __init__(self, name, missing=(), **kw):
+        super().__init__(name, **kw)
+        self.missing = set(missing)
+
+    def last_quotes(self, syms):
+        self.bulk_calls.append(list(syms))
+        return {
+            s: {"symbol": s, "price": 1.0 + i}
+            for i, s in enumerate(syms)
+            if s not in self.missing
+        }
+
+
+@pytest.fixture
+def fakes(monkeypatch):
+    monkeypatch.setattr(providers, "HAT_NO_CACHE", True)
+    clients = {}
+    monkeypatch.setattr(providers, "_client", lambda name, _p: clients.get(name))
+    return clients
+
+
+def test_bulk_endpoint_prices_equities_in_one_request(fakes):
+    fakes["polygon"] = BulkClient("polygon")
+    syms = [f"T{i}" for i in range(150)]
+    out = providers.get_prices(syms, {})
+    assert len(fakes["polygon"].bulk_calls) == 2  # chunks of 100
+    assert fakes["polygon"].calls == []
+    assert all(out[s]["source"] == "polygon" for s in syms)
+    assert out["T0"]["price"] == 1.0
+
+
+def test_unpriced_bulk_symbols_fall_through_per_chunk(fakes):
+    fakes["polygon"] = BulkClient("polygon", missing={"T5", "T120", "T240"})
+    fakes["coinapi"] = FakeClient("coinapi", prices={"T120": 7.0})
+    syms = [f"T{i}" for i in range(250)]
+    out = providers.get_prices(syms, {}, hedge_after=5.0)
+    assert len(fakes["polygon"].bulk_calls) == 3
+    assert fakes["polygon"].calls == []  # bulk already asked polygon
+    assert sorted(fakes["coinapi"].calls) == ["T120", "T240", "T5"]
+    assert out["T120"] == {"symbol": "T120", "price": 7.0, "source": "coinapi"}
+    assert out["T5"]["source"] == out["T240"]["source"] == "coinapi"
+    assert out["T249"]["source"] == "polygon"
+
+
+def test_symbols_fan_out_concurrently(fakes):
+    fakes["coinapi"] = FakeClient("coinapi", delay=0.1)
+    syms = [f"C{i}/USD" for i in range(12)]
+    t0 = time.perf_counter()
+    out = providers.get_prices(syms, {}, hedge_after=5.0)
+    assert time.perf_counter() - t0 < 0.6  # serial would take 1.2s
+    assert {r["source"] for r in out.values()} == {"coinapi"}
+
+
+def test_slow_primary_is_hedged(fakes):
+    fakes["coinapi"] = FakeClient("coinapi", delay=1.0)
+    fakes["kraken"] = FakeClient("kraken", prices={"ETHUSDT": 42.0})
+    t0 = time.perf_counter()
+    out = providers.get_prices(["ETHUSDT"], {}, hedge_after=0.05)
+    assert time.perf_counter() - t0 < 0.5
+    assert out["ETHUSDT"] == {"symbol": "ETHUSDT", "price": 42.0, "source": "kraken"}
+
+
+def test_failed_primary_fails_over_and_fallback(fakes):
+    fakes["polygon"] = FakeClient("polygon", fail=True)
+    fakes["coinapi"] = FakeClient("coinapi")
+    out = providers.get_prices(["AAPL", " ", "CL1!"], {}, hedge_after=5.0)
+    assert out["AAPL"]["source"] == "coinapi"
+    assert out[" "]["reason"] == "empty_symbol"
+    assert out["CL1!"]["reason"] == "fallback"
+    assert out["CL1!"]["source"] == "polygon"
+    assert out["CL1!"]["price"] == providers._synthetic_price("CL1!")
+
+
+def test_clients_are_long_lived(monkeypatch):
+    cfg = {"providers": {"kraken": {"base": "https://example.invalid"}}}
+    a = providers._client("kraken", cfg["providers"])
+    b = providers._client("kraken", cfg["providers"])
+    assert a is b and a is not None
+    assert providers._client("coinapi", {}) is None  # missing key: not built
@@ -0,0 +1,187 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from hybrid_ai_trading.utils.feature_store import FeatureStore, QuoteWriter
+
+T0 = datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def _quote(store, sym, k, **extra):
+    store.write_quote(
+        symbol=sym, ts=T0 + timedelta(seconds=k), bid=k, ask=k + 0.1, **extra
+    )
+
+
+def test_rows_flush_into_rolling_parts(tmp_path):
+    store = FeatureStore(tmp_path, flush_rows=3, flush_ms=60_000, clock=FakeClock())
+    for k in range(7):
+        _quote(store, "AAPL", k)
+    part_dir = tmp_path / "quotes" / "AAPL_20250106"
+    assert sorted(p.name for p in part_dir.iterdir()) == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+    assert store.pending_rows() == 1
+
+    store.close()
+    df = store.read_quotes("AAPL", "20250106")
+    assert list(df["bid"]) == list(range(7))
+    assert set(df["symbol"]) == {"AAPL"}
+    assert store.rows_written == 7 and store.parts_written == 3
+
+
+def test_time_based_flush(tmp_path):
+    clock = FakeClock()
+    store = FeatureStore(tmp_path, flush_rows=1_000, flush_ms=500, clock=clock)
+    _quote(store, "MSFT", 0)
+    clock.t = 0.2
+    _quote(store, "AAPL", 1)
+    assert store.parts_written == 0
+
+    clock.t = 0.6  # MSFT buffer is 600ms old, AAPL only 400ms
+    _quote(store, "NVDA", 2)
+    assert store.parts_written == 1
+    assert len(store.read_quotes("MSFT", "20250106")) == 1
+
+    clock.t = 1.5
+    assert store.flush_due() == 2
+    assert store.pending_rows() == 0
+
+
+def test_compact_merges_parts_and_reader_stitches(tmp_path):
+    store = FeatureStore(tmp_path, flush_rows=2, clock=FakeClock())
+    for k in range(5):
+        _quote(store, "BRK.B", k)
+    _quote(store, "AAPL", 0)
+    assert store.compact(symbol="BRK.B") == 1
+
+    target = tmp_path / "quotes" / "BRK.B_20250106.parquet"
+    assert target.exists()
+    assert not (tmp_path / "quotes" / "BRK.B_20250106").exists()
+    assert list(pd.read_parquet(target)["bid"]) == list(range(5))
+    assert store.pending_rows() == 1  # AAPL untouched
+
+    # later writes land in new parts; reader returns compacted + parts
+    for k in range(5, 8):
+        _quote(store, "BRK.B", k)
+    store.flush()
+    assert list(store.read_quotes("BRK.B", "20250106")["bid"]) == list(range(8))
+    store.compact()
+    assert list(pd.read_parquet(target)["bid"]) == list(range(8))
+
+
+def test_schema_change_and_day_roll(tmp_path):
+    with FeatureStore(tmp_path, flush_rows=100, clock=FakeClock()) as store:
+        _quote(store, "AAPL", 0)
+        _quote(store, "AAPL", 1, last=5.0)
+        _quote(store, "AAPL", 86_400)
+    df = store.read_quotes("AAPL", "20250106")
+    assert len(df) == 2 and df["last"].isna().tolist() == [True, False]
+    assert len(store.read_quotes("AAPL", "20250107")) == 1
+    assert store.read_quotes("TSLA", "20250106").empty
+
+
+class RecordingStore:
+    def __init__(self, gate=None):
+        self.rows = []
+        self.gate = gate
+
+    def write_quote(self, symbol, ts, **fields):
+        if self.gate is not None:
+            self.gate.wait()
+        self.rows.append((symbol, fields["bid"]))
+
+    def flush_due(self):
+        return 0
+
+    def flush(self):
+        pass
+
+
+def _submit(writer, sym, k):
+    return writer.submit(symbol=sym, ts=T0, bid=k)
+
+
+@pytest.mark.parametrize(
+    "policy,kept,dropped",
+    [
+        ("drop_newest", [0, 1, 2], 2),
+        ("drop_oldest", [2, 3, 4], 2),
+    ],
+)
+def test_drop_policies(policy, kept, dropped):
+    store = RecordingStore()
+    writer = QuoteWriter(store, capacity=3, policy=policy)
+    results = [_submit(writer, "A", k) for k in range(5)]
+    assert results.count(False) == (dropped if policy == "drop_newest" else 0)
+    assert writer.depth() == 3 and writer.max_depth == 3
+    writer.drain()
+    assert [b for _, b in store.rows] == kept
+    assert writer.stats()["dropped"] == dropped
+
+
+def test_coalesce_keeps_latest_per_symbol_in_order():
+    store = RecordingStore()
+    writer = QuoteWriter(store, capacity=2, policy="coalesce")
+    for sym, k in [("A", 0), ("B", 1), ("A", 2), ("B", 3), ("A", 4), ("C", 5)]:
+        assert _submit(writer, sym, k)
+    writer.drain()
+    assert store.rows == [("A", 0), ("B", 1), ("A", 4), ("B", 3), ("C", 5)]
+    assert writer.coalesced == 1 and writer.dropped == 0
+
+    # once drained, A goes back through the queue
+    _submit(writer, "A", 6)
+    assert writer.depth() == 1 and not writer._latest
+
+
+def test_writer_thread_keeps_producer_off_disk(tmp_path):
+    gate = threading.Event()
+    writer = QuoteWriter(RecordingStore(gate), capacity=1_000, interval_ms=5).start()
+    t0 = time.perf_counter()
+    for k in range(500):
+        _submit(writer, "A", k)
+    assert time.perf_counter() - t0 < 1.0  # store is blocked; submit is not
+    gate.set()
+    writer.stop()
+    assert writer.written == 500
+    assert [b for _, b in writer.store.rows] == list(range(500))
+
+    store = FeatureStore(tmp_path, flush_rows=64)
+    writer = QuoteWriter(store, interval_ms=5).start()
+    for k in range(300):
+        writer.submit(symbol="MSFT", ts=T0 + timedelta(seconds=k), bid=k)
+    writer.stop()
+    stats = writer.stats()
+    assert stats["written"] == 300 and stats["depth"] == 0
+    assert stats["flushes"] >= 1 and stats["max_flush_ms"] >= stats["avg_flush_ms"]
+    assert len(store.read_quotes("MSFT", "20250106")) == 300
+    with pytest.raises(ValueError):
+        QuoteWriter(store, policy="block")
+
+
+def test_stop_timeout_leaves_busy_writer_alone(caplog):
+    gate = threading.Event()
+    store = RecordingStore(gate)
+    writer = QuoteWriter(store, interval_ms=5).start()
+    for k in range(3):
+        _submit(writer, "A", k)
+    time.sleep(0.05)  # writer thread is now blocked inside write_quote
+    caplog.set_level("WARNING")
+    assert writer.stop(timeout=0.05) is False
+    assert "still busy" in caplog.text
+    assert store.rows == [] and writer._thread.is_alive()
+    gate.set()
+    assert writer.stop() is True
+    assert [b for _, b in store.rows] == [0, 1, 2] and writer._thread is None
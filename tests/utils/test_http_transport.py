@@ -0,0 +1,138 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hybrid_ai_trading.utils import http_transport
+from hybrid_ai_trading.utils.http_transport import HttpTransport
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    ports = set()
+    fail_next = 0
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        if code >= 429 and "wait" in self.path:
+            self.send_header("Retry-After", "3600")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        Handler.ports.add(self.client_address[1])
+        if self.path.startswith("/flaky") and Handler.fail_next > 0:
+            Handler.fail_next -= 1
+            self._send(503, {"error": "busy"})
+        elif self.path.startswith("/limited"):
+            Handler.fail_next += 1
+            self._send(429, {"error": "slow down"})
+        elif self.path.startswith("/missing"):
+            self._send(404, {"error": "nope"})
+        elif self.path.startswith("/text"):
+            self.send_response(200)
+            self.send_header("Content-Length", "3")
+            self.end_headers()
+            self.wfile.write(b"abc")
+        else:
+            self._send(200, {"path": self.path})
+
+
+@pytest.fixture
+def server():
+    Handler.ports = set()
+    Handler.fail_next = 0
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    th = threading.Thread(target=srv.serve_forever, daemon=True)
+    th.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_connections_are_reused(server):
+    tr = HttpTransport(retries=0)
+    for i in range(10):
+        assert tr.get_json(f"{server}/q/{i}") == {"path": f"/q/{i}"}
+    assert len(Handler.ports) == 1  # one keep-alive connection
+    tr.close()
+
+
+def test_hooks_and_stats(server):
+    tr = HttpTransport(retries=0)
+    events = []
+    tr.add_hook(events.append)
+    tr.get_json(f"{server}/a", params={"x": 1})
+    tr.get_json(f"{server}/missing")
+    tr.remove_hook(events.append)
+    tr.get_json(f"{server}/b")
+    assert [e["status"] for e in events] == [200, 404]
+    assert all(e["method"] == "GET" and e["elapsed_ms"] >= 0 for e in events)
+    st = tr.stats()[server.split("//")[1]]
+    assert st["requests"] == 3 and st["errors"] == 1
+    assert st["avg_ms"] <= st["max_ms"]
+
+
+def test_get_json_error_contract(server):
+    tr = HttpTransport(retries=0)
+    assert tr.get_json(f"{server}/missing")["_error"].startswith("HTTPError")
+    assert "_error" in tr.get_json(f"{server}/text")
+    assert "_error" in tr.get_json("http://127.0.0.1:9/none", timeout=0.5)
+
+
+def test_get_retries_on_503(server):
+    Handler.fail_next = 2
+    tr = HttpTransport(retries=2, backoff=0.0)
+    assert tr.get_json(f"{server}/flaky") == {"path": "/flaky"}
+    assert Handler.fail_next == 0
+
+
+def test_retry_after_is_capped_and_429_left_to_caller(server, monkeypatch):
+    monkeypatch.setattr(http_transport, "RETRY_AFTER_MAX", 0.05)
+    Handler.fail_next = 1
+    tr = HttpTransport(retries=2, backoff=0.0)
+    t0 = time.perf_counter()
+    assert tr.get_json(f"{server}/flaky?wait") == {"path": "/flaky?wait"}
+    assert time.perf_counter() - t0 < 2.0  # not the server's 3600s
+
+    assert tr.get(f"{server}/limited?wait").status_code == 429
+    assert Handler.fail_next == 1  # one request, no transport retry
+
+
+def test_retry_false_skips_transport_retries(server):
+    Handler.fail_next = 2
+    tr = HttpTransport(retries=2, backoff=0.0)
+    assert tr.get(f"{server}/flaky", retry=False).status_code == 503
+    assert Handler.fail_next == 1
+    assert tr.stats()[server.split("//")[1]]["errors"] == 1
+
+
+def test_doubles_patch_the_shared_session(server, monkeypatch):
+    calls = []
+
+    class Resp:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"fake": True}
+
+    def fake_get(url, **kw):
+        calls.append((url, kw.get("timeout")))
+        return Resp()
+
+    tr = HttpTransport(timeout=3.0)
+    monkeypatch.setattr(tr.session, "get", fake_get)
+    assert tr.get_json(f"{server}/a") == {"fake": True}
+    assert calls == [(f"{server}/a", 3.0)] and not Handler.ports
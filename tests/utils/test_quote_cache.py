@@ -0,0 +1,111 @@
+import threading
+import time
+
+from hybrid_ai_trading.utils import providers
+from hybrid_ai_trading.utils.quote_cache import QuoteCache
+
+
+class Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+class Fetcher:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+        self.version = 0
+
+    def __call__(self, syms):
+        self.calls.append(list(syms))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("down")
+        self.version += 1
+        return {s: (s, self.version) for s in syms}
+
+
+def test_ttl_per_symbol_and_lru_eviction():
+    clock, fetch = Clock(), Fetcher()
+    cache = QuoteCache(
+        ttl=lambda s: 10.0 if s == "SLOW" else 1.0,
+        stale_s=0.0,
+        max_entries=2,
+        clock=clock,
+    )
+    assert cache.get_many(["A", "SLOW"], fetch) == {"A": ("A", 1), "SLOW": ("SLOW", 1)}
+    clock.t = 5.0
+    assert cache.get("SLOW", fetch) == ("SLOW", 1)  # still fresh
+    assert cache.get("A", fetch) == ("A", 2)  # expired, refetched
+    cache.get("B", fetch)  # evicts SLOW, the least recently used
+    assert cache.peek("SLOW") is None and len(cache) == 2
+    st = cache.stats()
+    assert (st["hits"], st["misses"], st["evictions"]) == (1, 4, 1)
+
+
+def test_stale_while_revalidate():
+    clock, fetch = Clock(), Fetcher(delay=0.2)
+    cache = QuoteCache(ttl=1.0, stale_s=5.0, clock=clock)
+    cache.get("X", fetch)
+    clock.t = 3.0
+    t0 = time.perf_counter()
+    assert cache.get("X", fetch) == ("X", 1)  # stale value, no blocking
+    assert time.perf_counter() - t0 < 0.1
+    assert cache.get("X", fetch) == ("X", 1)  # refresh already in flight
+    deadline = time.time() + 2.0
+    while cache.peek("X") == ("X", 1) and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.peek("X") == ("X", 2)
+    assert len(fetch.calls) == 2 and cache.stats()["refreshes"] == 1
+    clock.t = 100.0  # beyond ttl + stale_s: blocking miss again
+    assert cache.get("X", fetch) == ("X", 3)
+
+
+def test_single_flight_for_concurrent_misses():
+    fetch = Fetcher(delay=0.2)
+    cache = QuoteCache(ttl=10.0)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("Y", fetch)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(fetch.calls) == 1
+    assert results == [("Y", 1)] * 8
+    st = cache.stats()
+    assert st["misses"] == 1 and st["joined"] == 7 and st["inflight"] == 0
+
+
+def test_failed_fetch_is_not_cached():
+    fetch = Fetcher(fail=True)
+    cache = QuoteCache(ttl=10.0)
+    assert cache.get("Z", fetch) is None
+    assert cache.stats()["errors"] == 1 and len(cache) == 0
+    fetch.fail = False
+    assert cache.get("Z", fetch) == ("Z", 1)
+
+
+def test_providers_share_the_cache(monkeypatch):
+    cache = QuoteCache(ttl=lambda s: providers.CACHE_TTLS[providers.asset_class(s)])
+    monkeypatch.setattr(providers, "_QUOTES", cache)
+    monkeypatch.setattr(providers, "HAT_NO_CACHE", False)
+    calls = []
+
+    def fetch_many(syms, cfg, hedge_after=None, timeout=None):
+        calls.append(list(syms))
+        return {s: {"symbol": s, "price": 1.0, "source": "fake"} for s in syms}
+
+    monkeypatch.setattr(providers, "_fetch_many", fetch_many)
+    providers.get_prices(["AAPL", "BTC-USDT"], {})
+    assert providers.get_price("AAPL", {})["source"] == "fake"
+    assert calls == [["AAPL", "BTC-USDT"]]
+    assert providers.quote_cache() is cache and cache.stats()["hits"] == 1
+    assert providers.asset_class("BTC-USDT") == "crypto"
+    assert providers.asset_class("XAUUSD") == "metal"